@@ -0,0 +1,85 @@
+import statistics
+import threading
+import time
+import unittest
+from typing import List
+
+from test.stub_server import StubResponse, StubServer
+from zitadel_client.auth.client_credentials_authenticator import ClientCredentialsAuthenticator
+from zitadel_client.auth.oauth_authenticator import OAuthAuthenticator
+
+TOKEN_PATH = "/oauth/v2/token"  # noqa: S105
+
+
+def _p99(samples: List[float]) -> float:
+    return statistics.quantiles(samples, n=100)[98]
+
+
+def _measure(authenticator: OAuthAuthenticator, duration: float, threads: int = 8) -> List[float]:
+    """Calls get_auth_token from several threads for the given duration and returns all latencies."""
+    latencies: List[float] = []
+    lock = threading.Lock()
+    deadline = time.monotonic() + duration
+
+    def worker() -> None:
+        local: List[float] = []
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            authenticator.get_auth_token()
+            local.append(time.perf_counter() - start)
+            time.sleep(0.001)
+        with lock:
+            latencies.extend(local)
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for thread in workers:
+        thread.start()
+    for thread in workers:
+        thread.join()
+    return latencies
+
+
+class BackgroundRefreshTest(unittest.TestCase):
+    def test_rejects_invalid_ratio(self) -> None:
+        with StubServer() as server:
+            server.oauth()
+            with self.assertRaises(ValueError):
+                ClientCredentialsAuthenticator.builder(server.url, "client", "secret").background_refresh(1.5)
+
+    def test_p99_stays_flat_across_refresh_boundary(self) -> None:
+        with StubServer() as server:
+            # tokens live for 2s and the endpoint takes 300ms, so several refreshes happen during the run
+            server.oauth(expires_in=2, delay=0.3)
+            authenticator = ClientCredentialsAuthenticator.builder(server.url, "client", "secret").background_refresh(0.5).build()
+            authenticator.get_auth_token()
+            try:
+                latencies = _measure(authenticator, duration=2.5)
+            finally:
+                authenticator.close()
+
+        self.assertGreaterEqual(server.hits[TOKEN_PATH], 3)
+        self.assertLess(_p99(latencies), 0.05)
+
+    def test_blocking_refresh_stalls_requests(self) -> None:
+        with StubServer() as server:
+            # without background refresh, a short-lived token is renewed on the request path
+            server.oauth(expires_in=2, delay=0.3)
+            authenticator = ClientCredentialsAuthenticator.builder(server.url, "client", "secret").build()
+            latencies = _measure(authenticator, duration=1.0)
+
+        self.assertGreaterEqual(max(latencies), 0.3)
+
+    def test_failed_refresh_keeps_serving_valid_token(self) -> None:
+        with StubServer() as server:
+            server.oauth(expires_in=3)
+            authenticator = ClientCredentialsAuthenticator.builder(server.url, "client", "secret").background_refresh(0.2).build()
+            authenticator.RETRY_BASE_DELAY = 0.05
+            first = authenticator.get_auth_token()
+            server.route(TOKEN_PATH, lambda _: StubResponse(500, {"error": "server_error"}))
+            try:
+                time.sleep(1.5)
+                self.assertEqual(first, authenticator.get_auth_token())
+            finally:
+                authenticator.close()
+
+        self.assertGreaterEqual(server.hits[TOKEN_PATH], 3)
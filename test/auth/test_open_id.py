@@ -0,0 +1,73 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from test.stub_server import StubServer
+from zitadel_client.auth.client_credentials_authenticator import ClientCredentialsAuthenticator
+from zitadel_client.auth.open_id import OpenId
+from zitadel_client.transport_options import TransportOptions
+
+DISCOVERY_PATH = "/.well-known/openid-configuration"
+
+
+class OpenIdTest(unittest.TestCase):
+    def test_construction_does_no_network_io(self) -> None:
+        with StubServer() as server:
+            server.oauth()
+            ClientCredentialsAuthenticator.builder(server.url, "client", "secret").build()
+
+        self.assertEqual(0, server.hits[DISCOVERY_PATH])
+
+    def test_discovery_is_shared_between_clients(self) -> None:
+        with StubServer() as server:
+            server.oauth()
+            for client_id in ("first", "second", "third"):
+                ClientCredentialsAuthenticator.builder(server.url, client_id, "secret").build().get_auth_token()
+
+        self.assertEqual(1, server.hits[DISCOVERY_PATH])
+
+    def test_cache_is_keyed_by_transport_options(self) -> None:
+        with StubServer() as server:
+            server.oauth()
+            OpenId(server.url).get_token_endpoint()
+            OpenId(server.url, TransportOptions(default_headers={"X-Tenant": "a"})).get_token_endpoint()
+            OpenId(server.url, TransportOptions(default_headers={"X-Tenant": "a"})).get_token_endpoint()
+
+        self.assertEqual(2, server.hits[DISCOVERY_PATH])
+
+    def test_respects_cache_control(self) -> None:
+        with StubServer() as server:
+            config = {"token_endpoint": server.url + "/oauth/v2/token"}
+            server.json(DISCOVERY_PATH, config, headers={"Cache-Control": "no-store"})
+            OpenId(server.url).get_token_endpoint()
+            OpenId(server.url).get_token_endpoint()
+            self.assertEqual(2, server.hits[DISCOVERY_PATH])
+
+            server.json(DISCOVERY_PATH, config, headers={"Cache-Control": "public, max-age=1"})
+            OpenId(server.url).get_token_endpoint()
+            OpenId(server.url).get_token_endpoint()
+            self.assertEqual(3, server.hits[DISCOVERY_PATH])
+
+            time.sleep(1.1)
+            OpenId(server.url).get_token_endpoint()
+            self.assertEqual(4, server.hits[DISCOVERY_PATH])
+
+    def test_seeded_from_file(self) -> None:
+        with StubServer() as server, tempfile.TemporaryDirectory() as directory:
+            server.oauth()
+            path = os.path.join(directory, "openid-configuration.json")
+            with open(path, "w") as file:
+                json.dump({"token_endpoint": server.url + "/oauth/v2/token"}, file)
+
+            authenticator = ClientCredentialsAuthenticator.builder(server.url, "client", "secret").discovery_file(path).build()
+            self.assertEqual("token-1", authenticator.get_auth_token())
+
+        self.assertEqual(0, server.hits[DISCOVERY_PATH])
+
+    def test_missing_token_endpoint_fails(self) -> None:
+        with StubServer() as server:
+            server.json(DISCOVERY_PATH, {"issuer": server.url})
+            with self.assertRaisesRegex(Exception, "token_endpoint not found"):
+                OpenId(server.url).get_token_endpoint()
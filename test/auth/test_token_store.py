@@ -0,0 +1,83 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from test.stub_server import StubServer
+from zitadel_client.auth.authenticator import Token
+from zitadel_client.auth.client_credentials_authenticator import ClientCredentialsAuthenticator
+from zitadel_client.auth.file_token_store import FileTokenStore
+from zitadel_client.auth.token_store import InMemoryTokenStore
+
+TOKEN_PATH = "/oauth/v2/token"  # noqa: S105
+WORKERS = 8
+
+
+def _fetch_token(authenticator: ClientCredentialsAuthenticator, barrier: Any, queue: Any) -> None:
+    barrier.wait()
+    queue.put(authenticator.get_auth_token())
+
+
+class FileTokenStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def test_round_trip(self) -> None:
+        store = FileTokenStore(self.directory.name)
+        self.assertIsNone(store.get("key"))
+
+        expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        with store.lock("key"):
+            store.put("key", Token("access", expires_at))
+
+        token = FileTokenStore(self.directory.name).get("key")
+        assert token is not None
+        self.assertEqual("access", token.access_token)
+        self.assertAlmostEqual(expires_at.timestamp(), token.expires_at.timestamp(), places=3)
+
+    def test_rejects_oversized_token(self) -> None:
+        store = FileTokenStore(self.directory.name)
+        with self.assertRaises(ValueError):
+            store.put("key", Token("x" * FileTokenStore.SLOT_SIZE, datetime.now(timezone.utc)))
+
+    @unittest.skipUnless(hasattr(os, "fork"), "requires os.fork()")
+    def test_forked_workers_fetch_one_token(self) -> None:
+        with StubServer() as server:
+            server.oauth()
+            authenticator = (
+                ClientCredentialsAuthenticator.builder(server.url, "client", "secret")
+                .token_store(FileTokenStore(self.directory.name))
+                .build()
+            )
+
+            context = multiprocessing.get_context("fork")
+            barrier = context.Barrier(WORKERS)
+            queue = context.Queue()
+            workers = [context.Process(target=_fetch_token, args=(authenticator, barrier, queue)) for _ in range(WORKERS)]
+            for worker in workers:
+                worker.start()
+            tokens = [queue.get(timeout=30) for _ in workers]
+            for worker in workers:
+                worker.join(timeout=30)
+
+        self.assertEqual(1, server.hits[TOKEN_PATH])
+        self.assertEqual({"token-1"}, set(tokens))
+        self.assertTrue(all(worker.exitcode == 0 for worker in workers))
+
+
+class InMemoryTokenStoreTest(unittest.TestCase):
+    def test_authenticators_share_tokens(self) -> None:
+        store = InMemoryTokenStore()
+        with StubServer() as server:
+            server.oauth()
+            first = ClientCredentialsAuthenticator.builder(server.url, "client", "secret").token_store(store).build()
+            second = ClientCredentialsAuthenticator.builder(server.url, "client", "secret").token_store(store).build()
+            other = ClientCredentialsAuthenticator.builder(server.url, "other", "secret").token_store(store).build()
+
+            self.assertEqual(first.get_auth_token(), second.get_auth_token())
+            self.assertNotEqual(first.get_auth_token(), other.get_auth_token())
+
+        self.assertEqual(2, server.hits[TOKEN_PATH])
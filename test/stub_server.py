@@ -0,0 +1,227 @@
+import json
+import socketserver
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, List, Mapping, Optional, Type
+
+
+@dataclass
+class StubRequest:
+    """A request received by the stub server."""
+
+    method: str
+    path: str
+    headers: Mapping[str, str]
+    body: bytes
+
+    def json(self) -> Any:
+        return json.loads(self.body.decode("utf-8"))
+
+
+@dataclass
+class StubResponse:
+    """A canned response returned by the stub server."""
+
+    status: int = 200
+    body: Any = None
+    headers: Dict[str, str] = field(default_factory=dict)
+    delay: float = 0.0
+
+    def encode(self) -> bytes:
+        if self.body is None:
+            return b""
+        if isinstance(self.body, bytes):
+            return self.body
+        return json.dumps(self.body).encode("utf-8")
+
+
+Handler = Callable[[StubRequest], StubResponse]
+
+
+class StubServer:
+    """
+    A minimal threaded HTTP server used to exercise the SDK without containers.
+
+    Routes map a path to a handler that builds a response for each request, and
+    every request is recorded so that tests can count hits per path. Accepted
+    connections are counted as well, to check connection reuse.
+    """
+
+    def __init__(self) -> None:
+        self.routes: Dict[str, Handler] = {}
+        self.requests: List[StubRequest] = []
+        self.hits: Counter = Counter()
+        self.connections = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class(), bind_and_activate=False)
+        self._server.daemon_threads = True
+        # accept bursts of connections from many threads, rather than resetting them
+        self._server.request_queue_size = 256
+        self._server.server_bind()
+        self._server.server_activate()
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "StubServer":
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def route(self, path: str, handler: Handler) -> None:
+        self.routes[path] = handler
+
+    def json(self, path: str, body: Any, status: int = 200, headers: Optional[Dict[str, str]] = None) -> None:
+        response = StubResponse(status, body, {"Content-Type": "application/json", **(headers or {})})
+        self.route(path, lambda _: response)
+
+    def oauth(self, expires_in: int = 3600, delay: float = 0.0) -> None:
+        """Installs an OpenID discovery document and a token endpoint issuing unique tokens."""
+        self.json("/.well-known/openid-configuration", {"token_endpoint": self.url + "/oauth/v2/token"})
+
+        def token(_: StubRequest) -> StubResponse:
+            body = {
+                "access_token": f"token-{self.hits['/oauth/v2/token']}",
+                "token_type": "Bearer",
+                "expires_in": expires_in,
+            }
+            return StubResponse(200, body, {"Content-Type": "application/json"}, delay)
+
+        self.route("/oauth/v2/token", token)
+
+    def _dispatch(self, request: StubRequest) -> StubResponse:
+        with self._lock:
+            self.requests.append(request)
+            self.hits[request.path] += 1
+        handler = self.routes.get(request.path)
+        if handler is None:
+            return StubResponse(404, {"code": 5, "message": "not found"}, {"Content-Type": "application/json"})
+        return handler(request)
+
+    def _handler_class(self) -> Type[socketserver.BaseRequestHandler]:
+        stub = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def setup(self) -> None:
+                super().setup()
+                with stub._lock:
+                    stub.connections += 1
+
+            def _handle(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                request = StubRequest(self.command, self.path.split("?")[0], dict(self.headers), self.rfile.read(length))
+                response = stub._dispatch(request)
+                if response.delay:
+                    time.sleep(response.delay)
+                payload = response.encode()
+                self.send_response(response.status)
+                for name, value in response.headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = _handle  # noqa: N815
+            do_POST = _handle  # noqa: N815
+
+            def log_message(self, *args: Any) -> None:
+                pass
+
+        return _Handler
+
+
+class H2StubServer(StubServer):
+    """
+    A StubServer speaking HTTP/2 over plain TCP (h2c with prior knowledge), requiring h2.
+
+    The streams of a connection are answered concurrently, each on its own thread, so that
+    tests can check that requests are multiplexed rather than queued on the connection.
+    """
+
+    def _handler_class(self) -> Type[socketserver.BaseRequestHandler]:  # noqa C901 too complex
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+        from h2.events import ConnectionTerminated, DataReceived, RequestReceived, StreamEnded
+        from h2.exceptions import StreamClosedError
+
+        stub = self
+
+        class _Handler(socketserver.BaseRequestHandler):
+            def setup(self) -> None:
+                with stub._lock:
+                    stub.connections += 1
+                self.connection = H2Connection(H2Configuration(client_side=False, header_encoding="utf-8"))
+                self.changed = threading.Condition()
+                self.streams: Dict[int, Any] = {}
+                self.closed = False
+
+            def handle(self) -> None:
+                with self.changed:
+                    self.connection.initiate_connection()
+                    self.request.sendall(self.connection.data_to_send())
+                try:
+                    self._receive()
+                finally:
+                    with self.changed:
+                        self.closed = True
+                        self.changed.notify_all()
+
+            def _receive(self) -> None:
+                while data := self.request.recv(65536):
+                    with self.changed:
+                        events = self.connection.receive_data(data)
+                        self.request.sendall(self.connection.data_to_send())
+                        self.changed.notify_all()
+                    for event in events:
+                        if isinstance(event, RequestReceived):
+                            self.streams[event.stream_id] = (dict(event.headers), bytearray())
+                        elif isinstance(event, DataReceived):
+                            self.streams[event.stream_id][1].extend(event.data)
+                            with self.changed:
+                                self.connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                                self.request.sendall(self.connection.data_to_send())
+                        elif isinstance(event, StreamEnded):
+                            headers, body = self.streams.pop(event.stream_id)
+                            threading.Thread(target=self._respond, args=(event.stream_id, headers, body), daemon=True).start()
+                        elif isinstance(event, ConnectionTerminated):
+                            return
+
+            def _respond(self, stream_id: int, headers: Dict[str, str], body: bytes) -> None:
+                request = StubRequest(headers[":method"], headers[":path"].split("?")[0], headers, bytes(body))
+                response = stub._dispatch(request)
+                if response.delay:
+                    time.sleep(response.delay)
+                payload = memoryview(response.encode())
+                response_headers = [(":status", str(response.status)), ("content-length", str(len(payload)))]
+                response_headers += [(name.lower(), value) for name, value in response.headers.items()]
+                try:
+                    with self.changed:
+                        self.connection.send_headers(stream_id, response_headers, end_stream=not payload)
+                        self.request.sendall(self.connection.data_to_send())
+                        while payload:
+                            # wait until the client lets more of the body be sent
+                            self.changed.wait_for(lambda: self.closed or self._window(stream_id) > 0)
+                            if self.closed:
+                                return
+                            size = min(self._window(stream_id), self.connection.max_outbound_frame_size, len(payload))
+                            self.connection.send_data(stream_id, payload[:size].tobytes(), end_stream=size == len(payload))
+                            self.request.sendall(self.connection.data_to_send())
+                            payload = payload[size:]
+                except (StreamClosedError, OSError):
+                    pass  # the client reset the stream or closed the connection
+
+            def _window(self, stream_id: int) -> int:
+                return self.connection.local_flow_control_window(stream_id)
+
+        return _Handler
@@ -0,0 +1,67 @@
+import asyncio
+import inspect
+import unittest
+
+from test.stub_server import StubServer
+from zitadel_client import ApiError, Configuration
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.auth.client_credentials_authenticator import ClientCredentialsAuthenticator
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.models import SessionServiceGetSessionRequest, SessionServiceGetSessionResponse
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+
+
+class AsyncZitadelTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.server.json(GET_SESSION, {"session": {"id": "session-1", "sequence": "3"}})
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    async def test_service_methods_are_awaitable(self) -> None:
+        async with AsyncZitadel.with_access_token(self.server.url, "token") as zitadel:
+            self.assertTrue(inspect.iscoroutinefunction(zitadel.sessions.get_session))
+            response = await zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertIsInstance(response, SessionServiceGetSessionResponse)
+        assert response.session is not None
+        self.assertEqual("session-1", response.session.id)
+        request = self.server.requests[0]
+        self.assertEqual("Bearer token", request.headers["Authorization"])
+        self.assertEqual({"sessionId": "session-1"}, request.json())
+
+    async def test_arguments_are_validated(self) -> None:
+        async with AsyncZitadel.with_access_token(self.server.url, "token") as zitadel:
+            with self.assertRaises(ValueError):
+                await zitadel.sessions.get_session(42)
+
+    async def test_error_responses_raise_api_error(self) -> None:
+        async with AsyncZitadel.with_access_token(self.server.url, "token") as zitadel:
+            with self.assertRaises(ApiError) as context:
+                await zitadel.users.get_user_by_id({"userId": "missing"})
+
+        self.assertEqual(404, context.exception.code)
+        self.assertEqual({"code": 5, "message": "not found"}, context.exception.response_body)
+
+    async def test_concurrent_requests_share_a_bounded_pool(self) -> None:
+        def mutate_config(config: Configuration) -> None:
+            config.connection_pool_maxsize = 4
+
+        authenticator = PersonalAccessTokenAuthenticator(self.server.url, "token")
+        async with AsyncZitadel(authenticator, mutate_config=mutate_config) as zitadel:
+            responses = await asyncio.gather(*[zitadel.sessions.get_session({"sessionId": f"session-{i}"}) for i in range(200)])
+
+        self.assertEqual(200, len(responses))
+        self.assertEqual(200, self.server.hits[GET_SESSION])
+
+    async def test_token_is_refreshed_once_for_concurrent_callers(self) -> None:
+        self.server.oauth(delay=0.2)
+        authenticator = ClientCredentialsAuthenticator.builder(self.server.url, "client", "secret").build()
+
+        async with AsyncZitadel(authenticator) as zitadel:
+            await asyncio.gather(*[zitadel.sessions.get_session({"sessionId": "session-1"}) for _ in range(20)])
+
+        self.assertEqual(1, self.server.hits["/oauth/v2/token"])
+        self.assertEqual("Bearer token-1", self.server.requests[-1].headers["Authorization"])
@@ -0,0 +1,163 @@
+import unittest
+from typing import List, Optional, Tuple
+
+from test.stub_server import StubResponse, StubServer
+from test.test_rate_limit import FakeClock
+from zitadel_client import ApiError, CircuitOpenError, Configuration, Zitadel
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.circuit_breaker import Circuit, CircuitBreaker
+from zitadel_client.models import SessionServiceGetSessionRequest, SettingsServiceGetLoginSettingsRequest
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+GET_LOGIN_SETTINGS = "/zitadel.settings.v2.SettingsService/GetLoginSettings"
+URL = "https://api.example.com" + GET_SESSION
+
+
+class CircuitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.clock = FakeClock()
+        self.transitions: List[Tuple[str, str, str]] = []
+        self.breaker = CircuitBreaker(
+            window_size=4,
+            minimum_calls=4,
+            slow_call_duration=1.0,
+            open_duration=10.0,
+            half_open_calls=2,
+            on_state_change=lambda *transition: self.transitions.append(transition),
+            clock=self.clock,
+        )
+        self.circuit = self.breaker.circuit(URL)
+
+    def _calls(self, *outcomes: Tuple[Optional[int], float]) -> None:
+        for status, duration in outcomes:
+            self.circuit.acquire()
+            self.circuit.record(status, duration)
+
+    def test_keyed_by_host_and_service(self) -> None:
+        self.assertEqual("api.example.com/zitadel.session.v2.SessionService", self.circuit.key)
+        self.assertIs(
+            self.circuit, self.breaker.circuit("https://api.example.com/zitadel.session.v2.SessionService/ListSessions")
+        )
+        self.assertIsNot(self.circuit, self.breaker.circuit("https://api.example.com" + GET_LOGIN_SETTINGS))
+        self.assertIsNot(self.circuit, self.breaker.circuit("https://other.example.com" + GET_SESSION))
+
+    def test_opens_on_failure_rate(self) -> None:
+        self._calls((200, 0.1), (503, 0.1), (200, 0.1))
+        self.assertEqual(Circuit.CLOSED, self.circuit.state)
+
+        self._calls((500, 0.1))
+
+        self.assertEqual(Circuit.OPEN, self.circuit.state)
+        with self.assertRaises(CircuitOpenError) as context:
+            self.circuit.acquire()
+        self.assertEqual(10.0, context.exception.retry_after)
+        self.assertEqual([(self.circuit.key, Circuit.CLOSED, Circuit.OPEN)], self.transitions)
+
+    def test_opens_on_slow_calls(self) -> None:
+        self._calls((200, 1.5), (200, 2.0), (200, 1.0))
+        self.assertEqual(Circuit.CLOSED, self.circuit.state)
+
+        self._calls((200, 1.0))
+
+        self.assertEqual(Circuit.OPEN, self.circuit.state)
+
+    def test_client_errors_are_not_failures(self) -> None:
+        self._calls((404, 0.1), (400, 0.1), (429, 0.1), (404, 0.1))
+
+        self.assertEqual(Circuit.CLOSED, self.circuit.state)
+
+    def test_closes_after_probes_succeed(self) -> None:
+        self._calls(*[(503, 0.1)] * 4)
+        self.clock.now = 10.0
+
+        self.circuit.acquire()
+        self.circuit.acquire()
+        with self.assertRaises(CircuitOpenError):
+            self.circuit.acquire()
+        self.circuit.record(200, 0.1)
+        self.circuit.record(200, 0.1)
+
+        self.assertEqual(Circuit.CLOSED, self.circuit.state)
+        self.assertEqual([Circuit.OPEN, Circuit.HALF_OPEN, Circuit.CLOSED], [new for _, _, new in self.transitions])
+
+    def test_reopens_when_a_probe_fails(self) -> None:
+        self._calls(*[(503, 0.1)] * 4)
+        self.clock.now = 10.0
+
+        self._calls((200, 0.1), (None, 0.1))
+
+        self.assertEqual(Circuit.OPEN, self.circuit.state)
+        self.assertEqual({self.circuit.key: Circuit.OPEN}, self.breaker.states())
+
+    def test_released_probes_can_be_retaken(self) -> None:
+        self._calls(*[(503, 0.1)] * 4)
+        self.clock.now = 10.0
+
+        self.circuit.acquire()
+        self.circuit.acquire()
+        self.circuit.release()
+
+        self.circuit.acquire()
+
+
+class RESTClientCircuitBreakerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.server.json(GET_SESSION, {"code": 14, "message": "unavailable"}, status=503)
+        self.server.json(GET_LOGIN_SETTINGS, {"settings": {}})
+        self.breaker = CircuitBreaker(window_size=3, minimum_calls=3, slow_call_duration=0.2)
+
+        def mutate_config(config: Configuration) -> None:
+            config.circuit_breaker = self.breaker
+
+        self.zitadel = Zitadel(PersonalAccessTokenAuthenticator(self.server.url, "token"), mutate_config)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def _get_session(self) -> None:
+        self.zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+    def test_fails_fast_once_open(self) -> None:
+        for _ in range(3):
+            with self.assertRaises(ApiError):
+                self._get_session()
+
+        with self.assertRaises(CircuitOpenError):
+            self._get_session()
+
+        self.assertEqual(3, self.server.hits[GET_SESSION])
+        # other services of the same host are not affected
+        self.zitadel.settings.get_login_settings(SettingsServiceGetLoginSettingsRequest())
+
+    def test_opens_on_slow_calls(self) -> None:
+        self.server.route(GET_LOGIN_SETTINGS, lambda _: StubResponse(200, {}, {"Content-Type": "application/json"}, 0.25))
+
+        for _ in range(3):
+            self.zitadel.settings.get_login_settings(SettingsServiceGetLoginSettingsRequest())
+
+        with self.assertRaises(CircuitOpenError):
+            self.zitadel.settings.get_login_settings(SettingsServiceGetLoginSettingsRequest())
+
+
+class AsyncCircuitBreakerTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.server.json(GET_SESSION, {"code": 14, "message": "unavailable"}, status=503)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    async def test_fails_fast_once_open(self) -> None:
+        def mutate_config(config: Configuration) -> None:
+            config.circuit_breaker = CircuitBreaker(window_size=2, minimum_calls=2)
+
+        async with AsyncZitadel(PersonalAccessTokenAuthenticator(self.server.url, "token"), mutate_config) as zitadel:
+            for _ in range(2):
+                with self.assertRaises(ApiError):
+                    await zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+            with self.assertRaises(CircuitOpenError):
+                await zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertEqual(2, self.server.hits[GET_SESSION])
@@ -0,0 +1,147 @@
+import importlib.util
+import unittest
+from typing import Any, Dict
+
+import urllib3
+
+from test.timing import best_of
+from zitadel_client import ApiClient, Configuration
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.codec import JsonCodec, MsgspecCodec, OrjsonCodec, StdlibJsonCodec
+from zitadel_client.exceptions import ApiError
+from zitadel_client.rest_response import RESTResponse
+
+CODECS = [StdlibJsonCodec]
+if importlib.util.find_spec("orjson"):
+    CODECS.append(OrjsonCodec)
+if importlib.util.find_spec("msgspec"):
+    CODECS.append(MsgspecCodec)
+
+
+def _list_users(count: int) -> Dict[str, Any]:
+    users = [
+        {
+            "userId": str(i),
+            "username": f"user-{i}@example.com",
+            "state": "USER_STATE_ACTIVE",
+            "loginNames": [f"user-{i}@example.com"],
+            "human": {
+                "profile": {"givenName": "Jöhn", "familyName": f"Doe {i}", "displayName": "Jöhn Doe"},
+                "email": {"email": f"user-{i}@example.com", "isVerified": True},
+                "passwordChanged": "2025-01-01T00:00:00Z",
+            },
+            "details": {"sequence": str(i), "changeDate": "2025-01-01T00:00:00.123456Z", "resourceOwner": "org"},
+        }
+        for i in range(count)
+    ]
+    return {"details": {"totalResult": str(count), "timestamp": "2025-01-01T00:00:00Z"}, "result": users}
+
+
+def _list_sessions(count: int) -> Dict[str, Any]:
+    sessions = [
+        {
+            "id": str(i),
+            "creationDate": "2025-01-01T00:00:00Z",
+            "changeDate": "2025-01-01T00:00:00Z",
+            "sequence": str(i),
+            "factors": {"user": {"id": str(i), "loginName": f"user-{i}", "organizationId": "org"}},
+            "metadata": {"key": "dmFsdWU="},
+            "userAgent": {"ip": "127.0.0.1", "description": "Firefox", "header": {"Accept": {"values": ["*/*"]}}},
+        }
+        for i in range(count)
+    ]
+    return {"details": {"totalResult": str(count)}, "sessions": sessions}
+
+
+def _rest_response(status: int, data: bytes, content_type: str = "application/json") -> RESTResponse:
+    response = RESTResponse(urllib3.HTTPResponse(body=data, headers={"Content-Type": content_type}, status=status))
+    response.read()
+    return response
+
+
+def _api_client(codec: JsonCodec) -> ApiClient:
+    configuration = Configuration(NoAuthAuthenticator())
+    configuration.json_codec = codec
+    return ApiClient(configuration)
+
+
+class JsonCodecTest(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        document = {"a": [1, 2.5, True, None], "b": "Jöhn ☃", "c": {"d": {}}}
+        for codec_class in CODECS:
+            with self.subTest(codec=codec_class.name):
+                codec = codec_class()
+                encoded = codec.dumps(document)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(document, codec.loads(encoded))
+                self.assertEqual(document, codec.loads(encoded.decode("utf-8")))
+
+    def test_malformed_input_raises_value_error(self) -> None:
+        for codec_class in CODECS:
+            with self.subTest(codec=codec_class.name), self.assertRaises(ValueError):
+                codec_class().loads(b"{")
+
+    def test_default_prefers_installed_backend(self) -> None:
+        self.assertIs(CODECS[1] if len(CODECS) > 1 else StdlibJsonCodec, type(JsonCodec.default()))
+
+    def test_configuration_selects_codec(self) -> None:
+        configuration = Configuration(NoAuthAuthenticator())
+        configuration.json_codec = StdlibJsonCodec()
+
+        self.assertIs(configuration.json_codec, ApiClient(configuration).rest_client.codec)
+
+    def test_deserializes_bytes_and_text_alike(self) -> None:
+        body = _list_users(3)
+        for codec_class in CODECS:
+            with self.subTest(codec=codec_class.name):
+                client = _api_client(codec_class())
+                data = StdlibJsonCodec().dumps(body)
+                from_bytes = client.response_deserialize(_rest_response(200, data), {"200": "UserServiceListUsersResponse"}).data
+                from_text = client.deserialize(data.decode("utf-8"), "UserServiceListUsersResponse", "application/json")
+                self.assertEqual(from_text, from_bytes)
+                self.assertEqual("Jöhn", from_bytes.result[0].human.profile.given_name)
+
+    def test_decodes_other_charsets(self) -> None:
+        client = _api_client(JsonCodec.default())
+        data = '{"userId": "Jöhn"}'.encode("latin-1")
+
+        response = client.response_deserialize(
+            _rest_response(200, data, "application/json; charset=latin-1"), {"200": "UserServiceUser"}
+        )
+
+        self.assertEqual("Jöhn", response.data.user_id)
+
+    def test_decodes_error_body(self) -> None:
+        for codec_class in CODECS:
+            with self.subTest(codec=codec_class.name):
+                client = _api_client(codec_class())
+                with self.assertRaises(ApiError) as context:
+                    client.response_deserialize(_rest_response(404, b'{"code": 5}'), {"200": "UserServiceUser"})
+                self.assertEqual({"code": 5}, context.exception.response_body)
+
+                with self.assertRaises(ApiError) as context:
+                    client.response_deserialize(_rest_response(500, b"{oops"), {"200": "UserServiceUser"})
+                self.assertEqual("{oops", context.exception.response_body)
+
+
+@unittest.skipUnless(len(CODECS) > 1, "no fast JSON backend installed")
+class JsonCodecBenchmark(unittest.TestCase):
+    """
+    Compares the fastest installed codec with the stdlib on large list payloads.
+    """
+
+    def _assert_faster(self, payload: Dict[str, Any]) -> None:
+        stdlib, fast = StdlibJsonCodec(), JsonCodec.default()
+        data = stdlib.dumps(payload)
+
+        self.assertEqual(stdlib.loads(data), fast.loads(data))
+        fast_decode, stdlib_decode = best_of(lambda: fast.loads(data), lambda: stdlib.loads(data), number=5)
+        self.assertLess(fast_decode, stdlib_decode)
+        fast_encode, stdlib_encode = best_of(lambda: fast.dumps(payload), lambda: stdlib.dumps(payload), number=5)
+        self.assertLess(fast_encode, stdlib_encode)
+
+    def test_list_users(self) -> None:
+        self._assert_faster(_list_users(5000))
+
+    def test_list_sessions(self) -> None:
+        self._assert_faster(_list_sessions(5000))
@@ -0,0 +1,87 @@
+import datetime
+import unittest
+from typing import List
+
+from dateutil.parser import parse
+
+from test.timing import best_of
+from zitadel_client import ApiClient, Configuration
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.models import UserServiceDetails
+from zitadel_client.utils.datetime_util import DateTimeUtil
+
+TIMESTAMPS = [
+    "2025-01-02T03:04:05Z",
+    "2025-01-02T03:04:05.1Z",
+    "2025-01-02T03:04:05.123Z",
+    "2025-01-02T03:04:05.123456Z",
+    "2025-01-02T03:04:05.123456789Z",
+    "2025-01-02T03:04:05.000000001z",
+    "2025-01-02t03:04:05+02:00",
+    "2025-01-02 03:04:05.5-05:30",
+]
+
+
+def _timestamps(count: int) -> List[str]:
+    """Returns the changeDate, creationDate and passwordChanged timestamps of `count` users, all distinct."""
+    start = datetime.datetime(2025, 1, 1, tzinfo=datetime.timezone.utc)
+    return [
+        (start + datetime.timedelta(seconds=i, microseconds=offset)).isoformat(timespec="microseconds").replace("+00:00", "Z")
+        for i in range(count)
+        for offset in (1, 2, 3)
+    ]
+
+
+class DateTimeUtilTest(unittest.TestCase):
+    def test_matches_dateutil(self) -> None:
+        for value in TIMESTAMPS:
+            with self.subTest(value=value):
+                self.assertEqual(parse(value), DateTimeUtil.parse_datetime(value))
+
+    def test_matches_model_fields(self) -> None:
+        for value in TIMESTAMPS:
+            with self.subTest(value=value):
+                details = UserServiceDetails.model_validate({"changeDate": value})
+                self.assertEqual(details.change_date, DateTimeUtil.parse_datetime(value))
+
+    def test_falls_back_to_dateutil(self) -> None:
+        self.assertEqual(datetime.datetime(2025, 1, 2, 3, 4), DateTimeUtil.parse_datetime("Jan 2 2025 03:04"))
+        self.assertEqual(datetime.date(2025, 1, 2), DateTimeUtil.parse_date("2 January 2025"))
+
+    def test_rejects_invalid_values(self) -> None:
+        for value in ("2025-13-02T03:04:05Z", "yesterday"):
+            with self.subTest(value=value), self.assertRaises(ValueError):
+                DateTimeUtil.parse_datetime(value)
+
+    def test_api_client(self) -> None:
+        client = ApiClient(Configuration(NoAuthAuthenticator()))
+
+        self.assertEqual(
+            datetime.datetime(2025, 1, 2, 3, 4, 5, 123456, tzinfo=datetime.timezone.utc),
+            client.deserialize('"2025-01-02T03:04:05.123456789Z"', "datetime", "application/json"),
+        )
+        self.assertEqual(datetime.date(2025, 1, 2), client.deserialize('"2025-01-02"', "date", "application/json"))
+        with self.assertRaises(RuntimeError):
+            client.deserialize('"2025-01-32"', "date", "application/json")
+
+
+class DateTimeUtilBenchmark(unittest.TestCase):
+    """
+    Compares parsing the timestamps of 10,000 users with dateutil.
+    """
+
+    def test_users(self) -> None:
+        values = _timestamps(10000)
+
+        def fast() -> None:
+            DateTimeUtil.parse_datetime.cache_clear()
+            for value in values:
+                DateTimeUtil.parse_datetime(value)
+
+        def generic() -> None:
+            for value in values:
+                parse(value)
+
+        fast_time, generic_time = best_of(fast, generic, number=1, rounds=3)
+
+        self.assertLess(fast_time * 5, generic_time)
@@ -0,0 +1,80 @@
+import datetime
+import unittest
+
+from test.timing import best_of
+from zitadel_client import ApiClient, Configuration, Zitadel
+from zitadel_client.api import SessionServiceApi, UserServiceApi
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.models import UserServiceType, UserServiceUser
+
+_decoder = ApiClient._ApiClient__decoder  # ty: ignore[unresolved-attribute]
+
+
+class DecoderCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = ApiClient(Configuration(NoAuthAuthenticator()))
+
+    def test_decodes_nested_containers(self) -> None:
+        data = self.client.deserialize(
+            '{"a": ["2025-01-02T03:04:05Z", null], "b": []}', "Dict[str, List[datetime]]", "application/json"
+        )
+
+        self.assertEqual({"a": [datetime.datetime(2025, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc), None], "b": []}, data)
+
+    def test_decodes_container_items(self) -> None:
+        users = self.client.deserialize('[{"userId": "1"}, {"userId": "2"}]', "List[UserServiceUser]", "application/json")
+        types = self.client.deserialize('{"a": "TYPE_HUMAN"}', "Dict[str, UserServiceType]", "application/json")
+
+        self.assertEqual([UserServiceUser(userId="1"), UserServiceUser(userId="2")], users)
+        self.assertEqual({"a": UserServiceType.TYPE_HUMAN}, types)
+
+    def test_resolves_each_type_once(self) -> None:
+        self.assertIs(_decoder("List[Dict[str, int]]"), _decoder("List[Dict[str, int]]"))
+
+    def test_rejects_unknown_types(self) -> None:
+        with self.assertRaises(AttributeError):
+            _decoder("List[NoSuchModel]")
+
+    def test_warm_up(self) -> None:
+        _decoder.cache_clear()
+
+        self.client.warm_up(UserServiceApi(self.client), SessionServiceApi)
+
+        before = _decoder.cache_info()
+        _decoder("UserServiceListUsersResponse")
+        _decoder("SessionServiceCreateSessionResponse")
+        after = _decoder.cache_info()
+        self.assertEqual(before.misses, after.misses)
+        self.assertEqual(before.hits + 2, after.hits)
+
+    def test_zitadel_warm_up(self) -> None:
+        _decoder.cache_clear()
+
+        Zitadel(NoAuthAuthenticator()).warm_up("users")
+
+        before = _decoder.cache_info()
+        _decoder("UserServiceListUsersResponse")
+        self.assertEqual(before.misses, _decoder.cache_info().misses)
+
+
+class DecoderCacheBenchmark(unittest.TestCase):
+    """
+    Compares decoding 10,000 small responses with resolving their type on each call.
+    """
+
+    def test_small_responses(self) -> None:
+        decoder = _decoder("Dict[str, UserServiceType]")
+        data = {"a": "TYPE_HUMAN"}
+
+        def cached() -> None:
+            for _ in range(10000):
+                decoder(data)
+
+        def uncached() -> None:
+            for _ in range(10000):
+                _decoder.cache_clear()
+                _decoder("Dict[str, UserServiceType]")(data)
+
+        cached_time, uncached_time = best_of(cached, uncached, number=1, rounds=3)
+
+        self.assertLess(cached_time * 2, uncached_time)
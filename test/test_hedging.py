@@ -0,0 +1,132 @@
+import time
+import unittest
+
+from test.stub_server import Handler, StubRequest, StubResponse, StubServer
+from zitadel_client import Configuration, HedgingPolicy, Zitadel
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.hedging import LatencyTracker
+from zitadel_client.models import SessionServiceGetSessionRequest, UserServiceAddHumanUserRequest
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+ADD_HUMAN_USER = "/zitadel.user.v2.UserService/AddHumanUser"
+
+
+def _slow_first(delay: float) -> Handler:
+    """Returns a handler delaying its first response by `delay` seconds, and answering the others at once."""
+    calls = []
+
+    def handler(_: StubRequest) -> StubResponse:
+        calls.append(None)
+        body = {"session": {"id": f"session-{len(calls)}"}}
+        return StubResponse(200, body, {"Content-Type": "application/json"}, delay if len(calls) == 1 else 0.0)
+
+    return handler
+
+
+class HedgingPolicyTest(unittest.TestCase):
+    def test_percentiles(self) -> None:
+        tracker = LatencyTracker(window=100)
+        for latency in range(1, 201):
+            tracker.record(GET_SESSION, latency / 1000)
+
+        self.assertEqual(0.195, tracker.percentile(GET_SESSION, 95))
+        self.assertEqual(0.101, tracker.percentile(GET_SESSION, 0))
+        self.assertEqual(0.2, tracker.percentile(GET_SESSION, 100))
+        self.assertIsNone(tracker.percentile(GET_SESSION, 95, min_samples=101))
+        self.assertIsNone(tracker.percentile(ADD_HUMAN_USER, 95))
+
+    def test_delay_follows_latencies(self) -> None:
+        policy = HedgingPolicy(percentile=90, min_samples=10)
+        url = "https://example.com" + GET_SESSION
+
+        self.assertIsNone(policy.delay(url))
+        for latency in range(1, 11):
+            policy.record(url, latency / 100)
+        self.assertEqual(0.09, policy.delay(url))
+        self.assertEqual(0.5, HedgingPolicy(delay=0.5).delay(url))
+
+    def test_hedges_reads_only(self) -> None:
+        policy = HedgingPolicy()
+        selective = HedgingPolicy(endpoints={"GetLoginSettings", GET_SESSION})
+
+        self.assertTrue(policy.should_hedge("POST", GET_SESSION))
+        self.assertFalse(policy.should_hedge("POST", ADD_HUMAN_USER))
+        self.assertTrue(selective.should_hedge("POST", GET_SESSION))
+        self.assertTrue(selective.should_hedge("POST", "/zitadel.settings.v2.SettingsService/GetLoginSettings"))
+        self.assertFalse(selective.should_hedge("POST", "/zitadel.user.v2.UserService/GetUserByID"))
+        self.assertFalse(HedgingPolicy(endpoints={"AddHumanUser"}).should_hedge("POST", ADD_HUMAN_USER))
+
+
+class HedgedRequestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def _zitadel(self, policy: HedgingPolicy) -> Zitadel:
+        def mutate_config(config: Configuration) -> None:
+            config.hedging_policy = policy
+
+        return Zitadel(PersonalAccessTokenAuthenticator(self.server.url, "token"), mutate_config)
+
+    def test_first_response_wins(self) -> None:
+        self.server.route(GET_SESSION, _slow_first(1.0))
+        zitadel = self._zitadel(HedgingPolicy(delay=0.05))
+
+        start = time.monotonic()
+        response = zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertLess(time.monotonic() - start, 0.5)
+        self.assertEqual("session-2", response.session.id)
+        self.assertEqual(2, self.server.hits[GET_SESSION])
+
+    def test_fast_responses_are_not_hedged(self) -> None:
+        self.server.route(GET_SESSION, _slow_first(0.0))
+        zitadel = self._zitadel(HedgingPolicy(delay=0.5))
+
+        for _ in range(5):
+            zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertEqual(5, self.server.hits[GET_SESSION])
+
+    def test_extra_load_is_capped(self) -> None:
+        policy = HedgingPolicy(delay=0.01, max_extra_load=0.0)
+        self.server.route(GET_SESSION, lambda _: StubResponse(200, {}, {"Content-Type": "application/json"}, 0.05))
+        zitadel = self._zitadel(policy)
+
+        for _ in range(3):
+            zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        # only the initial reserve allows a hedge
+        self.assertEqual(3 + 1, self.server.hits[GET_SESSION])
+
+    def test_mutations_are_not_hedged(self) -> None:
+        self.server.route(ADD_HUMAN_USER, lambda _: StubResponse(200, {}, {"Content-Type": "application/json"}, 0.1))
+        zitadel = self._zitadel(HedgingPolicy(delay=0.01))
+
+        zitadel.users.add_human_user(UserServiceAddHumanUserRequest())
+
+        self.assertEqual(1, self.server.hits[ADD_HUMAN_USER])
+
+
+class AsyncHedgedRequestTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    async def test_first_response_wins(self) -> None:
+        self.server.route(GET_SESSION, _slow_first(1.0))
+
+        def mutate_config(config: Configuration) -> None:
+            config.hedging_policy = HedgingPolicy(delay=0.05)
+
+        async with AsyncZitadel(PersonalAccessTokenAuthenticator(self.server.url, "token"), mutate_config) as zitadel:
+            start = time.monotonic()
+            response = await zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+            self.assertLess(time.monotonic() - start, 0.5)
+            self.assertEqual("session-2", response.session.id)
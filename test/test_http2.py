@@ -0,0 +1,116 @@
+import importlib.util
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple, Type
+
+import urllib3
+
+from test.stub_server import H2StubServer, StubResponse, StubServer
+from zitadel_client import ApiError, Configuration, Zitadel
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.models import SessionServiceGetSessionRequest
+from zitadel_client.rest import RESTClientObject
+from zitadel_client.transport import Transport
+from zitadel_client.transport_options import TransportOptions
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+HAS_H2 = importlib.util.find_spec("h2") is not None
+
+
+def _zitadel(server: StubServer, http2: bool) -> Zitadel:
+    def mutate_config(config: Configuration) -> None:
+        config.http2 = http2
+
+    return Zitadel(PersonalAccessTokenAuthenticator(server.url, "token"), mutate_config)
+
+
+@unittest.skipUnless(HAS_H2, "h2 is not installed")
+class Http2TransportTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = H2StubServer().__enter__()
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_calls_share_one_connection(self) -> None:
+        self.server.json(GET_SESSION, {"session": {"id": "session-1"}})
+        options = TransportOptions(default_headers={"X-Test": self.id()}, http2=True)
+        zitadel = Zitadel.with_access_token(self.server.url, "token", transport_options=options)
+
+        for _ in range(3):
+            response = zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertEqual("session-1", response.session.id)
+        self.assertEqual("Bearer token", self.server.requests[0].headers["authorization"])
+        self.assertEqual(3, self.server.hits[GET_SESSION])
+        self.assertEqual(1, self.server.connections)
+
+    def test_error_responses(self) -> None:
+        self.server.json(GET_SESSION, {"code": 5, "message": "not found"}, status=404)
+
+        with self.assertRaises(ApiError) as context:
+            _zitadel(self.server, http2=True).sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertEqual(404, context.exception.code)
+
+    def test_flow_control(self) -> None:
+        large = b"x" * 300_000
+        self.server.route("/large", lambda _: StubResponse(200, large))
+        self.server.route("/echo", lambda request: StubResponse(200, request.body))
+        pool = Transport({"maxsize": 1}, http2=True).api_pool_manager
+
+        # unread bodies are given back to the connection's flow control window when released
+        for _ in range(20):
+            response = pool.request("POST", self.server.url + "/large", preload_content=False)
+            next(response.stream())
+            response.release_conn()
+        self.assertEqual(large, pool.request("POST", self.server.url + "/large").data)
+
+        with ThreadPoolExecutor(10) as executor:
+            echoed = list(executor.map(lambda _: pool.request("POST", self.server.url + "/echo", body=large).data, range(10)))
+        self.assertEqual([large] * 10, echoed)
+        self.assertEqual(1, self.server.connections)
+
+    def test_connection_errors_are_transient(self) -> None:
+        pool = Transport({}, http2=True).api_pool_manager
+
+        with self.assertRaises(RESTClientObject.TRANSIENT_ERRORS):
+            pool.request("POST", "http://127.0.0.1:1" + GET_SESSION, timeout=urllib3.Timeout(connect=1.0, read=1.0))
+
+    def test_enabled_by_transport_options(self) -> None:
+        self.assertNotEqual(hash(TransportOptions()), hash(TransportOptions(http2=True)))
+        self.assertIsNot(Transport.shared(TransportOptions()), Transport.shared(TransportOptions(http2=True)))
+        plain = Transport.from_options(TransportOptions())
+        self.assertIs(plain.pool_manager, plain.api_pool_manager)
+        self.assertIsNot(Transport.from_options(TransportOptions(http2=True)).api_pool_manager, plain.pool_manager)
+
+
+@unittest.skipUnless(HAS_H2, "h2 is not installed")
+class Http2TransportBenchmark(unittest.TestCase):
+    """
+    Compares HTTP/2 with the HTTP/1.1 connection pool under 200 concurrent threads.
+    """
+
+    THREADS = 200
+    CALLS = 1000
+
+    def _run(self, server_class: Type[StubServer], http2: bool) -> Tuple[float, int]:
+        with server_class() as server:
+            server.route(GET_SESSION, lambda _: StubResponse(200, {"session": {}}, {"Content-Type": "application/json"}, 0.01))
+            zitadel = _zitadel(server, http2)
+            request = SessionServiceGetSessionRequest(sessionId="session-1")
+            zitadel.sessions.get_session(request)
+            with ThreadPoolExecutor(self.THREADS) as executor:
+                start = time.perf_counter()
+                list(executor.map(lambda _: zitadel.sessions.get_session(request), range(self.CALLS)))
+                return time.perf_counter() - start, server.connections
+
+    def test_fewer_sockets_at_comparable_throughput(self) -> None:
+        http1_time, http1_sockets = self._run(StubServer, http2=False)
+        http2_time, http2_sockets = self._run(H2StubServer, http2=True)
+
+        # the stub allows 100 streams per connection, so 200 threads need two connections
+        self.assertLessEqual(http2_sockets, 2)
+        self.assertGreater(http1_sockets, 10 * http2_sockets)
+        self.assertLess(http2_time, 2 * http1_time)
@@ -0,0 +1,69 @@
+import json
+import subprocess
+import sys
+import unittest
+from typing import Dict, List, Tuple
+
+# Generous enough for slow CI runners, while still far below the cost of
+# eagerly building every model (several seconds).
+COLD_IMPORT_BUDGET_US = 1_500_000
+
+
+def _cold_import(statement: str) -> Tuple[Dict[str, int], List[str]]:
+    """
+    Runs the statement in a fresh interpreter with `-X importtime` and returns
+    the cumulative import time in microseconds of every module imported, along
+    with the names of all modules loaded afterwards.
+    """
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-W",
+            "ignore",
+            "-c",
+            f"{statement}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        times[name.strip()] = int(cumulative)
+    return times, json.loads(result.stdout.splitlines()[-1])
+
+
+class ImportTimeTest(unittest.TestCase):
+    def test_cold_import_does_not_load_models(self) -> None:
+        _, modules = _cold_import("import zitadel_client")
+        self.assertEqual([], [name for name in modules if name.startswith("zitadel_client.models.")])
+
+    def test_cold_import_within_budget(self) -> None:
+        times, _ = _cold_import("import zitadel_client")
+        self.assertLess(times["zitadel_client"], COLD_IMPORT_BUDGET_US)
+
+    def test_model_is_resolved_on_first_access(self) -> None:
+        _, modules = _cold_import("from zitadel_client.models import UserServiceUser")
+        self.assertIn("zitadel_client.models.user_service_user", modules)
+        self.assertNotIn("zitadel_client.models.session_service_session", modules)
+
+    def test_facade_import_does_not_load_services(self) -> None:
+        times, modules = _cold_import("from zitadel_client import Zitadel")
+        self.assertLess(times["zitadel_client.zitadel"], COLD_IMPORT_BUDGET_US)
+        self.assertEqual([], [name for name in modules if name.startswith("zitadel_client.api.")])
+
+    def test_startup_only_loads_accessed_service(self) -> None:
+        _, modules = _cold_import(
+            "from zitadel_client import Zitadel\n"
+            "zitadel = Zitadel.with_access_token('https://example.zitadel.cloud', 'token')\n"
+            "zitadel.users"
+        )
+        self.assertEqual(
+            ["zitadel_client.api.user_service_api"],
+            [name for name in modules if name.startswith("zitadel_client.api.")],
+        )
@@ -0,0 +1,154 @@
+import io
+import json
+import tracemalloc
+import unittest
+from typing import Any, List
+
+import urllib3
+
+from test.stub_server import StubServer
+from test.test_codec import _list_users, _rest_response
+from zitadel_client import ApiClient, Configuration, Zitadel
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.codec import StdlibJsonCodec
+from zitadel_client.exceptions import ApiError
+from zitadel_client.item_stream import ItemStream
+from zitadel_client.models import (
+    SessionServiceListSessionsResponse,
+    UserServiceGetUserByIDResponse,
+    UserServiceListUsersRequest,
+    UserServiceListUsersResponse,
+)
+from zitadel_client.rest_response import RESTResponse
+
+LIST_USERS = "/zitadel.user.v2.UserService/ListUsers"
+RESPONSE_TYPES = {"200": "UserServiceListUsersResponse"}
+
+
+def _chunked(data: bytes, size: int) -> List[bytes]:
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def _stream(body: Any, size: int = 7) -> ItemStream:
+    data = body if isinstance(body, bytes) else json.dumps(body, ensure_ascii=False).encode("utf-8")
+    return ItemStream(_chunked(data, size), UserServiceListUsersResponse, json.loads)
+
+
+class ItemStreamTest(unittest.TestCase):
+    def test_matches_the_whole_response(self) -> None:
+        body = _list_users(5)
+        expected = UserServiceListUsersResponse.from_dict(body)
+
+        for size in (1, 3, 64, 1 << 20):
+            with self.subTest(size=size):
+                stream = _stream(body, size)
+                self.assertEqual(expected.result, list(stream))
+                self.assertEqual(expected.details, stream.response.details)
+                self.assertIsNone(stream.response.result)
+
+    def test_members_after_the_items(self) -> None:
+        data = b'{"result": [{"userId": "1"}], "details": {"totalResult": "1"}}'
+
+        stream = _stream(data)
+
+        self.assertEqual(["1"], [user.user_id for user in stream])
+        self.assertEqual(1, stream.response.details.total_result)
+
+    def test_strings_holding_json_syntax(self) -> None:
+        username = 'a"b\\"]}[{,: \\u00e4 ☃'
+        data = json.dumps({"result": [{"userId": "1", "username": username}, {"userId": "2"}]}).encode("utf-8")
+
+        for size in range(1, 12):
+            with self.subTest(size=size):
+                self.assertEqual([username, None], [user.username for user in _stream(data, size)])
+
+    def test_empty_and_missing_items(self) -> None:
+        for data in (b"{}", b' { "result" : [ ] } ', b'{"result": null}'):
+            with self.subTest(data=data):
+                stream = _stream(data)
+                self.assertEqual([], list(stream))
+                self.assertIsInstance(stream.response, UserServiceListUsersResponse)
+
+    def test_bytes_fields_stay_text(self) -> None:
+        data = b'{"sessions": [{"id": "1", "metadata": {"key": "dmFsdWU="}}]}'
+
+        (session,) = ItemStream(_chunked(data, 5), SessionServiceListSessionsResponse, json.loads)
+
+        self.assertEqual({"key": "dmFsdWU="}, session.metadata)
+
+    def test_truncated_document(self) -> None:
+        for data in (b'{"result": [{"userId": "1"}', b'{"result": [{"userId": "1', b'{"details": {}'):
+            with self.subTest(data=data), self.assertRaises(ValueError):
+                list(_stream(data))
+
+    def test_response_before_the_end(self) -> None:
+        stream = _stream(_list_users(2))
+
+        next(iter(stream))
+
+        with self.assertRaises(RuntimeError):
+            _ = stream.response
+
+    def test_iterates_once(self) -> None:
+        stream = _stream(_list_users(2))
+        list(stream)
+
+        with self.assertRaises(RuntimeError):
+            list(stream)
+
+    def test_requires_a_list_response(self) -> None:
+        with self.assertRaises(ValueError):
+            ItemStream([b"{}"], UserServiceGetUserByIDResponse, json.loads)
+
+
+class StreamResponseModeTest(unittest.TestCase):
+    def test_service_methods(self) -> None:
+        with StubServer() as server:
+            server.json(LIST_USERS, _list_users(3))
+            zitadel = Zitadel.with_access_token(server.url, "token")
+
+            stream = zitadel.users.list_users(UserServiceListUsersRequest(), _response_mode="stream")
+            self.assertEqual(["0", "1", "2"], [user.user_id for user in stream])
+            self.assertEqual(3, stream.response.details.total_result)
+            # the connection is reused once the stream has been read
+            zitadel.users.list_users(UserServiceListUsersRequest())
+            self.assertEqual(1, server.connections)
+
+    def test_errors_are_raised(self) -> None:
+        with StubServer() as server:
+            server.json(LIST_USERS, {"code": 7}, status=403)
+            zitadel = Zitadel.with_access_token(server.url, "token")
+
+            with self.assertRaises(ApiError) as context:
+                zitadel.users.list_users(UserServiceListUsersRequest(), _response_mode="stream")
+
+        self.assertEqual({"code": 7}, context.exception.response_body)
+
+
+class ItemStreamMemoryTest(unittest.TestCase):
+    """
+    Compares the peak memory of reading a large list response item by item with
+    reading it into a model, while the body is received from a socket-like stream.
+    """
+
+    @staticmethod
+    def _peak(response_mode: str, data: bytes) -> int:
+        client = ApiClient(Configuration(NoAuthAuthenticator()))
+        # warm up the caches of the deserializer outside of the measurement
+        client.response_deserialize(_rest_response(200, data), RESPONSE_TYPES, "model")
+        tracemalloc.start()
+        try:
+            response = RESTResponse(urllib3.HTTPResponse(body=io.BytesIO(data), status=200, preload_content=False))
+            if response_mode != "stream":
+                response.read()
+            result = client.response_deserialize(response, RESPONSE_TYPES, response_mode).data
+            for _ in result if response_mode == "stream" else result.result:
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_list_users(self) -> None:
+        data = StdlibJsonCodec().dumps(_list_users(5000))
+
+        self.assertLess(self._peak("stream", data) * 10, self._peak("model", data))
@@ -0,0 +1,98 @@
+import tracemalloc
+import unittest
+
+from test.stub_server import StubServer
+from test.test_codec import _list_users, _rest_response
+from zitadel_client import ApiClient, Configuration, Zitadel
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.codec import StdlibJsonCodec
+from zitadel_client.exceptions import ApiError
+from zitadel_client.models import UserServiceListUsersRequest, UserServiceListUsersResponse
+
+LIST_USERS = "/zitadel.user.v2.UserService/ListUsers"
+RESPONSE_TYPES = {"200": "UserServiceListUsersResponse"}
+
+
+def _lean(config: Configuration) -> None:
+    config.lean_responses = True
+
+
+class LeanResponsesTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = ApiClient(Configuration(NoAuthAuthenticator()))
+        self.client.lean_responses = True
+
+    def test_keeps_only_the_data(self) -> None:
+        response = _rest_response(200, StdlibJsonCodec().dumps(_list_users(2)))
+
+        result = self.client.response_deserialize(response, RESPONSE_TYPES)
+
+        self.assertIsInstance(result.data, UserServiceListUsersResponse)
+        self.assertIsNone(result.raw_data)
+        self.assertIsNone(response.data)
+        self.assertIsNone(response.response)
+
+    def test_headers_are_a_read_only_view(self) -> None:
+        result = self.client.response_deserialize(_rest_response(200, b"{}"), RESPONSE_TYPES)
+
+        self.assertEqual("application/json", result.headers["content-type"])
+        with self.assertRaises(TypeError):
+            result.headers["Content-Type"] = "text/plain"  # ty: ignore[invalid-assignment]
+
+    def test_errors_keep_the_body(self) -> None:
+        with self.assertRaises(ApiError) as context:
+            self.client.response_deserialize(_rest_response(500, b'{"code": 13}'), RESPONSE_TYPES)
+
+        self.assertEqual({"code": 13}, context.exception.response_body)
+
+    def test_service_methods(self) -> None:
+        with StubServer() as server:
+            server.json(LIST_USERS, _list_users(2))
+            zitadel = Zitadel(PersonalAccessTokenAuthenticator(server.url, "token"), _lean)
+
+            for _ in range(2):
+                self.assertEqual("user-1@example.com", zitadel.users.list_users(UserServiceListUsersRequest()).result[1].username)
+
+
+class AsyncLeanResponsesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_service_methods(self) -> None:
+        with StubServer() as server:
+            server.json(LIST_USERS, _list_users(2))
+            async with AsyncZitadel(PersonalAccessTokenAuthenticator(server.url, "token"), _lean) as zitadel:
+                response = await zitadel.users.list_users(UserServiceListUsersRequest())
+
+        self.assertEqual("user-1@example.com", response.result[1].username)
+
+
+class LeanResponsesMemoryTest(unittest.TestCase):
+    """
+    Measures the memory still held once a large list response has been deserialized,
+    while both the REST response and the ApiResponse are kept alive.
+    """
+
+    def _retained(self, lean: bool, body: bytes) -> int:
+        client = ApiClient(Configuration(NoAuthAuthenticator()))
+        client.lean_responses = lean
+        # warm up the caches of the deserializer outside of the measurement
+        client.response_deserialize(_rest_response(200, body), RESPONSE_TYPES)
+        tracemalloc.start()
+        try:
+            # a copy of the body, allocated while tracing
+            response = _rest_response(200, bytes(bytearray(body)))
+            result = client.response_deserialize(response, RESPONSE_TYPES)
+            retained = tracemalloc.get_traced_memory()[0]
+            del response, result
+            return retained
+        finally:
+            tracemalloc.stop()
+
+    def test_list_users(self) -> None:
+        body = StdlibJsonCodec().dumps(_list_users(2000))
+
+        lean = self._retained(True, body)
+        default = self._retained(False, body)
+
+        # the raw body is no longer held once deserialized
+        self.assertLess(lean + len(body) * 0.9, default)
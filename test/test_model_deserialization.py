@@ -0,0 +1,90 @@
+import json
+import unittest
+
+from test.test_codec import _list_sessions, _list_users, _rest_response
+from test.test_model_serialization import _models, _nulls, _populated
+from test.timing import best_of
+from zitadel_client import ApiClient, Configuration
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.codec import StdlibJsonCodec
+from zitadel_client.models import (
+    SessionServiceListSessionsResponse,
+    UserServiceConnectError,
+    UserServiceListUsersResponse,
+)
+from zitadel_client.utils.model_util import ModelUtil
+
+
+class ModelDeserializationTest(unittest.TestCase):
+    """
+    Validating response bodies directly must build the same models as from_dict().
+    """
+
+    def setUp(self) -> None:
+        self.client = ApiClient(Configuration(NoAuthAuthenticator()))
+        self.codec = StdlibJsonCodec()
+
+    def test_every_model_matches_from_dict(self) -> None:
+        for cls in _models():
+            for model in (_populated(cls), _nulls(cls)):
+                data = self.codec.dumps(self.client.sanitize_for_serialization(model))
+                with self.subTest(model=cls.__name__, mode=ModelUtil.validation_mode(cls)):
+                    expected = cls.from_dict(json.loads(data))  # ty: ignore[unresolved-attribute]
+                    self.assertEqual(expected, ModelUtil.validate(cls, data, self.codec.loads))
+
+    def test_list_responses_are_validated_from_json(self) -> None:
+        self.assertEqual(ModelUtil.JSON, ModelUtil.validation_mode(UserServiceListUsersResponse))
+        # session metadata values are bytes fields, kept as the document's str
+        self.assertEqual(ModelUtil.PYTHON, ModelUtil.validation_mode(SessionServiceListSessionsResponse))
+        self.assertEqual(ModelUtil.FROM_DICT, ModelUtil.validation_mode(UserServiceConnectError))
+
+    def test_response_deserialize(self) -> None:
+        body = _list_users(2)
+        body["unknownField"] = {"ignored": True}
+        body["result"][0]["human"]["unknownField"] = 1
+
+        response = self.client.response_deserialize(
+            _rest_response(200, self.codec.dumps(body)), {"200": "UserServiceListUsersResponse"}
+        ).data
+
+        self.assertIsInstance(response, UserServiceListUsersResponse)
+        self.assertEqual(2, response.details.total_result)
+        self.assertEqual("user-1@example.com", response.result[1].username)
+        self.assertEqual(2025, response.result[0].details.change_date.year)
+
+    def test_bytes_fields_stay_text(self) -> None:
+        response = self.client.response_deserialize(
+            _rest_response(200, self.codec.dumps(_list_sessions(1))), {"200": "SessionServiceListSessionsResponse"}
+        ).data
+
+        self.assertEqual({"key": "dmFsdWU="}, response.sessions[0].metadata)
+
+    def test_additional_properties_are_collected(self) -> None:
+        error = self.client.deserialize(b'{"code": "not_found", "extra": 1}', "UserServiceConnectError", "application/json")
+
+        self.assertEqual({"extra": 1}, error.additional_properties)
+
+
+class ModelDeserializationBenchmark(unittest.TestCase):
+    """
+    Compares validating list responses directly with json.loads() followed by from_dict().
+    """
+
+    def _assert_faster(self, cls: type, body: dict) -> None:
+        client = ApiClient(Configuration(NoAuthAuthenticator()))
+        data = StdlibJsonCodec().dumps(body)
+
+        legacy, direct = best_of(
+            lambda: cls.from_dict(json.loads(data.decode("utf-8"))),
+            lambda: client.deserialize(data, cls.__name__, "application/json"),
+            number=3,
+            rounds=3,
+        )
+
+        self.assertLess(direct * 1.5, legacy)
+
+    def test_list_users(self) -> None:
+        self._assert_faster(UserServiceListUsersResponse, _list_users(2000))
+
+    def test_list_sessions(self) -> None:
+        self._assert_faster(SessionServiceListSessionsResponse, _list_sessions(2000))
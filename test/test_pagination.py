@@ -0,0 +1,161 @@
+import time
+import unittest
+from typing import Callable
+
+from test.stub_server import StubRequest, StubResponse, StubServer
+from zitadel_client import Zitadel
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.exceptions import InconsistentPageError
+
+LIST_USERS = "/zitadel.user.v2.UserService/ListUsers"
+LIST_USER_METADATA = "/zitadel.user.v2.UserService/ListUserMetadata"
+TOTAL = 250
+
+
+def _list_users(
+    max_limit: int = 1000,
+    delay: float = 0.0,
+    timestamp: Callable[[int], str] = lambda _: "2025-01-01T00:00:00Z",
+) -> Callable[[StubRequest], StubResponse]:
+    """Serves TOTAL users, honouring the requested offset and limit up to max_limit."""
+
+    def handler(request: StubRequest) -> StubResponse:
+        query = request.json().get("query", {})
+        offset = int(query.get("offset", 0))
+        limit = min(int(query.get("limit", max_limit)), max_limit)
+        users = [{"userId": str(i)} for i in range(offset, min(offset + limit, TOTAL))]
+        body = {"details": {"totalResult": str(TOTAL), "timestamp": timestamp(offset)}, "result": users}
+        return StubResponse(200, body, {"Content-Type": "application/json"}, delay)
+
+    return handler
+
+
+class PaginationTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.zitadel = Zitadel.with_access_token(self.server.url, "token")
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def test_iterates_all_pages(self) -> None:
+        self.server.route(LIST_USERS, _list_users())
+
+        ids = [user.user_id for user in self.zitadel.users.iter_users({}, page_size=100)]
+
+        self.assertEqual([str(i) for i in range(TOTAL)], ids)
+        self.assertEqual(3, self.server.hits[LIST_USERS])
+        self.assertEqual(["0", "100", "200"], [request.json()["query"]["offset"] for request in self.server.requests])
+
+    def test_streams_all_pages(self) -> None:
+        self.server.route(LIST_USERS, _list_users())
+
+        ids = [user.user_id for user in self.zitadel.users.iter_users({}, page_size=100).stream()]
+
+        self.assertEqual([str(i) for i in range(TOTAL)], ids)
+        self.assertEqual(3, self.server.hits[LIST_USERS])
+
+    def test_keeps_query_and_starting_offset(self) -> None:
+        self.server.route(LIST_USERS, _list_users())
+        request = {"query": {"offset": "240", "asc": True}, "queries": [{"userNameQuery": {"userName": "a"}}]}
+
+        ids = [user.user_id for user in self.zitadel.users.iter_users(request, page_size=5)]
+
+        self.assertEqual([str(i) for i in range(240, TOTAL)], ids)
+        sent = self.server.requests[0].json()
+        self.assertEqual({"offset": "240", "limit": 5, "asc": True}, sent["query"])
+        self.assertEqual([{"userNameQuery": {"userName": "a"}}], sent["queries"])
+
+    def test_follows_server_capped_page_size(self) -> None:
+        self.server.route(LIST_USERS, _list_users(max_limit=40))
+
+        ids = [user.user_id for user in self.zitadel.users.iter_users({}, page_size=100)]
+
+        self.assertEqual([str(i) for i in range(TOTAL)], ids)
+        self.assertEqual(7, self.server.hits[LIST_USERS])
+
+    def test_stops_at_short_page_without_total(self) -> None:
+        metadata = [{"key": f"k{i}", "value": "dg=="} for i in range(3)]
+        self.server.json(LIST_USER_METADATA, {"metadata": metadata})
+
+        keys = [item.key for item in self.zitadel.users.iter_user_metadata({"userId": "1"}, page_size=10)]
+
+        self.assertEqual(["k0", "k1", "k2"], keys)
+        self.assertEqual({"offset": "0", "limit": 10}, self.server.requests[0].json()["pagination"])
+
+    def test_read_ahead_overlaps_requests_with_consumption(self) -> None:
+        self.server.route(LIST_USERS, _list_users(delay=0.2))
+        pages = 0
+
+        start = time.monotonic()
+        for _ in self.zitadel.users.iter_users({}, page_size=100, read_ahead=True).pages():
+            pages += 1
+            time.sleep(0.2)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(3, pages)
+        # sequentially this takes 3 * (0.2 + 0.2) seconds
+        self.assertLess(elapsed, 1.0)
+
+    def test_stopping_early_leaves_remaining_pages_unfetched(self) -> None:
+        self.server.route(LIST_USERS, _list_users())
+
+        for user in self.zitadel.users.iter_users({}, page_size=100):
+            if user.user_id == "10":
+                break
+
+        self.assertEqual(1, self.server.hits[LIST_USERS])
+
+    def test_fetch_all_requests_pages_concurrently(self) -> None:
+        self.server.route(LIST_USERS, _list_users(delay=0.2))
+
+        start = time.monotonic()
+        ids = [user.user_id for user in self.zitadel.users.iter_users({}, page_size=25).fetch_all(concurrency=9)]
+        elapsed = time.monotonic() - start
+
+        self.assertEqual([str(i) for i in range(TOTAL)], ids)
+        self.assertEqual(10, self.server.hits[LIST_USERS])
+        # the first page, then the other nine at once; sequentially this takes 10 * 0.2 seconds
+        self.assertLess(elapsed, 1.0)
+
+    def test_fetch_all_as_completed(self) -> None:
+        self.server.route(LIST_USERS, _list_users(max_limit=40))
+
+        ids = [user.user_id for user in self.zitadel.users.iter_users({}, page_size=100).fetch_all(concurrency=3, ordered=False)]
+
+        self.assertEqual(sorted(str(i) for i in range(TOTAL)), sorted(ids))
+        self.assertEqual(7, self.server.hits[LIST_USERS])
+
+    def test_fetch_all_rejects_pages_read_at_another_state(self) -> None:
+        self.server.route(LIST_USERS, _list_users(timestamp=lambda offset: f"2025-01-01T00:00:{offset // 100:02d}Z"))
+
+        with self.assertRaises(InconsistentPageError):
+            list(self.zitadel.users.iter_users({}, page_size=100).fetch_all(consistent=True))
+
+    def test_fetch_all_consistent_when_state_is_stable(self) -> None:
+        self.server.route(LIST_USERS, _list_users())
+
+        users = list(self.zitadel.users.iter_users({}, page_size=100).fetch_all(consistent=True))
+
+        self.assertEqual(TOTAL, len(users))
+
+
+class AsyncPaginationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_iterates_all_pages(self) -> None:
+        with StubServer() as server:
+            server.route(LIST_USERS, _list_users())
+            async with AsyncZitadel.with_access_token(server.url, "token") as zitadel:
+                ids = [user.user_id async for user in zitadel.users.iter_users({}, page_size=100, read_ahead=True)]
+
+        self.assertEqual([str(i) for i in range(TOTAL)], ids)
+        self.assertEqual(3, server.hits[LIST_USERS])
+
+    async def test_fetch_all(self) -> None:
+        with StubServer() as server:
+            server.route(LIST_USERS, _list_users(max_limit=40))
+            async with AsyncZitadel.with_access_token(server.url, "token") as zitadel:
+                paginator = zitadel.users.iter_users({}, page_size=100)
+                ids = [user.user_id async for user in paginator.afetch_all(concurrency=4, consistent=True)]
+
+        self.assertEqual([str(i) for i in range(TOTAL)], ids)
+        self.assertEqual(7, server.hits[LIST_USERS])
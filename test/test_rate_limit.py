@@ -0,0 +1,134 @@
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from test.stub_server import StubServer
+from zitadel_client import ApiError, Configuration, Zitadel
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.models import SessionServiceGetSessionRequest
+from zitadel_client.rate_limit import AdaptiveTokenBucket, RateLimiter, TokenBucket
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+SET_USER_METADATA = "/zitadel.user.v2.UserService/SetUserMetadata"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_spaces_requests_after_a_burst(self) -> None:
+        clock = FakeClock()
+        bucket = TokenBucket(10, burst=2, clock=clock)
+
+        self.assertEqual([0.0, 0.0, 0.1, 0.2], [bucket.reserve() for _ in range(4)])
+        clock.now = 1.0
+        self.assertEqual([0.0, 0.0, 0.1], [bucket.reserve() for _ in range(3)])
+
+    def test_adaptive_backs_off_on_429(self) -> None:
+        clock = FakeClock()
+        bucket = AdaptiveTokenBucket(100, min_rate=30, cooldown=1.0, clock=clock)
+
+        bucket.record(429, 0.01)
+        self.assertEqual(50, bucket.rate)
+        # responses to requests already in flight do not cut the rate again
+        bucket.record(429, 0.01)
+        self.assertEqual(50, bucket.rate)
+        clock.now = 1.0
+        bucket.record(429, 0.01)
+        self.assertEqual(30, bucket.rate)
+
+    def test_adaptive_backs_off_on_latency_growth(self) -> None:
+        bucket = AdaptiveTokenBucket(100, increase=0, latency_factor=2.0, clock=FakeClock())
+
+        for _ in range(10):
+            bucket.record(200, 0.01)
+        self.assertEqual(100, bucket.rate)
+        for _ in range(10):
+            bucket.record(200, 0.1)
+        self.assertEqual(50, bucket.rate)
+
+    def test_adaptive_probes_upward(self) -> None:
+        bucket = AdaptiveTokenBucket(10, max_rate=12, latency_factor=None, clock=FakeClock())
+
+        for _ in range(10):
+            bucket.record(200, 0.01)
+        self.assertAlmostEqual(11, bucket.rate, delta=0.05)
+        for _ in range(100):
+            bucket.record(200, 0.01)
+        self.assertEqual(12, bucket.rate)
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_applies_client_service_and_endpoint_limits(self) -> None:
+        limiter = RateLimiter(
+            rate=100,
+            services={"UserService": 50, "zitadel.session.v2.SessionService": 40},
+            endpoints={"SetUserMetadata": 10},
+        )
+
+        self.assertEqual(
+            (limiter.client, limiter.services["UserService"], limiter.endpoints["SetUserMetadata"]),
+            limiter.buckets("https://example.com" + SET_USER_METADATA),
+        )
+        self.assertEqual(
+            (limiter.client, limiter.services["zitadel.session.v2.SessionService"]),
+            limiter.buckets(GET_SESSION),
+        )
+        self.assertEqual(
+            {"client": 100, "UserService": 50, "zitadel.session.v2.SessionService": 40, "SetUserMetadata": 10},
+            limiter.rates(),
+        )
+
+    def test_waits_for_the_slowest_limit(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(
+            rate=TokenBucket(100, burst=1, clock=clock),
+            endpoints={"SetUserMetadata": TokenBucket(10, burst=1, clock=clock)},
+        )
+
+        self.assertEqual([0.0, 0.1], [limiter.reserve(SET_USER_METADATA) for _ in range(2)])
+
+    def test_no_limits(self) -> None:
+        self.assertEqual(0.0, RateLimiter().reserve(GET_SESSION))
+
+
+class ApiClientRateLimitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.server.json(GET_SESSION, {"session": {"id": "session-1"}})
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def _zitadel(self, limiter: RateLimiter) -> Zitadel:
+        def mutate_config(config: Configuration) -> None:
+            config.rate_limiter = limiter
+
+        return Zitadel(PersonalAccessTokenAuthenticator(self.server.url, "token"), mutate_config)
+
+    def test_throttles_threads(self) -> None:
+        zitadel = self._zitadel(RateLimiter(endpoints={"GetSession": TokenBucket(50, burst=1)}))
+        request = SessionServiceGetSessionRequest(sessionId="session-1")
+
+        start = time.monotonic()
+        with ThreadPoolExecutor(8) as executor:
+            for future in [executor.submit(zitadel.sessions.get_session, request) for _ in range(21)]:
+                future.result()
+
+        # one request at once, then twenty at 50 per second
+        self.assertGreaterEqual(time.monotonic() - start, 0.39)
+        self.assertEqual(21, self.server.hits[GET_SESSION])
+
+    def test_adapts_to_429(self) -> None:
+        limiter = RateLimiter(endpoints={"GetSession": AdaptiveTokenBucket(50)})
+        self.server.json(GET_SESSION, {"code": 8, "message": "quota exceeded"}, status=429)
+
+        with self.assertRaises(ApiError):
+            self._zitadel(limiter).sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertEqual({"GetSession": 25}, limiter.rates())
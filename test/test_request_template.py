@@ -0,0 +1,97 @@
+import functools
+import unittest
+from typing import Any, List, Tuple
+
+from test.timing import best_of
+from zitadel_client import ApiClient, Configuration
+from zitadel_client.api.session_service_api import SessionServiceApi
+from zitadel_client.api.user_service_api import UserServiceApi
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.models import (
+    SessionServiceGetSessionRequest,
+    SessionServiceListSessionsRequest,
+    UserServiceGetUserByIDRequest,
+    UserServiceListUsersRequest,
+)
+
+
+class _UntemplatedApiClient(ApiClient):
+    """Serializes every request from scratch, as before request templates."""
+
+    TEMPLATE_HEADERS = frozenset()
+
+
+def _endpoints(client: ApiClient) -> List[Tuple[Any, str, Any]]:
+    sessions, users = SessionServiceApi(client), UserServiceApi(client)
+    return [
+        (sessions, "get_session", SessionServiceGetSessionRequest(sessionId="session-1")),
+        (sessions, "list_sessions", SessionServiceListSessionsRequest(query={"limit": 10})),
+        (users, "get_user_by_id", UserServiceGetUserByIDRequest(userId="user-1")),
+        (users, "list_users", UserServiceListUsersRequest(query={"limit": 10})),
+    ]
+
+
+def _serialize(api: Any, endpoint: str, request: Any, **kwargs: Any) -> Any:
+    arguments = {"_request_auth": None, "_content_type": None, "_headers": None, "_host_index": 0, **kwargs}
+    return getattr(api, f"_{endpoint}_serialize")(request, **arguments)
+
+
+def _client(cls: type = ApiClient) -> ApiClient:
+    return cls(Configuration(PersonalAccessTokenAuthenticator("https://example.zitadel.cloud", "token")))
+
+
+class RequestTemplateTest(unittest.TestCase):
+    def test_matches_untemplated_requests(self) -> None:
+        for (api, endpoint, request), (plain_api, _, _) in zip(
+            _endpoints(_client()), _endpoints(_client(_UntemplatedApiClient)), strict=True
+        ):
+            with self.subTest(endpoint=endpoint):
+                for _ in range(2):
+                    self.assertEqual(_serialize(plain_api, endpoint, request), _serialize(api, endpoint, request))
+
+    def test_one_template_per_endpoint(self) -> None:
+        client = _client()
+        for api, endpoint, request in _endpoints(client) * 3:
+            _serialize(api, endpoint, request)
+
+        self.assertEqual(4, len(client._templates))
+        url = "https://example.zitadel.cloud/zitadel.session.v2.SessionService/GetSession"
+        self.assertEqual(url, next(iter(client._templates.values())).url)
+
+    def test_custom_headers_are_not_cached(self) -> None:
+        client = _client()
+        api, endpoint, request = _endpoints(client)[0]
+
+        _, _, headers, _, _ = _serialize(api, endpoint, request, _headers={"X-Trace": "1"})
+
+        self.assertEqual("1", headers["X-Trace"])
+        self.assertEqual({}, client._templates)
+
+    def test_default_header_changes_rebuild_template(self) -> None:
+        client = _client()
+        api, endpoint, request = _endpoints(client)[0]
+        _serialize(api, endpoint, request)
+
+        client.set_default_header("X-Tenant", "a")
+        _, _, headers, _, _ = _serialize(api, endpoint, request)
+
+        self.assertEqual("a", headers["X-Tenant"])
+        self.assertEqual("Bearer token", headers["Authorization"])
+
+
+class RequestTemplateBenchmark(unittest.TestCase):
+    """
+    Compares serializing requests of representative endpoints with and without templates.
+    """
+
+    def test_endpoints(self) -> None:
+        for (api, endpoint, request), (plain_api, _, _) in zip(
+            _endpoints(_client()), _endpoints(_client(_UntemplatedApiClient)), strict=True
+        ):
+            with self.subTest(endpoint=endpoint):
+                templated, untemplated = best_of(
+                    functools.partial(_serialize, api, endpoint, request),
+                    functools.partial(_serialize, plain_api, endpoint, request),
+                    number=1000,
+                )
+                self.assertLess(templated, untemplated)
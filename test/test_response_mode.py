@@ -0,0 +1,98 @@
+import unittest
+
+from test.stub_server import StubServer
+from test.test_codec import _list_users, _rest_response
+from test.timing import best_of
+from zitadel_client import ApiClient, Configuration, Zitadel
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.codec import StdlibJsonCodec
+from zitadel_client.exceptions import ApiError
+from zitadel_client.models import UserServiceListUsersRequest, UserServiceListUsersResponse
+
+LIST_USERS = "/zitadel.user.v2.UserService/ListUsers"
+RESPONSE_TYPES = {"200": "UserServiceListUsersResponse"}
+
+
+def _dict_responses(config: Configuration) -> None:
+    config.response_mode = "dict"
+
+
+class ResponseModeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = ApiClient(Configuration(NoAuthAuthenticator()))
+        self.data = StdlibJsonCodec().dumps(_list_users(2))
+
+    def test_model_by_default(self) -> None:
+        response = self.client.response_deserialize(_rest_response(200, self.data), RESPONSE_TYPES).data
+
+        self.assertIsInstance(response, UserServiceListUsersResponse)
+
+    def test_dict(self) -> None:
+        response = self.client.response_deserialize(_rest_response(200, self.data), RESPONSE_TYPES, "dict").data
+
+        self.assertEqual(_list_users(2), response)
+
+    def test_bytes(self) -> None:
+        response = self.client.response_deserialize(_rest_response(200, self.data), RESPONSE_TYPES, "bytes").data
+
+        self.assertEqual(self.data, response)
+
+    def test_client_default(self) -> None:
+        self.client.response_mode = "bytes"
+
+        self.assertEqual(self.data, self.client.response_deserialize(_rest_response(200, self.data), RESPONSE_TYPES).data)
+
+    def test_errors_are_raised(self) -> None:
+        for mode in ApiClient.RESPONSE_MODES:
+            with self.subTest(mode=mode), self.assertRaises(ApiError) as context:
+                self.client.response_deserialize(_rest_response(404, b'{"code": 5}'), RESPONSE_TYPES, mode)
+
+            self.assertEqual(404, context.exception.code)
+            self.assertEqual({"code": 5}, context.exception.response_body)
+
+    def test_rejects_unknown_mode(self) -> None:
+        with self.assertRaises(ValueError):
+            self.client.response_deserialize(_rest_response(200, self.data), RESPONSE_TYPES, "xml")
+
+    def test_service_methods(self) -> None:
+        with StubServer() as server:
+            server.json(LIST_USERS, _list_users(2))
+            zitadel = Zitadel(PersonalAccessTokenAuthenticator(server.url, "token"), _dict_responses)
+
+            self.assertEqual(_list_users(2), zitadel.users.list_users(UserServiceListUsersRequest()))
+            response = zitadel.users.list_users(UserServiceListUsersRequest(), _response_mode="model")
+            self.assertIsInstance(response, UserServiceListUsersResponse)
+            self.assertEqual(
+                ["user-0@example.com", "user-1@example.com"],
+                [user.username for user in zitadel.users.iter_users(UserServiceListUsersRequest())],
+            )
+
+
+class AsyncResponseModeTest(unittest.IsolatedAsyncioTestCase):
+    async def test_service_methods(self) -> None:
+        with StubServer() as server:
+            server.json(LIST_USERS, _list_users(2))
+            async with AsyncZitadel(PersonalAccessTokenAuthenticator(server.url, "token")) as zitadel:
+                response = await zitadel.users.list_users(UserServiceListUsersRequest(), _response_mode="bytes")
+
+        self.assertEqual(_list_users(2), StdlibJsonCodec().loads(response))
+
+
+class ResponseModeBenchmark(unittest.TestCase):
+    """
+    Compares returning list responses as dicts with validating them into models.
+    """
+
+    def test_list_users(self) -> None:
+        client = ApiClient(Configuration(NoAuthAuthenticator()))
+        response = _rest_response(200, StdlibJsonCodec().dumps(_list_users(2000)))
+
+        model, raw = best_of(
+            lambda: client.response_deserialize(response, RESPONSE_TYPES, "model"),
+            lambda: client.response_deserialize(response, RESPONSE_TYPES, "dict"),
+            number=3,
+        )
+
+        self.assertLess(raw * 1.5, model)
@@ -0,0 +1,177 @@
+import unittest
+from email.utils import formatdate
+from time import time
+from typing import Dict, Optional
+
+from test.stub_server import Handler, StubRequest, StubResponse, StubServer
+from zitadel_client import ApiError, Configuration, Zitadel
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.models import SessionServiceGetSessionRequest, UserServiceAddHumanUserRequest
+from zitadel_client.retry import RetryBudget, RetryPolicy
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+ADD_HUMAN_USER = "/zitadel.user.v2.UserService/AddHumanUser"
+
+
+def _faults(failures: int, status: int = 503, headers: Optional[Dict[str, str]] = None) -> Handler:
+    """Returns a handler failing the first `failures` requests with `status`, then succeeding."""
+    calls = []
+    error_headers = {"Content-Type": "application/json", **(headers or {})}
+
+    def handler(_: StubRequest) -> StubResponse:
+        calls.append(None)
+        if len(calls) <= failures:
+            return StubResponse(status, {"code": 14, "message": "unavailable"}, error_headers)
+        return StubResponse(200, {"session": {"id": "session-1"}}, {"Content-Type": "application/json"})
+
+    return handler
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+        self.policy = RetryPolicy(initial_backoff=0.001, max_backoff=0.5)
+
+        def mutate_config(config: Configuration) -> None:
+            config.retry_policy = self.policy
+
+        self.zitadel = Zitadel(PersonalAccessTokenAuthenticator(self.server.url, "token"), mutate_config)
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    def _get_session(self) -> None:
+        self.zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+    def test_retries_reads(self) -> None:
+        for status in sorted(RetryPolicy.RETRYABLE_STATUSES):
+            with self.subTest(status=status):
+                self.server.hits.clear()
+                self.server.route(GET_SESSION, _faults(2, status))
+
+                self._get_session()
+
+                self.assertEqual(3, self.server.hits[GET_SESSION])
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        self.server.route(GET_SESSION, _faults(3))
+
+        with self.assertRaises(ApiError) as context:
+            self._get_session()
+
+        self.assertEqual(503, context.exception.code)
+        self.assertEqual(3, self.server.hits[GET_SESSION])
+
+    def test_does_not_retry_other_errors(self) -> None:
+        self.server.route(GET_SESSION, _faults(1, 500))
+
+        with self.assertRaises(ApiError):
+            self._get_session()
+
+        self.assertEqual(1, self.server.hits[GET_SESSION])
+
+    def test_does_not_retry_mutations(self) -> None:
+        self.server.route(ADD_HUMAN_USER, _faults(1))
+
+        with self.assertRaises(ApiError):
+            self.zitadel.users.add_human_user(UserServiceAddHumanUserRequest())
+
+        self.assertEqual(1, self.server.hits[ADD_HUMAN_USER])
+
+    def test_retries_mutations_opted_in(self) -> None:
+        self.policy.idempotent = frozenset(("AddHumanUser",))
+        self.server.route(ADD_HUMAN_USER, _faults(1))
+
+        self.zitadel.users.add_human_user(UserServiceAddHumanUserRequest())
+
+        self.assertEqual(2, self.server.hits[ADD_HUMAN_USER])
+
+    def test_honours_retry_after(self) -> None:
+        self.server.route(GET_SESSION, _faults(1, 429, {"Retry-After": "0"}))
+
+        self._get_session()
+
+        self.assertEqual(2, self.server.hits[GET_SESSION])
+
+    def test_gives_up_on_long_retry_after(self) -> None:
+        self.server.route(GET_SESSION, _faults(1, 503, {"Retry-After": "60"}))
+
+        with self.assertRaises(ApiError):
+            self._get_session()
+
+        self.assertEqual(1, self.server.hits[GET_SESSION])
+
+    def test_budget_caps_retries(self) -> None:
+        self.policy.budget = RetryBudget(ratio=0.5, reserve=1)
+        self.server.route(GET_SESSION, _faults(100))
+
+        for _ in range(4):
+            with self.assertRaises(ApiError):
+                self._get_session()
+
+        # one retry from the reserve, then one per two calls
+        self.assertEqual(4 + 2, self.server.hits[GET_SESSION])
+
+
+class AsyncRetryTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = StubServer().__enter__()
+
+    def tearDown(self) -> None:
+        self.server.__exit__()
+
+    async def test_retries_reads(self) -> None:
+        self.server.route(GET_SESSION, _faults(2))
+
+        def mutate_config(config: Configuration) -> None:
+            config.retry_policy = RetryPolicy(initial_backoff=0.001)
+
+        async with AsyncZitadel(PersonalAccessTokenAuthenticator(self.server.url, "token"), mutate_config) as zitadel:
+            await zitadel.sessions.get_session(SessionServiceGetSessionRequest(sessionId="session-1"))
+
+        self.assertEqual(3, self.server.hits[GET_SESSION])
+
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_classifies_reads(self) -> None:
+        policy = RetryPolicy(idempotent=("SetUserMetadata", "/zitadel.org.v2.OrganizationService/AddOrganization"))
+
+        for path in (
+            "/zitadel.user.v2.UserService/GetUserByID",
+            "/zitadel.user.v2.UserService/ListUsers",
+            "/zitadel.settings.v2.SettingsService/GetLoginSettings",
+            "/zitadel.user.v2.UserService/SetUserMetadata",
+            "/zitadel.org.v2.OrganizationService/AddOrganization",
+        ):
+            with self.subTest(path=path):
+                self.assertTrue(policy.is_idempotent("POST", "https://example.com" + path))
+        for path in (
+            "/zitadel.user.v2.UserService/CreateUser",
+            "/zitadel.user.v2.UserService/DeleteUser",
+            "/zitadel.user.v2.UserService/Getaway",
+        ):
+            with self.subTest(path=path):
+                self.assertFalse(policy.is_idempotent("POST", "https://example.com" + path))
+        self.assertTrue(policy.is_idempotent("GET", "https://example.com/.well-known/openid-configuration"))
+
+    def test_backoff_grows_to_max(self) -> None:
+        policy = RetryPolicy(initial_backoff=1, max_backoff=5)
+
+        for attempt, bound in ((1, 1), (2, 2), (3, 4), (4, 5), (10, 5)):
+            with self.subTest(attempt=attempt):
+                self.assertTrue(all(0 <= policy.backoff(attempt) <= bound for _ in range(100)))
+
+    def test_retries_connection_errors(self) -> None:
+        policy = RetryPolicy(max_attempts=2)
+
+        self.assertIsNotNone(policy.delay(1))
+        self.assertIsNone(policy.delay(2))
+
+    def test_parses_retry_after(self) -> None:
+        self.assertEqual(3.0, RetryPolicy.retry_after("3"))
+        self.assertAlmostEqual(30, RetryPolicy.retry_after(formatdate(time() + 30, usegmt=True)), delta=2)
+        self.assertEqual(0.0, RetryPolicy.retry_after(formatdate(time() - 30, usegmt=True)))
+        for value in (None, "", "soon", "-1"):
+            with self.subTest(value=value):
+                self.assertIsNone(RetryPolicy.retry_after(value))
@@ -0,0 +1,30 @@
+import unittest
+
+from test.stub_server import StubServer
+from zitadel_client import Zitadel
+from zitadel_client.transport import Transport
+from zitadel_client.transport_options import TransportOptions
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+
+
+class TransportTest(unittest.TestCase):
+    def test_shared_per_transport_options(self) -> None:
+        options = TransportOptions(default_headers={"X-Tenant": "a"})
+        self.assertIs(Transport.shared(options), Transport.shared(TransportOptions(default_headers={"X-Tenant": "a"})))
+        self.assertIsNot(Transport.shared(options), Transport.shared(TransportOptions(insecure=True)))
+
+    def test_discovery_token_and_api_calls_share_one_connection(self) -> None:
+        with StubServer() as server:
+            server.oauth()
+            server.json(GET_SESSION, {"session": {"id": "session-1"}})
+            # headers make the options, and with them the transport, unique to this test
+            options = TransportOptions(default_headers={"X-Test": self.id()})
+            zitadel = Zitadel.with_client_credentials(server.url, "client", "secret", transport_options=options)
+            for _ in range(3):
+                zitadel.sessions.get_session({"sessionId": "session-1"})
+
+        self.assertEqual(1, server.hits["/.well-known/openid-configuration"])
+        self.assertEqual(1, server.hits["/oauth/v2/token"])
+        self.assertEqual(3, server.hits[GET_SESSION])
+        self.assertEqual(1, server.connections)
@@ -0,0 +1,48 @@
+import json
+import unittest
+
+from pydantic import ValidationError
+
+from zitadel_client import ApiClient, Configuration
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.models import (
+    UserServiceListDetails,
+    UserServiceListQuery,
+    UserServiceListUsersRequest,
+    UserServiceListUsersResponse,
+)
+from zitadel_client.utils.model_util import ModelUtil
+
+
+class Int64Test(unittest.TestCase):
+    def test_accepts_strings_and_numbers(self) -> None:
+        for value in ("9007199254740993", 9007199254740993):
+            with self.subTest(value=value):
+                details = UserServiceListDetails.model_validate({"totalResult": value, "processedSequence": value})
+
+                self.assertEqual(9007199254740993, details.total_result)
+                self.assertEqual(9007199254740993, details.processed_sequence)
+
+    def test_validates_json(self) -> None:
+        details = UserServiceListDetails.model_validate_json('{"totalResult": "12", "processedSequence": 34}')
+
+        self.assertEqual(12, details.total_result)
+        self.assertEqual(34, details.processed_sequence)
+        self.assertEqual(ModelUtil.JSON, ModelUtil.validation_mode(UserServiceListUsersResponse))
+
+    def test_rejects_non_integers(self) -> None:
+        for value in ("twelve", "1.5", {"value": 1}):
+            with self.subTest(value=value), self.assertRaises(ValidationError):
+                UserServiceListDetails(totalResult=value)
+
+    def test_serializes_to_strings(self) -> None:
+        details = UserServiceListDetails(totalResult=12)
+
+        self.assertEqual({"totalResult": "12"}, details.to_dict())
+        self.assertEqual({"totalResult": "12"}, json.loads(details.to_json()))
+
+    def test_request_bodies(self) -> None:
+        client = ApiClient(Configuration(NoAuthAuthenticator()))
+        request = UserServiceListUsersRequest(query=UserServiceListQuery(offset=200, limit=100))
+
+        self.assertEqual({"query": {"offset": "200", "limit": 100}}, client.sanitize_for_serialization(request))
@@ -0,0 +1,97 @@
+import unittest
+from typing import Any, Callable
+
+from pydantic import ValidationError
+
+from test.stub_server import StubServer
+from test.timing import best_of
+from zitadel_client import ApiClient, Configuration, Zitadel
+from zitadel_client.api.session_service_api import SessionServiceApi
+from zitadel_client.api.user_service_api import UserServiceApi
+from zitadel_client.async_zitadel import AsyncZitadel
+from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
+from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
+from zitadel_client.models import SessionServiceGetSessionRequest, UserServiceGetUserByIDRequest
+
+GET_SESSION = "/zitadel.session.v2.SessionService/GetSession"
+
+
+def _disable_validation(config: Configuration) -> None:
+    config.client_side_validation = False
+
+
+class _SerializeReachedError(Exception):
+    """Raised in place of serializing the request, so only the argument handling of a call is timed."""
+
+
+def _stop(**kwargs: Any) -> None:
+    raise _SerializeReachedError
+
+
+class ClientSideValidationTest(unittest.TestCase):
+    def test_validates_by_default(self) -> None:
+        with StubServer() as server:
+            server.json(GET_SESSION, {"session": {"id": "session-1"}})
+            zitadel = Zitadel.with_access_token(server.url, "token")
+
+            self.assertEqual("session-1", zitadel.sessions.get_session({"sessionId": "session-1"}).session.id)
+            with self.assertRaises(ValidationError):
+                zitadel.sessions.get_session({"sessionId": "session-1"}, _host_index=1)
+
+    def test_skips_validation_when_disabled(self) -> None:
+        with StubServer() as server:
+            server.json(GET_SESSION, {"session": {"id": "session-1"}})
+            zitadel = Zitadel(PersonalAccessTokenAuthenticator(server.url, "token"), _disable_validation)
+            request = SessionServiceGetSessionRequest(sessionId="session-1")
+
+            response = zitadel.sessions.get_session(request, _host_index=1)
+
+            self.assertEqual("session-1", response.session.id)
+            self.assertEqual({"sessionId": "session-1"}, server.requests[0].json())
+
+
+class AsyncClientSideValidationTest(unittest.IsolatedAsyncioTestCase):
+    async def test_skips_validation_when_disabled(self) -> None:
+        with StubServer() as server:
+            server.json(GET_SESSION, {"session": {"id": "session-1"}})
+            async with AsyncZitadel(PersonalAccessTokenAuthenticator(server.url, "token"), _disable_validation) as zitadel:
+                request = SessionServiceGetSessionRequest(sessionId="session-1")
+                response = await zitadel.sessions.get_session(request, _host_index=1)
+
+        self.assertEqual("session-1", response.session.id)
+
+
+class ClientSideValidationBenchmark(unittest.TestCase):
+    """
+    Compares the per-call overhead of endpoints with and without argument validation, up to
+    the point where the request is serialized.
+    """
+
+    @staticmethod
+    def _call(api_class: type, endpoint: str, request: Any, validation: bool) -> Callable[[], None]:
+        api = api_class(ApiClient(Configuration(NoAuthAuthenticator())))
+        api.api_client.client_side_validation = validation
+        setattr(api, f"_{endpoint}_serialize", _stop)
+
+        def call() -> None:
+            try:
+                getattr(api, endpoint)(request, _request_timeout=5.0)
+            except _SerializeReachedError:
+                pass
+
+        return call
+
+    def _assert_faster(self, api_class: type, endpoint: str, request: Any) -> None:
+        validated, trusted = best_of(
+            self._call(api_class, endpoint, request, True),
+            self._call(api_class, endpoint, request, False),
+            number=1000,
+        )
+
+        self.assertLess(trusted * 2, validated)
+
+    def test_get_session(self) -> None:
+        self._assert_faster(SessionServiceApi, "get_session", SessionServiceGetSessionRequest(sessionId="session-1"))
+
+    def test_get_user_by_id(self) -> None:
+        self._assert_faster(UserServiceApi, "get_user_by_id", UserServiceGetUserByIDRequest(userId="user-1"))
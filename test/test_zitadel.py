@@ -45,6 +45,11 @@ class ZitadelServicesTest(unittest.TestCase):
         }
         self.assertEqual(expected, actual)
 
+    def test_services_are_cached(self) -> None:
+        zitadel = Zitadel(NoAuthAuthenticator("http://dummy"))
+        self.assertIs(zitadel.users, zitadel.users)
+        self.assertIs(zitadel.users.api_client, zitadel.sessions.api_client)
+
 
 class ZitadelTransportTest(unittest.TestCase):
     host: Optional[str] = None
@@ -147,9 +152,10 @@ class ZitadelTransportTest(unittest.TestCase):
         self.assertEqual("http", response.default_language)
 
     def test_no_ca_cert_fails(self) -> None:
+        zitadel = Zitadel.with_client_credentials(
+            f"https://{self.host}:{self.https_port}",
+            "dummy-client",
+            "dummy-secret",
+        )
         with self.assertRaises(Exception):  # noqa: B017
-            Zitadel.with_client_credentials(
-                f"https://{self.host}:{self.https_port}",
-                "dummy-client",
-                "dummy-secret",
-            )
+            zitadel.settings.get_general_settings({})
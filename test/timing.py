@@ -0,0 +1,16 @@
+import timeit
+from typing import Callable, List
+
+
+def best_of(*functions: Callable[[], object], number: int, rounds: int = 7) -> List[float]:
+    """
+    Times each function `number` times per round and returns the best round of each.
+
+    Rounds alternate between the functions, so that a slow spell on a busy machine
+    affects all of them alike rather than whichever happened to be timed at the time.
+    """
+    best = [float("inf")] * len(functions)
+    for _ in range(rounds):
+        for i, function in enumerate(functions):
+            best[i] = min(best[i], timeit.timeit(function, number=number))
+    return best
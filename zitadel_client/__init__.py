@@ -1,12 +1,48 @@
 __version__ = "0.0.1"
 
+from typing import TYPE_CHECKING, Any
+
 from .api_client import ApiClient  # noqa F401
 from .api_response import ApiResponse  # noqa F401
+from .circuit_breaker import CircuitBreaker  # noqa F401
 from .configuration import Configuration  # noqa F401
 from .exceptions import (
     ApiError,  # noqa F401
+    CircuitOpenError,  # noqa F401
     ZitadelError,  # noqa F401
 )
-from .models import *  # noqa: F403, F401
+from .hedging import HedgingPolicy  # noqa F401
+from .rate_limit import (
+    AdaptiveTokenBucket,  # noqa F401
+    RateLimiter,  # noqa F401
+    TokenBucket,  # noqa F401
+)
+from .retry import (
+    RetryBudget,  # noqa F401
+    RetryPolicy,  # noqa F401
+)
 from .transport_options import TransportOptions  # noqa F401
-from .zitadel import Zitadel  # noqa F401
+
+if TYPE_CHECKING:
+    from .async_zitadel import AsyncZitadel  # noqa F401
+    from .models import *  # noqa: F403, F401
+    from .zitadel import Zitadel  # noqa F401
+
+
+def __getattr__(name: str) -> Any:
+    """Resolves the facade and model classes lazily so that importing the package stays cheap."""
+    if name == "Zitadel":
+        from .zitadel import Zitadel
+
+        return Zitadel
+    if name == "AsyncZitadel":
+        from .async_zitadel import AsyncZitadel
+
+        return AsyncZitadel
+
+    from . import models
+
+    try:
+        return getattr(models, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
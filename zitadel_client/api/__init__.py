@@ -1,33 +1,84 @@
 # flake8: noqa
 
-# import apis into api package
-from zitadel_client.api.action_service_api import ActionServiceApi
-from zitadel_client.api.application_service_api import ApplicationServiceApi
-from zitadel_client.api.authorization_service_api import AuthorizationServiceApi
-from zitadel_client.api.beta_action_service_api import BetaActionServiceApi
-from zitadel_client.api.beta_app_service_api import BetaAppServiceApi
-from zitadel_client.api.beta_authorization_service_api import BetaAuthorizationServiceApi
-from zitadel_client.api.beta_feature_service_api import BetaFeatureServiceApi
-from zitadel_client.api.beta_instance_service_api import BetaInstanceServiceApi
-from zitadel_client.api.beta_internal_permission_service_api import BetaInternalPermissionServiceApi
-from zitadel_client.api.beta_oidc_service_api import BetaOIDCServiceApi
-from zitadel_client.api.beta_organization_service_api import BetaOrganizationServiceApi
-from zitadel_client.api.beta_project_service_api import BetaProjectServiceApi
-from zitadel_client.api.beta_session_service_api import BetaSessionServiceApi
-from zitadel_client.api.beta_settings_service_api import BetaSettingsServiceApi
-from zitadel_client.api.beta_telemetry_service_api import BetaTelemetryServiceApi
-from zitadel_client.api.beta_user_service_api import BetaUserServiceApi
-from zitadel_client.api.beta_web_key_service_api import BetaWebKeyServiceApi
-from zitadel_client.api.feature_service_api import FeatureServiceApi
-from zitadel_client.api.identity_provider_service_api import IdentityProviderServiceApi
-from zitadel_client.api.instance_service_api import InstanceServiceApi
-from zitadel_client.api.internal_permission_service_api import InternalPermissionServiceApi
-from zitadel_client.api.oidc_service_api import OIDCServiceApi
-from zitadel_client.api.organization_service_api import OrganizationServiceApi
-from zitadel_client.api.project_service_api import ProjectServiceApi
-from zitadel_client.api.saml_service_api import SAMLServiceApi
-from zitadel_client.api.session_service_api import SessionServiceApi
-from zitadel_client.api.settings_service_api import SettingsServiceApi
-from zitadel_client.api.user_service_api import UserServiceApi
-from zitadel_client.api.web_key_service_api import WebKeyServiceApi
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
+# index of api names to the modules defining them; apis are imported on first access
+_APIS: Dict[str, str] = {
+    "ActionServiceApi": "action_service_api",
+    "ApplicationServiceApi": "application_service_api",
+    "AuthorizationServiceApi": "authorization_service_api",
+    "BetaActionServiceApi": "beta_action_service_api",
+    "BetaAppServiceApi": "beta_app_service_api",
+    "BetaAuthorizationServiceApi": "beta_authorization_service_api",
+    "BetaFeatureServiceApi": "beta_feature_service_api",
+    "BetaInstanceServiceApi": "beta_instance_service_api",
+    "BetaInternalPermissionServiceApi": "beta_internal_permission_service_api",
+    "BetaOIDCServiceApi": "beta_oidc_service_api",
+    "BetaOrganizationServiceApi": "beta_organization_service_api",
+    "BetaProjectServiceApi": "beta_project_service_api",
+    "BetaSessionServiceApi": "beta_session_service_api",
+    "BetaSettingsServiceApi": "beta_settings_service_api",
+    "BetaTelemetryServiceApi": "beta_telemetry_service_api",
+    "BetaUserServiceApi": "beta_user_service_api",
+    "BetaWebKeyServiceApi": "beta_web_key_service_api",
+    "FeatureServiceApi": "feature_service_api",
+    "IdentityProviderServiceApi": "identity_provider_service_api",
+    "InstanceServiceApi": "instance_service_api",
+    "InternalPermissionServiceApi": "internal_permission_service_api",
+    "OIDCServiceApi": "oidc_service_api",
+    "OrganizationServiceApi": "organization_service_api",
+    "ProjectServiceApi": "project_service_api",
+    "SAMLServiceApi": "saml_service_api",
+    "SessionServiceApi": "session_service_api",
+    "SettingsServiceApi": "settings_service_api",
+    "UserServiceApi": "user_service_api",
+    "WebKeyServiceApi": "web_key_service_api",
+}
+
+__all__: List[str] = list(_APIS)
+
+if TYPE_CHECKING:
+    from zitadel_client.api.action_service_api import ActionServiceApi
+    from zitadel_client.api.application_service_api import ApplicationServiceApi
+    from zitadel_client.api.authorization_service_api import AuthorizationServiceApi
+    from zitadel_client.api.beta_action_service_api import BetaActionServiceApi
+    from zitadel_client.api.beta_app_service_api import BetaAppServiceApi
+    from zitadel_client.api.beta_authorization_service_api import BetaAuthorizationServiceApi
+    from zitadel_client.api.beta_feature_service_api import BetaFeatureServiceApi
+    from zitadel_client.api.beta_instance_service_api import BetaInstanceServiceApi
+    from zitadel_client.api.beta_internal_permission_service_api import BetaInternalPermissionServiceApi
+    from zitadel_client.api.beta_oidc_service_api import BetaOIDCServiceApi
+    from zitadel_client.api.beta_organization_service_api import BetaOrganizationServiceApi
+    from zitadel_client.api.beta_project_service_api import BetaProjectServiceApi
+    from zitadel_client.api.beta_session_service_api import BetaSessionServiceApi
+    from zitadel_client.api.beta_settings_service_api import BetaSettingsServiceApi
+    from zitadel_client.api.beta_telemetry_service_api import BetaTelemetryServiceApi
+    from zitadel_client.api.beta_user_service_api import BetaUserServiceApi
+    from zitadel_client.api.beta_web_key_service_api import BetaWebKeyServiceApi
+    from zitadel_client.api.feature_service_api import FeatureServiceApi
+    from zitadel_client.api.identity_provider_service_api import IdentityProviderServiceApi
+    from zitadel_client.api.instance_service_api import InstanceServiceApi
+    from zitadel_client.api.internal_permission_service_api import InternalPermissionServiceApi
+    from zitadel_client.api.oidc_service_api import OIDCServiceApi
+    from zitadel_client.api.organization_service_api import OrganizationServiceApi
+    from zitadel_client.api.project_service_api import ProjectServiceApi
+    from zitadel_client.api.saml_service_api import SAMLServiceApi
+    from zitadel_client.api.session_service_api import SessionServiceApi
+    from zitadel_client.api.settings_service_api import SettingsServiceApi
+    from zitadel_client.api.user_service_api import UserServiceApi
+    from zitadel_client.api.web_key_service_api import WebKeyServiceApi
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _APIS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_APIS))
@@ -12,8 +12,8 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from typing import Any, Dict
@@ -27,6 +27,7 @@ from zitadel_client.models.action_service_deactivate_public_key_request import A
 from zitadel_client.models.action_service_deactivate_public_key_response import ActionServiceDeactivatePublicKeyResponse
 from zitadel_client.models.action_service_delete_target_request import ActionServiceDeleteTargetRequest
 from zitadel_client.models.action_service_delete_target_response import ActionServiceDeleteTargetResponse
+from zitadel_client.models.action_service_execution import ActionServiceExecution
 from zitadel_client.models.action_service_get_target_request import ActionServiceGetTargetRequest
 from zitadel_client.models.action_service_get_target_response import ActionServiceGetTargetResponse
 from zitadel_client.models.action_service_list_execution_functions_response import ActionServiceListExecutionFunctionsResponse
@@ -38,15 +39,18 @@ from zitadel_client.models.action_service_list_public_keys_request import Action
 from zitadel_client.models.action_service_list_public_keys_response import ActionServiceListPublicKeysResponse
 from zitadel_client.models.action_service_list_targets_request import ActionServiceListTargetsRequest
 from zitadel_client.models.action_service_list_targets_response import ActionServiceListTargetsResponse
+from zitadel_client.models.action_service_public_key import ActionServicePublicKey
 from zitadel_client.models.action_service_remove_public_key_request import ActionServiceRemovePublicKeyRequest
 from zitadel_client.models.action_service_remove_public_key_response import ActionServiceRemovePublicKeyResponse
 from zitadel_client.models.action_service_set_execution_request import ActionServiceSetExecutionRequest
 from zitadel_client.models.action_service_set_execution_response import ActionServiceSetExecutionResponse
+from zitadel_client.models.action_service_target import ActionServiceTarget
 from zitadel_client.models.action_service_update_target_request import ActionServiceUpdateTargetRequest
 from zitadel_client.models.action_service_update_target_response import ActionServiceUpdateTargetResponse
 
-from zitadel_client.api_client import ApiClient, RequestSerialized
+from zitadel_client.api_client import ApiClient, RequestSerialized, validate_call
 from zitadel_client.api_response import ApiResponse
+from zitadel_client.pagination import Paginator
 from zitadel_client.rest import RESTResponseType
 
 
@@ -64,7 +68,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def activate_public_key(        self,                action_service_activate_public_key_request: ActionServiceActivatePublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceActivatePublicKeyResponse:
+    def activate_public_key(        self,                action_service_activate_public_key_request: ActionServiceActivatePublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceActivatePublicKeyResponse:
         """Activate Public Key
 
         Activates the public key for payload encryption.  The public key is used to encrypt the payload sent to the target when the payload type is set to `PAYLOAD_TYPE_JWE`.  Activating a new key will deactivate the current active key. Only one key can be active at a time.  The active key is indicated in the `kid` header in the JWE token sent to the target.  Activating a key that is already active is a no-op.   Required permission:    - `action.target.write`
@@ -90,6 +94,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -108,10 +116,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _activate_public_key_serialize(
@@ -192,7 +202,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def add_public_key(        self,                action_service_add_public_key_request: ActionServiceAddPublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceAddPublicKeyResponse:
+    def add_public_key(        self,                action_service_add_public_key_request: ActionServiceAddPublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceAddPublicKeyResponse:
         """Add Public Key
 
         Adds a public key to the target for payload encryption.  The public key is used to encrypt the payload sent to the target when the payload type is set to `PAYLOAD_TYPE_JWE`.  The public key must be in PEM format and be either an RSA or an EC key.  On a successful addition, a key ID is returned which can not only be used to manage the key (activate, remove),  but also will be used as the `kid` header in the JWE token sent to the target to indicate which key was used for encryption.  Note that newly added keys are inactive by default. You must activate the key to use it for payload encryption.  Providing an optional expiration date allows you to set a validity period for the key.  After the expiration date, the key will be automatically deactivated and no longer used for payload encryption.  Be sure to activate a new key before the current active key expires to avoid interruptions in your target executions.  You can have multiple inactive keys for rotation purposes, but only one active key at a time.   Required permission:    - `action.target.write`
@@ -218,6 +228,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -236,10 +250,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _add_public_key_serialize(
@@ -320,7 +336,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def create_target(        self,                action_service_create_target_request: Optional[ActionServiceCreateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceCreateTargetResponse:
+    def create_target(        self,                action_service_create_target_request: Optional[ActionServiceCreateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceCreateTargetResponse:
         if action_service_create_target_request is None:
             action_service_create_target_request = {}
         """Create Target
@@ -348,6 +364,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -366,10 +386,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _create_target_serialize(
@@ -450,7 +472,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def deactivate_public_key(        self,                action_service_deactivate_public_key_request: ActionServiceDeactivatePublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceDeactivatePublicKeyResponse:
+    def deactivate_public_key(        self,                action_service_deactivate_public_key_request: ActionServiceDeactivatePublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceDeactivatePublicKeyResponse:
         """Deactivate Public Key
 
         Deactivates the public key for payload encryption.  The public key will no longer be used to encrypt payloads sent to the target.  Be aware that deactivating the active key will leave the target without an active key.  Subsequent calls to the target with payload type `PAYLOAD_TYPE_JWE` will fail until a new key is activated.  This endpoint can be used in break glass scenarios to quickly disable a compromised key.  Deactivating a key that is already inactive is a no-op.   Required permission:    - `action.target.write`
@@ -476,6 +498,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -494,10 +520,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _deactivate_public_key_serialize(
@@ -578,7 +606,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def delete_target(        self,                action_service_delete_target_request: ActionServiceDeleteTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceDeleteTargetResponse:
+    def delete_target(        self,                action_service_delete_target_request: ActionServiceDeleteTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceDeleteTargetResponse:
         """Delete Target
 
         Delete an existing target. This will remove it from any configured execution as well.  In case the target is not found, the request will return a successful response as  the desired state is already achieved.   Required permission:    - `action.target.delete`
@@ -604,6 +632,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -622,10 +654,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _delete_target_serialize(
@@ -706,7 +740,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def get_target(        self,                action_service_get_target_request: ActionServiceGetTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceGetTargetResponse:
+    def get_target(        self,                action_service_get_target_request: ActionServiceGetTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceGetTargetResponse:
         """Get Target
 
         Returns the target identified by the requested ID.   Required permission:    - `action.target.read`
@@ -732,6 +766,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -750,10 +788,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _get_target_serialize(
@@ -834,7 +874,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def list_execution_functions(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceListExecutionFunctionsResponse:
+    def list_execution_functions(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceListExecutionFunctionsResponse:
         if body is None:
             body = {}
         """List Execution Functions
@@ -862,6 +902,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -880,10 +924,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_execution_functions_serialize(
@@ -964,7 +1010,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def list_execution_methods(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceListExecutionMethodsResponse:
+    def list_execution_methods(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceListExecutionMethodsResponse:
         if body is None:
             body = {}
         """List Execution Methods
@@ -992,6 +1038,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1010,10 +1060,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_execution_methods_serialize(
@@ -1094,7 +1146,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def list_execution_services(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceListExecutionServicesResponse:
+    def list_execution_services(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceListExecutionServicesResponse:
         if body is None:
             body = {}
         """List Execution Services
@@ -1122,6 +1174,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1140,10 +1196,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_execution_services_serialize(
@@ -1224,7 +1282,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def list_executions(        self,                action_service_list_executions_request: ActionServiceListExecutionsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceListExecutionsResponse:
+    def list_executions(        self,                action_service_list_executions_request: ActionServiceListExecutionsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceListExecutionsResponse:
         """List Executions
 
         List all matching executions. By default all executions of the instance are returned that have at least one execution target.  Make sure to include a limit and sorting for pagination.   Required permission:    - `action.execution.read`
@@ -1250,6 +1308,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1268,10 +1330,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_executions_serialize(
@@ -1352,7 +1416,40 @@ class ActionServiceApi:
 
 
     @validate_call
-    def list_public_keys(        self,                action_service_list_public_keys_request: ActionServiceListPublicKeysRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceListPublicKeysResponse:
+    def iter_executions(        self,                action_service_list_executions_request: ActionServiceListExecutionsRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[ActionServiceExecution]:
+        """List Executions (all pages)
+
+        Iterates over the `executions` of every page returned by list_executions, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param action_service_list_executions_request: (required)
+        :type action_service_list_executions_request: ActionServiceListExecutionsRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_executions,
+            action_service_list_executions_request,
+            page_field="pagination",
+            items_field="executions",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def list_public_keys(        self,                action_service_list_public_keys_request: ActionServiceListPublicKeysRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceListPublicKeysResponse:
         """List Public Keys
 
         Lists all public keys of a target.  The response includes which key is active and the key's expiration dates.  This allows you to manage key rotations and ensure that your target always has an active key for payload encryption.   Required permission:    - `action.target.read`
@@ -1378,6 +1475,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1396,10 +1497,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_public_keys_serialize(
@@ -1480,7 +1583,40 @@ class ActionServiceApi:
 
 
     @validate_call
-    def list_targets(        self,                action_service_list_targets_request: ActionServiceListTargetsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceListTargetsResponse:
+    def iter_public_keys(        self,                action_service_list_public_keys_request: ActionServiceListPublicKeysRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[ActionServicePublicKey]:
+        """List Public Keys (all pages)
+
+        Iterates over the `public_keys` of every page returned by list_public_keys, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param action_service_list_public_keys_request: (required)
+        :type action_service_list_public_keys_request: ActionServiceListPublicKeysRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_public_keys,
+            action_service_list_public_keys_request,
+            page_field="pagination",
+            items_field="public_keys",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def list_targets(        self,                action_service_list_targets_request: ActionServiceListTargetsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceListTargetsResponse:
         """List targets
 
         List all matching targets. By default all targets of the instance are returned.  Make sure to include a limit and sorting for pagination.   Required permission:    - `action.target.read`
@@ -1506,6 +1642,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1524,10 +1664,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_targets_serialize(
@@ -1608,7 +1750,40 @@ class ActionServiceApi:
 
 
     @validate_call
-    def remove_public_key(        self,                action_service_remove_public_key_request: ActionServiceRemovePublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceRemovePublicKeyResponse:
+    def iter_targets(        self,                action_service_list_targets_request: ActionServiceListTargetsRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[ActionServiceTarget]:
+        """List targets (all pages)
+
+        Iterates over the `targets` of every page returned by list_targets, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param action_service_list_targets_request: (required)
+        :type action_service_list_targets_request: ActionServiceListTargetsRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_targets,
+            action_service_list_targets_request,
+            page_field="pagination",
+            items_field="targets",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def remove_public_key(        self,                action_service_remove_public_key_request: ActionServiceRemovePublicKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceRemovePublicKeyResponse:
         """Remove Public Key
 
         Removes the public key from the target. This is a permanent action and can not be undone.  Note that you can only remove inactive keys. Attempting to remove an active key will result in an error.  For break glass scenarios, deactivate the key first and then remove it.  Removing a non-existing key is a no-op.   Required permission:    - `action.target.write`
@@ -1634,6 +1809,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1652,10 +1831,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _remove_public_key_serialize(
@@ -1736,7 +1917,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def set_execution(        self,                action_service_set_execution_request: ActionServiceSetExecutionRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceSetExecutionResponse:
+    def set_execution(        self,                action_service_set_execution_request: ActionServiceSetExecutionRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceSetExecutionResponse:
         """Set Execution
 
         Sets an execution to call a target or include the targets of another execution.  Setting an empty list of targets will remove all targets from the execution, making it a noop.   Required permission:    - `action.execution.write`
@@ -1762,6 +1943,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1780,10 +1965,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _set_execution_serialize(
@@ -1864,7 +2051,7 @@ class ActionServiceApi:
 
 
     @validate_call
-    def update_target(        self,                action_service_update_target_request: Optional[ActionServiceUpdateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ActionServiceUpdateTargetResponse:
+    def update_target(        self,                action_service_update_target_request: Optional[ActionServiceUpdateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ActionServiceUpdateTargetResponse:
         if action_service_update_target_request is None:
             action_service_update_target_request = {}
         """Update Target
@@ -1892,6 +2079,10 @@ class ActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1910,10 +2101,12 @@ class ActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _update_target_serialize(
@@ -12,10 +12,12 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from typing_extensions import Annotated
 
+from zitadel_client.models.application_service_application import ApplicationServiceApplication
+from zitadel_client.models.application_service_application_key import ApplicationServiceApplicationKey
 from zitadel_client.models.application_service_create_application_key_request import ApplicationServiceCreateApplicationKeyRequest
 from zitadel_client.models.application_service_create_application_key_response import ApplicationServiceCreateApplicationKeyResponse
 from zitadel_client.models.application_service_create_application_request import ApplicationServiceCreateApplicationRequest
@@ -41,8 +43,9 @@ from zitadel_client.models.application_service_reactivate_application_response i
 from zitadel_client.models.application_service_update_application_request import ApplicationServiceUpdateApplicationRequest
 from zitadel_client.models.application_service_update_application_response import ApplicationServiceUpdateApplicationResponse
 
-from zitadel_client.api_client import ApiClient, RequestSerialized
+from zitadel_client.api_client import ApiClient, RequestSerialized, validate_call
 from zitadel_client.api_response import ApiResponse
+from zitadel_client.pagination import Paginator
 from zitadel_client.rest import RESTResponseType
 
 
@@ -60,7 +63,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def create_application(        self,                application_service_create_application_request: Optional[ApplicationServiceCreateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceCreateApplicationResponse:
+    def create_application(        self,                application_service_create_application_request: Optional[ApplicationServiceCreateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceCreateApplicationResponse:
         if application_service_create_application_request is None:
             application_service_create_application_request = {}
         """Create Application
@@ -88,6 +91,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -106,10 +113,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _create_application_serialize(
@@ -190,7 +199,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def create_application_key(        self,                application_service_create_application_key_request: ApplicationServiceCreateApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceCreateApplicationKeyResponse:
+    def create_application_key(        self,                application_service_create_application_key_request: ApplicationServiceCreateApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceCreateApplicationKeyResponse:
         """Create Application Key
 
         Create a new application key, which is used to authorize an API application.   Key details are returned in the response. They must be stored safely, as it will not  be possible to retrieve them again.   Required permissions:    - `project.app.write`
@@ -216,6 +225,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -234,10 +247,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _create_application_key_serialize(
@@ -318,7 +333,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def deactivate_application(        self,                application_service_deactivate_application_request: ApplicationServiceDeactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceDeactivateApplicationResponse:
+    def deactivate_application(        self,                application_service_deactivate_application_request: ApplicationServiceDeactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceDeactivateApplicationResponse:
         """Deactivate Application
 
         Deactivates the application belonging to the input project and matching the provided  application ID.   Required permissions:    - project.app.write
@@ -344,6 +359,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -362,10 +381,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _deactivate_application_serialize(
@@ -446,7 +467,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def delete_application(        self,                application_service_delete_application_request: ApplicationServiceDeleteApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceDeleteApplicationResponse:
+    def delete_application(        self,                application_service_delete_application_request: ApplicationServiceDeleteApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceDeleteApplicationResponse:
         """Delete Application
 
         Deletes the application belonging to the input project and matching the provided  application ID.   Required permissions:    - project.app.delete
@@ -472,6 +493,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -490,10 +515,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _delete_application_serialize(
@@ -574,7 +601,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def delete_application_key(        self,                application_service_delete_application_key_request: ApplicationServiceDeleteApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceDeleteApplicationKeyResponse:
+    def delete_application_key(        self,                application_service_delete_application_key_request: ApplicationServiceDeleteApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceDeleteApplicationKeyResponse:
         """Delete Application Key
 
         Deletes an application key matching the provided ID.   Organization ID is not mandatory, but helps with filtering/performance.   The deletion time is returned in response message.   Required permissions:    - `project.app.write`
@@ -600,6 +627,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -618,10 +649,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _delete_application_key_serialize(
@@ -702,7 +735,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def generate_client_secret(        self,                application_service_generate_client_secret_request: ApplicationServiceGenerateClientSecretRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceGenerateClientSecretResponse:
+    def generate_client_secret(        self,                application_service_generate_client_secret_request: ApplicationServiceGenerateClientSecretRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceGenerateClientSecretResponse:
         """Generate Client Secret
 
         Generates the client secret of an API or OIDC application that belongs to the input project.   Required permissions:    - project.app.write
@@ -728,6 +761,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -746,10 +783,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _generate_client_secret_serialize(
@@ -830,7 +869,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def get_application(        self,                application_service_get_application_request: ApplicationServiceGetApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceGetApplicationResponse:
+    def get_application(        self,                application_service_get_application_request: ApplicationServiceGetApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceGetApplicationResponse:
         """Get Application
 
         Retrieves the application matching the provided ID.   Required permissions:    - project.app.read
@@ -856,6 +895,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -874,10 +917,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _get_application_serialize(
@@ -958,7 +1003,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def get_application_key(        self,                application_service_get_application_key_request: ApplicationServiceGetApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceGetApplicationKeyResponse:
+    def get_application_key(        self,                application_service_get_application_key_request: ApplicationServiceGetApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceGetApplicationKeyResponse:
         """Get Application Key
 
         Retrieves the application key matching the provided ID.   Specifying a project, organization and application ID is optional but help with filtering/performance.   Required permissions:    - project.app.read
@@ -984,6 +1029,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1002,10 +1051,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _get_application_key_serialize(
@@ -1086,7 +1137,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def list_application_keys(        self,                application_service_list_application_keys_request: ApplicationServiceListApplicationKeysRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceListApplicationKeysResponse:
+    def list_application_keys(        self,                application_service_list_application_keys_request: ApplicationServiceListApplicationKeysRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceListApplicationKeysResponse:
         """List Application Keys
 
         Returns a list of application keys matching the input parameters.   The result can be sorted by id, aggregate, creation date, expiration date, resource owner or type.  It can also be filtered by application, project or organization ID.   Required permissions:    - project.app.read
@@ -1112,6 +1163,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1130,10 +1185,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_application_keys_serialize(
@@ -1214,7 +1271,40 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def list_applications(        self,                application_service_list_applications_request: ApplicationServiceListApplicationsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceListApplicationsResponse:
+    def iter_application_keys(        self,                application_service_list_application_keys_request: ApplicationServiceListApplicationKeysRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[ApplicationServiceApplicationKey]:
+        """List Application Keys (all pages)
+
+        Iterates over the `keys` of every page returned by list_application_keys, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param application_service_list_application_keys_request: (required)
+        :type application_service_list_application_keys_request: ApplicationServiceListApplicationKeysRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_application_keys,
+            application_service_list_application_keys_request,
+            page_field="pagination",
+            items_field="keys",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def list_applications(        self,                application_service_list_applications_request: ApplicationServiceListApplicationsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceListApplicationsResponse:
         """List Applications
 
         Returns a list of applications matching the input parameters. The results can be filtered  by project, state, type and name. It can be sorted by id, name, creation date, change date or state.   Required permissions:    - project.app.read
@@ -1240,6 +1330,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1258,10 +1352,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_applications_serialize(
@@ -1342,7 +1438,40 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def reactivate_application(        self,                application_service_reactivate_application_request: ApplicationServiceReactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceReactivateApplicationResponse:
+    def iter_applications(        self,                application_service_list_applications_request: ApplicationServiceListApplicationsRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[ApplicationServiceApplication]:
+        """List Applications (all pages)
+
+        Iterates over the `applications` of every page returned by list_applications, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param application_service_list_applications_request: (required)
+        :type application_service_list_applications_request: ApplicationServiceListApplicationsRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_applications,
+            application_service_list_applications_request,
+            page_field="pagination",
+            items_field="applications",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def reactivate_application(        self,                application_service_reactivate_application_request: ApplicationServiceReactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceReactivateApplicationResponse:
         """Reactivate Application
 
         Reactivates the application belonging to the input project and matching the provided  application ID.   Required permissions:    - project.app.write
@@ -1368,6 +1497,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1386,10 +1519,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _reactivate_application_serialize(
@@ -1470,7 +1605,7 @@ class ApplicationServiceApi:
 
 
     @validate_call
-    def update_application(        self,                application_service_update_application_request: Optional[ApplicationServiceUpdateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> ApplicationServiceUpdateApplicationResponse:
+    def update_application(        self,                application_service_update_application_request: Optional[ApplicationServiceUpdateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> ApplicationServiceUpdateApplicationResponse:
         if application_service_update_application_request is None:
             application_service_update_application_request = {}
         """Update Application
@@ -1498,6 +1633,10 @@ class ApplicationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1516,10 +1655,12 @@ class ApplicationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _update_application_serialize(
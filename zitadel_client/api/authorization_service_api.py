@@ -12,12 +12,13 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from zitadel_client.models.authorization_service_activate_authorization_request import AuthorizationServiceActivateAuthorizationRequest
 from zitadel_client.models.authorization_service_activate_authorization_response import AuthorizationServiceActivateAuthorizationResponse
+from zitadel_client.models.authorization_service_authorization import AuthorizationServiceAuthorization
 from zitadel_client.models.authorization_service_create_authorization_request import AuthorizationServiceCreateAuthorizationRequest
 from zitadel_client.models.authorization_service_create_authorization_response import AuthorizationServiceCreateAuthorizationResponse
 from zitadel_client.models.authorization_service_deactivate_authorization_request import AuthorizationServiceDeactivateAuthorizationRequest
@@ -29,8 +30,9 @@ from zitadel_client.models.authorization_service_list_authorizations_response im
 from zitadel_client.models.authorization_service_update_authorization_request import AuthorizationServiceUpdateAuthorizationRequest
 from zitadel_client.models.authorization_service_update_authorization_response import AuthorizationServiceUpdateAuthorizationResponse
 
-from zitadel_client.api_client import ApiClient, RequestSerialized
+from zitadel_client.api_client import ApiClient, RequestSerialized, validate_call
 from zitadel_client.api_response import ApiResponse
+from zitadel_client.pagination import Paginator
 from zitadel_client.rest import RESTResponseType
 
 
@@ -48,7 +50,7 @@ class AuthorizationServiceApi:
 
 
     @validate_call
-    def activate_authorization(        self,                authorization_service_activate_authorization_request: AuthorizationServiceActivateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> AuthorizationServiceActivateAuthorizationResponse:
+    def activate_authorization(        self,                authorization_service_activate_authorization_request: AuthorizationServiceActivateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> AuthorizationServiceActivateAuthorizationResponse:
         """Activate Authorization
 
         ActivateAuthorization activates an existing but inactive authorization.   In case the authorization is already active, the request will return a successful response as  the desired state is already achieved.  You can check the change date in the response to verify if the authorization was activated by the request.   Required permissions:    - \"user.grant.write\"
@@ -74,6 +76,10 @@ class AuthorizationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -92,10 +98,12 @@ class AuthorizationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _activate_authorization_serialize(
@@ -176,7 +184,7 @@ class AuthorizationServiceApi:
 
 
     @validate_call
-    def create_authorization(        self,                authorization_service_create_authorization_request: AuthorizationServiceCreateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> AuthorizationServiceCreateAuthorizationResponse:
+    def create_authorization(        self,                authorization_service_create_authorization_request: AuthorizationServiceCreateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> AuthorizationServiceCreateAuthorizationResponse:
         """Create Authorization
 
         CreateAuthorization creates a new authorization for a user in an owned or granted project.   Required permissions:    - \"user.grant.write\"
@@ -202,6 +210,10 @@ class AuthorizationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -220,10 +232,12 @@ class AuthorizationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _create_authorization_serialize(
@@ -304,7 +318,7 @@ class AuthorizationServiceApi:
 
 
     @validate_call
-    def deactivate_authorization(        self,                authorization_service_deactivate_authorization_request: AuthorizationServiceDeactivateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> AuthorizationServiceDeactivateAuthorizationResponse:
+    def deactivate_authorization(        self,                authorization_service_deactivate_authorization_request: AuthorizationServiceDeactivateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> AuthorizationServiceDeactivateAuthorizationResponse:
         """Deactivate Authorization
 
         DeactivateAuthorization deactivates an existing and active authorization.   In case the authorization is already inactive, the request will return a successful response as  the desired state is already achieved.  You can check the change date in the response to verify if the authorization was deactivated by the request.   Required permissions:    - \"user.grant.write\"
@@ -330,6 +344,10 @@ class AuthorizationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -348,10 +366,12 @@ class AuthorizationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _deactivate_authorization_serialize(
@@ -432,7 +452,7 @@ class AuthorizationServiceApi:
 
 
     @validate_call
-    def delete_authorization(        self,                authorization_service_delete_authorization_request: AuthorizationServiceDeleteAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> AuthorizationServiceDeleteAuthorizationResponse:
+    def delete_authorization(        self,                authorization_service_delete_authorization_request: AuthorizationServiceDeleteAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> AuthorizationServiceDeleteAuthorizationResponse:
         """Delete Authorization
 
         DeleteAuthorization deletes the authorization.   In case the authorization is not found, the request will return a successful response as  the desired state is already achieved.  You can check the deletion date in the response to verify if the authorization was deleted by the request.   Required permissions:    - \"user.grant.delete\"
@@ -458,6 +478,10 @@ class AuthorizationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -476,10 +500,12 @@ class AuthorizationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _delete_authorization_serialize(
@@ -560,7 +586,7 @@ class AuthorizationServiceApi:
 
 
     @validate_call
-    def list_authorizations(        self,                authorization_service_list_authorizations_request: AuthorizationServiceListAuthorizationsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> AuthorizationServiceListAuthorizationsResponse:
+    def list_authorizations(        self,                authorization_service_list_authorizations_request: AuthorizationServiceListAuthorizationsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> AuthorizationServiceListAuthorizationsResponse:
         """List Authorizations
 
         ListAuthorizations returns all authorizations matching the request and necessary permissions.   Required permissions:    - \"user.grant.read\"    - no permissions required for listing own authorizations
@@ -586,6 +612,10 @@ class AuthorizationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -604,10 +634,12 @@ class AuthorizationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_authorizations_serialize(
@@ -688,7 +720,40 @@ class AuthorizationServiceApi:
 
 
     @validate_call
-    def update_authorization(        self,                authorization_service_update_authorization_request: AuthorizationServiceUpdateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> AuthorizationServiceUpdateAuthorizationResponse:
+    def iter_authorizations(        self,                authorization_service_list_authorizations_request: AuthorizationServiceListAuthorizationsRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[AuthorizationServiceAuthorization]:
+        """List Authorizations (all pages)
+
+        Iterates over the `authorizations` of every page returned by list_authorizations, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param authorization_service_list_authorizations_request: (required)
+        :type authorization_service_list_authorizations_request: AuthorizationServiceListAuthorizationsRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_authorizations,
+            authorization_service_list_authorizations_request,
+            page_field="pagination",
+            items_field="authorizations",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def update_authorization(        self,                authorization_service_update_authorization_request: AuthorizationServiceUpdateAuthorizationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> AuthorizationServiceUpdateAuthorizationResponse:
         """Update Authorization
 
         UpdateAuthorization updates the authorization.   Note that any role keys previously granted to the user and not present in the request will be revoked.   Required permissions:    - \"user.grant.write\"
@@ -714,6 +779,10 @@ class AuthorizationServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -732,10 +801,12 @@ class AuthorizationServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _update_authorization_serialize(
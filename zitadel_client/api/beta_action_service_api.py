@@ -12,8 +12,8 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from typing_extensions import Annotated
 
 from typing import Any, Dict
@@ -21,6 +21,7 @@ from zitadel_client.models.beta_action_service_create_target_request import Beta
 from zitadel_client.models.beta_action_service_create_target_response import BetaActionServiceCreateTargetResponse
 from zitadel_client.models.beta_action_service_delete_target_request import BetaActionServiceDeleteTargetRequest
 from zitadel_client.models.beta_action_service_delete_target_response import BetaActionServiceDeleteTargetResponse
+from zitadel_client.models.beta_action_service_execution import BetaActionServiceExecution
 from zitadel_client.models.beta_action_service_get_target_request import BetaActionServiceGetTargetRequest
 from zitadel_client.models.beta_action_service_get_target_response import BetaActionServiceGetTargetResponse
 from zitadel_client.models.beta_action_service_list_execution_functions_response import BetaActionServiceListExecutionFunctionsResponse
@@ -32,11 +33,13 @@ from zitadel_client.models.beta_action_service_list_targets_request import BetaA
 from zitadel_client.models.beta_action_service_list_targets_response import BetaActionServiceListTargetsResponse
 from zitadel_client.models.beta_action_service_set_execution_request import BetaActionServiceSetExecutionRequest
 from zitadel_client.models.beta_action_service_set_execution_response import BetaActionServiceSetExecutionResponse
+from zitadel_client.models.beta_action_service_target import BetaActionServiceTarget
 from zitadel_client.models.beta_action_service_update_target_request import BetaActionServiceUpdateTargetRequest
 from zitadel_client.models.beta_action_service_update_target_response import BetaActionServiceUpdateTargetResponse
 
-from zitadel_client.api_client import ApiClient, RequestSerialized
+from zitadel_client.api_client import ApiClient, RequestSerialized, validate_call
 from zitadel_client.api_response import ApiResponse
+from zitadel_client.pagination import Paginator
 from zitadel_client.rest import RESTResponseType
 
 
@@ -54,7 +57,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def create_target(        self,                beta_action_service_create_target_request: Optional[BetaActionServiceCreateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceCreateTargetResponse:
+    def create_target(        self,                beta_action_service_create_target_request: Optional[BetaActionServiceCreateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceCreateTargetResponse:
         if beta_action_service_create_target_request is None:
             beta_action_service_create_target_request = {}
         """Create Target
@@ -82,6 +85,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -100,10 +107,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _create_target_serialize(
@@ -184,7 +193,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def delete_target(        self,                beta_action_service_delete_target_request: BetaActionServiceDeleteTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceDeleteTargetResponse:
+    def delete_target(        self,                beta_action_service_delete_target_request: BetaActionServiceDeleteTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceDeleteTargetResponse:
         """Delete Target
 
         Deprecated: please move to the corresponding endpoint under action service v2. This endpoint will be removed with the next major version of ZITADEL.   Delete an existing target. This will remove it from any configured execution as well.  In case the target is not found, the request will return a successful response as  the desired state is already achieved.   Required permission:    - `action.target.delete`
@@ -210,6 +219,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -228,10 +241,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _delete_target_serialize(
@@ -312,7 +327,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def get_target(        self,                beta_action_service_get_target_request: BetaActionServiceGetTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceGetTargetResponse:
+    def get_target(        self,                beta_action_service_get_target_request: BetaActionServiceGetTargetRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceGetTargetResponse:
         """Get Target
 
         Deprecated: please move to the corresponding endpoint under action service v2. This endpoint will be removed with the next major version of ZITADEL.   Returns the target identified by the requested ID.   Required permission:    - `action.target.read`
@@ -338,6 +353,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -356,10 +375,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _get_target_serialize(
@@ -440,7 +461,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def list_execution_functions(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceListExecutionFunctionsResponse:
+    def list_execution_functions(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceListExecutionFunctionsResponse:
         if body is None:
             body = {}
         """List Execution Functions
@@ -468,6 +489,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -486,10 +511,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_execution_functions_serialize(
@@ -570,7 +597,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def list_execution_methods(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceListExecutionMethodsResponse:
+    def list_execution_methods(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceListExecutionMethodsResponse:
         if body is None:
             body = {}
         """List Execution Methods
@@ -598,6 +625,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -616,10 +647,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_execution_methods_serialize(
@@ -700,7 +733,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def list_execution_services(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceListExecutionServicesResponse:
+    def list_execution_services(        self,                body: Optional[Dict[str, Any]] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceListExecutionServicesResponse:
         if body is None:
             body = {}
         """List Execution Services
@@ -728,6 +761,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -746,10 +783,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_execution_services_serialize(
@@ -830,7 +869,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def list_executions(        self,                beta_action_service_list_executions_request: BetaActionServiceListExecutionsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceListExecutionsResponse:
+    def list_executions(        self,                beta_action_service_list_executions_request: BetaActionServiceListExecutionsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceListExecutionsResponse:
         """List Executions
 
         Deprecated: please move to the corresponding endpoint under action service v2. This endpoint will be removed with the next major version of ZITADEL.   List all matching executions. By default all executions of the instance are returned that have at least one execution target.  Make sure to include a limit and sorting for pagination.   Required permission:    - `action.execution.read`
@@ -856,6 +895,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -874,10 +917,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_executions_serialize(
@@ -958,7 +1003,40 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def list_targets(        self,                beta_action_service_list_targets_request: BetaActionServiceListTargetsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceListTargetsResponse:
+    def iter_executions(        self,                beta_action_service_list_executions_request: BetaActionServiceListExecutionsRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[BetaActionServiceExecution]:
+        """List Executions (all pages)
+
+        Iterates over the `executions` of every page returned by list_executions, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param beta_action_service_list_executions_request: (required)
+        :type beta_action_service_list_executions_request: BetaActionServiceListExecutionsRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_executions,
+            beta_action_service_list_executions_request,
+            page_field="pagination",
+            items_field="executions",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def list_targets(        self,                beta_action_service_list_targets_request: BetaActionServiceListTargetsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceListTargetsResponse:
         """List targets
 
         Deprecated: please move to the corresponding endpoint under action service v2. This endpoint will be removed with the next major version of ZITADEL.   List all matching targets. By default all targets of the instance are returned.  Make sure to include a limit and sorting for pagination.   Required permission:    - `action.target.read`
@@ -984,6 +1062,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1002,10 +1084,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_targets_serialize(
@@ -1086,7 +1170,40 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def set_execution(        self,                beta_action_service_set_execution_request: BetaActionServiceSetExecutionRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceSetExecutionResponse:
+    def iter_targets(        self,                beta_action_service_list_targets_request: BetaActionServiceListTargetsRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[BetaActionServiceTarget]:
+        """List targets (all pages)
+
+        Iterates over the `targets` of every page returned by list_targets, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param beta_action_service_list_targets_request: (required)
+        :type beta_action_service_list_targets_request: BetaActionServiceListTargetsRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_targets,
+            beta_action_service_list_targets_request,
+            page_field="pagination",
+            items_field="targets",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def set_execution(        self,                beta_action_service_set_execution_request: BetaActionServiceSetExecutionRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceSetExecutionResponse:
         """Set Execution
 
         Deprecated: please move to the corresponding endpoint under action service v2. This endpoint will be removed with the next major version of ZITADEL.   Sets an execution to call a target or include the targets of another execution.  Setting an empty list of targets will remove all targets from the execution, making it a noop.   Required permission:    - `action.execution.write`
@@ -1112,6 +1229,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1130,10 +1251,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _set_execution_serialize(
@@ -1214,7 +1337,7 @@ class BetaActionServiceApi:
 
 
     @validate_call
-    def update_target(        self,                beta_action_service_update_target_request: Optional[BetaActionServiceUpdateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaActionServiceUpdateTargetResponse:
+    def update_target(        self,                beta_action_service_update_target_request: Optional[BetaActionServiceUpdateTargetRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaActionServiceUpdateTargetResponse:
         if beta_action_service_update_target_request is None:
             beta_action_service_update_target_request = {}
         """Update Target
@@ -1242,6 +1365,10 @@ class BetaActionServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1260,10 +1387,12 @@ class BetaActionServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _update_target_serialize(
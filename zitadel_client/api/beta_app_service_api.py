@@ -12,10 +12,12 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
-from typing import Any, Dict, List, Optional, Tuple, Union
+from pydantic import Field, StrictBool, StrictFloat, StrictStr, StrictInt
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
 from typing_extensions import Annotated
 
+from zitadel_client.models.beta_app_service_application import BetaAppServiceApplication
+from zitadel_client.models.beta_app_service_application_key import BetaAppServiceApplicationKey
 from zitadel_client.models.beta_app_service_create_application_key_request import BetaAppServiceCreateApplicationKeyRequest
 from zitadel_client.models.beta_app_service_create_application_key_response import BetaAppServiceCreateApplicationKeyResponse
 from zitadel_client.models.beta_app_service_create_application_request import BetaAppServiceCreateApplicationRequest
@@ -41,8 +43,9 @@ from zitadel_client.models.beta_app_service_regenerate_client_secret_response im
 from zitadel_client.models.beta_app_service_update_application_request import BetaAppServiceUpdateApplicationRequest
 from zitadel_client.models.beta_app_service_update_application_response import BetaAppServiceUpdateApplicationResponse
 
-from zitadel_client.api_client import ApiClient, RequestSerialized
+from zitadel_client.api_client import ApiClient, RequestSerialized, validate_call
 from zitadel_client.api_response import ApiResponse
+from zitadel_client.pagination import Paginator
 from zitadel_client.rest import RESTResponseType
 
 
@@ -60,7 +63,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def create_application(        self,                beta_app_service_create_application_request: Optional[BetaAppServiceCreateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceCreateApplicationResponse:
+    def create_application(        self,                beta_app_service_create_application_request: Optional[BetaAppServiceCreateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceCreateApplicationResponse:
         if beta_app_service_create_application_request is None:
             beta_app_service_create_application_request = {}
         """Create Application
@@ -88,6 +91,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -106,10 +113,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _create_application_serialize(
@@ -190,7 +199,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def create_application_key(        self,                beta_app_service_create_application_key_request: BetaAppServiceCreateApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceCreateApplicationKeyResponse:
+    def create_application_key(        self,                beta_app_service_create_application_key_request: BetaAppServiceCreateApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceCreateApplicationKeyResponse:
         """Create Application Key
 
         Deprecated: use [application service v2 CreateApplicationKey](apis/resources/application_service_v2/application-service-create-application-key.api.mdx) instead.   Create a new application key, which is used to authorize an API application.   Key details are returned in the response. They must be stored safely, as it will not  be possible to retrieve them again.   Required permissions:    - `project.app.write`
@@ -216,6 +225,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -234,10 +247,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _create_application_key_serialize(
@@ -318,7 +333,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def deactivate_application(        self,                beta_app_service_deactivate_application_request: BetaAppServiceDeactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceDeactivateApplicationResponse:
+    def deactivate_application(        self,                beta_app_service_deactivate_application_request: BetaAppServiceDeactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceDeactivateApplicationResponse:
         """Deactivate Application
 
         Deprecated: use [application service v2 DeactivateApplication](apis/resources/application_service_v2/application-service-deactivate-application.api.mdx) instead.   Deactivates the application belonging to the input project and matching the provided  application ID.   Required permissions:    - project.app.write
@@ -344,6 +359,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -362,10 +381,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _deactivate_application_serialize(
@@ -446,7 +467,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def delete_application(        self,                beta_app_service_delete_application_request: BetaAppServiceDeleteApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceDeleteApplicationResponse:
+    def delete_application(        self,                beta_app_service_delete_application_request: BetaAppServiceDeleteApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceDeleteApplicationResponse:
         """Delete Application
 
         Deprecated: use [application service v2 DeleteApplication](apis/resources/application_service_v2/application-service-delete-application.api.mdx) instead.   Deletes the application belonging to the input project and matching the provided  application ID.   Required permissions:    - project.app.delete
@@ -472,6 +493,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -490,10 +515,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _delete_application_serialize(
@@ -574,7 +601,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def delete_application_key(        self,                beta_app_service_delete_application_key_request: BetaAppServiceDeleteApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceDeleteApplicationKeyResponse:
+    def delete_application_key(        self,                beta_app_service_delete_application_key_request: BetaAppServiceDeleteApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceDeleteApplicationKeyResponse:
         """Delete Application Key
 
         Deprecated: use [application service v2 DeleteApplicationKey](apis/resources/application_service_v2/application-service-delete-application-key.api.mdx) instead.   Deletes an application key matching the provided ID.   Organization ID is not mandatory, but helps with filtering/performance.   The deletion time is returned in response message.   Required permissions:    - `project.app.write`
@@ -600,6 +627,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -618,10 +649,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _delete_application_key_serialize(
@@ -702,7 +735,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def get_application(        self,                beta_app_service_get_application_request: BetaAppServiceGetApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceGetApplicationResponse:
+    def get_application(        self,                beta_app_service_get_application_request: BetaAppServiceGetApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceGetApplicationResponse:
         """Get Application
 
         Deprecated: use [application service v2 GetApplication](apis/resources/application_service_v2/application-service-get-application.api.mdx) instead.   Retrieves the application matching the provided ID.   Required permissions:    - project.app.read
@@ -728,6 +761,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -746,10 +783,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _get_application_serialize(
@@ -830,7 +869,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def get_application_key(        self,                beta_app_service_get_application_key_request: BetaAppServiceGetApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceGetApplicationKeyResponse:
+    def get_application_key(        self,                beta_app_service_get_application_key_request: BetaAppServiceGetApplicationKeyRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceGetApplicationKeyResponse:
         """Get Application Key
 
         Deprecated: use [application service v2 GetApplicationKey](apis/resources/application_service_v2/application-service-get-application-key.api.mdx) instead.   Retrieves the application key matching the provided ID.   Specifying a project, organization and app ID is optional but help with filtering/performance.   Required permissions:    - project.app.read
@@ -856,6 +895,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -874,10 +917,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _get_application_key_serialize(
@@ -958,7 +1003,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def list_application_keys(        self,                beta_app_service_list_application_keys_request: Optional[BetaAppServiceListApplicationKeysRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceListApplicationKeysResponse:
+    def list_application_keys(        self,                beta_app_service_list_application_keys_request: Optional[BetaAppServiceListApplicationKeysRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceListApplicationKeysResponse:
         if beta_app_service_list_application_keys_request is None:
             beta_app_service_list_application_keys_request = {}
         """List Application Keys
@@ -986,6 +1031,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1004,10 +1053,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_application_keys_serialize(
@@ -1088,7 +1139,43 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def list_applications(        self,                beta_app_service_list_applications_request: BetaAppServiceListApplicationsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceListApplicationsResponse:
+    def iter_application_keys(        self,                beta_app_service_list_application_keys_request: Optional[BetaAppServiceListApplicationKeysRequest] = None,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[BetaAppServiceApplicationKey]:
+        """List Application Keys (all pages)
+
+        Iterates over the `keys` of every page returned by list_application_keys, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param beta_app_service_list_application_keys_request:
+        :type beta_app_service_list_application_keys_request: BetaAppServiceListApplicationKeysRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        if beta_app_service_list_application_keys_request is None:
+            beta_app_service_list_application_keys_request = BetaAppServiceListApplicationKeysRequest()
+
+        return Paginator(
+            self.list_application_keys,
+            beta_app_service_list_application_keys_request,
+            page_field="pagination",
+            items_field="keys",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def list_applications(        self,                beta_app_service_list_applications_request: BetaAppServiceListApplicationsRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceListApplicationsResponse:
         """List Applications
 
         Deprecated: use [application service v2 ListApplications](apis/resources/application_service_v2/application-service-list-applications.api.mdx) instead.   Returns a list of applications matching the input parameters that belong to the provided  project.   The result can be sorted by app id, name, creation date, change date or state. It can also  be filtered by app state, app type and app name.   Required permissions:    - project.app.read
@@ -1114,6 +1201,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1132,10 +1223,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _list_applications_serialize(
@@ -1216,7 +1309,40 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def reactivate_application(        self,                beta_app_service_reactivate_application_request: BetaAppServiceReactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceReactivateApplicationResponse:
+    def iter_applications(        self,                beta_app_service_list_applications_request: BetaAppServiceListApplicationsRequest,        page_size: Annotated[StrictInt, Field(gt=0)] = 100,        read_ahead: StrictBool = False,        _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,    ) -> Paginator[BetaAppServiceApplication]:
+        """List Applications (all pages)
+
+        Iterates over the `applications` of every page returned by list_applications, requesting page_size items at a time until `totalResult` items have been returned.
+
+        :param beta_app_service_list_applications_request: (required)
+        :type beta_app_service_list_applications_request: BetaAppServiceListApplicationsRequest
+        :param page_size: number of items requested per page.
+        :type page_size: int, optional
+        :param read_ahead: fetch the next page in the background while
+                           the current one is consumed.
+        :type read_ahead: bool, optional
+        :param _request_timeout: timeout setting for each request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :type _request_timeout: int, tuple(int, int), optional
+        :return: Returns an iterator over the items of all pages.
+        """ # noqa: E501
+
+        return Paginator(
+            self.list_applications,
+            beta_app_service_list_applications_request,
+            page_field="pagination",
+            items_field="applications",
+            page_size=page_size,
+            read_ahead=read_ahead,
+            _request_timeout=_request_timeout,
+        )
+
+
+
+    @validate_call
+    def reactivate_application(        self,                beta_app_service_reactivate_application_request: BetaAppServiceReactivateApplicationRequest,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceReactivateApplicationResponse:
         """Reactivate Application
 
         Deprecated: use [application service v2 ReactivateApplication](apis/resources/application_service_v2/application-service-reactivate-application.api.mdx) instead.   Reactivates the application belonging to the input project and matching the provided  application ID.   Required permissions:    - project.app.write
@@ -1242,6 +1368,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1260,10 +1390,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _reactivate_application_serialize(
@@ -1344,7 +1476,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def regenerate_client_secret(        self,                beta_app_service_regenerate_client_secret_request: Optional[BetaAppServiceRegenerateClientSecretRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceRegenerateClientSecretResponse:
+    def regenerate_client_secret(        self,                beta_app_service_regenerate_client_secret_request: Optional[BetaAppServiceRegenerateClientSecretRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceRegenerateClientSecretResponse:
         if beta_app_service_regenerate_client_secret_request is None:
             beta_app_service_regenerate_client_secret_request = {}
         """Regenerate Client Secret
@@ -1372,6 +1504,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1390,10 +1526,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _regenerate_client_secret_serialize(
@@ -1474,7 +1612,7 @@ class BetaAppServiceApi:
 
 
     @validate_call
-    def update_application(        self,                beta_app_service_update_application_request: Optional[BetaAppServiceUpdateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,    ) -> BetaAppServiceUpdateApplicationResponse:
+    def update_application(        self,                beta_app_service_update_application_request: Optional[BetaAppServiceUpdateApplicationRequest] = None,                _request_timeout: Union[            None,            Annotated[StrictFloat, Field(gt=0)],            Tuple[                Annotated[StrictFloat, Field(gt=0)],                Annotated[StrictFloat, Field(gt=0)]            ]        ] = None,        _request_auth: Optional[Dict[StrictStr, Any]] = None,        _content_type: Optional[StrictStr] = None,        _headers: Optional[Dict[StrictStr, Any]] = None,        _host_index: Annotated[StrictInt, Field(ge=0, le=0)] = 0,        _response_mode: Optional[Literal["model", "dict", "bytes", "stream"]] = None,    ) -> BetaAppServiceUpdateApplicationResponse:
         if beta_app_service_update_application_request is None:
             beta_app_service_update_application_request = {}
         """Update Application
@@ -1502,6 +1640,10 @@ class BetaAppServiceApi:
                             request; this effectively ignores the host_index
                             in the spec for a single request.
         :type _host_index: int, optional
+        :param _response_mode: set to override the response_mode of the
+                               client for a single request: "model",
+                               "dict", "bytes" or "stream".
+        :type _response_mode: str, optional
         :return: Returns the result object.
         """ # noqa: E501
 
@@ -1520,10 +1662,12 @@ class BetaAppServiceApi:
             *_param,
             _request_timeout=_request_timeout
         )
-        response_data.read()
+        if _response_mode != "stream":
+            response_data.read()
         return self.api_client.response_deserialize(
             response_data=response_data,
             response_types_map=_response_types_map,
+            response_mode=_response_mode,
         ).data
 
     def _update_application_serialize(
@@ -1,17 +1,21 @@
+import concurrent.futures
 import datetime
 import decimal
+import functools
+import inspect
 import json
 import mimetypes
 import os
 import re
 import tempfile
+import time
 from enum import Enum
-from types import TracebackType
-from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar, Union, no_type_check
+from types import MappingProxyType, TracebackType
+from typing import Any, Callable, Dict, List, Mapping, NamedTuple, Optional, Tuple, Type, TypeVar, Union, no_type_check
 from urllib.parse import quote
 
-from dateutil.parser import parse
-from pydantic import SecretStr
+import pydantic
+from pydantic import BaseModel, SecretStr
 
 import zitadel_client.models
 import zitadel_client.rest_response
@@ -23,10 +27,59 @@ from zitadel_client.api_response import T as ApiResponseT
 from zitadel_client.auth.no_auth_authenticator import NoAuthAuthenticator
 from zitadel_client.configuration import Configuration
 from zitadel_client.exceptions import ApiError
+from zitadel_client.hedging import HedgingPolicy
+from zitadel_client.item_stream import ItemStream
+from zitadel_client.utils.datetime_util import DateTimeUtil
+from zitadel_client.utils.model_util import ModelUtil
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
 
+class RequestTemplate(NamedTuple):
+    """The parts of a request that stay the same between calls to one endpoint."""
+
+    url: str
+    """The fully resolved URL."""
+    headers: Mapping[str, str]
+    """The sanitized endpoint and default headers, without authentication."""
+    default_headers: Dict[str, str]
+    """The client's default headers when the template was built."""
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def validate_call(method: F) -> F:
+    """Validates the arguments of a service method, unless client side validation is disabled.
+
+    Arguments are validated with pydantic's validate_call while the service's
+    `api_client.client_side_validation` is set, which is the default. Otherwise they
+    are handed to the method unchecked, so callers must pass request models, not dicts.
+
+    :param method: The service method.
+    :return: The wrapped service method.
+    """
+    validated = pydantic.validate_call(method)
+
+    if inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def async_wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if self.api_client.client_side_validation:
+                return await validated(self, *args, **kwargs)
+            return await method(self, *args, **kwargs)
+
+        return async_wrapper  # ty: ignore[invalid-return-type]
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        if self.api_client.client_side_validation:
+            return validated(self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+
+    return wrapper  # ty: ignore[invalid-return-type]
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -54,6 +107,10 @@ class ApiClient:
         "object": object,
     }
     _pool = None
+    RESPONSE_MODES = ("model", "dict", "bytes", "stream")
+    TEMPLATE_HEADERS = frozenset(("Accept", "Content-Type"))
+    _JSON_OBJECT_BYTES = re.compile(rb"\s*\{")
+    _JSON_OBJECT_TEXT = re.compile(r"\s*\{")
 
     def __init__(
         self,
@@ -70,6 +127,9 @@ class ApiClient:
         if header_name is not None and header_value is not None:
             self.default_headers[header_name] = header_value
         self.client_side_validation = configuration.client_side_validation
+        self.response_mode = configuration.response_mode
+        self.lean_responses = configuration.lean_responses
+        self._templates: Dict[Tuple[Any, ...], RequestTemplate] = {}
 
     # noinspection PyArgumentList
     T = TypeVar("T", bound="ApiClient")
@@ -88,11 +148,15 @@ class ApiClient:
     def set_default_header(self, header_name: str, header_value: str) -> None:
         self.default_headers[header_name] = header_value
 
+    def get_auth_headers(self) -> Dict[str, str]:
+        """Returns the authentication headers to attach to each serialized request."""
+        return self.configuration.authenticator.get_auth_headers()
+
     _default = None
 
     # noinspection PyUnusedLocal
     @no_type_check
-    def param_serialize(
+    def param_serialize(  # noqa C901 too complex
         self,
         method,
         resource_path,
@@ -130,6 +194,11 @@ class ApiClient:
             body, post_params, files)
         """
 
+        if not (path_params or query_params or post_params or files):
+            serialized = self.__serialize_from_template(method, resource_path, header_params, body, post_params, _host)
+            if serialized is not None:
+                return serialized
+
         config = self.configuration
 
         # header parameters
@@ -155,7 +224,7 @@ class ApiClient:
             if files:
                 post_params.extend(self.files_parameters(files))
 
-        header_params.update(self.configuration.authenticator.get_auth_headers())
+        header_params.update(self.get_auth_headers())
 
         if body:
             body = self.sanitize_for_serialization(body)
@@ -172,6 +241,58 @@ class ApiClient:
 
         return method, url, header_params, body, post_params
 
+    @no_type_check
+    def __serialize_from_template(self, method, resource_path, header_params, body, post_params, _host):
+        """Builds the request params from the endpoint's template, if it has one.
+
+        Only the authentication headers and the body change between calls.
+
+        :return: tuple as returned by param_serialize, or None.
+        """
+        template = self.request_template(method, resource_path, header_params, _host)
+        if template is None:
+            return None
+
+        header_params = dict(template.headers)
+        header_params.update(self.get_auth_headers())
+        if body:
+            body = self.sanitize_for_serialization(body)
+        return method, template.url, header_params, body, post_params
+
+    def request_template(
+        self,
+        method: str,
+        resource_path: str,
+        header_params: Optional[Dict[str, Any]],
+        _host: Optional[str] = None,
+    ) -> Optional[RequestTemplate]:
+        """Returns the cached template of an endpoint, building it on first use.
+
+        Templates are only kept for requests whose headers are the generated
+        Accept and Content-Type headers; requests with custom headers are not
+        cached. A template is rebuilt when the default headers have changed.
+
+        :param method: Method to call.
+        :param resource_path: Path to method endpoint.
+        :param header_params: Header parameters of the endpoint.
+        :param _host: The host to override, if any.
+        :return: RequestTemplate, or None for requests with custom headers.
+        """
+        header_params = header_params or {}
+        if not self.TEMPLATE_HEADERS.issuperset(header_params):
+            return None
+
+        key = (method, resource_path, _host, *header_params.items())
+        template = self._templates.get(key)
+        if template is None or template.default_headers != self.default_headers:
+            headers = dict(header_params)
+            headers.update(self.default_headers)
+            headers = dict(self.parameters_to_tuples(self.sanitize_for_serialization(headers), None))
+            url = (self.configuration.host if _host is None else _host) + resource_path
+            template = RequestTemplate(url, MappingProxyType(headers), dict(self.default_headers))
+            self._templates[key] = template
+        return template
+
     @no_type_check
     def call_api(
         self,
@@ -194,10 +315,47 @@ class ApiClient:
         :param _request_timeout: timeout setting for this request.
         :return: RESTResponse
         """
+        policy = self.configuration.retry_policy
+        retry = policy is not None and policy.is_idempotent(method, url)
+        if retry:
+            policy.budget.deposit()
+
+        limiter = self.configuration.rate_limiter
+        attempt = 1
+        while True:
+            if limiter is not None:
+                wait = limiter.reserve(url)
+                if wait:
+                    time.sleep(wait)
+            sent = time.monotonic()
+            try:
+                # perform request and return response
+                response_data = self.__send(method, url, header_params, body, post_params, _request_timeout)
+            except self.rest_client.TRANSIENT_ERRORS:
+                delay = policy.delay(attempt) if retry else None
+                if delay is None:
+                    raise
+            else:
+                if limiter is not None:
+                    limiter.record(url, response_data.status, time.monotonic() - sent)
+                delay = policy.delay(attempt, response_data.status, response_data.headers) if retry else None
+                if delay is None:
+                    return response_data
+                # drain the body, so the connection can be reused by the retry
+                response_data.read()
 
-        try:
-            # perform request and return response
-            response_data = self.rest_client.request(
+            time.sleep(delay)
+            attempt += 1
+
+    @no_type_check
+    def __send(self, method, url, header_params, body, post_params, _request_timeout):
+        """Sends a request, hedged if the configured hedging policy selects it.
+
+        :return: RESTResponse
+        """
+        policy = self.configuration.hedging_policy
+        if policy is None or not policy.should_hedge(method, url):
+            return self.rest_client.request(
                 method,
                 url,
                 headers=header_params,
@@ -206,38 +364,79 @@ class ApiClient:
                 _request_timeout=_request_timeout,
             )
 
-        except ApiError as e:
-            raise e
-
-        return response_data
+        def attempt():
+            sent = time.monotonic()
+            response = self.rest_client.request(
+                method,
+                url,
+                headers=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+            policy.record(url, time.monotonic() - sent)
+            return response
+
+        policy.budget.deposit()
+        attempts = [policy.executor.submit(attempt)]
+        delay = policy.delay(url)
+        if delay is not None:
+            done, _ = concurrent.futures.wait(attempts, timeout=delay)
+            if not done and policy.budget.withdraw():
+                attempts.append(policy.executor.submit(attempt))
+
+        # the first response wins; an error only counts once no other attempt is left
+        error = None
+        for future in concurrent.futures.as_completed(attempts):
+            error = future.exception()
+            if error is None:
+                for other in attempts:
+                    if other is not future:
+                        other.add_done_callback(HedgingPolicy.discard)
+                return future.result()
+        raise error
 
     @no_type_check
-    def response_deserialize(
+    def response_deserialize(  # noqa C901 too complex
         self,
         response_data: zitadel_client.rest_response.RESTResponse,
         response_types_map: Optional[Dict[str, ApiResponseT]] = None,
+        response_mode: Optional[str] = None,
     ) -> ApiResponse[ApiResponseT]:
         """Deserializes response into an object.
         :param response_data: RESTResponse object to be deserialized.
         :param response_types_map: dict of response types.
+        :param response_mode: "model", "dict", "bytes" or "stream";
+            defaults to the client's response_mode. In "stream" mode,
+            response_data need not have been read.
         :return: ApiResponse
         """
 
-        msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
-        assert response_data.data is not None, msg
+        response_mode = response_mode or self.response_mode
+        if response_mode not in self.RESPONSE_MODES:
+            raise ValueError(f"response_mode must be one of {', '.join(self.RESPONSE_MODES)}, not {response_mode!r}")
 
         response_type = response_types_map.get(str(response_data.status), None)
         if not response_type and isinstance(response_data.status, int) and 100 <= response_data.status <= 599:
             # if not found, look for '1XX', '2XX', etc.
             response_type = response_types_map.get(str(response_data.status)[0] + "XX", None)
 
+        if response_mode == "stream":
+            if 200 <= response_data.status <= 299:
+                return self.__stream(response_data, response_type)
+            # error responses are read in full, to be raised as ApiError
+            response_data.read()
+
+        msg = "RESTResponse.read() must be called before passing it to response_deserialize()"
+        assert response_data.data is not None, msg
+
         # deserialize response data
         # noinspection PyUnusedLocal
         response_text = None
         return_data = None
         # noinspection PyUnreachableCode
         try:
-            if response_type == "bytearray":
+            if response_type == "bytearray" or (response_type is not None and response_mode == "bytes"):
                 return_data = response_data.data
             elif response_type == "file":
                 return_data = self.__deserialize_file(response_data)
@@ -247,9 +446,12 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                # noinspection PyTypeChecker
-                return_data = self.deserialize(response_text, response_type, content_type)
+                response_text = self.__response_text(response_data.data, encoding)
+                if response_mode == "dict":
+                    return_data = self.configuration.json_codec.loads(response_text) if response_text else None
+                else:
+                    # noinspection PyTypeChecker
+                    return_data = self.deserialize(response_text, response_type, content_type)
         finally:
             if not 200 <= response_data.status <= 299:
                 body = None
@@ -262,8 +464,8 @@ class ApiClient:
                     if is_json:
                         try:
                             # Attempt to decode the JSON into a standard dictionary
-                            body = json.loads(response_data.data.decode("utf-8"))
-                        except (json.JSONDecodeError, UnicodeDecodeError):
+                            body = self.configuration.json_codec.loads(response_data.data)
+                        except (ValueError, UnicodeDecodeError):
                             # Fallback to raw text if JSON is malformed
                             body = response_data.data.decode("utf-8", errors="ignore")
                     else:
@@ -271,6 +473,15 @@ class ApiClient:
                         body = response_data.data.decode("utf-8", errors="ignore")
 
                 raise ApiError(response_data.status, response_data.getheaders(), body)
+            elif self.lean_responses:
+                # keep only the deserialized data, with a view of the headers
+                response_data.release()
+                return ApiResponse.model_construct(
+                    status_code=response_data.status,
+                    data=return_data,
+                    headers=response_data.headers,
+                    raw_data=None,
+                )
             else:
                 return ApiResponse(
                     status_code=response_data.status,
@@ -279,6 +490,25 @@ class ApiClient:
                     raw_data=response_data.data,
                 )
 
+    @no_type_check
+    def __stream(self, response_data, response_type):
+        """Returns the items of a list response as an ItemStream, read as they are received.
+
+        :param response_data: RESTResponse object, read or not.
+        :param response_type: class name of the list response.
+        :return: ApiResponse holding the ItemStream.
+        """
+        model = self.__response_model(response_type)
+        if model is None:
+            raise ValueError(f"{response_type} responses cannot be streamed")
+        chunks = (response_data.data,) if response_data.data is not None else response_data.stream()
+        return ApiResponse.model_construct(
+            status_code=response_data.status,
+            data=ItemStream(chunks, model, self.configuration.json_codec.loads),
+            headers=response_data.headers,
+            raw_data=None,
+        )
+
     @no_type_check
     def sanitize_for_serialization(self, obj):  # noqa C901 too complex
         """Builds a JSON POST object.
@@ -291,7 +521,8 @@ class ApiClient:
         If obj is decimal.Decimal return string representation.
         If obj is list, sanitize each element in the list.
         If obj is dict, return the dict.
-        If obj is OpenAPI model, return the properties' dict.
+        If obj is OpenAPI model, return the properties' dict, as its
+            to_dict() would, in a single pass over the model tree.
 
         :param obj: The data to serialize.
         :return: The serialized form of data.
@@ -314,7 +545,12 @@ class ApiClient:
             return str(obj)
 
         elif isinstance(obj, dict):
-            obj_dict = obj
+            items = obj.items()
+        elif isinstance(obj, BaseModel) and hasattr(obj, "to_dict"):
+            # Read the fields of generated models directly, with the keys and
+            # values their to_dict() would return, so that each nested model is
+            # walked once instead of being dumped again at every level above it.
+            items = ModelUtil.fields(obj)
         else:
             # Convert model obj to dict except
             # attributes `openapi_types`, `attribute_map`
@@ -322,17 +558,17 @@ class ApiClient:
             # Convert attribute name to json key in
             # model definition for request.
             if hasattr(obj, "to_dict") and callable(obj.to_dict):
-                obj_dict = obj.to_dict()
+                items = obj.to_dict().items()
             else:
-                obj_dict = obj.__dict__
+                items = obj.__dict__.items()
 
-        return {key: self.sanitize_for_serialization(val) for key, val in obj_dict.items()}
+        return {key: self.sanitize_for_serialization(val) for key, val in items}
 
     @no_type_check
-    def deserialize(self, response_text: str, response_type: str, content_type: Optional[str]):
+    def deserialize(self, response_text: Union[str, bytes], response_type: str, content_type: Optional[str]):
         """Deserializes response into an object.
 
-        :param response_text: RESTResponse object to be deserialized.
+        :param response_text: The response body, as text or UTF-8 encoded bytes.
         :param response_type: class literal for
             deserialized object, or string of class name.
         :param content_type: content type of response.
@@ -340,33 +576,98 @@ class ApiClient:
         :return: deserialized object.
         """
 
+        codec = self.configuration.json_codec
+
+        # validate JSON objects straight into the response model, without
+        # building the intermediate dicts of json.loads() and from_dict()
+        model = self.__response_model(response_type)
+        if model is not None and self.__is_json_object(response_text, content_type):
+            return ModelUtil.validate(model, response_text, codec.loads)
+
         # fetch data from response object
         if content_type is None:
             try:
                 # noinspection PyUnusedLocal
-                data = json.loads(response_text)
+                data = codec.loads(response_text)
             except ValueError:
-                data = response_text
+                data = self.__text(response_text)
         elif re.match(
             r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)",
             content_type,
             re.IGNORECASE,
         ):
-            if response_text == "":
+            if not response_text:
                 data = ""
             else:
-                data = json.loads(response_text)
+                data = codec.loads(response_text)
         elif re.match(r"^text/[a-z.+-]+\s*(;|$)", content_type, re.IGNORECASE):
-            data = response_text
+            data = self.__text(response_text)
         else:
             raise RuntimeError("Unsupported content type: {0}".format(content_type))
 
         return self.__deserialize(data, response_type)
 
+    @no_type_check
+    def warm_up(self, *services) -> None:
+        """Resolves the response types of service APIs ahead of their first requests.
+
+        Response types are otherwise resolved, and cached, on first use. Resolving them
+        at startup keeps that work out of the latency of the first call to each endpoint.
+
+        :param services: Service API instances or classes, e.g. UserServiceApi.
+        """
+        for service in services:
+            api_class = service if isinstance(service, type) else type(service)
+            for name, method in inspect.getmembers(api_class, callable):
+                if name.startswith("_") or not hasattr(api_class, f"_{name}_serialize"):
+                    continue
+                response_type = inspect.signature(method).return_annotation.__name__
+                self.__decoder(response_type)
+                model = self.__response_model(response_type)
+                if model is not None:
+                    ModelUtil.validation_mode(model)
+
     # noinspection PyNestedDecorators
     @no_type_check
     @staticmethod
-    def __deserialize(data, klass):  # noqa C901 too complex
+    @functools.lru_cache(maxsize=None)
+    def __response_model(klass):
+        """Return the generated model class named by a response type, if any.
+
+        :param klass: class literal, or string of class name.
+        :return: model class, or None.
+        """
+        if isinstance(klass, str):
+            if klass.startswith(("List[", "Dict[")) or klass in ApiClient.NATIVE_TYPES_MAPPING:
+                return None
+            klass = getattr(zitadel_client.models, klass, None)
+        if isinstance(klass, type) and issubclass(klass, BaseModel) and hasattr(klass, "from_dict"):
+            return klass
+        return None
+
+    # noinspection PyNestedDecorators
+    @no_type_check
+    @staticmethod
+    def __is_json_object(response_text, content_type):
+        """Check whether a response body is a JSON object.
+
+        :param response_text: str, or UTF-8 encoded bytes.
+        :param content_type: content type of response.
+        :return: bool.
+        """
+        if content_type is not None and not re.match(
+            r"^application/(json|[\w!#$&.+-^_]+\+json)\s*(;|$)",
+            content_type,
+            re.IGNORECASE,
+        ):
+            return False
+        pattern = ApiClient._JSON_OBJECT_BYTES if isinstance(response_text, bytes) else ApiClient._JSON_OBJECT_TEXT
+        return pattern.match(response_text) is not None
+
+    # noinspection PyNestedDecorators
+    @no_type_check
+    @staticmethod
+    def __deserialize(data, klass):
         """Deserializes dict, list, str into an object.
 
         :param data: dict, list or str.
@@ -377,19 +678,32 @@ class ApiClient:
         if data is None:
             return None
 
+        return ApiClient.__decoder(klass)(data)
+
+    # noinspection PyNestedDecorators
+    @no_type_check
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def __decoder(klass):  # noqa C901 too complex
+        """Return the function deserializing decoded JSON into a type.
+
+        The type is resolved once, so that deserializing a response does not
+        parse container types or look up classes again.
+
+        :param klass: class literal, or string of class name, e.g.
+            "List[UserServiceUser]" or "Dict[str, int]".
+        :return: function of the decoded JSON, which must not be None.
+        """
         if isinstance(klass, str):
-            if klass.startswith("List["):
-                m = re.match(r"List\[(.*)]", klass)
-                assert m is not None, "Malformed List type definition"
-                # noinspection PyArgumentList
-                return [ApiClient.__deserialize(sub_data) for sub_data in data]
-
-            if klass.startswith("Dict["):
-                m = re.match(r"Dict\[([^,]*), (.*)]", klass)
-                assert m is not None, "Malformed Dict type definition"
-                sub_kls = m.group(2)
-                # noinspection PyArgumentList
-                return {k: ApiClient.__deserialize(sub_kls) for k, v in data.items()}
+            m = re.fullmatch(r"List\[(.*)]", klass)
+            if m is not None:
+                item = ApiClient.__decoder(m.group(1))
+                return lambda data: [None if value is None else item(value) for value in data]
+
+            m = re.fullmatch(r"Dict\[([^,]*), (.*)]", klass)
+            if m is not None:
+                item = ApiClient.__decoder(m.group(2))
+                return lambda data: {key: None if value is None else item(value) for key, value in data.items()}
 
             # convert str to class
             if klass in ApiClient.NATIVE_TYPES_MAPPING:
@@ -398,19 +712,19 @@ class ApiClient:
                 klass = getattr(zitadel_client.models, klass)
 
         if klass in ApiClient.PRIMITIVE_TYPES:
-            return ApiClient.__deserialize_primitive(data, klass)
+            return functools.partial(ApiClient.__deserialize_primitive, klass=klass)
         elif klass is object:
-            return ApiClient.__deserialize_object(data)
+            return ApiClient.__deserialize_object
         elif klass == datetime.date:
-            return ApiClient.__deserialize_date(data)
+            return ApiClient.__deserialize_date
         elif klass == datetime.datetime:
-            return ApiClient.__deserialize_datetime(data)
+            return ApiClient.__deserialize_datetime
         elif klass == decimal.Decimal:
-            return decimal.Decimal(data)
+            return decimal.Decimal
         elif issubclass(klass, Enum):
-            return ApiClient.__deserialize_enum(data, klass)
+            return functools.partial(ApiClient.__deserialize_enum, klass=klass)
         else:
-            return ApiClient.__deserialize_model(data, klass)
+            return functools.partial(ApiClient.__deserialize_model, klass=klass)
 
     # noinspection PyNestedDecorators
     @no_type_check
@@ -525,11 +839,7 @@ class ApiClient:
         if not accepts:
             return None
 
-        for accept in accepts:
-            if re.search("json", accept, re.IGNORECASE):
-                return accept
-
-        return accepts[0]
+        return ApiClient._select_json(tuple(accepts))
 
     # noinspection PyNestedDecorators
     @no_type_check
@@ -543,11 +853,25 @@ class ApiClient:
         if not content_types:
             return None
 
-        for content_type in content_types:
-            if re.search("json", content_type, re.IGNORECASE):
-                return content_type
+        return ApiClient._select_json(tuple(content_types))
+
+    # noinspection PyNestedDecorators
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _select_json(media_types: Tuple[str, ...]) -> str:
+        """Returns the first JSON media type, or the first one if none is JSON.
+
+        The generated endpoints pass the same constant lists on every call, so
+        the result is cached.
+
+        :param media_types: Media types, e.g. ("application/json",).
+        :return: The selected media type.
+        """
+        for media_type in media_types:
+            if re.search("json", media_type, re.IGNORECASE):
+                return media_type
 
-        return content_types[0]
+        return media_types[0]
 
     # noinspection PyNestedDecorators
     @no_type_check
@@ -608,6 +932,35 @@ class ApiClient:
         """
         return value
 
+    # noinspection PyNestedDecorators
+    @no_type_check
+    @staticmethod
+    def __response_text(data, encoding):
+        """Return the response body for deserialize().
+
+        UTF-8 bodies are handed to the JSON codec as bytes, without decoding them first.
+
+        :param data: bytes.
+        :param encoding: the charset of the response.
+        :return: bytes, or str for other charsets.
+        """
+        if encoding.lower() in ("utf-8", "utf8"):
+            return data
+        return data.decode(encoding)
+
+    # noinspection PyNestedDecorators
+    @no_type_check
+    @staticmethod
+    def __text(response_text):
+        """Return the response body as text.
+
+        :param response_text: str, or UTF-8 encoded bytes.
+        :return: str.
+        """
+        if isinstance(response_text, bytes):
+            return response_text.decode("utf-8")
+        return response_text
+
     # noinspection PyNestedDecorators
     @no_type_check
     @staticmethod
@@ -618,7 +971,7 @@ class ApiClient:
         :return: date.
         """
         try:
-            return parse(string).date()
+            return DateTimeUtil.parse_date(string)
         except ImportError:
             return string
         except ValueError as err:
@@ -636,7 +989,7 @@ class ApiClient:
         :return: datetime.
         """
         try:
-            return parse(string)
+            return DateTimeUtil.parse_datetime(string)
         except ImportError:
             return string
         except ValueError as err:
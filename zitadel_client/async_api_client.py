@@ -0,0 +1,214 @@
+import asyncio
+import functools
+import inspect
+import time
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Type, TypeVar, no_type_check
+
+from zitadel_client.api_client import ApiClient, validate_call
+from zitadel_client.async_rest import AsyncRESTClientObject
+from zitadel_client.configuration import Configuration
+from zitadel_client.rest_response import AsyncRESTResponse
+
+
+class AsyncApiClient(ApiClient):
+    """Asynchronous API client.
+
+    Requests are serialized and responses deserialized exactly as in ApiClient;
+    only the transport and the authentication header lookup are awaitable.
+
+    :param configuration: .Configuration object for this client
+    """
+
+    rest_client: AsyncRESTClientObject
+
+    def __init__(
+        self,
+        configuration: Configuration,
+        header_name: Optional[str] = None,
+        header_value: Optional[str] = None,
+    ) -> None:
+        super().__init__(configuration, header_name, header_value)
+        self.rest_client = AsyncRESTClientObject(configuration)
+
+    # noinspection PyArgumentList
+    T = TypeVar("T", bound="AsyncApiClient")
+
+    async def __aenter__(self: T) -> T:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Closes the connection pool."""
+        await self.rest_client.close()
+
+    def get_auth_headers(self) -> Dict[str, str]:
+        """Authentication headers are resolved asynchronously in call_api instead."""
+        return {}
+
+    @no_type_check
+    async def call_api(  # ty: ignore[invalid-method-override]
+        self,
+        method,
+        url,
+        header_params=None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        """Makes the HTTP request (asynchronous)
+        :param method: Method to call.
+        :param url: Path to method endpoint.
+        :param header_params: Header parameters to be
+            placed in the request header.
+        :param body: Request body.
+        :param post_params: Request post form parameters,
+            for `application/x-www-form-urlencoded`, `multipart/form-data`.
+        :param _request_timeout: timeout setting for this request.
+        :return: AsyncRESTResponse
+        """
+        header_params = dict(header_params or {})
+        header_params.update(await self.configuration.authenticator.get_auth_headers_async())
+
+        policy = self.configuration.retry_policy
+        retry = policy is not None and policy.is_idempotent(method, url)
+        if retry:
+            policy.budget.deposit()
+
+        limiter = self.configuration.rate_limiter
+        attempt = 1
+        while True:
+            if limiter is not None:
+                wait = limiter.reserve(url)
+                if wait:
+                    await asyncio.sleep(wait)
+            sent = time.monotonic()
+            try:
+                response_data = await self.__send(method, url, header_params, body, post_params, _request_timeout)
+            except self.rest_client.TRANSIENT_ERRORS:
+                delay = policy.delay(attempt) if retry else None
+                if delay is None:
+                    raise
+            else:
+                if limiter is not None:
+                    limiter.record(url, response_data.status, time.monotonic() - sent)
+                delay = policy.delay(attempt, response_data.status, response_data.headers) if retry else None
+                if delay is None:
+                    return response_data
+                # drain the body, so the connection can be reused by the retry
+                await response_data.read()
+
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    @no_type_check
+    async def __send(self, method, url, header_params, body, post_params, _request_timeout):
+        """Sends a request, hedged if the configured hedging policy selects it.
+
+        :return: AsyncRESTResponse
+        """
+        policy = self.configuration.hedging_policy
+        if policy is None or not policy.should_hedge(method, url):
+            return await self.rest_client.request(
+                method,
+                url,
+                headers=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+
+        async def attempt():
+            sent = time.monotonic()
+            response = await self.rest_client.request(
+                method,
+                url,
+                headers=header_params,
+                body=body,
+                post_params=post_params,
+                _request_timeout=_request_timeout,
+            )
+            policy.record(url, time.monotonic() - sent)
+            return response
+
+        policy.budget.deposit()
+        pending = {asyncio.ensure_future(attempt())}
+        delay = policy.delay(url)
+        if delay is not None:
+            done, _ = await asyncio.wait(pending, timeout=delay)
+            if not done and policy.budget.withdraw():
+                pending.add(asyncio.ensure_future(attempt()))
+
+        # the first response wins; an error only counts once no other attempt is left
+        while True:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            responses = [task.result() for task in done if task.exception() is None]
+            if responses:
+                for task in pending:
+                    task.cancel()
+                for response in responses[1:]:
+                    response.release()
+                return responses[0]
+            if not pending:
+                raise next(iter(done)).exception()
+
+
+def _async_endpoint(name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Builds the awaitable variant of a generated service method.
+
+    The generated method is only used for its signature and return type: arguments are
+    validated the same way, then handed to the generated `_<name>_serialize` method, and
+    the response goes through the shared `response_deserialize`.
+    """
+    raw = getattr(method, "__wrapped__", method)
+    signature = inspect.signature(raw)
+    serialize_name = f"_{name}_serialize"
+    response_types_map = {"200": signature.return_annotation.__name__}
+
+    async def endpoint(self, *args: Any, **kwargs: Any) -> Any:
+        bound = signature.bind(self, *args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+        del arguments["self"]
+        request_timeout = arguments.pop("_request_timeout")
+        response_mode = arguments.pop("_response_mode")
+
+        _param = getattr(self, serialize_name)(**arguments)
+        response_data = await self.api_client.call_api(*_param, _request_timeout=request_timeout)
+        await response_data.read()
+        return self.api_client.response_deserialize(
+            response_data=response_data,
+            response_types_map=response_types_map,
+            response_mode=response_mode,
+        ).data
+
+    functools.update_wrapper(endpoint, raw)
+    endpoint.__signature__ = signature  # ty: ignore[unresolved-attribute]
+    return validate_call(endpoint)
+
+
+@functools.lru_cache(maxsize=None)
+def async_service(api_class: Type[Any]) -> Type[Any]:
+    """
+    Returns the asynchronous variant of a generated service API class.
+
+    The returned class subclasses the generated one, so request serialization is shared,
+    and replaces every public endpoint with an awaitable version of the same signature.
+
+    :param api_class: A generated service API class, e.g. UserServiceApi.
+    :return: The asynchronous service API class, e.g. AsyncUserServiceApi.
+    """
+    endpoints = {
+        name: _async_endpoint(name, member)
+        for name, member in vars(api_class).items()
+        if not name.startswith("_") and callable(member) and hasattr(api_class, f"_{name}_serialize")
+    }
+    return type(f"Async{api_class.__name__}", (api_class,), {"__module__": __name__, **endpoints})
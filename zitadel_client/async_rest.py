@@ -0,0 +1,140 @@
+import asyncio
+import re
+import ssl
+import time
+from typing import Any, Dict, Optional
+
+from zitadel_client.circuit_breaker import CircuitBreaker
+from zitadel_client.codec import JsonCodec
+from zitadel_client.rest_response import AsyncRESTResponse
+
+try:
+    import aiohttp
+except ImportError as e:  # pragma: no cover
+    raise ImportError("The asynchronous client requires aiohttp; install it with `pip install zitadel_client[async]`.") from e
+
+
+class AsyncRESTClientObject:
+    """
+    Asynchronous counterpart of RESTClientObject built on aiohttp.
+
+    A single aiohttp session is created lazily inside the running event loop, and its
+    connector bounds the number of concurrently open connections to
+    `configuration.connection_pool_maxsize`.
+    """
+
+    TRANSIENT_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError)
+    """Errors of a request that may succeed if sent again."""
+
+    def __init__(self, configuration) -> None:
+        self.maxsize = configuration.connection_pool_maxsize
+
+        self.ssl_context = ssl.create_default_context(cafile=configuration.ssl_ca_cert, cadata=configuration.ca_cert_data)
+        if configuration.cert_file:
+            self.ssl_context.load_cert_chain(configuration.cert_file, keyfile=configuration.key_file)
+        if not configuration.verify_ssl:
+            self.ssl_context.check_hostname = False
+            self.ssl_context.verify_mode = ssl.CERT_NONE
+
+        self.proxy = configuration.proxy_url
+        self.codec: JsonCodec = configuration.json_codec
+        self.circuit_breaker: Optional[CircuitBreaker] = configuration.circuit_breaker
+        self.pool_manager: Optional[Any] = None
+
+    async def close(self) -> None:
+        """Closes the underlying session and all pooled connections."""
+        if self.pool_manager is not None:
+            await self.pool_manager.close()
+            self.pool_manager = None
+
+    async def request(  # noqa C901 too complex
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ) -> AsyncRESTResponse:
+        """Perform requests.
+
+        :param method: http request method
+        :param url: http request url
+        :param headers: http request headers
+        :param body: request json body, for `application/json`
+        :param post_params: request post parameters,
+                            `application/x-www-form-urlencoded`
+                            and `multipart/form-data`
+        :param _request_timeout: timeout setting for this request. If one
+                                 number provided, it will be total request
+                                 timeout. It can also be a pair (tuple) of
+                                 (connection, read) timeouts.
+        :raises CircuitOpenError: If a circuit breaker is configured and the
+                                  circuit of the URL's host and service is open.
+        """
+        method = method.upper()
+        assert method in ["GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"]
+
+        if post_params and body:
+            raise RuntimeError("body parameter cannot be used with post_params parameter.")
+
+        post_params = post_params or {}
+        headers = headers or {}
+
+        timeout = None
+        if _request_timeout:
+            if isinstance(_request_timeout, (int, float)):
+                timeout = aiohttp.ClientTimeout(total=_request_timeout)
+            elif isinstance(_request_timeout, tuple) and len(_request_timeout) == 2:
+                timeout = aiohttp.ClientTimeout(sock_connect=_request_timeout[0], sock_read=_request_timeout[1])
+
+        args: Dict[str, Any] = {"method": method, "url": url, "headers": headers}
+        if timeout is not None:
+            args["timeout"] = timeout
+        if self.proxy:
+            args["proxy"] = self.proxy
+
+        if method in ["POST", "PUT", "PATCH", "OPTIONS", "DELETE"]:
+            content_type = headers.get("Content-Type")
+            if not content_type or re.search("json", content_type, re.IGNORECASE):
+                if body is not None:
+                    args["data"] = self.codec.dumps(body)
+            elif content_type == "application/x-www-form-urlencoded":
+                args["data"] = aiohttp.FormData(post_params)
+            elif isinstance(body, str) or isinstance(body, bytes):
+                args["data"] = body
+            else:
+                # Cannot generate the request from given parameters
+                msg = """Cannot prepare a request message for provided
+                         arguments. Please check that your arguments match
+                         declared content type."""
+                raise RuntimeError(msg)
+
+        if self.pool_manager is None:
+            self.pool_manager = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.maxsize, ssl=self.ssl_context),
+            )
+
+        circuit = self.circuit_breaker.circuit(url) if self.circuit_breaker is not None else None
+        if circuit is not None:
+            circuit.acquire()
+        start = time.monotonic()
+        try:
+            r = await self.pool_manager.request(**args)
+        except aiohttp.ClientSSLError as e:
+            if circuit is not None:
+                circuit.release()
+            msg = "\n".join([type(e).__name__, str(e)])
+            raise RuntimeError(msg) from e
+        except self.TRANSIENT_ERRORS:
+            if circuit is not None:
+                circuit.record(None, time.monotonic() - start)
+            raise
+        except BaseException:
+            if circuit is not None:
+                circuit.release()
+            raise
+        if circuit is not None:
+            circuit.record(r.status, time.monotonic() - start)
+
+        return AsyncRESTResponse(r)
@@ -0,0 +1,69 @@
+from types import TracebackType
+from typing import Any, Callable, Optional, Type, TypeVar
+
+from zitadel_client.api_client import ApiClient
+from zitadel_client.async_api_client import AsyncApiClient, async_service
+from zitadel_client.configuration import Configuration
+from zitadel_client.zitadel import Zitadel
+
+
+class AsyncZitadel(Zitadel):
+    """
+    Asynchronous entry point for the Zitadel SDK.
+
+    Exposes the same services and factory methods as Zitadel, but every service method is a
+    coroutine running on a non-blocking aiohttp transport with a bounded connection pool.
+    Authenticators that need to fetch tokens do so without blocking the event loop.
+
+    Example:
+        async with AsyncZitadel.with_private_key(host, key_file) as zitadel:
+            response = await zitadel.sessions.get_session(request)
+    """
+
+    def _create_api_client(self, configuration: Configuration) -> ApiClient:
+        """
+        Creates the asynchronous API client shared by all service APIs.
+
+        :param configuration: The configuration for the client.
+        :return: The API client.
+        """
+        return AsyncApiClient(configuration=configuration)
+
+    def _create_service(self, api_class: Callable[[ApiClient], Any]) -> Any:
+        """
+        Creates the asynchronous variant of a service API bound to the shared API client.
+
+        :param api_class: The generated service API class.
+        :return: The asynchronous service API instance.
+        """
+        return async_service(api_class)(self._api_client)
+
+    # noinspection PyArgumentList
+    T = TypeVar("T", bound="AsyncZitadel")
+
+    async def __aenter__(self: T) -> T:
+        """
+        Enter the asynchronous runtime context.
+
+        Returns:
+            AsyncZitadel: The current instance.
+        """
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """
+        Exit the asynchronous runtime context and release pooled connections.
+        """
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Closes the connection pool of the underlying API client.
+        """
+        assert isinstance(self._api_client, AsyncApiClient)
+        await self._api_client.close()
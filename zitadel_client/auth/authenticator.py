@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Generic, TypeVar  # noqa: F401
+from typing import Any, Dict, Generic, Optional, TypeVar  # noqa: F401
 
 
 class Authenticator(ABC):
@@ -30,6 +30,17 @@ class Authenticator(ABC):
         """
         pass  # pragma: no cover
 
+    async def get_auth_headers_async(self) -> Dict[str, str]:
+        """
+        Retrieves the authentication headers from within an event loop.
+
+        Authenticators whose headers may require network I/O must override this method so that
+        the event loop is never blocked. The default implementation returns the synchronous headers.
+
+        :return: A dictionary mapping header names to their values.
+        """
+        return self.get_auth_headers()
+
     def get_host(self) -> str:
         """
         Returns the stored host.
@@ -40,7 +51,7 @@ class Authenticator(ABC):
 
 
 class Token:
-    def __init__(self, access_token: str, expires_at: datetime):
+    def __init__(self, access_token: str, expires_at: datetime, issued_at: Optional[datetime] = None):
         """
         Initializes a new Token instance.
 
@@ -48,6 +59,7 @@ class Token:
         - access_token (str): The JWT or OAuth token.
         - expires_at (datetime): The expiration time of the token. It should be timezone-aware.
           If a naive datetime is provided, it will be converted to an aware datetime in UTC.
+        - issued_at (datetime, optional): The time the token was issued. Defaults to now.
         """
         self.access_token = access_token
 
@@ -57,6 +69,25 @@ class Token:
         else:
             self.expires_at = expires_at
 
+        if issued_at is None:
+            self.issued_at = datetime.now(timezone.utc)
+        elif issued_at.tzinfo is None:
+            self.issued_at = issued_at.replace(tzinfo=timezone.utc)
+        else:
+            self.issued_at = issued_at
+
+    def expires_within(self, margin: timedelta) -> bool:
+        """
+        Checks if the token expires within the given margin from the current UTC time.
+
+        Parameters:
+        - margin (timedelta): How far ahead of the expiration time to consider the token expired.
+
+        Returns:
+        - bool: True if the token expires within the margin, False otherwise.
+        """
+        return datetime.now(timezone.utc) >= (self.expires_at - margin)
+
     def is_expired(self) -> bool:
         """
         Checks if the token is expired by comparing the current UTC time
@@ -65,4 +96,4 @@ class Token:
         Returns:
         - bool: True if expired, False otherwise.
         """
-        return datetime.now(timezone.utc) >= (self.expires_at - timedelta(minutes=5))
+        return self.expires_within(timedelta(minutes=5))
@@ -13,6 +13,7 @@ from zitadel_client.auth.oauth_authenticator import (
     OAuthAuthenticatorBuilder,
 )
 from zitadel_client.auth.open_id import OpenId
+from zitadel_client.auth.token_store import TokenStore
 from zitadel_client.transport_options import TransportOptions
 
 
@@ -30,6 +31,8 @@ class ClientCredentialsAuthenticator(OAuthAuthenticator):
         client_secret: str,
         auth_scopes: Set[str],
         transport_options: Optional[TransportOptions] = None,
+        refresh_ratio: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
     ):
         """
         Constructs a ClientCredentialsAuthenticator.
@@ -39,6 +42,9 @@ class ClientCredentialsAuthenticator(OAuthAuthenticator):
         :param client_secret: The OAuth client secret.
         :param auth_scopes: The scope(s) for the token request.
         :param transport_options: Optional transport options for TLS, proxy, and headers.
+        :param refresh_ratio: Optional fraction of the token lifetime after which the token is
+            renewed in the background.
+        :param token_store: Optional store through which tokens are shared with other authenticators.
         """
         opts = transport_options or TransportOptions.defaults()
 
@@ -56,6 +62,8 @@ class ClientCredentialsAuthenticator(OAuthAuthenticator):
             open_id,
             session,
             transport_options=opts,
+            refresh_ratio=refresh_ratio,
+            token_store=token_store,
         )
 
     @override
@@ -116,4 +124,6 @@ class ClientCredentialsAuthenticatorBuilder(OAuthAuthenticatorBuilder["ClientCre
             self.client_secret,
             self.auth_scopes,
             transport_options=self.transport_options,
+            refresh_ratio=self.refresh_ratio,
+            token_store=self.store,
         )
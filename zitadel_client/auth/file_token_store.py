@@ -0,0 +1,170 @@
+import fcntl
+import hashlib
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from threading import Lock, get_ident
+from typing import Dict, Generator, Optional
+
+from zitadel_client.auth.authenticator import Token
+from zitadel_client.auth.token_store import TokenStore
+from zitadel_client.utils.fork_util import ForkUtil
+
+
+class _Slot:
+    """A memory-mapped token file, together with the locks guarding its refresh."""
+
+    def __init__(self, path: str, size: int) -> None:
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self.fd).st_size < size:
+            os.ftruncate(self.fd, size)
+        self.map = mmap.mmap(self.fd, size)
+        self.lock = Lock()
+        self.owner: Optional[int] = None
+        """The thread holding the locks, if any."""
+
+    def close(self) -> None:
+        self.map.close()
+        os.close(self.fd)
+
+
+class FileTokenStore(TokenStore):
+    """
+    Token store shared by all processes on a host, backed by memory-mapped files.
+
+    Each key maps to a small file in the store directory. Refreshes are serialized across
+    processes with an exclusive `flock` on that file, so only one process fetches a new token.
+    Reads go straight to the shared memory map without taking the file lock; a sequence number
+    written before and after each update lets readers detect and retry torn reads. A reader that
+    keeps seeing an update in progress takes the file lock instead, and discards a token left
+    half-written by a writer that crashed.
+
+    Locks and mappings are re-opened in child processes after os.fork(), so a store created
+    before forking a worker pool is safe to use in every worker. Only POSIX platforms are supported.
+    """
+
+    SLOT_SIZE = 16384
+    MAX_READ_ATTEMPTS = 1000
+    """Optimistic reads tried before a reader takes the file lock."""
+    _HEADER = struct.Struct("<QI")
+
+    def __init__(self, directory: Optional[str] = None) -> None:
+        """
+        Initializes the store.
+
+        :param directory: The directory holding the token files. Defaults to a directory of
+            the current user inside the system temporary directory.
+        :raises PermissionError: If the default directory belongs to another user, or can be
+            accessed by other users.
+        """
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(), f"zitadel_client-tokens-{os.getuid()}")
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+            # the name is predictable, so another user may have created the directory first
+            status = os.lstat(directory)
+            if not stat.S_ISDIR(status.st_mode) or status.st_uid != os.getuid() or stat.S_IMODE(status.st_mode) & 0o077:
+                raise PermissionError(f"Token directory {directory} must be a directory private to the current user")
+        else:
+            os.makedirs(directory, mode=0o700, exist_ok=True)
+        self.directory = directory
+        self._slots: Dict[str, _Slot] = {}
+        self._guard = Lock()
+        ForkUtil.register(self)
+
+    def _slot(self, key: str) -> _Slot:
+        with self._guard:
+            slot = self._slots.get(key)
+            if slot is None:
+                name = hashlib.sha256(key.encode("utf-8")).hexdigest() + ".token"
+                slot = _Slot(os.path.join(self.directory, name), self.SLOT_SIZE)
+                self._slots[key] = slot
+            return slot
+
+    def get(self, key: str) -> Optional[Token]:
+        slot = self._slot(key)
+        for _ in range(self.MAX_READ_ATTEMPTS):
+            sequence, length = self._HEADER.unpack_from(slot.map, 0)
+            if sequence % 2 == 1:
+                continue
+            payload = slot.map[self._HEADER.size : self._HEADER.size + length]
+            if self._HEADER.unpack_from(slot.map, 0)[0] == sequence:
+                break
+        else:
+            payload = self._read_locked(key, slot)
+
+        if not payload:
+            return None
+        data = json.loads(payload)
+        return Token(
+            data["access_token"],
+            datetime.fromtimestamp(data["expires_at"], timezone.utc),
+            datetime.fromtimestamp(data["issued_at"], timezone.utc),
+        )
+
+    def _read_locked(self, key: str, slot: _Slot) -> bytes:
+        """
+        Reads a slot holding its lock, which no writer can then be updating.
+
+        An odd sequence number left behind is from a writer that crashed halfway, so the slot
+        is reset to empty.
+        """
+        if slot.owner == get_ident():
+            return self._repair(slot)
+        with self.lock(key):
+            return self._repair(slot)
+
+    def _repair(self, slot: _Slot) -> bytes:
+        sequence, length = self._HEADER.unpack_from(slot.map, 0)
+        if sequence % 2 == 1:
+            self._HEADER.pack_into(slot.map, 0, sequence + 1, 0)
+            return b""
+        return slot.map[self._HEADER.size : self._HEADER.size + length]
+
+    def put(self, key: str, token: Token) -> None:
+        """
+        Stores a token under the key. Callers must hold the lock for the key.
+        """
+        payload = json.dumps(
+            {
+                "access_token": token.access_token,
+                "expires_at": token.expires_at.timestamp(),
+                "issued_at": token.issued_at.timestamp(),
+            }
+        ).encode("utf-8")
+        if len(payload) > self.SLOT_SIZE - self._HEADER.size:
+            raise ValueError("Token is too large for the token store")
+
+        slot = self._slot(key)
+        sequence = self._HEADER.unpack_from(slot.map, 0)[0]
+        self._HEADER.pack_into(slot.map, 0, sequence + 1, 0)
+        slot.map[self._HEADER.size : self._HEADER.size + len(payload)] = payload
+        self._HEADER.pack_into(slot.map, 0, sequence + 2, len(payload))
+
+    @contextmanager
+    def lock(self, key: str) -> Generator[None, None, None]:
+        slot = self._slot(key)
+        with slot.lock:
+            fcntl.flock(slot.fd, fcntl.LOCK_EX)
+            slot.owner = get_ident()
+            try:
+                yield
+            finally:
+                slot.owner = None
+                fcntl.flock(slot.fd, fcntl.LOCK_UN)
+
+    def after_fork(self) -> None:
+        """
+        Re-opens the token files in a forked child.
+
+        The inherited descriptors share their `flock` with the parent, so the child must use
+        its own; closing the inherited copies does not release the parent's locks.
+        """
+        for slot in self._slots.values():
+            slot.close()
+        self._slots = {}
+        self._guard = Lock()
@@ -1,6 +1,8 @@
+import asyncio
+import random
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
-from threading import Lock
+from threading import Event, Lock, Thread
 from typing import Any, Dict, Generic, Optional, TypeVar  # noqa: F401
 
 from authlib.integrations.requests_client import OAuth2Session
@@ -8,23 +10,44 @@ from authlib.integrations.requests_client import OAuth2Session
 from zitadel_client import ZitadelError
 from zitadel_client.auth.authenticator import Authenticator, Token
 from zitadel_client.auth.open_id import OpenId
+from zitadel_client.auth.token_store import TokenStore
+from zitadel_client.auth.transport_adapter import TransportAdapter
+from zitadel_client.transport import Transport
 from zitadel_client.transport_options import TransportOptions
+from zitadel_client.utils.fork_util import ForkUtil
 
 
 class OAuthAuthenticator(Authenticator, ABC):
     """
     Base class for OAuth-based authentication using Authlib.
 
+    By default, an expired token is refreshed on the request path while holding a lock. When a
+    refresh ratio is given, the token is instead renewed by a background thread once that fraction
+    of its lifetime has elapsed, and requests read the current token without locking. A failed
+    background refresh keeps serving the still-valid token and is retried with jittered backoff.
+
+    When a token store is given, tokens are shared through it: a refresh first checks whether
+    another authenticator (possibly in another process) already stored a fresh token, and only
+    fetches one itself while holding the store's lock for the cache key.
+
     Attributes:
         open_id: An object providing OAuth endpoint information.
         oauth_session: An OAuth2Session instance used for fetching tokens.
+        refresh_ratio: The fraction of the token lifetime after which the background thread
+            renews it, or None to refresh on the request path.
+        token_store: An optional store through which tokens are shared with other authenticators.
     """
 
+    RETRY_BASE_DELAY = 1.0
+    RETRY_MAX_DELAY = 60.0
+
     def __init__(
         self,
         open_id: OpenId,
         oauth_session: OAuth2Session,
         transport_options: Optional[TransportOptions] = None,
+        refresh_ratio: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
     ):
         """
         Constructs an OAuthAuthenticator.
@@ -32,21 +55,82 @@ class OAuthAuthenticator(Authenticator, ABC):
         :param open_id: An object that must implement get_host_endpoint() and get_token_endpoint().
         :param oauth_session: The scope for the token request.
         :param transport_options: Optional transport options for TLS, proxy, and headers.
+        :param refresh_ratio: Optional fraction (between 0 and 1) of the token lifetime after which
+            the token is renewed in the background.
+        :param token_store: Optional store through which tokens are shared with other authenticators.
         """
+        if refresh_ratio is not None and not 0 < refresh_ratio < 1:
+            raise ValueError("refresh_ratio must be between 0 and 1")
+
         super().__init__(open_id.get_host_endpoint())
         self.open_id = open_id
         self.token: Optional[Token] = None
         self.transport_options = transport_options or TransportOptions.defaults()
         self.oauth_session = oauth_session
+        # token requests share the connection pool of discovery and API calls
+        adapter = TransportAdapter(Transport.shared(self.transport_options))
+        self.oauth_session.mount("https://", adapter)
+        self.oauth_session.mount("http://", adapter)
+        self.refresh_ratio = refresh_ratio
+        self.token_store = token_store
         self._lock = Lock()
+        self._async_lock: Optional[asyncio.Lock] = None
+        self._refresher: Optional[Thread] = None
+        self._stopped = Event()
+        ForkUtil.register(self)
+
+    def after_fork(self) -> None:
+        """
+        Replaces locks and the background refresh thread, none of which survive os.fork().
+        """
+        self._lock = Lock()
+        self._async_lock = None
+        self._stopped = Event()
+        refresher, self._refresher = self._refresher, None
+        if refresher is not None:
+            self._start_refresher()
+
+    def token_cache_key(self) -> str:
+        """
+        Returns the key under which tokens are shared in the token store.
+
+        Tokens are only interchangeable between authenticators that request them from the same
+        token endpoint, for the same client and with the same scopes.
+        """
+        scopes = " ".join(sorted(str(self.oauth_session.scope or "").split()))
+        return f"{self.open_id.get_token_endpoint()} {self._token_subject()} {scopes}"
+
+    def _token_subject(self) -> str:
+        """
+        Returns the identity the tokens are issued to, as part of the token cache key.
+        """
+        return str(self.oauth_session.client_id)
+
+    def _needs_refresh(self, token: Optional[Token]) -> bool:
+        """
+        Checks whether a token must be refreshed before it can be used on the request path.
+
+        With background refresh enabled, the token stays usable until it actually expires.
+        """
+        if token is None:
+            return True
+        if self.refresh_ratio is not None:
+            return token.expires_within(timedelta(0))
+        return token.is_expired()
 
     def get_auth_token(self) -> str:
         """
         Returns the current access token, refreshing it if necessary.
         """
+        token = self.token
+        if self.refresh_ratio is not None and not self._needs_refresh(token):
+            assert token is not None
+            return token.access_token
+
         with self._lock:
-            if self.token is None or self.token.is_expired():
-                self.refresh_token()
+            if self._needs_refresh(self.token):
+                self._renew()
+                self._start_refresher()
 
             if self.token is None:
                 raise ZitadelError("Token is null even after attempting to refresh.")
@@ -61,6 +145,22 @@ class OAuthAuthenticator(Authenticator, ABC):
         """
         return {"Authorization": "Bearer " + self.get_auth_token()}
 
+    async def get_auth_headers_async(self) -> Dict[str, str]:
+        """
+        Retrieves authentication headers without blocking the event loop.
+
+        When the token must be refreshed, the blocking token request runs in the loop's default
+        executor and concurrent callers wait for that single refresh instead of issuing their own.
+
+        :return: A dictionary containing the 'Authorization' header.
+        """
+        if self._needs_refresh(self.token):
+            if self._async_lock is None:
+                self._async_lock = asyncio.Lock()
+            async with self._async_lock:
+                await asyncio.get_running_loop().run_in_executor(None, self.get_auth_token)
+        return self.get_auth_headers()
+
     @abstractmethod
     def get_grant(self) -> Dict[str, str]:
         """
@@ -87,6 +187,90 @@ class OAuthAuthenticator(Authenticator, ABC):
         except Exception as e:
             raise ZitadelError("Failed to refresh token: " + str(e)) from e
 
+    def _renew(self) -> Token:
+        """
+        Replaces the current token, adopting one from the token store if it holds a fresher one.
+
+        Callers must hold the authenticator's lock.
+        """
+        if self.token_store is None:
+            return self.refresh_token()
+
+        key = self.token_cache_key()
+        with self.token_store.lock(key):
+            stored = self.token_store.get(key)
+            if stored is not None and self._is_fresh(stored):
+                self.token = stored
+                return stored
+            token = self.refresh_token()
+            self.token_store.put(key, token)
+            return token
+
+    def _is_fresh(self, token: Token) -> bool:
+        """
+        Checks whether a stored token is newer than the current one and not yet due for renewal.
+        """
+        current = self.token
+        if current is not None and token.access_token == current.access_token:
+            return False
+        if self.refresh_ratio is None:
+            return not token.is_expired()
+        lifetime = token.expires_at - token.issued_at
+        return datetime.now(timezone.utc) < token.issued_at + lifetime * self.refresh_ratio
+
+    def close(self) -> None:
+        """
+        Stops the background refresh thread, if one is running.
+        """
+        self._stopped.set()
+
+    def _start_refresher(self) -> None:
+        """
+        Starts the background refresh thread once, if background refresh is enabled.
+        """
+        if self.refresh_ratio is None or self._refresher is not None:
+            return
+        self._refresher = Thread(target=self._refresh_loop, name="zitadel-token-refresh", daemon=True)
+        self._refresher.start()
+
+    def _next_refresh_delay(self) -> float:
+        """
+        Returns the number of seconds until the current token should be renewed.
+        """
+        token = self.token
+        if token is None or self.refresh_ratio is None:
+            return 0.0
+        lifetime = token.expires_at - token.issued_at
+        refresh_at = token.issued_at + lifetime * self.refresh_ratio
+        return max(0.0, (refresh_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _retry_delay(self, attempt: int) -> float:
+        """
+        Returns a jittered exponential backoff delay, never past the current token's expiry.
+        """
+        delay = random.uniform(0, min(self.RETRY_MAX_DELAY, self.RETRY_BASE_DELAY * 2**attempt))  # noqa: S311
+        token = self.token
+        if token is not None:
+            remaining = (token.expires_at - datetime.now(timezone.utc)).total_seconds()
+            delay = min(delay, max(0.0, remaining))
+        return delay
+
+    def _refresh_loop(self) -> None:
+        """
+        Renews the token whenever the refresh ratio of its lifetime has elapsed.
+        """
+        attempt = 0
+        delay = self._next_refresh_delay()
+        while not self._stopped.wait(delay):
+            try:
+                with self._lock:
+                    self._renew()
+                attempt = 0
+                delay = self._next_refresh_delay()
+            except ZitadelError:
+                delay = self._retry_delay(attempt)
+                attempt += 1
+
 
 # noinspection PyArgumentList
 T = TypeVar("T", bound="OAuthAuthenticatorBuilder[Any]")
@@ -115,6 +299,8 @@ class OAuthAuthenticatorBuilder(ABC, Generic[T]):
         self.transport_options = transport_options or TransportOptions.defaults()
         self.open_id = OpenId(host, transport_options=self.transport_options)
         self.auth_scopes = {"openid", "urn:zitadel:iam:org:project:id:zitadel:aud"}
+        self.refresh_ratio: Optional[float] = None
+        self.store: Optional[TokenStore] = None
 
     def scopes(self: T, *auth_scopes: str) -> T:
         """
@@ -125,3 +311,42 @@ class OAuthAuthenticatorBuilder(ABC, Generic[T]):
         """
         self.auth_scopes = set(auth_scopes)
         return self
+
+    def discovery_file(self: T, path: str) -> T:
+        """
+        Seeds the OpenID configuration from a local JSON file instead of fetching it from the host.
+
+        :param path: Path to a copy of the host's `/.well-known/openid-configuration` document.
+        :return: The builder instance to allow for method chaining.
+        """
+        self.open_id.seed(path)
+        return self
+
+    def background_refresh(self: T, ratio: float = 0.75) -> T:
+        """
+        Enables proactive token renewal in a background thread.
+
+        Once the given fraction of the token lifetime has elapsed, the token is renewed without
+        blocking requests, which keep using the still-valid token until the new one arrives.
+
+        :param ratio: The fraction (between 0 and 1) of the token lifetime after which to renew it.
+        :return: The builder instance to allow for method chaining.
+        """
+        if not 0 < ratio < 1:
+            raise ValueError("ratio must be between 0 and 1")
+        self.refresh_ratio = ratio
+        return self
+
+    def token_store(self: T, store: TokenStore) -> T:
+        """
+        Shares tokens with other authenticators through the given store.
+
+        Authenticators using the same store, token endpoint, client and scopes fetch a new token
+        only once between them. With a FileTokenStore this holds across all processes on the host,
+        such as the workers of a pre-forking server.
+
+        :param store: The token store to share tokens through.
+        :return: The builder instance to allow for method chaining.
+        """
+        self.store = store
+        return self
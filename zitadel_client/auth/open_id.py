@@ -1,25 +1,71 @@
 import json
-import ssl
-import urllib.error
-import urllib.request
-from typing import Optional
+import re
+import time
+from threading import Lock
+from typing import Any, Dict, Optional, Tuple
 from urllib.parse import urljoin
 
+import urllib3
+
+from zitadel_client.transport import Transport
 from zitadel_client.transport_options import TransportOptions
+from zitadel_client.utils.fork_util import ForkUtil
+
+_CacheKey = Tuple[str, TransportOptions]
+
+
+class _DiscoveryCache:
+    """
+    Process-wide cache of OpenID configurations, keyed by well-known URL and transport options.
+
+    Concurrent lookups of the same key wait for a single discovery request.
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[_CacheKey, Tuple[float, Dict[str, Any]]] = {}
+        self._locks: Dict[_CacheKey, Lock] = {}
+        self._guard = Lock()
+        ForkUtil.register(self)
+
+    def get(self, key: _CacheKey) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def put(self, key: _CacheKey, config: Dict[str, Any], ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, config)
+
+    def lock(self, key: _CacheKey) -> Lock:
+        with self._guard:
+            return self._locks.setdefault(key, Lock())
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def after_fork(self) -> None:
+        self._locks = {}
+        self._guard = Lock()
 
 
 class OpenId:
     """
     OpenId retrieves OpenID Connect configuration from a given host.
 
-    It builds the well-known configuration URL from the provided hostname,
-    fetches the configuration, and extracts the token endpoint.
+    It builds the well-known configuration URL from the provided hostname and
+    extracts the token endpoint from the configuration. The configuration is
+    only fetched when the token endpoint is first needed, over the shared
+    transport for the transport options, and is shared by all
+    instances for the same host and transport options for as long as the
+    server's Cache-Control header allows (DEFAULT_TTL seconds if it sets none).
     """
 
+    DEFAULT_TTL = 3600.0
+
     host_endpoint: str
-    token_endpoint: str
+    _cache = _DiscoveryCache()
 
-    def __init__(  # noqa: C901
+    def __init__(
         self,
         hostname: str,
         transport_options: Optional[TransportOptions] = None,
@@ -30,65 +76,13 @@ class OpenId:
         :param hostname: The Zitadel instance hostname or URL.
         :param transport_options: Optional transport options for TLS, proxy, and headers.
         """
-        if transport_options is None:
-            transport_options = TransportOptions.defaults()
-
         # noinspection HttpUrlsUsage
         if not (hostname.startswith("http://") or hostname.startswith("https://")):
             hostname = "https://" + hostname
 
         self.host_endpoint = hostname
-        well_known_url = self.build_well_known_url(hostname)
-
-        try:
-            # noinspection HttpUrlsUsage
-            if not well_known_url.lower().startswith(("http://", "https://")):
-                raise ValueError("Invalid URL scheme. Only 'http' and 'https' are allowed.")
-
-            request = urllib.request.Request(well_known_url)  # noqa: S310
-            if transport_options.default_headers:
-                for header_name, header_value in transport_options.default_headers.items():
-                    request.add_header(header_name, header_value)
-
-            if transport_options.insecure:
-                ctx = ssl.create_default_context()
-                ctx.check_hostname = False
-                ctx.verify_mode = ssl.CERT_NONE
-            elif transport_options.ca_cert_path:
-                ctx = ssl.create_default_context()
-                ctx.check_hostname = True
-                ctx.verify_mode = ssl.CERT_REQUIRED
-                ctx.load_verify_locations(transport_options.ca_cert_path)
-            else:
-                ctx = None
-
-            if transport_options.proxy_url:
-                proxy_handler = urllib.request.ProxyHandler(
-                    {"http": transport_options.proxy_url, "https": transport_options.proxy_url}
-                )
-                if ctx:
-                    https_handler = urllib.request.HTTPSHandler(context=ctx)
-                    opener = urllib.request.build_opener(proxy_handler, https_handler)
-                else:
-                    opener = urllib.request.build_opener(proxy_handler)
-                response_ctx = opener.open(request)
-            else:
-                response_ctx = urllib.request.urlopen(request, context=ctx)  # noqa: S310
-
-            with response_ctx as response:
-                if response.status != 200:
-                    raise Exception(f"Failed to fetch OpenID configuration: HTTP {response.status}")
-                config = json.loads(response.read().decode("utf-8"))
-        except urllib.error.URLError as e:
-            raise Exception(f"URL error occurred: {e}") from e
-        except json.JSONDecodeError as e:
-            raise Exception("Failed to decode JSON response") from e
-
-        token_endpoint = config.get("token_endpoint")
-        if not token_endpoint:
-            raise Exception("token_endpoint not found in OpenID configuration")
-
-        self.token_endpoint = token_endpoint
+        self.transport_options = transport_options or TransportOptions.defaults()
+        self.well_known_url = self.build_well_known_url(hostname)
 
     @staticmethod
     def build_well_known_url(hostname: str) -> str:
@@ -97,6 +91,30 @@ class OpenId:
         """
         return urljoin(hostname, "/.well-known/openid-configuration")
 
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Discards all cached OpenID configurations.
+        """
+        OpenId._cache.clear()
+
+    def seed(self, path: str, ttl: Optional[float] = None) -> None:
+        """
+        Caches the OpenID configuration stored in a local JSON file, so no discovery request is
+        made until the entry expires.
+
+        :param path: Path to a copy of the host's `/.well-known/openid-configuration` document.
+        :param ttl: Seconds to keep the configuration for. Defaults to DEFAULT_TTL.
+        """
+        try:
+            with open(path, "r") as file:
+                config = json.load(file)
+        except Exception as e:
+            raise Exception(f"Unable to read OpenID configuration file: {path}") from e
+
+        self._validate(config)
+        self._cache.put(self._cache_key(), config, self.DEFAULT_TTL if ttl is None else ttl)
+
     def get_host_endpoint(self) -> str:
         """
         Returns the host endpoint URL.
@@ -107,4 +125,72 @@ class OpenId:
         """
         Returns the token endpoint URL extracted from the OpenID configuration.
         """
-        return self.token_endpoint
+        return self.get_configuration()["token_endpoint"]
+
+    def get_configuration(self) -> Dict[str, Any]:
+        """
+        Returns the OpenID configuration, fetching it if it is not cached or has expired.
+        """
+        key = self._cache_key()
+        config = self._cache.get(key)
+        if config is not None:
+            return config
+
+        with self._cache.lock(key):
+            config = self._cache.get(key)
+            if config is None:
+                config, ttl = self._fetch()
+                self._validate(config)
+                if ttl > 0:
+                    self._cache.put(key, config, ttl)
+            return config
+
+    def _cache_key(self) -> _CacheKey:
+        return self.well_known_url, self.transport_options
+
+    @staticmethod
+    def _validate(config: Dict[str, Any]) -> None:
+        if not config.get("token_endpoint"):
+            raise Exception("token_endpoint not found in OpenID configuration")
+
+    def _fetch(self) -> Tuple[Dict[str, Any], float]:
+        """
+        Fetches the OpenID configuration and returns it along with the number of seconds it may be cached.
+        """
+        well_known_url = self.well_known_url
+        # noinspection HttpUrlsUsage
+        if not well_known_url.lower().startswith(("http://", "https://")):
+            raise ValueError("Invalid URL scheme. Only 'http' and 'https' are allowed.")
+
+        try:
+            response = Transport.shared(self.transport_options).request(
+                "GET",
+                well_known_url,
+                headers=dict(self.transport_options.default_headers),
+            )
+        except urllib3.exceptions.HTTPError as e:
+            raise Exception(f"URL error occurred: {e}") from e
+
+        if response.status != 200:
+            raise Exception(f"Failed to fetch OpenID configuration: HTTP {response.status}")
+        try:
+            config = json.loads(response.data.decode("utf-8"))
+        except json.JSONDecodeError as e:
+            raise Exception("Failed to decode JSON response") from e
+
+        return config, self._max_age(response.headers.get("Cache-Control"))
+
+    def _max_age(self, cache_control: Optional[str]) -> float:
+        """
+        Returns the number of seconds a response may be cached for according to its Cache-Control header.
+        """
+        if not cache_control:
+            return self.DEFAULT_TTL
+        directives = [directive.strip().lower() for directive in cache_control.split(",")]
+        if "no-store" in directives or "no-cache" in directives:
+            return 0.0
+        for directive in directives:
+            match = re.fullmatch(r"max-age\s*=\s*\"?(\d+)\"?", directive)
+            if match:
+                return float(match.group(1))
+        return self.DEFAULT_TTL
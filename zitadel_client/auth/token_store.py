@@ -0,0 +1,76 @@
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from threading import Lock
+from typing import ContextManager, Dict, Generator, Optional
+
+from zitadel_client.auth.authenticator import Token
+from zitadel_client.utils.fork_util import ForkUtil
+
+
+class TokenStore(ABC):
+    """
+    Abstract base class for token stores shared between authenticators.
+
+    Tokens are keyed by a string identifying the token endpoint, the client or subject and the
+    requested scopes. Authenticators hold the store's lock for a key while refreshing, so only
+    one of them fetches a new token and the others pick it up from the store.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Token]:
+        """
+        Returns the stored token for the key, if any.
+
+        :param key: The token cache key.
+        :return: The stored token, or None.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def put(self, key: str, token: Token) -> None:
+        """
+        Stores a token under the key, replacing any previous one.
+
+        :param key: The token cache key.
+        :param token: The token to store.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def lock(self, key: str) -> ContextManager[None]:
+        """
+        Returns a context manager holding the exclusive refresh lock for the key.
+
+        :param key: The token cache key.
+        """
+        pass  # pragma: no cover
+
+
+class InMemoryTokenStore(TokenStore):
+    """
+    Token store shared by all authenticators of a single process.
+    """
+
+    def __init__(self) -> None:
+        self._tokens: Dict[str, Token] = {}
+        self._locks: Dict[str, Lock] = {}
+        self._guard = Lock()
+        ForkUtil.register(self)
+
+    def get(self, key: str) -> Optional[Token]:
+        return self._tokens.get(key)
+
+    def put(self, key: str, token: Token) -> None:
+        self._tokens[key] = token
+
+    @contextmanager
+    def lock(self, key: str) -> Generator[None, None, None]:
+        with self._guard:
+            lock = self._locks.setdefault(key, Lock())
+        with lock:
+            yield
+
+    def after_fork(self) -> None:
+        """Replaces locks that may have been held by other threads at the time of the fork."""
+        self._locks = {}
+        self._guard = Lock()
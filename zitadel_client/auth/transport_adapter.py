@@ -0,0 +1,70 @@
+from typing import Any
+
+import urllib3
+from requests import PreparedRequest, Response, exceptions
+from requests.adapters import HTTPAdapter
+
+from zitadel_client.transport import Transport
+
+
+class TransportAdapter(HTTPAdapter):
+    """
+    A requests adapter that sends requests through a Transport.
+
+    Mounted on the OAuth2Session of an authenticator, it makes token requests reuse the
+    connections, TLS settings and proxy of API calls instead of a separate requests pool.
+    The session's own `verify` and `proxies` settings are ignored in favour of the transport's.
+    """
+
+    def __init__(self, transport: Transport) -> None:
+        """
+        Initializes the adapter.
+
+        :param transport: The transport to send requests through.
+        """
+        super().__init__()
+        self.transport = transport
+
+    def send(
+        self,
+        request: PreparedRequest,
+        stream: bool = False,
+        timeout: Any = None,
+        verify: Any = True,
+        cert: Any = None,
+        proxies: Any = None,
+    ) -> Response:
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            pool_timeout = urllib3.Timeout(connect=connect, read=read)
+        else:
+            pool_timeout = urllib3.Timeout(connect=timeout, read=timeout)
+
+        try:
+            response = self.transport.pool_manager.urlopen(
+                str(request.method),
+                str(request.url),
+                body=request.body,
+                headers=dict(request.headers),
+                redirect=False,
+                preload_content=False,
+                decode_content=False,
+                retries=self.max_retries,
+                timeout=pool_timeout,
+            )
+        except urllib3.exceptions.MaxRetryError as e:
+            if isinstance(e.reason, urllib3.exceptions.ConnectTimeoutError):
+                raise exceptions.ConnectTimeout(e, request=request) from e
+            if isinstance(e.reason, urllib3.exceptions.SSLError):
+                raise exceptions.SSLError(e, request=request) from e
+            raise exceptions.ConnectionError(e, request=request) from e
+        except urllib3.exceptions.ReadTimeoutError as e:
+            raise exceptions.ReadTimeout(e, request=request) from e
+        except urllib3.exceptions.HTTPError as e:
+            raise exceptions.ConnectionError(e, request=request) from e
+
+        return self.build_response(request, response)
+
+    def close(self) -> None:
+        """The connection pool belongs to the transport, which may be shared, so it is left open."""
+        pass
@@ -10,6 +10,7 @@ from zitadel_client.auth.oauth_authenticator import (
     OAuthAuthenticatorBuilder,
 )
 from zitadel_client.auth.open_id import OpenId
+from zitadel_client.auth.token_store import TokenStore
 from zitadel_client.transport_options import TransportOptions
 
 
@@ -32,6 +33,8 @@ class WebTokenAuthenticator(OAuthAuthenticator):
         jwt_algorithm: str = "RS256",
         key_id: Optional[str] = None,
         transport_options: Optional[TransportOptions] = None,
+        refresh_ratio: Optional[float] = None,
+        token_store: Optional[TokenStore] = None,
     ):
         """
         Constructs a WebTokenAuthenticator.
@@ -45,6 +48,9 @@ class WebTokenAuthenticator(OAuthAuthenticator):
         :param jwt_lifetime: Lifetime of the JWT in seconds.
         :param jwt_algorithm: The JWT signing algorithm (default "RS256").
         :param transport_options: Optional transport options for TLS, proxy, and headers.
+        :param refresh_ratio: Optional fraction of the token lifetime after which the token is
+            renewed in the background.
+        :param token_store: Optional store through which tokens are shared with other authenticators.
         """
         opts = transport_options or TransportOptions.defaults()
 
@@ -56,7 +62,7 @@ class WebTokenAuthenticator(OAuthAuthenticator):
         if opts.default_headers:
             session.headers.update(opts.default_headers)
 
-        super().__init__(open_id, session, transport_options=opts)
+        super().__init__(open_id, session, transport_options=opts, refresh_ratio=refresh_ratio, token_store=token_store)
         self.jwt_issuer = jwt_issuer
         self.jwt_subject = jwt_subject
         self.jwt_audience = jwt_audience
@@ -65,6 +71,12 @@ class WebTokenAuthenticator(OAuthAuthenticator):
         self.jwt_algorithm = jwt_algorithm
         self.key_id = key_id
 
+    def _token_subject(self) -> str:
+        """
+        Returns the JWT subject, which identifies the service user the tokens are issued to.
+        """
+        return self.jwt_subject
+
     def get_grant(self) -> Dict[str, str]:
         """
         Builds and returns the grant parameters for the JWT bearer flow.
@@ -219,6 +231,8 @@ class WebTokenAuthenticatorBuilder(OAuthAuthenticatorBuilder["WebTokenAuthentica
             jwt_lifetime=self.jwt_lifetime,
             key_id=self.key_id,
             transport_options=self.transport_options,
+            refresh_ratio=self.refresh_ratio,
+            token_store=self.store,
         )
 
     def key_identifier(self, key_id: Optional[str]) -> "WebTokenAuthenticatorBuilder":
@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+from zitadel_client.exceptions import CircuitOpenError
+
+StateListener = Callable[[str, str, str], None]
+
+
+class Circuit:
+    """
+    The state of the calls to one RPC service of one host.
+
+    A circuit starts CLOSED and records the outcome of the last `window_size` calls. Once at
+    least `minimum_calls` are recorded, it OPENs if too many of them failed, or took longer
+    than `slow_call_duration`. An open circuit rejects calls for `open_duration` seconds,
+    then lets `half_open_calls` probes through: it closes again if they all succeed in time,
+    and opens again as soon as one does not.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, key: str, breaker: "CircuitBreaker") -> None:
+        """
+        Initializes the circuit, closed.
+
+        :param key: The host and RPC service, e.g. "api.example.com/zitadel.user.v2.UserService".
+        :param breaker: The circuit breaker holding the thresholds.
+        """
+        self.key = key
+        self.breaker = breaker
+        self.state = Circuit.CLOSED
+        self._outcomes: Deque[Tuple[bool, bool]] = deque(maxlen=breaker.window_size)
+        self._opened = 0.0
+        self._probes = 0
+        self._probed = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """
+        Admits a call, or rejects it while the circuit is open.
+
+        :raises CircuitOpenError: If the circuit is open, or all its half-open probes are in flight.
+        """
+        with self._lock:
+            if self.state == Circuit.OPEN:
+                remaining = self._opened + self.breaker.open_duration - self.breaker.clock()
+                if remaining > 0:
+                    raise CircuitOpenError(self.key, remaining)
+                self._transition(Circuit.HALF_OPEN)
+            if self.state == Circuit.HALF_OPEN:
+                if self._probes >= self.breaker.half_open_calls:
+                    raise CircuitOpenError(self.key, 0.0)
+                self._probes += 1
+
+    def record(self, status: Optional[int], duration: float) -> None:
+        """
+        Records the outcome of an admitted call.
+
+        :param status: The HTTP status of the response, or None if the request failed without one.
+            Server errors, 500 and above, count as failures.
+        :param duration: The seconds the call took.
+        """
+        failed = status is None or status >= 500
+        slow = duration >= self.breaker.slow_call_duration
+        with self._lock:
+            if self.state == Circuit.HALF_OPEN:
+                if failed or slow:
+                    self._open()
+                else:
+                    self._probed += 1
+                    if self._probed >= self.breaker.half_open_calls:
+                        self._transition(Circuit.CLOSED)
+                return
+            if self.state == Circuit.OPEN:
+                return
+            self._outcomes.append((failed, slow))
+            if len(self._outcomes) >= self.breaker.minimum_calls:
+                calls = len(self._outcomes)
+                failures = sum(failed for failed, _ in self._outcomes)
+                slow_calls = sum(slow for _, slow in self._outcomes)
+                if (
+                    failures >= self.breaker.failure_rate_threshold * calls
+                    or slow_calls >= self.breaker.slow_call_rate_threshold * calls
+                ):
+                    self._open()
+
+    def release(self) -> None:
+        """Releases an admitted call that failed on the client side, without recording it."""
+        with self._lock:
+            if self.state == Circuit.HALF_OPEN and self._probes > 0:
+                self._probes -= 1
+
+    def _open(self) -> None:
+        self._opened = self.breaker.clock()
+        self._transition(Circuit.OPEN)
+
+    def _transition(self, state: str) -> None:
+        previous, self.state = self.state, state
+        self._outcomes.clear()
+        self._probes = 0
+        self._probed = 0
+        for listener in self.breaker.listeners:
+            listener(self.key, previous, state)
+
+
+class CircuitBreaker:
+    """
+    Fails calls fast while a host's RPC service is degraded, instead of waiting on each one.
+
+    Every host and RPC service gets its own Circuit, created on first use, with the thresholds
+    below. Rejected calls raise CircuitOpenError without sending a request.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        slow_call_rate_threshold: float = 1.0,
+        slow_call_duration: float = 10.0,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 3,
+        on_state_change: Optional[StateListener] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the circuit breaker.
+
+        :param failure_rate_threshold: The share of failed calls that opens a circuit.
+        :param slow_call_rate_threshold: The share of slow calls that opens a circuit.
+        :param slow_call_duration: The seconds after which a call counts as slow.
+        :param window_size: The number of most recent calls the rates are computed over.
+        :param minimum_calls: The number of calls needed before a circuit can open.
+        :param open_duration: The seconds a circuit rejects calls before probing again.
+        :param half_open_calls: The probes that must succeed to close a circuit.
+        :param on_state_change: Called with the circuit key, the previous and the new state
+            on every transition, e.g. to update metrics. Listeners run under the circuit's
+            lock, so they must be quick and must not call into the client.
+        :param clock: The monotonic clock, in seconds.
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+        self.listeners = [on_state_change] if on_state_change is not None else []
+        self.clock = clock
+        self.circuits: Dict[str, Circuit] = {}
+        self._lock = threading.Lock()
+
+    def circuit(self, url: str) -> Circuit:
+        """
+        Returns the circuit of a request, creating it on first use.
+
+        :param url: The request URL.
+        :return: The circuit of the URL's host and RPC service.
+        """
+        parts = urlsplit(url)
+        key = parts.netloc + "/" + parts.path.strip("/").rpartition("/")[0]
+        circuit = self.circuits.get(key)
+        if circuit is None:
+            with self._lock:
+                circuit = self.circuits.setdefault(key, Circuit(key, self))
+        return circuit
+
+    def states(self) -> Dict[str, str]:
+        """
+        Returns the state of each circuit, e.g. to export as a metric.
+
+        :return: The states, keyed by host and RPC service.
+        """
+        return {key: circuit.state for key, circuit in self.circuits.items()}
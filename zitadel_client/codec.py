@@ -0,0 +1,102 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+
+class JsonCodec(ABC):
+    """
+    Abstract base class for the JSON codecs used to encode request bodies and decode responses.
+
+    Codecs go directly between Python objects and UTF-8 encoded bytes, so that backends which
+    work on bytes avoid an intermediate str copy. Decoding malformed input raises ValueError.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encodes an object made of dicts, lists, strings, numbers, booleans and None.
+
+        :param obj: The object to encode.
+        :return: The UTF-8 encoded JSON document.
+        """
+        pass  # pragma: no cover
+
+    @abstractmethod
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """
+        Decodes a JSON document.
+
+        :param data: The UTF-8 encoded JSON document, or its text.
+        :return: The decoded object.
+        :raises ValueError: If the document is not valid JSON.
+        """
+        pass  # pragma: no cover
+
+    @staticmethod
+    def default() -> "JsonCodec":
+        """
+        Returns the fastest available codec: orjson if installed, then msgspec, then the stdlib.
+        """
+        for codec in (OrjsonCodec, MsgspecCodec):
+            try:
+                return codec()
+            except ImportError:
+                continue
+        return StdlibJsonCodec()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec backed by the standard library's json module."""
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec backed by orjson. Raises ImportError if orjson is not installed."""
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+        self._options = orjson.OPT_NON_STR_KEYS
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj, option=self._options)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec backed by msgspec. Raises ImportError if msgspec is not installed."""
+
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec  # ty: ignore[unresolved-import]
+
+        self._decode_error = msgspec.DecodeError
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as e:
+            raise ValueError(str(e)) from e
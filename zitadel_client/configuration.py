@@ -10,6 +10,12 @@ from typing import Any, Dict, Optional, Union
 from typing_extensions import Self
 
 from zitadel_client.auth.authenticator import Authenticator
+from zitadel_client.circuit_breaker import CircuitBreaker
+from zitadel_client.codec import JsonCodec
+from zitadel_client.hedging import HedgingPolicy
+from zitadel_client.rate_limit import RateLimiter
+from zitadel_client.retry import RetryPolicy
+from zitadel_client.transport import Transport
 from zitadel_client.version import Version
 
 
@@ -76,24 +82,88 @@ class Configuration:
 
         self.safe_chars_for_path_param = ""
         self.retries = retries
-        # Enable client side validation
+        self.retry_policy: Optional[RetryPolicy] = None
+        """SDK-level retries of failed calls, in addition to the connection
+       retries of urllib3 configured by `retries`. Only reads, and the
+       mutations the policy names as idempotent, are retried.
+    """
+        self.rate_limiter: Optional[RateLimiter] = None
+        """Client-side throttling of requests, per client, service or endpoint,
+       to stay within the rate limits of the server.
+    """
+        self.circuit_breaker: Optional[CircuitBreaker] = None
+        """Fails requests fast, with CircuitOpenError, while a host's RPC
+       service keeps failing or responding slowly.
+    """
+        self.hedging_policy: Optional[HedgingPolicy] = None
+        """Sends a second request for reads slower than usual, and uses
+       whichever response arrives first.
+    """
         self.client_side_validation = True
+        """Whether service methods validate their arguments with pydantic.
+       Disable it for trusted callers that always pass request models, to
+       skip the validation overhead on every call.
+    """
+        self.response_mode = "model"
+        """What service methods return: "model" for the response model, "dict"
+       for the decoded JSON object, keyed by the JSON field names, or "bytes"
+       for the raw response body. The raw modes skip building models. List
+       endpoints can also be called with "stream", for an ItemStream that
+       decodes the items one at a time as the response body is received.
+    """
+        self.lean_responses = False
+        """Whether to keep only the deserialized data of a response. The raw
+       body is then released as soon as it has been deserialized, instead of
+       being kept in ApiResponse.raw_data, and ApiResponse.headers is a
+       read-only view of the response headers rather than a copy.
+    """
         self.socket_options = None
         self.datetime_format = "%Y-%m-%dT%H:%M:%S.%f%z"
         self.date_format = "%Y-%m-%d"
         self.default_headers: Dict[str, str] = {}
         self.proxy_url: Optional[str] = None
+        self.http2 = False
+        """Whether to multiplex API calls over HTTP/2 connections, instead of
+       opening a connection per concurrent call. Requires the `http2` extra,
+       `pip install zitadel_client[http2]`, and applies to the synchronous
+       client. Ignored when a transport is set below.
+    """
+        self.transport: Optional[Transport] = None
+        """Connection pool to send requests through, e.g. one shared with the
+       authenticator. When unset, a pool is created from the TLS and proxy
+       settings above.
+    """
+        self.json_codec: JsonCodec = JsonCodec.default()
+        """JSON codec used to encode request bodies and decode responses.
+       orjson or msgspec is used when installed, the json module otherwise.
+    """
 
     def __deepcopy__(self, memo: Dict[int, Any]) -> Self:
         cls = self.__class__
         result = cls.__new__(cls)
         memo[id(self)] = result
         for k, v in self.__dict__.items():
-            if k not in ("logger", "logger_file_handler"):
+            if k not in (
+                "logger",
+                "logger_file_handler",
+                "transport",
+                "json_codec",
+                "retry_policy",
+                "rate_limiter",
+                "circuit_breaker",
+                "hedging_policy",
+            ):
                 # noinspection PyArgumentList
                 setattr(result, k, copy.deepcopy(v, memo))
         # shallow copy of loggers
         result.logger = copy.copy(self.logger)
+        # connection pools, retry budgets, rate limits, circuits and latencies are shared, not copied
+        result.transport = self.transport
+        result.retry_policy = self.retry_policy
+        result.rate_limiter = self.rate_limiter
+        result.circuit_breaker = self.circuit_breaker
+        result.hedging_policy = self.hedging_policy
+        result.json_codec = self.json_codec
         # use setters to configure loggers
         result.logger_file = self.logger_file
         result.debug = self.debug
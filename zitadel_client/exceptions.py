@@ -25,3 +25,33 @@ class ApiError(ZitadelError):
         self.code = code
         self.response_headers = response_headers
         self.response_body = response_body
+
+
+class InconsistentPageError(ZitadelError):
+    """
+    Raised when a page of a list result was read at a different state than the first page.
+
+    Attributes:
+      expected Any The `details.timestamp` reported with the first page
+      actual   Any The `details.timestamp` reported with the offending page
+    """
+
+    def __init__(self, expected: Any, actual: Any) -> None:
+        super().__init__(f"Page read at {actual}, but the first page was read at {expected}")
+        self.expected = expected
+        self.actual = actual
+
+
+class CircuitOpenError(ZitadelError):
+    """
+    Raised instead of sending a request while the circuit of its host and RPC service is open.
+
+    Attributes:
+      circuit     str   The host and RPC service of the circuit
+      retry_after float The seconds until the circuit lets a probe through, 0 if probes are in flight
+    """
+
+    def __init__(self, circuit: str, retry_after: float) -> None:
+        super().__init__(f"Circuit {circuit} is open")
+        self.circuit = circuit
+        self.retry_after = retry_after
@@ -0,0 +1,148 @@
+import math
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Collection, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+from zitadel_client.retry import RetryBudget, RetryPolicy
+
+
+class LatencyTracker:
+    """
+    Keeps the latencies of the most recent calls to each endpoint, to read percentiles from.
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        """
+        Initializes the tracker.
+
+        :param window: The number of most recent latencies kept per endpoint.
+        """
+        self.window = window
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, key: str, latency: float) -> None:
+        """
+        Records the latency of a call.
+
+        :param key: The endpoint, e.g. its path.
+        :param latency: The seconds the call took.
+        """
+        with self._lock:
+            latencies = self._latencies.get(key)
+            if latencies is None:
+                latencies = self._latencies[key] = deque(maxlen=self.window)
+            latencies.append(latency)
+
+    def percentile(self, key: str, percentile: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Returns a percentile of the recent latencies of an endpoint.
+
+        :param key: The endpoint, e.g. its path.
+        :param percentile: The percentile, between 0 and 100.
+        :param min_samples: The number of latencies needed for the percentile to be meaningful.
+        :return: The latency in seconds, or None if fewer than `min_samples` were recorded.
+        """
+        with self._lock:
+            latencies = sorted(self._latencies.get(key, ()))
+        if not latencies or len(latencies) < min_samples:
+            return None
+        return latencies[max(0, math.ceil(percentile / 100 * len(latencies)) - 1)]
+
+
+class HedgingPolicy:
+    """
+    Sends a second, identical request when the first one is slower than usual, and uses
+    whichever response arrives first.
+
+    Only safe reads, the RPCs named `Get...` or `List...`, are hedged, optionally limited to
+    the endpoints named in `endpoints`. The hedge is sent once the first request has taken
+    longer than `delay` seconds or, by default, than the `percentile` of the endpoint's recent
+    latencies, over another pooled connection. Hedges are drawn from a RetryBudget, so that
+    they add at most `max_extra_load` to the requests sent.
+
+    Hedged requests run on a thread pool of `max_workers` threads, shared by every client
+    using the policy, so that the caller can wait for either response.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        delay: Optional[float] = None,
+        min_samples: int = 20,
+        window: int = 200,
+        max_extra_load: float = 0.05,
+        endpoints: Optional[Collection[str]] = None,
+        max_workers: int = 32,
+    ) -> None:
+        """
+        Initializes the policy.
+
+        :param percentile: The percentile of recent latencies after which to hedge.
+        :param delay: A fixed delay in seconds after which to hedge, instead of the percentile.
+        :param min_samples: The latencies an endpoint needs before it is hedged by percentile.
+        :param window: The number of most recent latencies kept per endpoint.
+        :param max_extra_load: The hedges allowed per request sent, e.g. 0.05 for 5% more requests.
+        :param endpoints: The reads to hedge, by method name, e.g. "GetSession", or by path.
+            Defaults to every read.
+        :param max_workers: The threads running hedged requests.
+        """
+        self.percentile = percentile
+        self.fixed_delay = delay
+        self.min_samples = min_samples
+        self.endpoints = frozenset(endpoints) if endpoints is not None else None
+        self.latencies = LatencyTracker(window)
+        self.budget = RetryBudget(ratio=max_extra_load, reserve=1.0)
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def should_hedge(self, method: str, url: str) -> bool:
+        """
+        Returns whether a request may be hedged.
+
+        :param method: The HTTP method.
+        :param url: The request URL, or its path.
+        :return: True for the reads selected by `endpoints`.
+        """
+        path = urlsplit(url).path
+        if method.upper() not in RetryPolicy.SAFE_METHODS and not RetryPolicy.is_read(path):
+            return False
+        return self.endpoints is None or path in self.endpoints or path.rsplit("/", 1)[-1] in self.endpoints
+
+    def delay(self, url: str) -> Optional[float]:
+        """
+        Returns how long to wait for the first response before hedging.
+
+        :param url: The request URL, or its path.
+        :return: The delay in seconds, or None while too few latencies have been recorded.
+        """
+        if self.fixed_delay is not None:
+            return self.fixed_delay
+        return self.latencies.percentile(urlsplit(url).path, self.percentile, self.min_samples)
+
+    def record(self, url: str, latency: float) -> None:
+        """
+        Records the latency of a request, hedged or not.
+
+        :param url: The request URL, or its path.
+        :param latency: The seconds from sending the request to receiving the response headers.
+        """
+        self.latencies.record(urlsplit(url).path, latency)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """The thread pool running hedged requests, created on first use."""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="zitadel-hedge")
+        return self._executor
+
+    @staticmethod
+    def discard(future: "Future") -> None:
+        """Reads and drops the response of a losing request, so that its connection can be reused."""
+        if not future.cancelled() and future.exception() is None:
+            future.result().read()
@@ -0,0 +1,552 @@
+import http.client
+import socket
+import ssl
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Set, Tuple
+from urllib.parse import unquote, urlencode, urlsplit
+
+import urllib3
+from urllib3 import HTTPHeaderDict
+from urllib3.util import make_headers
+
+try:
+    from h2.config import H2Configuration
+    from h2.connection import H2Connection
+    from h2.errors import ErrorCodes
+    from h2.events import (
+        ConnectionTerminated,
+        DataReceived,
+        RemoteSettingsChanged,
+        ResponseReceived,
+        StreamEnded,
+        StreamReset,
+        WindowUpdated,
+    )
+    from h2.exceptions import NoAvailableStreamIDError, ProtocolError, StreamClosedError
+    from h2.settings import SettingCodes
+except ImportError as e:  # pragma: no cover
+    raise ImportError("The HTTP/2 transport requires h2; install it with `pip install zitadel_client[http2]`.") from e
+
+Origin = Tuple[str, str, int]
+
+# headers that are specific to an HTTP/1.1 connection, and forbidden in HTTP/2
+CONNECTION_HEADERS = frozenset(("connection", "host", "keep-alive", "proxy-connection", "te", "transfer-encoding", "upgrade"))
+
+
+class Http2Stream:
+    """
+    A request in flight on an Http2Connection, which receives the events of its stream.
+    """
+
+    def __init__(self, connection: "Http2Connection", stream_id: int) -> None:
+        self.connection = connection
+        self.stream_id = stream_id
+        self.changed = threading.Condition(connection.lock)
+        self.status: Optional[int] = None
+        self.headers: List[Tuple[str, str]] = []
+        self.chunks: Deque[bytes] = deque()
+        self.ended = False
+        self.error: Optional[Exception] = None
+
+    def wait_for_response(self, timeout: Optional[float]) -> None:
+        """
+        Waits for the response headers.
+
+        :raises urllib3.exceptions.HTTPError: If the stream failed or no response arrived in time.
+        """
+        with self.changed:
+            if not self.changed.wait_for(lambda: self.status is not None or self.error is not None, timeout):
+                raise urllib3.exceptions.ReadTimeoutError(None, self.connection.url, "Read timed out.")  # ty: ignore[invalid-argument-type]
+            if self.status is None and self.error is not None:
+                raise self.error
+
+    def read_chunk(self, timeout: Optional[float]) -> Optional[bytes]:
+        """
+        Returns the next chunk of the response body, and lets the server send as much again.
+
+        :return: The chunk, or None once the body has been received in full.
+        :raises urllib3.exceptions.HTTPError: If the stream failed or no data arrived in time.
+        """
+        with self.changed:
+            if not self.changed.wait_for(lambda: self.chunks or self.ended or self.error is not None, timeout):
+                raise urllib3.exceptions.ReadTimeoutError(None, self.connection.url, "Read timed out.")  # ty: ignore[invalid-argument-type]
+            if self.chunks:
+                chunk = self.chunks.popleft()
+                self.connection.h2.acknowledge_received_data(len(chunk), self.stream_id)
+                self.connection.flush()
+                return chunk
+            if self.error is not None:
+                raise self.error
+            return None
+
+    def fail(self, error: Exception) -> None:
+        """Fails the stream, waking up the thread waiting for it. Called with the connection lock held."""
+        if not self.ended:
+            self.error = error
+        self.changed.notify_all()
+
+
+class Http2Connection:
+    """
+    A single HTTP/2 connection that many threads send requests over at once, each on its own
+    stream.
+
+    All access to the protocol state is serialized by one lock. A reader thread receives the
+    frames of the server and hands them to the streams they belong to, while the threads that
+    sent the requests wait for their own stream only. The server is allowed to send more of a
+    response body once the previous chunks have been read, and request bodies are sent as fast
+    as the flow control windows of the server allow.
+    """
+
+    def __init__(self, sock: socket.socket, origin: Origin) -> None:
+        """
+        Starts the connection over a connected socket, sending the connection preface.
+
+        :param sock: A socket connected to the server, with TLS set up for https.
+        :param origin: The scheme, host and port of the server.
+        """
+        self.sock = sock
+        self.origin = origin
+        self.url = f"{origin[0]}://{origin[1]}:{origin[2]}"
+        self.lock = threading.RLock()
+        self.window_changed = threading.Condition(self.lock)
+        self.h2 = H2Connection(H2Configuration(client_side=True, header_encoding="utf-8"))
+        self.streams: Dict[int, Http2Stream] = {}
+        self.active = 0
+        self.settings_received = False
+        self.closed = False
+        with self.lock:
+            self.h2.initiate_connection()
+            self.h2.update_settings({SettingCodes.INITIAL_WINDOW_SIZE: 2**20, SettingCodes.ENABLE_PUSH: 0})
+            self.h2.increment_flow_control_window(2**24)
+            self.flush()
+        threading.Thread(target=self._read_frames, name="zitadel-h2-reader", daemon=True).start()
+
+    @property
+    def capacity(self) -> int:
+        """The number of streams the server allows at once, assumed to be 100 until it says so."""
+        return self.h2.remote_settings.max_concurrent_streams if self.settings_received else 100
+
+    def send(self, method: str, target: str, headers: Dict[str, str], body: Optional[bytes]) -> Http2Stream:
+        """
+        Sends a request on a new stream.
+
+        :param method: The HTTP method.
+        :param target: The path and query of the request.
+        :param headers: The request headers.
+        :param body: The request body, if any.
+        :return: The stream to read the response from.
+        """
+        authority = self.origin[1] if self.origin[2] in (80, 443) else f"{self.origin[1]}:{self.origin[2]}"
+        request_headers = [(":method", method), (":authority", authority), (":scheme", self.origin[0]), (":path", target)]
+        request_headers += [(name.lower(), value) for name, value in headers.items() if name.lower() not in CONNECTION_HEADERS]
+        with self.lock:
+            if self.closed:
+                raise urllib3.exceptions.ProtocolError("Connection closed.")
+            try:
+                stream_id = self.h2.get_next_available_stream_id()
+            except NoAvailableStreamIDError as e:
+                self.closed = True
+                raise urllib3.exceptions.ProtocolError("Connection has no stream ids left.", e) from e
+            stream = self.streams[stream_id] = Http2Stream(self, stream_id)
+            self.h2.send_headers(stream_id, request_headers, end_stream=not body)
+            self.flush()
+        if body:
+            try:
+                self._send_body(stream, body)
+            except BaseException:
+                self.reset(stream)
+                raise
+        return stream
+
+    def _send_body(self, stream: Http2Stream, body: bytes) -> None:
+        view = memoryview(body)
+        while view:
+            with self.lock:
+                self.window_changed.wait_for(lambda: self._window(stream) > 0 or stream.error is not None or self.closed)
+                if stream.error is not None:
+                    raise stream.error
+                if self.closed:
+                    raise urllib3.exceptions.ProtocolError("Connection closed.")
+                size = min(self._window(stream), self.h2.max_outbound_frame_size, len(view))
+                self.h2.send_data(stream.stream_id, view[:size].tobytes(), end_stream=size == len(view))
+                self.flush()
+            view = view[size:]
+
+    def _window(self, stream: Http2Stream) -> int:
+        try:
+            return self.h2.local_flow_control_window(stream.stream_id)
+        except StreamClosedError:
+            return 0
+
+    def reset(self, stream: Http2Stream) -> None:
+        """Cancels a stream whose response is no longer wanted."""
+        with self.lock:
+            if self.streams.pop(stream.stream_id, None) is None or self.closed:
+                return
+            try:
+                # the unread chunks still count against the connection's flow control window
+                unread = sum(len(chunk) for chunk in stream.chunks)
+                stream.chunks.clear()
+                if unread:
+                    self.h2.acknowledge_received_data(unread, stream.stream_id)
+                if not stream.ended:
+                    self.h2.reset_stream(stream.stream_id, ErrorCodes.CANCEL)
+                self.flush()
+            except (StreamClosedError, ProtocolError, urllib3.exceptions.ProtocolError):
+                pass
+
+    def flush(self) -> None:
+        """Writes the pending frames to the socket. Called with the lock held."""
+        data = self.h2.data_to_send()
+        if data:
+            try:
+                self.sock.sendall(data)
+            except OSError as e:
+                self._close(urllib3.exceptions.ProtocolError("Connection lost.", e))
+                raise urllib3.exceptions.ProtocolError("Connection lost.", e) from e
+
+    def close(self) -> None:
+        """Closes the connection, failing the requests in flight."""
+        with self.lock:
+            if not self.closed:
+                try:
+                    self.h2.close_connection()
+                    self.flush()
+                except (ProtocolError, urllib3.exceptions.ProtocolError):
+                    pass
+            self._close(urllib3.exceptions.ProtocolError("Connection closed."))
+
+    def _close(self, error: Exception, last_stream_id: int = -1) -> None:
+        self.closed = True
+        for stream_id, stream in list(self.streams.items()):
+            if stream_id > last_stream_id:
+                stream.fail(error)
+        self.window_changed.notify_all()
+        if last_stream_id < 0:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+
+    def _read_frames(self) -> None:
+        error: Exception = urllib3.exceptions.ProtocolError("Connection closed by the server.")
+        try:
+            while True:
+                data = self.sock.recv(65536)
+                if not data:
+                    break
+                with self.lock:
+                    for event in self.h2.receive_data(data):
+                        self._handle(event)
+                    self.flush()
+        except (OSError, ProtocolError, urllib3.exceptions.ProtocolError) as e:
+            error = urllib3.exceptions.ProtocolError(str(e), e)
+        with self.lock:
+            self._close(error)
+
+    def _handle(self, event: Any) -> None:  # noqa C901 too complex
+        stream = self.streams.get(getattr(event, "stream_id", None) or 0)
+        if isinstance(event, ResponseReceived) and stream is not None:
+            headers = event.headers or []
+            stream.status = int(next(value for name, value in headers if name == ":status"))
+            stream.headers = [(name, value) for name, value in headers if not name.startswith(":")]
+            stream.changed.notify_all()
+        elif isinstance(event, DataReceived):
+            if stream is not None:
+                stream.chunks.append(event.data or b"")
+                stream.changed.notify_all()
+                # padding is not passed on as data, so it is acknowledged right away
+                padding = (event.flow_controlled_length or 0) - len(event.data or b"")
+                if padding:
+                    self.h2.acknowledge_received_data(padding, stream.stream_id)
+            else:
+                self.h2.acknowledge_received_data(event.flow_controlled_length or 0, event.stream_id or 0)
+        elif isinstance(event, StreamEnded) and stream is not None:
+            stream.ended = True
+            stream.changed.notify_all()
+        elif isinstance(event, StreamReset) and stream is not None:
+            stream.fail(urllib3.exceptions.ProtocolError(f"Stream reset by the server with error {event.error_code!r}."))
+            self.window_changed.notify_all()
+        elif isinstance(event, WindowUpdated):
+            self.window_changed.notify_all()
+        elif isinstance(event, RemoteSettingsChanged):
+            self.settings_received = True
+            self.window_changed.notify_all()
+        elif isinstance(event, ConnectionTerminated):
+            # requests the server has not begun to process may safely be sent again
+            self._close(
+                urllib3.exceptions.ProtocolError(f"Connection terminated by the server with error {event.error_code!r}."),
+                event.last_stream_id or 0,
+            )
+
+
+class Http2Response:
+    """
+    The response to a request sent over HTTP/2, exposing the part of urllib3's response API
+    that RESTResponse uses.
+    """
+
+    def __init__(self, pool: "Http2PoolManager", stream: Http2Stream, read_timeout: Optional[float]) -> None:
+        self._pool = pool
+        self._stream: Optional[Http2Stream] = stream
+        self._read_timeout = read_timeout
+        self._data: Optional[bytes] = None
+        self.status = stream.status or 0
+        self.reason = http.client.responses.get(self.status, "")
+        self.headers = HTTPHeaderDict(stream.headers)
+        self.version = 20
+
+    @property
+    def data(self) -> bytes:
+        """The response body, read in full."""
+        if self._data is None:
+            self._data = b"".join(self.stream())
+        return self._data
+
+    def stream(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """Yields the response body in the chunks received, and releases the stream once read."""
+        stream = self._stream
+        if stream is None:
+            return
+        try:
+            while (chunk := stream.read_chunk(self._read_timeout)) is not None:
+                yield chunk
+        finally:
+            self.release_conn()
+
+    def release_conn(self) -> None:
+        """Frees the stream, cancelling it if the body has not been read in full."""
+        if self._stream is not None:
+            stream, self._stream = self._stream, None
+            self._pool.release(stream)
+
+
+class Http2PoolManager:
+    """
+    Sends requests over HTTP/2, multiplexing the concurrent requests to a host over one
+    connection instead of opening a connection per request in flight.
+
+    It stands in for the urllib3 PoolManager of API calls, taking the same TLS, proxy and pool
+    arguments and the same request() arguments. A second connection to a host is only opened
+    once the first has as many requests in flight as the server allows, and at most `maxsize`
+    are opened. HTTPS connections negotiate HTTP/2 with ALPN and requests to servers that do
+    not offer it are sent through `fallback` instead; plain HTTP connections speak HTTP/2 with
+    prior knowledge (h2c), as Zitadel does on plaintext ports. Through a proxy, connections are
+    tunnelled with CONNECT. Errors are raised as urllib3's, so that callers handle both alike.
+    """
+
+    def __init__(
+        self,
+        pool_args: Dict[str, Any],
+        proxy_url: Optional[str] = None,
+        fallback: Optional[urllib3.PoolManager] = None,
+    ) -> None:
+        """
+        Initializes the pool. Connections are opened on first use.
+
+        :param pool_args: The keyword arguments of the urllib3 PoolManager it replaces, e.g.
+            TLS settings and pool size.
+        :param proxy_url: Optional URL of a proxy that all requests are sent through.
+        :param fallback: The pool for servers that do not speak HTTP/2 over TLS.
+        """
+        self.pool_args = pool_args
+        self.proxy_url = proxy_url
+        self.fallback = fallback
+        self.maxsize: int = pool_args.get("maxsize") or 1
+        self._connections: Dict[Origin, List[Http2Connection]] = {}
+        self._connecting: Dict[Origin, bool] = {}
+        self._http1_origins: Set[Origin] = set()
+        self._available = threading.Condition()
+        self._ssl_context: Optional[ssl.SSLContext] = None
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        body: Any = None,
+        fields: Any = None,
+        encode_multipart: bool = True,
+        timeout: Optional[urllib3.Timeout] = None,
+        headers: Optional[Dict[str, str]] = None,
+        preload_content: bool = True,
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Sends a request, with the arguments of urllib3's PoolManager.request().
+
+        :return: The response. Its body is read on first access unless `preload_content` is set.
+        :raises urllib3.exceptions.HTTPError: If the request could not be sent or answered.
+        """
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname or "", parts.port or (443 if parts.scheme == "https" else 80))
+        if origin in self._http1_origins and self.fallback is not None:
+            return self.fallback.request(
+                method,
+                url,
+                body=body,
+                fields=fields,
+                encode_multipart=encode_multipart,
+                timeout=timeout,
+                headers=headers,
+                preload_content=preload_content,
+                **kwargs,
+            )
+        headers = dict(headers or {})
+        target = parts.path + (f"?{parts.query}" if parts.query else "")
+        target, body = self._encode(method, target, body, fields, encode_multipart, headers)
+        connect_timeout, read_timeout = self._timeouts(timeout)
+
+        connection = self._acquire(origin, connect_timeout)
+        if connection is None:
+            return self.request(method, url, body, None, encode_multipart, timeout, headers, preload_content, **kwargs)
+        try:
+            stream = connection.send(method, target, headers, body)
+        except BaseException:
+            self._release(connection)
+            raise
+        try:
+            stream.wait_for_response(read_timeout)
+        except BaseException:
+            self.release(stream)
+            raise
+        response = Http2Response(self, stream, read_timeout)
+        if preload_content:
+            response.data  # noqa: B018 read the body now
+        return response
+
+    @staticmethod
+    def _encode(
+        method: str, target: str, body: Any, fields: Any, encode_multipart: bool, headers: Dict[str, str]
+    ) -> Tuple[str, Optional[bytes]]:
+        """Encodes the fields into the query or the body like urllib3 does, and sets the body headers."""
+        if fields and method not in ("POST", "PUT", "PATCH", "OPTIONS", "DELETE"):
+            target += ("&" if "?" in target else "?") + urlencode(fields)
+        elif fields and encode_multipart:
+            body, headers["Content-Type"] = urllib3.encode_multipart_formdata(fields)
+        elif fields:
+            body = urlencode(fields)
+            headers["Content-Type"] = "application/x-www-form-urlencoded"
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if body:
+            headers["Content-Length"] = str(len(body))
+        return target, body
+
+    def release(self, stream: Http2Stream) -> None:
+        """Frees a stream once its response has been read, or is no longer wanted."""
+        stream.connection.reset(stream)
+        self._release(stream.connection)
+
+    def clear(self) -> None:
+        """Closes all connections."""
+        with self._available:
+            connections = [connection for pool in self._connections.values() for connection in pool]
+            self._connections = {}
+        for connection in connections:
+            connection.close()
+
+    def _release(self, connection: Http2Connection) -> None:
+        with self._available:
+            connection.active -= 1
+            self._available.notify_all()
+
+    def _acquire(self, origin: Origin, timeout: Optional[float]) -> Optional[Http2Connection]:
+        with self._available:
+            while True:
+                pool = self._connections.setdefault(origin, [])
+                pool[:] = [connection for connection in pool if not connection.closed]
+                available = [connection for connection in pool if connection.active < connection.capacity]
+                if available:
+                    connection = min(available, key=lambda c: c.active)
+                    connection.active += 1
+                    return connection
+                if not self._connecting.get(origin) and len(pool) < self.maxsize:
+                    self._connecting[origin] = True
+                    break
+                self._available.wait()
+        try:
+            connection = self._connect(origin, timeout)
+        finally:
+            with self._available:
+                self._connecting[origin] = False
+                self._available.notify_all()
+        if connection is None:
+            return None
+        with self._available:
+            connection.active += 1
+            self._connections[origin].append(connection)
+        return connection
+
+    def _connect(self, origin: Origin, timeout: Optional[float]) -> Optional[Http2Connection]:
+        scheme, host, port = origin
+        try:
+            if self.proxy_url:
+                proxy = urlsplit(self.proxy_url)
+                sock = self._open_socket(proxy.hostname or "", proxy.port or 80, timeout)
+                self._tunnel(sock, host, port, proxy.username, proxy.password)
+            else:
+                sock = self._open_socket(host, port, timeout)
+            if scheme == "https":
+                server_hostname = self.pool_args.get("server_hostname") or host
+                sock = self._tls_context().wrap_socket(sock, server_hostname=server_hostname)
+                if sock.selected_alpn_protocol() != "h2" and self.fallback is not None:
+                    sock.close()
+                    self._http1_origins.add(origin)
+                    return None
+        except socket.timeout as e:
+            raise urllib3.exceptions.ConnectTimeoutError(f"Connection to {host}:{port} timed out.") from e
+        except ssl.SSLError as e:
+            raise urllib3.exceptions.SSLError(e) from e
+        except OSError as e:
+            raise urllib3.exceptions.ProtocolError(f"Failed to connect to {host}:{port}.", e) from e
+        sock.settimeout(None)
+        return Http2Connection(sock, origin)
+
+    def _open_socket(self, host: str, port: int, timeout: Optional[float]) -> socket.socket:
+        sock = socket.create_connection((host, port), timeout)
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        for option in self.pool_args.get("socket_options") or ():
+            sock.setsockopt(*option)
+        return sock
+
+    @staticmethod
+    def _tunnel(sock: socket.socket, host: str, port: int, username: Optional[str], password: Optional[str]) -> None:
+        request = f"CONNECT {host}:{port} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+        if username:
+            credentials = f"{unquote(username)}:{unquote(password or '')}"
+            request += f"Proxy-Authorization: {make_headers(proxy_basic_auth=credentials)['proxy-authorization']}\r\n"
+        sock.sendall(f"{request}\r\n".encode("latin-1"))
+        response = b""
+        while b"\r\n\r\n" not in response:
+            chunk = sock.recv(4096)
+            if not chunk:
+                raise OSError("Proxy closed the connection.")
+            response += chunk
+        status_line = response.split(b"\r\n", 1)[0].decode("latin-1")
+        if status_line.split(" ")[1:2] != ["200"]:
+            raise urllib3.exceptions.ProxyError("Unable to connect to proxy", OSError(f"Tunnel connection failed: {status_line}"))
+
+    def _tls_context(self) -> ssl.SSLContext:
+        if self._ssl_context is None:
+            args = self.pool_args
+            context = ssl.create_default_context(cafile=args.get("ca_certs"), cadata=args.get("ca_cert_data"))
+            if args.get("cert_file"):
+                context.load_cert_chain(args["cert_file"], keyfile=args.get("key_file"))
+            if args.get("assert_hostname") is False or args.get("cert_reqs") == ssl.CERT_NONE:
+                context.check_hostname = False
+            if args.get("cert_reqs") == ssl.CERT_NONE:
+                context.verify_mode = ssl.CERT_NONE
+            context.set_alpn_protocols(["h2", "http/1.1"])
+            self._ssl_context = context
+        return self._ssl_context
+
+    @staticmethod
+    def _timeouts(timeout: Optional[urllib3.Timeout]) -> Tuple[Optional[float], Optional[float]]:
+        if timeout is None:
+            return None, None
+        timeout = timeout.clone()
+        connect = timeout.resolve_default_timeout(timeout.connect_timeout)
+        timeout.start_connect()
+        return connect, timeout.read_timeout
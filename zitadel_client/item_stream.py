@@ -0,0 +1,189 @@
+import re
+from typing import Any, Callable, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, Union
+
+from pydantic import BaseModel
+
+from zitadel_client.utils.model_util import ModelUtil
+
+T = TypeVar("T")
+
+_STRING = re.compile(rb'"[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+# runs of complete strings and other bytes are skipped in one match, leaving brackets in
+# groups 1 and 2; a lone quote in group 3 starts a string cut off by the end of the buffer
+_TOKEN = re.compile(rb'(?:[^"\[\]{}]+|"[^"\\]*(?:\\.[^"\\]*)*")+|([\[{])|([\]}])|(")', re.DOTALL)
+_SCALAR_END = re.compile(rb"[\s,\]}]")
+_WHITESPACE = re.compile(rb"\s*")
+
+
+class _JsonScanner:
+    """
+    Splits a JSON document, received in chunks, into the raw bytes of its values.
+
+    Only the value being scanned and the chunk it ends in are buffered. The scanner does
+    not decode anything: it finds where each value ends by matching brackets outside of
+    strings, and leaves the decoding of each value to the caller.
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self.chunks = iter(chunks)
+        self.buffer = bytearray()
+        self.pos = 0
+
+    def _fill(self) -> bool:
+        """Appends the next chunk, dropping what has been consumed; returns False at the end of the document."""
+        for chunk in self.chunks:
+            if chunk:
+                del self.buffer[: self.pos]
+                self.pos = 0
+                self.buffer += chunk
+                return True
+        return False
+
+    def peek(self) -> int:
+        """Skips whitespace and returns the next byte, without consuming it."""
+        while True:
+            self.pos = _WHITESPACE.match(self.buffer, self.pos).end()  # ty: ignore[unresolved-attribute]
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def accept(self, char: bytes) -> bool:
+        """Consumes the next byte if it is `char`."""
+        if self.peek() != char[0]:
+            return False
+        self.pos += 1
+        return True
+
+    def expect(self, char: bytes) -> None:
+        """Consumes the next byte, which must be `char`."""
+        if not self.accept(char):
+            raise ValueError(f"Expected {char.decode()!r} at {bytes(self.buffer[self.pos : self.pos + 20])!r}")
+
+    def value(self) -> bytes:
+        """Consumes the next value and returns its raw bytes."""
+        first = self.peek()
+        if first in b"{[":
+            end = self._container_end()
+        elif first == ord('"'):
+            end = self._string_end()
+        else:
+            end = self._scalar_end()
+        value = bytes(self.buffer[self.pos : end])
+        self.pos = end
+        return value
+
+    def _string_end(self) -> int:
+        """Returns where the string at the current position ends, reading chunks as needed."""
+        while True:
+            match = _STRING.match(self.buffer, self.pos)
+            if match is not None:
+                return match.end()
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+    def _scalar_end(self) -> int:
+        """Returns where the number or literal at the current position ends, reading chunks as needed."""
+        while True:
+            match = _SCALAR_END.search(self.buffer, self.pos)
+            if match is not None:
+                return match.start()
+            if not self._fill():
+                return len(self.buffer)
+
+    def _container_end(self) -> int:
+        """Returns where the object or array at the current position ends, reading chunks as needed."""
+        depth = 0
+        # scan offsets are kept relative to pos, which moves when chunks are appended
+        offset = 0
+        while True:
+            start = self.pos + offset
+            for match in _TOKEN.finditer(self.buffer, start):
+                group = match.lastindex
+                if group == 1:
+                    depth += 1
+                elif group == 2:
+                    depth -= 1
+                    if depth == 0:
+                        return match.end()
+                elif group == 3:
+                    start = match.start()
+                    break
+                start = match.end()
+            offset = start - self.pos
+            if not self._fill():
+                raise ValueError("Unexpected end of JSON document")
+
+
+class ItemStream(Generic[T]):
+    """
+    Iterates over the items of a list response, decoding one item at a time as the body
+    is received.
+
+    The response body is read in chunks and only the item being decoded is buffered, so
+    memory use is bounded by the largest item rather than the whole page. The other
+    members of the response, such as `details`, are available from `response` once all
+    items have been read. A stream can only be iterated once.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        response_type: Type[BaseModel],
+        loads: Callable[[Union[bytes, str]], Any],
+    ) -> None:
+        """
+        Initializes the stream.
+
+        :param chunks: The UTF-8 encoded response body, in chunks.
+        :param response_type: The list response model, e.g. UserServiceListUsersResponse.
+        :param loads: The JSON decoder used for items that cannot be validated directly.
+        """
+        _, self.items_key, self.item_type = ModelUtil.list_field(response_type)
+        self.response_type = response_type
+        self._chunks = chunks
+        self._loads = loads
+        self._response: Optional[BaseModel] = None
+        self._started = False
+
+    @property
+    def response(self) -> BaseModel:
+        """
+        The response without its items, once they have all been read.
+
+        :raises RuntimeError: If the items have not all been read yet.
+        """
+        if self._response is None:
+            raise RuntimeError("The response is only available once all items have been read")
+        return self._response
+
+    def __iter__(self) -> Iterator[T]:
+        if self._started:
+            raise RuntimeError("An ItemStream can only be iterated once")
+        self._started = True
+
+        scanner = _JsonScanner(self._chunks)
+        members: List[bytes] = []
+        scanner.expect(b"{")
+        if not scanner.accept(b"}"):
+            while True:
+                key = scanner.value()
+                scanner.expect(b":")
+                if self._loads(key) == self.items_key and scanner.peek() == ord("["):
+                    yield from self._items(scanner)
+                else:
+                    members.append(key + b":" + scanner.value())
+                if scanner.accept(b"}"):
+                    break
+                scanner.expect(b",")
+        self._response = ModelUtil.validate(self.response_type, b"{" + b",".join(members) + b"}", self._loads)
+
+    def _items(self, scanner: _JsonScanner) -> Iterator[T]:
+        scanner.expect(b"[")
+        if scanner.accept(b"]"):
+            return
+        while True:
+            yield ModelUtil.validate(self.item_type, scanner.value(), self._loads)  # ty: ignore[invalid-yield]
+            if scanner.accept(b"]"):
+                return
+            scanner.expect(b",")
@@ -12,1356 +12,2729 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
 
-# import models into model package
-from zitadel_client.models.action_service_activate_public_key_request import ActionServiceActivatePublicKeyRequest
-from zitadel_client.models.action_service_activate_public_key_response import ActionServiceActivatePublicKeyResponse
-from zitadel_client.models.action_service_add_public_key_request import ActionServiceAddPublicKeyRequest
-from zitadel_client.models.action_service_add_public_key_response import ActionServiceAddPublicKeyResponse
-from zitadel_client.models.action_service_any import ActionServiceAny
-from zitadel_client.models.action_service_condition import ActionServiceCondition
-from zitadel_client.models.action_service_connect_error import ActionServiceConnectError
-from zitadel_client.models.action_service_create_target_request import ActionServiceCreateTargetRequest
-from zitadel_client.models.action_service_create_target_response import ActionServiceCreateTargetResponse
-from zitadel_client.models.action_service_deactivate_public_key_request import ActionServiceDeactivatePublicKeyRequest
-from zitadel_client.models.action_service_deactivate_public_key_response import ActionServiceDeactivatePublicKeyResponse
-from zitadel_client.models.action_service_delete_target_request import ActionServiceDeleteTargetRequest
-from zitadel_client.models.action_service_delete_target_response import ActionServiceDeleteTargetResponse
-from zitadel_client.models.action_service_event_execution import ActionServiceEventExecution
-from zitadel_client.models.action_service_execution import ActionServiceExecution
-from zitadel_client.models.action_service_execution_field_name import ActionServiceExecutionFieldName
-from zitadel_client.models.action_service_execution_search_filter import ActionServiceExecutionSearchFilter
-from zitadel_client.models.action_service_execution_type import ActionServiceExecutionType
-from zitadel_client.models.action_service_execution_type_filter import ActionServiceExecutionTypeFilter
-from zitadel_client.models.action_service_function_execution import ActionServiceFunctionExecution
-from zitadel_client.models.action_service_get_target_request import ActionServiceGetTargetRequest
-from zitadel_client.models.action_service_get_target_response import ActionServiceGetTargetResponse
-from zitadel_client.models.action_service_in_conditions_filter import ActionServiceInConditionsFilter
-from zitadel_client.models.action_service_in_ids_filter import ActionServiceInIDsFilter
-from zitadel_client.models.action_service_in_target_ids_filter import ActionServiceInTargetIDsFilter
-from zitadel_client.models.action_service_list_execution_functions_response import ActionServiceListExecutionFunctionsResponse
-from zitadel_client.models.action_service_list_execution_methods_response import ActionServiceListExecutionMethodsResponse
-from zitadel_client.models.action_service_list_execution_services_response import ActionServiceListExecutionServicesResponse
-from zitadel_client.models.action_service_list_executions_request import ActionServiceListExecutionsRequest
-from zitadel_client.models.action_service_list_executions_response import ActionServiceListExecutionsResponse
-from zitadel_client.models.action_service_list_public_keys_request import ActionServiceListPublicKeysRequest
-from zitadel_client.models.action_service_list_public_keys_response import ActionServiceListPublicKeysResponse
-from zitadel_client.models.action_service_list_targets_request import ActionServiceListTargetsRequest
-from zitadel_client.models.action_service_list_targets_response import ActionServiceListTargetsResponse
-from zitadel_client.models.action_service_pagination_request import ActionServicePaginationRequest
-from zitadel_client.models.action_service_pagination_response import ActionServicePaginationResponse
-from zitadel_client.models.action_service_payload_type import ActionServicePayloadType
-from zitadel_client.models.action_service_public_key import ActionServicePublicKey
-from zitadel_client.models.action_service_public_key_field_name import ActionServicePublicKeyFieldName
-from zitadel_client.models.action_service_public_key_search_filter import ActionServicePublicKeySearchFilter
-from zitadel_client.models.action_service_rest_call import ActionServiceRESTCall
-from zitadel_client.models.action_service_rest_webhook import ActionServiceRESTWebhook
-from zitadel_client.models.action_service_remove_public_key_request import ActionServiceRemovePublicKeyRequest
-from zitadel_client.models.action_service_remove_public_key_response import ActionServiceRemovePublicKeyResponse
-from zitadel_client.models.action_service_request_execution import ActionServiceRequestExecution
-from zitadel_client.models.action_service_response_execution import ActionServiceResponseExecution
-from zitadel_client.models.action_service_set_execution_request import ActionServiceSetExecutionRequest
-from zitadel_client.models.action_service_set_execution_response import ActionServiceSetExecutionResponse
-from zitadel_client.models.action_service_target import ActionServiceTarget
-from zitadel_client.models.action_service_target_field_name import ActionServiceTargetFieldName
-from zitadel_client.models.action_service_target_filter import ActionServiceTargetFilter
-from zitadel_client.models.action_service_target_name_filter import ActionServiceTargetNameFilter
-from zitadel_client.models.action_service_target_search_filter import ActionServiceTargetSearchFilter
-from zitadel_client.models.action_service_text_filter_method import ActionServiceTextFilterMethod
-from zitadel_client.models.action_service_timestamp_filter import ActionServiceTimestampFilter
-from zitadel_client.models.action_service_timestamp_filter_method import ActionServiceTimestampFilterMethod
-from zitadel_client.models.action_service_update_target_request import ActionServiceUpdateTargetRequest
-from zitadel_client.models.action_service_update_target_response import ActionServiceUpdateTargetResponse
-from zitadel_client.models.application_service_api_auth_method_type import ApplicationServiceAPIAuthMethodType
-from zitadel_client.models.application_service_api_configuration import ApplicationServiceAPIConfiguration
-from zitadel_client.models.application_service_any import ApplicationServiceAny
-from zitadel_client.models.application_service_application import ApplicationServiceApplication
-from zitadel_client.models.application_service_application_key import ApplicationServiceApplicationKey
-from zitadel_client.models.application_service_application_key_application_id_filter import ApplicationServiceApplicationKeyApplicationIDFilter
-from zitadel_client.models.application_service_application_key_organization_id_filter import ApplicationServiceApplicationKeyOrganizationIDFilter
-from zitadel_client.models.application_service_application_key_project_id_filter import ApplicationServiceApplicationKeyProjectIDFilter
-from zitadel_client.models.application_service_application_key_search_filter import ApplicationServiceApplicationKeySearchFilter
-from zitadel_client.models.application_service_application_keys_sorting import ApplicationServiceApplicationKeysSorting
-from zitadel_client.models.application_service_application_name_filter import ApplicationServiceApplicationNameFilter
-from zitadel_client.models.application_service_application_search_filter import ApplicationServiceApplicationSearchFilter
-from zitadel_client.models.application_service_application_sorting import ApplicationServiceApplicationSorting
-from zitadel_client.models.application_service_application_state import ApplicationServiceApplicationState
-from zitadel_client.models.application_service_application_type import ApplicationServiceApplicationType
-from zitadel_client.models.application_service_client_id_filter import ApplicationServiceClientIDFilter
-from zitadel_client.models.application_service_connect_error import ApplicationServiceConnectError
-from zitadel_client.models.application_service_create_api_application_request import ApplicationServiceCreateAPIApplicationRequest
-from zitadel_client.models.application_service_create_api_application_response import ApplicationServiceCreateAPIApplicationResponse
-from zitadel_client.models.application_service_create_application_key_request import ApplicationServiceCreateApplicationKeyRequest
-from zitadel_client.models.application_service_create_application_key_response import ApplicationServiceCreateApplicationKeyResponse
-from zitadel_client.models.application_service_create_application_request import ApplicationServiceCreateApplicationRequest
-from zitadel_client.models.application_service_create_application_response import ApplicationServiceCreateApplicationResponse
-from zitadel_client.models.application_service_create_oidc_application_request import ApplicationServiceCreateOIDCApplicationRequest
-from zitadel_client.models.application_service_create_oidc_application_response import ApplicationServiceCreateOIDCApplicationResponse
-from zitadel_client.models.application_service_create_saml_application_request import ApplicationServiceCreateSAMLApplicationRequest
-from zitadel_client.models.application_service_deactivate_application_request import ApplicationServiceDeactivateApplicationRequest
-from zitadel_client.models.application_service_deactivate_application_response import ApplicationServiceDeactivateApplicationResponse
-from zitadel_client.models.application_service_delete_application_key_request import ApplicationServiceDeleteApplicationKeyRequest
-from zitadel_client.models.application_service_delete_application_key_response import ApplicationServiceDeleteApplicationKeyResponse
-from zitadel_client.models.application_service_delete_application_request import ApplicationServiceDeleteApplicationRequest
-from zitadel_client.models.application_service_delete_application_response import ApplicationServiceDeleteApplicationResponse
-from zitadel_client.models.application_service_entity_id_filter import ApplicationServiceEntityIDFilter
-from zitadel_client.models.application_service_generate_client_secret_request import ApplicationServiceGenerateClientSecretRequest
-from zitadel_client.models.application_service_generate_client_secret_response import ApplicationServiceGenerateClientSecretResponse
-from zitadel_client.models.application_service_get_application_key_request import ApplicationServiceGetApplicationKeyRequest
-from zitadel_client.models.application_service_get_application_key_response import ApplicationServiceGetApplicationKeyResponse
-from zitadel_client.models.application_service_get_application_request import ApplicationServiceGetApplicationRequest
-from zitadel_client.models.application_service_get_application_response import ApplicationServiceGetApplicationResponse
-from zitadel_client.models.application_service_list_application_keys_request import ApplicationServiceListApplicationKeysRequest
-from zitadel_client.models.application_service_list_application_keys_response import ApplicationServiceListApplicationKeysResponse
-from zitadel_client.models.application_service_list_applications_request import ApplicationServiceListApplicationsRequest
-from zitadel_client.models.application_service_list_applications_response import ApplicationServiceListApplicationsResponse
-from zitadel_client.models.application_service_login_v2 import ApplicationServiceLoginV2
-from zitadel_client.models.application_service_login_version import ApplicationServiceLoginVersion
-from zitadel_client.models.application_service_oidc_application_type import ApplicationServiceOIDCApplicationType
-from zitadel_client.models.application_service_oidc_auth_method_type import ApplicationServiceOIDCAuthMethodType
-from zitadel_client.models.application_service_oidc_configuration import ApplicationServiceOIDCConfiguration
-from zitadel_client.models.application_service_oidc_grant_type import ApplicationServiceOIDCGrantType
-from zitadel_client.models.application_service_oidc_localized_message import ApplicationServiceOIDCLocalizedMessage
-from zitadel_client.models.application_service_oidc_response_type import ApplicationServiceOIDCResponseType
-from zitadel_client.models.application_service_oidc_token_type import ApplicationServiceOIDCTokenType
-from zitadel_client.models.application_service_oidc_version import ApplicationServiceOIDCVersion
-from zitadel_client.models.application_service_pagination_request import ApplicationServicePaginationRequest
-from zitadel_client.models.application_service_pagination_response import ApplicationServicePaginationResponse
-from zitadel_client.models.application_service_project_id_filter import ApplicationServiceProjectIDFilter
-from zitadel_client.models.application_service_reactivate_application_request import ApplicationServiceReactivateApplicationRequest
-from zitadel_client.models.application_service_reactivate_application_response import ApplicationServiceReactivateApplicationResponse
-from zitadel_client.models.application_service_saml_configuration import ApplicationServiceSAMLConfiguration
-from zitadel_client.models.application_service_text_filter_method import ApplicationServiceTextFilterMethod
-from zitadel_client.models.application_service_update_api_application_configuration_request import ApplicationServiceUpdateAPIApplicationConfigurationRequest
-from zitadel_client.models.application_service_update_application_request import ApplicationServiceUpdateApplicationRequest
-from zitadel_client.models.application_service_update_application_response import ApplicationServiceUpdateApplicationResponse
-from zitadel_client.models.application_service_update_oidc_application_configuration_request import ApplicationServiceUpdateOIDCApplicationConfigurationRequest
-from zitadel_client.models.application_service_update_saml_application_configuration_request import ApplicationServiceUpdateSAMLApplicationConfigurationRequest
-from zitadel_client.models.authorization_service_activate_authorization_request import AuthorizationServiceActivateAuthorizationRequest
-from zitadel_client.models.authorization_service_activate_authorization_response import AuthorizationServiceActivateAuthorizationResponse
-from zitadel_client.models.authorization_service_any import AuthorizationServiceAny
-from zitadel_client.models.authorization_service_authorization import AuthorizationServiceAuthorization
-from zitadel_client.models.authorization_service_authorization_field_name import AuthorizationServiceAuthorizationFieldName
-from zitadel_client.models.authorization_service_authorizations_search_filter import AuthorizationServiceAuthorizationsSearchFilter
-from zitadel_client.models.authorization_service_connect_error import AuthorizationServiceConnectError
-from zitadel_client.models.authorization_service_create_authorization_request import AuthorizationServiceCreateAuthorizationRequest
-from zitadel_client.models.authorization_service_create_authorization_response import AuthorizationServiceCreateAuthorizationResponse
-from zitadel_client.models.authorization_service_deactivate_authorization_request import AuthorizationServiceDeactivateAuthorizationRequest
-from zitadel_client.models.authorization_service_deactivate_authorization_response import AuthorizationServiceDeactivateAuthorizationResponse
-from zitadel_client.models.authorization_service_delete_authorization_request import AuthorizationServiceDeleteAuthorizationRequest
-from zitadel_client.models.authorization_service_delete_authorization_response import AuthorizationServiceDeleteAuthorizationResponse
-from zitadel_client.models.authorization_service_id_filter import AuthorizationServiceIDFilter
-from zitadel_client.models.authorization_service_in_ids_filter import AuthorizationServiceInIDsFilter
-from zitadel_client.models.authorization_service_list_authorizations_request import AuthorizationServiceListAuthorizationsRequest
-from zitadel_client.models.authorization_service_list_authorizations_response import AuthorizationServiceListAuthorizationsResponse
-from zitadel_client.models.authorization_service_organization import AuthorizationServiceOrganization
-from zitadel_client.models.authorization_service_pagination_request import AuthorizationServicePaginationRequest
-from zitadel_client.models.authorization_service_pagination_response import AuthorizationServicePaginationResponse
-from zitadel_client.models.authorization_service_project import AuthorizationServiceProject
-from zitadel_client.models.authorization_service_project_name_query import AuthorizationServiceProjectNameQuery
-from zitadel_client.models.authorization_service_role import AuthorizationServiceRole
-from zitadel_client.models.authorization_service_role_key_query import AuthorizationServiceRoleKeyQuery
-from zitadel_client.models.authorization_service_state import AuthorizationServiceState
-from zitadel_client.models.authorization_service_state_query import AuthorizationServiceStateQuery
-from zitadel_client.models.authorization_service_text_filter_method import AuthorizationServiceTextFilterMethod
-from zitadel_client.models.authorization_service_update_authorization_request import AuthorizationServiceUpdateAuthorizationRequest
-from zitadel_client.models.authorization_service_update_authorization_response import AuthorizationServiceUpdateAuthorizationResponse
-from zitadel_client.models.authorization_service_user import AuthorizationServiceUser
-from zitadel_client.models.authorization_service_user_display_name_query import AuthorizationServiceUserDisplayNameQuery
-from zitadel_client.models.authorization_service_user_preferred_login_name_query import AuthorizationServiceUserPreferredLoginNameQuery
-from zitadel_client.models.beta_action_service_any import BetaActionServiceAny
-from zitadel_client.models.beta_action_service_condition import BetaActionServiceCondition
-from zitadel_client.models.beta_action_service_connect_error import BetaActionServiceConnectError
-from zitadel_client.models.beta_action_service_create_target_request import BetaActionServiceCreateTargetRequest
-from zitadel_client.models.beta_action_service_create_target_response import BetaActionServiceCreateTargetResponse
-from zitadel_client.models.beta_action_service_delete_target_request import BetaActionServiceDeleteTargetRequest
-from zitadel_client.models.beta_action_service_delete_target_response import BetaActionServiceDeleteTargetResponse
-from zitadel_client.models.beta_action_service_event_execution import BetaActionServiceEventExecution
-from zitadel_client.models.beta_action_service_execution import BetaActionServiceExecution
-from zitadel_client.models.beta_action_service_execution_field_name import BetaActionServiceExecutionFieldName
-from zitadel_client.models.beta_action_service_execution_search_filter import BetaActionServiceExecutionSearchFilter
-from zitadel_client.models.beta_action_service_execution_type import BetaActionServiceExecutionType
-from zitadel_client.models.beta_action_service_execution_type_filter import BetaActionServiceExecutionTypeFilter
-from zitadel_client.models.beta_action_service_function_execution import BetaActionServiceFunctionExecution
-from zitadel_client.models.beta_action_service_get_target_request import BetaActionServiceGetTargetRequest
-from zitadel_client.models.beta_action_service_get_target_response import BetaActionServiceGetTargetResponse
-from zitadel_client.models.beta_action_service_in_conditions_filter import BetaActionServiceInConditionsFilter
-from zitadel_client.models.beta_action_service_in_target_ids_filter import BetaActionServiceInTargetIDsFilter
-from zitadel_client.models.beta_action_service_list_execution_functions_response import BetaActionServiceListExecutionFunctionsResponse
-from zitadel_client.models.beta_action_service_list_execution_methods_response import BetaActionServiceListExecutionMethodsResponse
-from zitadel_client.models.beta_action_service_list_execution_services_response import BetaActionServiceListExecutionServicesResponse
-from zitadel_client.models.beta_action_service_list_executions_request import BetaActionServiceListExecutionsRequest
-from zitadel_client.models.beta_action_service_list_executions_response import BetaActionServiceListExecutionsResponse
-from zitadel_client.models.beta_action_service_list_targets_request import BetaActionServiceListTargetsRequest
-from zitadel_client.models.beta_action_service_list_targets_response import BetaActionServiceListTargetsResponse
-from zitadel_client.models.beta_action_service_pagination_request import BetaActionServicePaginationRequest
-from zitadel_client.models.beta_action_service_pagination_response import BetaActionServicePaginationResponse
-from zitadel_client.models.beta_action_service_rest_call import BetaActionServiceRESTCall
-from zitadel_client.models.beta_action_service_rest_webhook import BetaActionServiceRESTWebhook
-from zitadel_client.models.beta_action_service_request_execution import BetaActionServiceRequestExecution
-from zitadel_client.models.beta_action_service_response_execution import BetaActionServiceResponseExecution
-from zitadel_client.models.beta_action_service_set_execution_request import BetaActionServiceSetExecutionRequest
-from zitadel_client.models.beta_action_service_set_execution_response import BetaActionServiceSetExecutionResponse
-from zitadel_client.models.beta_action_service_target import BetaActionServiceTarget
-from zitadel_client.models.beta_action_service_target_field_name import BetaActionServiceTargetFieldName
-from zitadel_client.models.beta_action_service_target_filter import BetaActionServiceTargetFilter
-from zitadel_client.models.beta_action_service_target_name_filter import BetaActionServiceTargetNameFilter
-from zitadel_client.models.beta_action_service_target_search_filter import BetaActionServiceTargetSearchFilter
-from zitadel_client.models.beta_action_service_text_filter_method import BetaActionServiceTextFilterMethod
-from zitadel_client.models.beta_action_service_update_target_request import BetaActionServiceUpdateTargetRequest
-from zitadel_client.models.beta_action_service_update_target_response import BetaActionServiceUpdateTargetResponse
-from zitadel_client.models.beta_app_service_api_auth_method_type import BetaAppServiceAPIAuthMethodType
-from zitadel_client.models.beta_app_service_api_config import BetaAppServiceAPIConfig
-from zitadel_client.models.beta_app_service_any import BetaAppServiceAny
-from zitadel_client.models.beta_app_service_app_sorting import BetaAppServiceAppSorting
-from zitadel_client.models.beta_app_service_app_state import BetaAppServiceAppState
-from zitadel_client.models.beta_app_service_application import BetaAppServiceApplication
-from zitadel_client.models.beta_app_service_application_key import BetaAppServiceApplicationKey
-from zitadel_client.models.beta_app_service_application_keys_sorting import BetaAppServiceApplicationKeysSorting
-from zitadel_client.models.beta_app_service_application_name_query import BetaAppServiceApplicationNameQuery
-from zitadel_client.models.beta_app_service_application_search_filter import BetaAppServiceApplicationSearchFilter
-from zitadel_client.models.beta_app_service_connect_error import BetaAppServiceConnectError
-from zitadel_client.models.beta_app_service_create_api_application_request import BetaAppServiceCreateAPIApplicationRequest
-from zitadel_client.models.beta_app_service_create_api_application_response import BetaAppServiceCreateAPIApplicationResponse
-from zitadel_client.models.beta_app_service_create_application_key_request import BetaAppServiceCreateApplicationKeyRequest
-from zitadel_client.models.beta_app_service_create_application_key_response import BetaAppServiceCreateApplicationKeyResponse
-from zitadel_client.models.beta_app_service_create_application_request import BetaAppServiceCreateApplicationRequest
-from zitadel_client.models.beta_app_service_create_application_response import BetaAppServiceCreateApplicationResponse
-from zitadel_client.models.beta_app_service_create_oidc_application_request import BetaAppServiceCreateOIDCApplicationRequest
-from zitadel_client.models.beta_app_service_create_oidc_application_response import BetaAppServiceCreateOIDCApplicationResponse
-from zitadel_client.models.beta_app_service_create_saml_application_request import BetaAppServiceCreateSAMLApplicationRequest
-from zitadel_client.models.beta_app_service_deactivate_application_request import BetaAppServiceDeactivateApplicationRequest
-from zitadel_client.models.beta_app_service_deactivate_application_response import BetaAppServiceDeactivateApplicationResponse
-from zitadel_client.models.beta_app_service_delete_application_key_request import BetaAppServiceDeleteApplicationKeyRequest
-from zitadel_client.models.beta_app_service_delete_application_key_response import BetaAppServiceDeleteApplicationKeyResponse
-from zitadel_client.models.beta_app_service_delete_application_request import BetaAppServiceDeleteApplicationRequest
-from zitadel_client.models.beta_app_service_delete_application_response import BetaAppServiceDeleteApplicationResponse
-from zitadel_client.models.beta_app_service_get_application_key_request import BetaAppServiceGetApplicationKeyRequest
-from zitadel_client.models.beta_app_service_get_application_key_response import BetaAppServiceGetApplicationKeyResponse
-from zitadel_client.models.beta_app_service_get_application_request import BetaAppServiceGetApplicationRequest
-from zitadel_client.models.beta_app_service_get_application_response import BetaAppServiceGetApplicationResponse
-from zitadel_client.models.beta_app_service_list_application_keys_request import BetaAppServiceListApplicationKeysRequest
-from zitadel_client.models.beta_app_service_list_application_keys_response import BetaAppServiceListApplicationKeysResponse
-from zitadel_client.models.beta_app_service_list_applications_request import BetaAppServiceListApplicationsRequest
-from zitadel_client.models.beta_app_service_list_applications_response import BetaAppServiceListApplicationsResponse
-from zitadel_client.models.beta_app_service_login_v2 import BetaAppServiceLoginV2
-from zitadel_client.models.beta_app_service_login_version import BetaAppServiceLoginVersion
-from zitadel_client.models.beta_app_service_oidc_app_type import BetaAppServiceOIDCAppType
-from zitadel_client.models.beta_app_service_oidc_auth_method_type import BetaAppServiceOIDCAuthMethodType
-from zitadel_client.models.beta_app_service_oidc_config import BetaAppServiceOIDCConfig
-from zitadel_client.models.beta_app_service_oidc_grant_type import BetaAppServiceOIDCGrantType
-from zitadel_client.models.beta_app_service_oidc_localized_message import BetaAppServiceOIDCLocalizedMessage
-from zitadel_client.models.beta_app_service_oidc_response_type import BetaAppServiceOIDCResponseType
-from zitadel_client.models.beta_app_service_oidc_token_type import BetaAppServiceOIDCTokenType
-from zitadel_client.models.beta_app_service_oidc_version import BetaAppServiceOIDCVersion
-from zitadel_client.models.beta_app_service_pagination_request import BetaAppServicePaginationRequest
-from zitadel_client.models.beta_app_service_pagination_response import BetaAppServicePaginationResponse
-from zitadel_client.models.beta_app_service_reactivate_application_request import BetaAppServiceReactivateApplicationRequest
-from zitadel_client.models.beta_app_service_reactivate_application_response import BetaAppServiceReactivateApplicationResponse
-from zitadel_client.models.beta_app_service_regenerate_client_secret_request import BetaAppServiceRegenerateClientSecretRequest
-from zitadel_client.models.beta_app_service_regenerate_client_secret_response import BetaAppServiceRegenerateClientSecretResponse
-from zitadel_client.models.beta_app_service_saml_config import BetaAppServiceSAMLConfig
-from zitadel_client.models.beta_app_service_text_filter_method import BetaAppServiceTextFilterMethod
-from zitadel_client.models.beta_app_service_update_api_application_configuration_request import BetaAppServiceUpdateAPIApplicationConfigurationRequest
-from zitadel_client.models.beta_app_service_update_application_request import BetaAppServiceUpdateApplicationRequest
-from zitadel_client.models.beta_app_service_update_application_response import BetaAppServiceUpdateApplicationResponse
-from zitadel_client.models.beta_app_service_update_oidc_application_configuration_request import BetaAppServiceUpdateOIDCApplicationConfigurationRequest
-from zitadel_client.models.beta_app_service_update_saml_application_configuration_request import BetaAppServiceUpdateSAMLApplicationConfigurationRequest
-from zitadel_client.models.beta_authorization_service_activate_authorization_request import BetaAuthorizationServiceActivateAuthorizationRequest
-from zitadel_client.models.beta_authorization_service_activate_authorization_response import BetaAuthorizationServiceActivateAuthorizationResponse
-from zitadel_client.models.beta_authorization_service_any import BetaAuthorizationServiceAny
-from zitadel_client.models.beta_authorization_service_authorization import BetaAuthorizationServiceAuthorization
-from zitadel_client.models.beta_authorization_service_authorization_field_name import BetaAuthorizationServiceAuthorizationFieldName
-from zitadel_client.models.beta_authorization_service_authorizations_search_filter import BetaAuthorizationServiceAuthorizationsSearchFilter
-from zitadel_client.models.beta_authorization_service_connect_error import BetaAuthorizationServiceConnectError
-from zitadel_client.models.beta_authorization_service_create_authorization_request import BetaAuthorizationServiceCreateAuthorizationRequest
-from zitadel_client.models.beta_authorization_service_create_authorization_response import BetaAuthorizationServiceCreateAuthorizationResponse
-from zitadel_client.models.beta_authorization_service_deactivate_authorization_request import BetaAuthorizationServiceDeactivateAuthorizationRequest
-from zitadel_client.models.beta_authorization_service_deactivate_authorization_response import BetaAuthorizationServiceDeactivateAuthorizationResponse
-from zitadel_client.models.beta_authorization_service_delete_authorization_request import BetaAuthorizationServiceDeleteAuthorizationRequest
-from zitadel_client.models.beta_authorization_service_delete_authorization_response import BetaAuthorizationServiceDeleteAuthorizationResponse
-from zitadel_client.models.beta_authorization_service_id_filter import BetaAuthorizationServiceIDFilter
-from zitadel_client.models.beta_authorization_service_in_ids_filter import BetaAuthorizationServiceInIDsFilter
-from zitadel_client.models.beta_authorization_service_list_authorizations_request import BetaAuthorizationServiceListAuthorizationsRequest
-from zitadel_client.models.beta_authorization_service_list_authorizations_response import BetaAuthorizationServiceListAuthorizationsResponse
-from zitadel_client.models.beta_authorization_service_pagination_request import BetaAuthorizationServicePaginationRequest
-from zitadel_client.models.beta_authorization_service_pagination_response import BetaAuthorizationServicePaginationResponse
-from zitadel_client.models.beta_authorization_service_project_name_query import BetaAuthorizationServiceProjectNameQuery
-from zitadel_client.models.beta_authorization_service_role_key_query import BetaAuthorizationServiceRoleKeyQuery
-from zitadel_client.models.beta_authorization_service_state import BetaAuthorizationServiceState
-from zitadel_client.models.beta_authorization_service_state_query import BetaAuthorizationServiceStateQuery
-from zitadel_client.models.beta_authorization_service_text_filter_method import BetaAuthorizationServiceTextFilterMethod
-from zitadel_client.models.beta_authorization_service_update_authorization_request import BetaAuthorizationServiceUpdateAuthorizationRequest
-from zitadel_client.models.beta_authorization_service_update_authorization_response import BetaAuthorizationServiceUpdateAuthorizationResponse
-from zitadel_client.models.beta_authorization_service_user import BetaAuthorizationServiceUser
-from zitadel_client.models.beta_authorization_service_user_display_name_query import BetaAuthorizationServiceUserDisplayNameQuery
-from zitadel_client.models.beta_authorization_service_user_preferred_login_name_query import BetaAuthorizationServiceUserPreferredLoginNameQuery
-from zitadel_client.models.beta_feature_service_any import BetaFeatureServiceAny
-from zitadel_client.models.beta_feature_service_connect_error import BetaFeatureServiceConnectError
-from zitadel_client.models.beta_feature_service_details import BetaFeatureServiceDetails
-from zitadel_client.models.beta_feature_service_feature_flag import BetaFeatureServiceFeatureFlag
-from zitadel_client.models.beta_feature_service_get_instance_features_request import BetaFeatureServiceGetInstanceFeaturesRequest
-from zitadel_client.models.beta_feature_service_get_instance_features_response import BetaFeatureServiceGetInstanceFeaturesResponse
-from zitadel_client.models.beta_feature_service_get_organization_features_request import BetaFeatureServiceGetOrganizationFeaturesRequest
-from zitadel_client.models.beta_feature_service_get_organization_features_response import BetaFeatureServiceGetOrganizationFeaturesResponse
-from zitadel_client.models.beta_feature_service_get_system_features_response import BetaFeatureServiceGetSystemFeaturesResponse
-from zitadel_client.models.beta_feature_service_get_user_features_request import BetaFeatureServiceGetUserFeaturesRequest
-from zitadel_client.models.beta_feature_service_get_user_features_response import BetaFeatureServiceGetUserFeaturesResponse
-from zitadel_client.models.beta_feature_service_improved_performance import BetaFeatureServiceImprovedPerformance
-from zitadel_client.models.beta_feature_service_improved_performance_feature_flag import BetaFeatureServiceImprovedPerformanceFeatureFlag
-from zitadel_client.models.beta_feature_service_reset_instance_features_response import BetaFeatureServiceResetInstanceFeaturesResponse
-from zitadel_client.models.beta_feature_service_reset_organization_features_request import BetaFeatureServiceResetOrganizationFeaturesRequest
-from zitadel_client.models.beta_feature_service_reset_organization_features_response import BetaFeatureServiceResetOrganizationFeaturesResponse
-from zitadel_client.models.beta_feature_service_reset_system_features_response import BetaFeatureServiceResetSystemFeaturesResponse
-from zitadel_client.models.beta_feature_service_reset_user_features_request import BetaFeatureServiceResetUserFeaturesRequest
-from zitadel_client.models.beta_feature_service_reset_user_features_response import BetaFeatureServiceResetUserFeaturesResponse
-from zitadel_client.models.beta_feature_service_set_instance_features_request import BetaFeatureServiceSetInstanceFeaturesRequest
-from zitadel_client.models.beta_feature_service_set_instance_features_response import BetaFeatureServiceSetInstanceFeaturesResponse
-from zitadel_client.models.beta_feature_service_set_organization_features_request import BetaFeatureServiceSetOrganizationFeaturesRequest
-from zitadel_client.models.beta_feature_service_set_organization_features_response import BetaFeatureServiceSetOrganizationFeaturesResponse
-from zitadel_client.models.beta_feature_service_set_system_features_request import BetaFeatureServiceSetSystemFeaturesRequest
-from zitadel_client.models.beta_feature_service_set_system_features_response import BetaFeatureServiceSetSystemFeaturesResponse
-from zitadel_client.models.beta_feature_service_set_user_feature_request import BetaFeatureServiceSetUserFeatureRequest
-from zitadel_client.models.beta_feature_service_set_user_features_response import BetaFeatureServiceSetUserFeaturesResponse
-from zitadel_client.models.beta_feature_service_source import BetaFeatureServiceSource
-from zitadel_client.models.beta_instance_service_add_custom_domain_request import BetaInstanceServiceAddCustomDomainRequest
-from zitadel_client.models.beta_instance_service_add_custom_domain_response import BetaInstanceServiceAddCustomDomainResponse
-from zitadel_client.models.beta_instance_service_add_trusted_domain_request import BetaInstanceServiceAddTrustedDomainRequest
-from zitadel_client.models.beta_instance_service_add_trusted_domain_response import BetaInstanceServiceAddTrustedDomainResponse
-from zitadel_client.models.beta_instance_service_any import BetaInstanceServiceAny
-from zitadel_client.models.beta_instance_service_connect_error import BetaInstanceServiceConnectError
-from zitadel_client.models.beta_instance_service_delete_instance_request import BetaInstanceServiceDeleteInstanceRequest
-from zitadel_client.models.beta_instance_service_delete_instance_response import BetaInstanceServiceDeleteInstanceResponse
-from zitadel_client.models.beta_instance_service_domain import BetaInstanceServiceDomain
-from zitadel_client.models.beta_instance_service_domain_field_name import BetaInstanceServiceDomainFieldName
-from zitadel_client.models.beta_instance_service_domain_generated_query import BetaInstanceServiceDomainGeneratedQuery
-from zitadel_client.models.beta_instance_service_domain_primary_query import BetaInstanceServiceDomainPrimaryQuery
-from zitadel_client.models.beta_instance_service_domain_query import BetaInstanceServiceDomainQuery
-from zitadel_client.models.beta_instance_service_domain_search_query import BetaInstanceServiceDomainSearchQuery
-from zitadel_client.models.beta_instance_service_domains_query import BetaInstanceServiceDomainsQuery
-from zitadel_client.models.beta_instance_service_field_name import BetaInstanceServiceFieldName
-from zitadel_client.models.beta_instance_service_get_instance_request import BetaInstanceServiceGetInstanceRequest
-from zitadel_client.models.beta_instance_service_get_instance_response import BetaInstanceServiceGetInstanceResponse
-from zitadel_client.models.beta_instance_service_ids_query import BetaInstanceServiceIdsQuery
-from zitadel_client.models.beta_instance_service_instance import BetaInstanceServiceInstance
-from zitadel_client.models.beta_instance_service_list_custom_domains_request import BetaInstanceServiceListCustomDomainsRequest
-from zitadel_client.models.beta_instance_service_list_custom_domains_response import BetaInstanceServiceListCustomDomainsResponse
-from zitadel_client.models.beta_instance_service_list_instances_request import BetaInstanceServiceListInstancesRequest
-from zitadel_client.models.beta_instance_service_list_instances_response import BetaInstanceServiceListInstancesResponse
-from zitadel_client.models.beta_instance_service_list_trusted_domains_request import BetaInstanceServiceListTrustedDomainsRequest
-from zitadel_client.models.beta_instance_service_list_trusted_domains_response import BetaInstanceServiceListTrustedDomainsResponse
-from zitadel_client.models.beta_instance_service_pagination_request import BetaInstanceServicePaginationRequest
-from zitadel_client.models.beta_instance_service_pagination_response import BetaInstanceServicePaginationResponse
-from zitadel_client.models.beta_instance_service_query import BetaInstanceServiceQuery
-from zitadel_client.models.beta_instance_service_remove_custom_domain_request import BetaInstanceServiceRemoveCustomDomainRequest
-from zitadel_client.models.beta_instance_service_remove_custom_domain_response import BetaInstanceServiceRemoveCustomDomainResponse
-from zitadel_client.models.beta_instance_service_remove_trusted_domain_request import BetaInstanceServiceRemoveTrustedDomainRequest
-from zitadel_client.models.beta_instance_service_remove_trusted_domain_response import BetaInstanceServiceRemoveTrustedDomainResponse
-from zitadel_client.models.beta_instance_service_state import BetaInstanceServiceState
-from zitadel_client.models.beta_instance_service_text_query_method import BetaInstanceServiceTextQueryMethod
-from zitadel_client.models.beta_instance_service_trusted_domain import BetaInstanceServiceTrustedDomain
-from zitadel_client.models.beta_instance_service_trusted_domain_field_name import BetaInstanceServiceTrustedDomainFieldName
-from zitadel_client.models.beta_instance_service_trusted_domain_search_query import BetaInstanceServiceTrustedDomainSearchQuery
-from zitadel_client.models.beta_instance_service_update_instance_request import BetaInstanceServiceUpdateInstanceRequest
-from zitadel_client.models.beta_instance_service_update_instance_response import BetaInstanceServiceUpdateInstanceResponse
-from zitadel_client.models.beta_internal_permission_service_administrator import BetaInternalPermissionServiceAdministrator
-from zitadel_client.models.beta_internal_permission_service_administrator_field_name import BetaInternalPermissionServiceAdministratorFieldName
-from zitadel_client.models.beta_internal_permission_service_administrator_search_filter import BetaInternalPermissionServiceAdministratorSearchFilter
-from zitadel_client.models.beta_internal_permission_service_and_filter import BetaInternalPermissionServiceAndFilter
-from zitadel_client.models.beta_internal_permission_service_any import BetaInternalPermissionServiceAny
-from zitadel_client.models.beta_internal_permission_service_connect_error import BetaInternalPermissionServiceConnectError
-from zitadel_client.models.beta_internal_permission_service_create_administrator_request import BetaInternalPermissionServiceCreateAdministratorRequest
-from zitadel_client.models.beta_internal_permission_service_create_administrator_response import BetaInternalPermissionServiceCreateAdministratorResponse
-from zitadel_client.models.beta_internal_permission_service_delete_administrator_request import BetaInternalPermissionServiceDeleteAdministratorRequest
-from zitadel_client.models.beta_internal_permission_service_delete_administrator_response import BetaInternalPermissionServiceDeleteAdministratorResponse
-from zitadel_client.models.beta_internal_permission_service_id_filter import BetaInternalPermissionServiceIDFilter
-from zitadel_client.models.beta_internal_permission_service_in_ids_filter import BetaInternalPermissionServiceInIDsFilter
-from zitadel_client.models.beta_internal_permission_service_list_administrators_request import BetaInternalPermissionServiceListAdministratorsRequest
-from zitadel_client.models.beta_internal_permission_service_list_administrators_response import BetaInternalPermissionServiceListAdministratorsResponse
-from zitadel_client.models.beta_internal_permission_service_not_filter import BetaInternalPermissionServiceNotFilter
-from zitadel_client.models.beta_internal_permission_service_or_filter import BetaInternalPermissionServiceOrFilter
-from zitadel_client.models.beta_internal_permission_service_organization import BetaInternalPermissionServiceOrganization
-from zitadel_client.models.beta_internal_permission_service_pagination_request import BetaInternalPermissionServicePaginationRequest
-from zitadel_client.models.beta_internal_permission_service_pagination_response import BetaInternalPermissionServicePaginationResponse
-from zitadel_client.models.beta_internal_permission_service_project import BetaInternalPermissionServiceProject
-from zitadel_client.models.beta_internal_permission_service_project_grant import BetaInternalPermissionServiceProjectGrant
-from zitadel_client.models.beta_internal_permission_service_resource_filter import BetaInternalPermissionServiceResourceFilter
-from zitadel_client.models.beta_internal_permission_service_resource_type import BetaInternalPermissionServiceResourceType
-from zitadel_client.models.beta_internal_permission_service_role_filter import BetaInternalPermissionServiceRoleFilter
-from zitadel_client.models.beta_internal_permission_service_text_filter_method import BetaInternalPermissionServiceTextFilterMethod
-from zitadel_client.models.beta_internal_permission_service_timestamp_filter import BetaInternalPermissionServiceTimestampFilter
-from zitadel_client.models.beta_internal_permission_service_timestamp_filter_method import BetaInternalPermissionServiceTimestampFilterMethod
-from zitadel_client.models.beta_internal_permission_service_update_administrator_request import BetaInternalPermissionServiceUpdateAdministratorRequest
-from zitadel_client.models.beta_internal_permission_service_update_administrator_response import BetaInternalPermissionServiceUpdateAdministratorResponse
-from zitadel_client.models.beta_internal_permission_service_user import BetaInternalPermissionServiceUser
-from zitadel_client.models.beta_internal_permission_service_user_display_name_filter import BetaInternalPermissionServiceUserDisplayNameFilter
-from zitadel_client.models.beta_internal_permission_service_user_preferred_login_name_filter import BetaInternalPermissionServiceUserPreferredLoginNameFilter
-from zitadel_client.models.beta_oidc_service_any import BetaOIDCServiceAny
-from zitadel_client.models.beta_oidc_service_auth_request import BetaOIDCServiceAuthRequest
-from zitadel_client.models.beta_oidc_service_authorization_error import BetaOIDCServiceAuthorizationError
-from zitadel_client.models.beta_oidc_service_connect_error import BetaOIDCServiceConnectError
-from zitadel_client.models.beta_oidc_service_create_callback_request import BetaOIDCServiceCreateCallbackRequest
-from zitadel_client.models.beta_oidc_service_create_callback_response import BetaOIDCServiceCreateCallbackResponse
-from zitadel_client.models.beta_oidc_service_details import BetaOIDCServiceDetails
-from zitadel_client.models.beta_oidc_service_error_reason import BetaOIDCServiceErrorReason
-from zitadel_client.models.beta_oidc_service_get_auth_request_request import BetaOIDCServiceGetAuthRequestRequest
-from zitadel_client.models.beta_oidc_service_get_auth_request_response import BetaOIDCServiceGetAuthRequestResponse
-from zitadel_client.models.beta_oidc_service_prompt import BetaOIDCServicePrompt
-from zitadel_client.models.beta_oidc_service_session import BetaOIDCServiceSession
-from zitadel_client.models.beta_organization_service_activate_organization_request import BetaOrganizationServiceActivateOrganizationRequest
-from zitadel_client.models.beta_organization_service_activate_organization_response import BetaOrganizationServiceActivateOrganizationResponse
-from zitadel_client.models.beta_organization_service_add_human_user_request import BetaOrganizationServiceAddHumanUserRequest
-from zitadel_client.models.beta_organization_service_add_organization_domain_request import BetaOrganizationServiceAddOrganizationDomainRequest
-from zitadel_client.models.beta_organization_service_add_organization_domain_response import BetaOrganizationServiceAddOrganizationDomainResponse
-from zitadel_client.models.beta_organization_service_admin import BetaOrganizationServiceAdmin
-from zitadel_client.models.beta_organization_service_any import BetaOrganizationServiceAny
-from zitadel_client.models.beta_organization_service_assigned_admin import BetaOrganizationServiceAssignedAdmin
-from zitadel_client.models.beta_organization_service_connect_error import BetaOrganizationServiceConnectError
-from zitadel_client.models.beta_organization_service_create_organization_request import BetaOrganizationServiceCreateOrganizationRequest
-from zitadel_client.models.beta_organization_service_create_organization_response import BetaOrganizationServiceCreateOrganizationResponse
-from zitadel_client.models.beta_organization_service_created_admin import BetaOrganizationServiceCreatedAdmin
-from zitadel_client.models.beta_organization_service_deactivate_organization_request import BetaOrganizationServiceDeactivateOrganizationRequest
-from zitadel_client.models.beta_organization_service_deactivate_organization_response import BetaOrganizationServiceDeactivateOrganizationResponse
-from zitadel_client.models.beta_organization_service_delete_organization_domain_request import BetaOrganizationServiceDeleteOrganizationDomainRequest
-from zitadel_client.models.beta_organization_service_delete_organization_domain_response import BetaOrganizationServiceDeleteOrganizationDomainResponse
-from zitadel_client.models.beta_organization_service_delete_organization_metadata_request import BetaOrganizationServiceDeleteOrganizationMetadataRequest
-from zitadel_client.models.beta_organization_service_delete_organization_metadata_response import BetaOrganizationServiceDeleteOrganizationMetadataResponse
-from zitadel_client.models.beta_organization_service_delete_organization_request import BetaOrganizationServiceDeleteOrganizationRequest
-from zitadel_client.models.beta_organization_service_delete_organization_response import BetaOrganizationServiceDeleteOrganizationResponse
-from zitadel_client.models.beta_organization_service_domain import BetaOrganizationServiceDomain
-from zitadel_client.models.beta_organization_service_domain_name_filter import BetaOrganizationServiceDomainNameFilter
-from zitadel_client.models.beta_organization_service_domain_search_filter import BetaOrganizationServiceDomainSearchFilter
-from zitadel_client.models.beta_organization_service_domain_validation_type import BetaOrganizationServiceDomainValidationType
-from zitadel_client.models.beta_organization_service_gender import BetaOrganizationServiceGender
-from zitadel_client.models.beta_organization_service_generate_organization_domain_validation_request import BetaOrganizationServiceGenerateOrganizationDomainValidationRequest
-from zitadel_client.models.beta_organization_service_generate_organization_domain_validation_response import BetaOrganizationServiceGenerateOrganizationDomainValidationResponse
-from zitadel_client.models.beta_organization_service_hashed_password import BetaOrganizationServiceHashedPassword
-from zitadel_client.models.beta_organization_service_idp_link import BetaOrganizationServiceIDPLink
-from zitadel_client.models.beta_organization_service_list_organization_domains_request import BetaOrganizationServiceListOrganizationDomainsRequest
-from zitadel_client.models.beta_organization_service_list_organization_domains_response import BetaOrganizationServiceListOrganizationDomainsResponse
-from zitadel_client.models.beta_organization_service_list_organization_metadata_request import BetaOrganizationServiceListOrganizationMetadataRequest
-from zitadel_client.models.beta_organization_service_list_organization_metadata_response import BetaOrganizationServiceListOrganizationMetadataResponse
-from zitadel_client.models.beta_organization_service_list_organizations_request import BetaOrganizationServiceListOrganizationsRequest
-from zitadel_client.models.beta_organization_service_list_organizations_response import BetaOrganizationServiceListOrganizationsResponse
-from zitadel_client.models.beta_organization_service_metadata import BetaOrganizationServiceMetadata
-from zitadel_client.models.beta_organization_service_metadata_key_query import BetaOrganizationServiceMetadataKeyQuery
-from zitadel_client.models.beta_organization_service_metadata_query import BetaOrganizationServiceMetadataQuery
-from zitadel_client.models.beta_organization_service_org_domain_filter import BetaOrganizationServiceOrgDomainFilter
-from zitadel_client.models.beta_organization_service_org_field_name import BetaOrganizationServiceOrgFieldName
-from zitadel_client.models.beta_organization_service_org_id_filter import BetaOrganizationServiceOrgIDFilter
-from zitadel_client.models.beta_organization_service_org_name_filter import BetaOrganizationServiceOrgNameFilter
-from zitadel_client.models.beta_organization_service_org_state import BetaOrganizationServiceOrgState
-from zitadel_client.models.beta_organization_service_org_state_filter import BetaOrganizationServiceOrgStateFilter
-from zitadel_client.models.beta_organization_service_organization import BetaOrganizationServiceOrganization
-from zitadel_client.models.beta_organization_service_organization_admin import BetaOrganizationServiceOrganizationAdmin
-from zitadel_client.models.beta_organization_service_organization_search_filter import BetaOrganizationServiceOrganizationSearchFilter
-from zitadel_client.models.beta_organization_service_pagination_request import BetaOrganizationServicePaginationRequest
-from zitadel_client.models.beta_organization_service_pagination_response import BetaOrganizationServicePaginationResponse
-from zitadel_client.models.beta_organization_service_password import BetaOrganizationServicePassword
-from zitadel_client.models.beta_organization_service_send_email_verification_code import BetaOrganizationServiceSendEmailVerificationCode
-from zitadel_client.models.beta_organization_service_set_human_email import BetaOrganizationServiceSetHumanEmail
-from zitadel_client.models.beta_organization_service_set_human_phone import BetaOrganizationServiceSetHumanPhone
-from zitadel_client.models.beta_organization_service_set_human_profile import BetaOrganizationServiceSetHumanProfile
-from zitadel_client.models.beta_organization_service_set_metadata_entry import BetaOrganizationServiceSetMetadataEntry
-from zitadel_client.models.beta_organization_service_set_organization_metadata_request import BetaOrganizationServiceSetOrganizationMetadataRequest
-from zitadel_client.models.beta_organization_service_set_organization_metadata_response import BetaOrganizationServiceSetOrganizationMetadataResponse
-from zitadel_client.models.beta_organization_service_text_query_method import BetaOrganizationServiceTextQueryMethod
-from zitadel_client.models.beta_organization_service_update_organization_request import BetaOrganizationServiceUpdateOrganizationRequest
-from zitadel_client.models.beta_organization_service_update_organization_response import BetaOrganizationServiceUpdateOrganizationResponse
-from zitadel_client.models.beta_organization_service_verify_organization_domain_request import BetaOrganizationServiceVerifyOrganizationDomainRequest
-from zitadel_client.models.beta_organization_service_verify_organization_domain_response import BetaOrganizationServiceVerifyOrganizationDomainResponse
-from zitadel_client.models.beta_project_service_activate_project_grant_request import BetaProjectServiceActivateProjectGrantRequest
-from zitadel_client.models.beta_project_service_activate_project_grant_response import BetaProjectServiceActivateProjectGrantResponse
-from zitadel_client.models.beta_project_service_activate_project_request import BetaProjectServiceActivateProjectRequest
-from zitadel_client.models.beta_project_service_activate_project_response import BetaProjectServiceActivateProjectResponse
-from zitadel_client.models.beta_project_service_add_project_role_request import BetaProjectServiceAddProjectRoleRequest
-from zitadel_client.models.beta_project_service_add_project_role_response import BetaProjectServiceAddProjectRoleResponse
-from zitadel_client.models.beta_project_service_admin import BetaProjectServiceAdmin
-from zitadel_client.models.beta_project_service_any import BetaProjectServiceAny
-from zitadel_client.models.beta_project_service_connect_error import BetaProjectServiceConnectError
-from zitadel_client.models.beta_project_service_create_project_grant_request import BetaProjectServiceCreateProjectGrantRequest
-from zitadel_client.models.beta_project_service_create_project_grant_response import BetaProjectServiceCreateProjectGrantResponse
-from zitadel_client.models.beta_project_service_create_project_request import BetaProjectServiceCreateProjectRequest
-from zitadel_client.models.beta_project_service_create_project_response import BetaProjectServiceCreateProjectResponse
-from zitadel_client.models.beta_project_service_deactivate_project_grant_request import BetaProjectServiceDeactivateProjectGrantRequest
-from zitadel_client.models.beta_project_service_deactivate_project_grant_response import BetaProjectServiceDeactivateProjectGrantResponse
-from zitadel_client.models.beta_project_service_deactivate_project_request import BetaProjectServiceDeactivateProjectRequest
-from zitadel_client.models.beta_project_service_deactivate_project_response import BetaProjectServiceDeactivateProjectResponse
-from zitadel_client.models.beta_project_service_delete_project_grant_request import BetaProjectServiceDeleteProjectGrantRequest
-from zitadel_client.models.beta_project_service_delete_project_grant_response import BetaProjectServiceDeleteProjectGrantResponse
-from zitadel_client.models.beta_project_service_delete_project_request import BetaProjectServiceDeleteProjectRequest
-from zitadel_client.models.beta_project_service_delete_project_response import BetaProjectServiceDeleteProjectResponse
-from zitadel_client.models.beta_project_service_get_project_request import BetaProjectServiceGetProjectRequest
-from zitadel_client.models.beta_project_service_get_project_response import BetaProjectServiceGetProjectResponse
-from zitadel_client.models.beta_project_service_granted_project_state import BetaProjectServiceGrantedProjectState
-from zitadel_client.models.beta_project_service_id_filter import BetaProjectServiceIDFilter
-from zitadel_client.models.beta_project_service_in_ids_filter import BetaProjectServiceInIDsFilter
-from zitadel_client.models.beta_project_service_list_project_grants_request import BetaProjectServiceListProjectGrantsRequest
-from zitadel_client.models.beta_project_service_list_project_grants_response import BetaProjectServiceListProjectGrantsResponse
-from zitadel_client.models.beta_project_service_list_project_roles_request import BetaProjectServiceListProjectRolesRequest
-from zitadel_client.models.beta_project_service_list_project_roles_response import BetaProjectServiceListProjectRolesResponse
-from zitadel_client.models.beta_project_service_list_projects_request import BetaProjectServiceListProjectsRequest
-from zitadel_client.models.beta_project_service_list_projects_response import BetaProjectServiceListProjectsResponse
-from zitadel_client.models.beta_project_service_pagination_request import BetaProjectServicePaginationRequest
-from zitadel_client.models.beta_project_service_pagination_response import BetaProjectServicePaginationResponse
-from zitadel_client.models.beta_project_service_private_labeling_setting import BetaProjectServicePrivateLabelingSetting
-from zitadel_client.models.beta_project_service_project import BetaProjectServiceProject
-from zitadel_client.models.beta_project_service_project_field_name import BetaProjectServiceProjectFieldName
-from zitadel_client.models.beta_project_service_project_grant import BetaProjectServiceProjectGrant
-from zitadel_client.models.beta_project_service_project_grant_field_name import BetaProjectServiceProjectGrantFieldName
-from zitadel_client.models.beta_project_service_project_grant_search_filter import BetaProjectServiceProjectGrantSearchFilter
-from zitadel_client.models.beta_project_service_project_grant_state import BetaProjectServiceProjectGrantState
-from zitadel_client.models.beta_project_service_project_name_filter import BetaProjectServiceProjectNameFilter
-from zitadel_client.models.beta_project_service_project_role import BetaProjectServiceProjectRole
-from zitadel_client.models.beta_project_service_project_role_display_name_filter import BetaProjectServiceProjectRoleDisplayNameFilter
-from zitadel_client.models.beta_project_service_project_role_field_name import BetaProjectServiceProjectRoleFieldName
-from zitadel_client.models.beta_project_service_project_role_key_filter import BetaProjectServiceProjectRoleKeyFilter
-from zitadel_client.models.beta_project_service_project_role_search_filter import BetaProjectServiceProjectRoleSearchFilter
-from zitadel_client.models.beta_project_service_project_search_filter import BetaProjectServiceProjectSearchFilter
-from zitadel_client.models.beta_project_service_project_state import BetaProjectServiceProjectState
-from zitadel_client.models.beta_project_service_remove_project_role_request import BetaProjectServiceRemoveProjectRoleRequest
-from zitadel_client.models.beta_project_service_remove_project_role_response import BetaProjectServiceRemoveProjectRoleResponse
-from zitadel_client.models.beta_project_service_text_filter_method import BetaProjectServiceTextFilterMethod
-from zitadel_client.models.beta_project_service_update_project_grant_request import BetaProjectServiceUpdateProjectGrantRequest
-from zitadel_client.models.beta_project_service_update_project_grant_response import BetaProjectServiceUpdateProjectGrantResponse
-from zitadel_client.models.beta_project_service_update_project_request import BetaProjectServiceUpdateProjectRequest
-from zitadel_client.models.beta_project_service_update_project_response import BetaProjectServiceUpdateProjectResponse
-from zitadel_client.models.beta_project_service_update_project_role_request import BetaProjectServiceUpdateProjectRoleRequest
-from zitadel_client.models.beta_project_service_update_project_role_response import BetaProjectServiceUpdateProjectRoleResponse
-from zitadel_client.models.beta_session_service_any import BetaSessionServiceAny
-from zitadel_client.models.beta_session_service_challenges import BetaSessionServiceChallenges
-from zitadel_client.models.beta_session_service_check_idp_intent import BetaSessionServiceCheckIDPIntent
-from zitadel_client.models.beta_session_service_check_otp import BetaSessionServiceCheckOTP
-from zitadel_client.models.beta_session_service_check_password import BetaSessionServiceCheckPassword
-from zitadel_client.models.beta_session_service_check_totp import BetaSessionServiceCheckTOTP
-from zitadel_client.models.beta_session_service_check_user import BetaSessionServiceCheckUser
-from zitadel_client.models.beta_session_service_check_web_auth_n import BetaSessionServiceCheckWebAuthN
-from zitadel_client.models.beta_session_service_checks import BetaSessionServiceChecks
-from zitadel_client.models.beta_session_service_connect_error import BetaSessionServiceConnectError
-from zitadel_client.models.beta_session_service_create_session_request import BetaSessionServiceCreateSessionRequest
-from zitadel_client.models.beta_session_service_create_session_response import BetaSessionServiceCreateSessionResponse
-from zitadel_client.models.beta_session_service_creation_date_query import BetaSessionServiceCreationDateQuery
-from zitadel_client.models.beta_session_service_delete_session_request import BetaSessionServiceDeleteSessionRequest
-from zitadel_client.models.beta_session_service_delete_session_response import BetaSessionServiceDeleteSessionResponse
-from zitadel_client.models.beta_session_service_details import BetaSessionServiceDetails
-from zitadel_client.models.beta_session_service_factors import BetaSessionServiceFactors
-from zitadel_client.models.beta_session_service_get_session_request import BetaSessionServiceGetSessionRequest
-from zitadel_client.models.beta_session_service_get_session_response import BetaSessionServiceGetSessionResponse
-from zitadel_client.models.beta_session_service_header_values import BetaSessionServiceHeaderValues
-from zitadel_client.models.beta_session_service_ids_query import BetaSessionServiceIDsQuery
-from zitadel_client.models.beta_session_service_intent_factor import BetaSessionServiceIntentFactor
-from zitadel_client.models.beta_session_service_list_details import BetaSessionServiceListDetails
-from zitadel_client.models.beta_session_service_list_query import BetaSessionServiceListQuery
-from zitadel_client.models.beta_session_service_list_sessions_request import BetaSessionServiceListSessionsRequest
-from zitadel_client.models.beta_session_service_list_sessions_response import BetaSessionServiceListSessionsResponse
-from zitadel_client.models.beta_session_service_otp_email import BetaSessionServiceOTPEmail
-from zitadel_client.models.beta_session_service_otp_factor import BetaSessionServiceOTPFactor
-from zitadel_client.models.beta_session_service_otpsms import BetaSessionServiceOTPSMS
-from zitadel_client.models.beta_session_service_password_factor import BetaSessionServicePasswordFactor
-from zitadel_client.models.beta_session_service_request_challenges import BetaSessionServiceRequestChallenges
-from zitadel_client.models.beta_session_service_search_query import BetaSessionServiceSearchQuery
-from zitadel_client.models.beta_session_service_send_code import BetaSessionServiceSendCode
-from zitadel_client.models.beta_session_service_session import BetaSessionServiceSession
-from zitadel_client.models.beta_session_service_session_field_name import BetaSessionServiceSessionFieldName
-from zitadel_client.models.beta_session_service_set_session_request import BetaSessionServiceSetSessionRequest
-from zitadel_client.models.beta_session_service_set_session_response import BetaSessionServiceSetSessionResponse
-from zitadel_client.models.beta_session_service_totp_factor import BetaSessionServiceTOTPFactor
-from zitadel_client.models.beta_session_service_timestamp_query_method import BetaSessionServiceTimestampQueryMethod
-from zitadel_client.models.beta_session_service_user_agent import BetaSessionServiceUserAgent
-from zitadel_client.models.beta_session_service_user_factor import BetaSessionServiceUserFactor
-from zitadel_client.models.beta_session_service_user_id_query import BetaSessionServiceUserIDQuery
-from zitadel_client.models.beta_session_service_user_verification_requirement import BetaSessionServiceUserVerificationRequirement
-from zitadel_client.models.beta_session_service_web_auth_n import BetaSessionServiceWebAuthN
-from zitadel_client.models.beta_session_service_web_auth_n_factor import BetaSessionServiceWebAuthNFactor
-from zitadel_client.models.beta_settings_service_any import BetaSettingsServiceAny
-from zitadel_client.models.beta_settings_service_branding_settings import BetaSettingsServiceBrandingSettings
-from zitadel_client.models.beta_settings_service_connect_error import BetaSettingsServiceConnectError
-from zitadel_client.models.beta_settings_service_details import BetaSettingsServiceDetails
-from zitadel_client.models.beta_settings_service_domain_settings import BetaSettingsServiceDomainSettings
-from zitadel_client.models.beta_settings_service_embedded_iframe_settings import BetaSettingsServiceEmbeddedIframeSettings
-from zitadel_client.models.beta_settings_service_get_active_identity_providers_request import BetaSettingsServiceGetActiveIdentityProvidersRequest
-from zitadel_client.models.beta_settings_service_get_active_identity_providers_response import BetaSettingsServiceGetActiveIdentityProvidersResponse
-from zitadel_client.models.beta_settings_service_get_branding_settings_request import BetaSettingsServiceGetBrandingSettingsRequest
-from zitadel_client.models.beta_settings_service_get_branding_settings_response import BetaSettingsServiceGetBrandingSettingsResponse
-from zitadel_client.models.beta_settings_service_get_domain_settings_request import BetaSettingsServiceGetDomainSettingsRequest
-from zitadel_client.models.beta_settings_service_get_domain_settings_response import BetaSettingsServiceGetDomainSettingsResponse
-from zitadel_client.models.beta_settings_service_get_general_settings_response import BetaSettingsServiceGetGeneralSettingsResponse
-from zitadel_client.models.beta_settings_service_get_legal_and_support_settings_request import BetaSettingsServiceGetLegalAndSupportSettingsRequest
-from zitadel_client.models.beta_settings_service_get_legal_and_support_settings_response import BetaSettingsServiceGetLegalAndSupportSettingsResponse
-from zitadel_client.models.beta_settings_service_get_lockout_settings_request import BetaSettingsServiceGetLockoutSettingsRequest
-from zitadel_client.models.beta_settings_service_get_lockout_settings_response import BetaSettingsServiceGetLockoutSettingsResponse
-from zitadel_client.models.beta_settings_service_get_login_settings_request import BetaSettingsServiceGetLoginSettingsRequest
-from zitadel_client.models.beta_settings_service_get_login_settings_response import BetaSettingsServiceGetLoginSettingsResponse
-from zitadel_client.models.beta_settings_service_get_password_complexity_settings_request import BetaSettingsServiceGetPasswordComplexitySettingsRequest
-from zitadel_client.models.beta_settings_service_get_password_complexity_settings_response import BetaSettingsServiceGetPasswordComplexitySettingsResponse
-from zitadel_client.models.beta_settings_service_get_password_expiry_settings_request import BetaSettingsServiceGetPasswordExpirySettingsRequest
-from zitadel_client.models.beta_settings_service_get_password_expiry_settings_response import BetaSettingsServiceGetPasswordExpirySettingsResponse
-from zitadel_client.models.beta_settings_service_get_security_settings_response import BetaSettingsServiceGetSecuritySettingsResponse
-from zitadel_client.models.beta_settings_service_identity_provider import BetaSettingsServiceIdentityProvider
-from zitadel_client.models.beta_settings_service_identity_provider_type import BetaSettingsServiceIdentityProviderType
-from zitadel_client.models.beta_settings_service_legal_and_support_settings import BetaSettingsServiceLegalAndSupportSettings
-from zitadel_client.models.beta_settings_service_list_details import BetaSettingsServiceListDetails
-from zitadel_client.models.beta_settings_service_lockout_settings import BetaSettingsServiceLockoutSettings
-from zitadel_client.models.beta_settings_service_login_settings import BetaSettingsServiceLoginSettings
-from zitadel_client.models.beta_settings_service_multi_factor_type import BetaSettingsServiceMultiFactorType
-from zitadel_client.models.beta_settings_service_passkeys_type import BetaSettingsServicePasskeysType
-from zitadel_client.models.beta_settings_service_password_complexity_settings import BetaSettingsServicePasswordComplexitySettings
-from zitadel_client.models.beta_settings_service_password_expiry_settings import BetaSettingsServicePasswordExpirySettings
-from zitadel_client.models.beta_settings_service_request_context import BetaSettingsServiceRequestContext
-from zitadel_client.models.beta_settings_service_resource_owner_type import BetaSettingsServiceResourceOwnerType
-from zitadel_client.models.beta_settings_service_second_factor_type import BetaSettingsServiceSecondFactorType
-from zitadel_client.models.beta_settings_service_security_settings import BetaSettingsServiceSecuritySettings
-from zitadel_client.models.beta_settings_service_set_security_settings_request import BetaSettingsServiceSetSecuritySettingsRequest
-from zitadel_client.models.beta_settings_service_set_security_settings_response import BetaSettingsServiceSetSecuritySettingsResponse
-from zitadel_client.models.beta_settings_service_theme import BetaSettingsServiceTheme
-from zitadel_client.models.beta_settings_service_theme_mode import BetaSettingsServiceThemeMode
-from zitadel_client.models.beta_telemetry_service_any import BetaTelemetryServiceAny
-from zitadel_client.models.beta_telemetry_service_connect_error import BetaTelemetryServiceConnectError
-from zitadel_client.models.beta_telemetry_service_count_parent_type import BetaTelemetryServiceCountParentType
-from zitadel_client.models.beta_telemetry_service_instance_information import BetaTelemetryServiceInstanceInformation
-from zitadel_client.models.beta_telemetry_service_report_base_information_request import BetaTelemetryServiceReportBaseInformationRequest
-from zitadel_client.models.beta_telemetry_service_report_base_information_response import BetaTelemetryServiceReportBaseInformationResponse
-from zitadel_client.models.beta_telemetry_service_report_resource_counts_request import BetaTelemetryServiceReportResourceCountsRequest
-from zitadel_client.models.beta_telemetry_service_report_resource_counts_response import BetaTelemetryServiceReportResourceCountsResponse
-from zitadel_client.models.beta_telemetry_service_resource_count import BetaTelemetryServiceResourceCount
-from zitadel_client.models.beta_user_service_access_token_type import BetaUserServiceAccessTokenType
-from zitadel_client.models.beta_user_service_add_human_user_request import BetaUserServiceAddHumanUserRequest
-from zitadel_client.models.beta_user_service_add_human_user_response import BetaUserServiceAddHumanUserResponse
-from zitadel_client.models.beta_user_service_add_idp_link_request import BetaUserServiceAddIDPLinkRequest
-from zitadel_client.models.beta_user_service_add_idp_link_response import BetaUserServiceAddIDPLinkResponse
-from zitadel_client.models.beta_user_service_add_otp_email_request import BetaUserServiceAddOTPEmailRequest
-from zitadel_client.models.beta_user_service_add_otp_email_response import BetaUserServiceAddOTPEmailResponse
-from zitadel_client.models.beta_user_service_add_otpsms_request import BetaUserServiceAddOTPSMSRequest
-from zitadel_client.models.beta_user_service_add_otpsms_response import BetaUserServiceAddOTPSMSResponse
-from zitadel_client.models.beta_user_service_and_query import BetaUserServiceAndQuery
-from zitadel_client.models.beta_user_service_any import BetaUserServiceAny
-from zitadel_client.models.beta_user_service_authentication_method_type import BetaUserServiceAuthenticationMethodType
-from zitadel_client.models.beta_user_service_connect_error import BetaUserServiceConnectError
-from zitadel_client.models.beta_user_service_create_passkey_registration_link_request import BetaUserServiceCreatePasskeyRegistrationLinkRequest
-from zitadel_client.models.beta_user_service_create_passkey_registration_link_response import BetaUserServiceCreatePasskeyRegistrationLinkResponse
-from zitadel_client.models.beta_user_service_deactivate_user_request import BetaUserServiceDeactivateUserRequest
-from zitadel_client.models.beta_user_service_deactivate_user_response import BetaUserServiceDeactivateUserResponse
-from zitadel_client.models.beta_user_service_delete_user_request import BetaUserServiceDeleteUserRequest
-from zitadel_client.models.beta_user_service_delete_user_response import BetaUserServiceDeleteUserResponse
-from zitadel_client.models.beta_user_service_details import BetaUserServiceDetails
-from zitadel_client.models.beta_user_service_display_name_query import BetaUserServiceDisplayNameQuery
-from zitadel_client.models.beta_user_service_email_query import BetaUserServiceEmailQuery
-from zitadel_client.models.beta_user_service_first_name_query import BetaUserServiceFirstNameQuery
-from zitadel_client.models.beta_user_service_form_data import BetaUserServiceFormData
-from zitadel_client.models.beta_user_service_gender import BetaUserServiceGender
-from zitadel_client.models.beta_user_service_get_user_by_id_request import BetaUserServiceGetUserByIDRequest
-from zitadel_client.models.beta_user_service_get_user_by_id_response import BetaUserServiceGetUserByIDResponse
-from zitadel_client.models.beta_user_service_hashed_password import BetaUserServiceHashedPassword
-from zitadel_client.models.beta_user_service_human_email import BetaUserServiceHumanEmail
-from zitadel_client.models.beta_user_service_human_phone import BetaUserServiceHumanPhone
-from zitadel_client.models.beta_user_service_human_profile import BetaUserServiceHumanProfile
-from zitadel_client.models.beta_user_service_human_user import BetaUserServiceHumanUser
-from zitadel_client.models.beta_user_service_idp_information import BetaUserServiceIDPInformation
-from zitadel_client.models.beta_user_service_idp_intent import BetaUserServiceIDPIntent
-from zitadel_client.models.beta_user_service_idpldap_access_information import BetaUserServiceIDPLDAPAccessInformation
-from zitadel_client.models.beta_user_service_idp_link import BetaUserServiceIDPLink
-from zitadel_client.models.beta_user_service_idpo_auth_access_information import BetaUserServiceIDPOAuthAccessInformation
-from zitadel_client.models.beta_user_service_idpsaml_access_information import BetaUserServiceIDPSAMLAccessInformation
-from zitadel_client.models.beta_user_service_in_user_emails_query import BetaUserServiceInUserEmailsQuery
-from zitadel_client.models.beta_user_service_in_user_id_query import BetaUserServiceInUserIDQuery
-from zitadel_client.models.beta_user_service_ldap_credentials import BetaUserServiceLDAPCredentials
-from zitadel_client.models.beta_user_service_last_name_query import BetaUserServiceLastNameQuery
-from zitadel_client.models.beta_user_service_list_authentication_method_types_request import BetaUserServiceListAuthenticationMethodTypesRequest
-from zitadel_client.models.beta_user_service_list_authentication_method_types_response import BetaUserServiceListAuthenticationMethodTypesResponse
-from zitadel_client.models.beta_user_service_list_details import BetaUserServiceListDetails
-from zitadel_client.models.beta_user_service_list_query import BetaUserServiceListQuery
-from zitadel_client.models.beta_user_service_list_users_request import BetaUserServiceListUsersRequest
-from zitadel_client.models.beta_user_service_list_users_response import BetaUserServiceListUsersResponse
-from zitadel_client.models.beta_user_service_lock_user_request import BetaUserServiceLockUserRequest
-from zitadel_client.models.beta_user_service_lock_user_response import BetaUserServiceLockUserResponse
-from zitadel_client.models.beta_user_service_login_name_query import BetaUserServiceLoginNameQuery
-from zitadel_client.models.beta_user_service_machine_user import BetaUserServiceMachineUser
-from zitadel_client.models.beta_user_service_nick_name_query import BetaUserServiceNickNameQuery
-from zitadel_client.models.beta_user_service_not_query import BetaUserServiceNotQuery
-from zitadel_client.models.beta_user_service_notification_type import BetaUserServiceNotificationType
-from zitadel_client.models.beta_user_service_or_query import BetaUserServiceOrQuery
-from zitadel_client.models.beta_user_service_organization import BetaUserServiceOrganization
-from zitadel_client.models.beta_user_service_organization_id_query import BetaUserServiceOrganizationIdQuery
-from zitadel_client.models.beta_user_service_passkey_authenticator import BetaUserServicePasskeyAuthenticator
-from zitadel_client.models.beta_user_service_passkey_registration_code import BetaUserServicePasskeyRegistrationCode
-from zitadel_client.models.beta_user_service_password import BetaUserServicePassword
-from zitadel_client.models.beta_user_service_password_reset_request import BetaUserServicePasswordResetRequest
-from zitadel_client.models.beta_user_service_password_reset_response import BetaUserServicePasswordResetResponse
-from zitadel_client.models.beta_user_service_phone_query import BetaUserServicePhoneQuery
-from zitadel_client.models.beta_user_service_reactivate_user_request import BetaUserServiceReactivateUserRequest
-from zitadel_client.models.beta_user_service_reactivate_user_response import BetaUserServiceReactivateUserResponse
-from zitadel_client.models.beta_user_service_redirect_urls import BetaUserServiceRedirectURLs
-from zitadel_client.models.beta_user_service_register_passkey_request import BetaUserServiceRegisterPasskeyRequest
-from zitadel_client.models.beta_user_service_register_passkey_response import BetaUserServiceRegisterPasskeyResponse
-from zitadel_client.models.beta_user_service_register_totp_request import BetaUserServiceRegisterTOTPRequest
-from zitadel_client.models.beta_user_service_register_totp_response import BetaUserServiceRegisterTOTPResponse
-from zitadel_client.models.beta_user_service_register_u2_f_request import BetaUserServiceRegisterU2FRequest
-from zitadel_client.models.beta_user_service_register_u2_f_response import BetaUserServiceRegisterU2FResponse
-from zitadel_client.models.beta_user_service_remove_otp_email_request import BetaUserServiceRemoveOTPEmailRequest
-from zitadel_client.models.beta_user_service_remove_otp_email_response import BetaUserServiceRemoveOTPEmailResponse
-from zitadel_client.models.beta_user_service_remove_otpsms_request import BetaUserServiceRemoveOTPSMSRequest
-from zitadel_client.models.beta_user_service_remove_otpsms_response import BetaUserServiceRemoveOTPSMSResponse
-from zitadel_client.models.beta_user_service_remove_phone_request import BetaUserServiceRemovePhoneRequest
-from zitadel_client.models.beta_user_service_remove_phone_response import BetaUserServiceRemovePhoneResponse
-from zitadel_client.models.beta_user_service_remove_totp_request import BetaUserServiceRemoveTOTPRequest
-from zitadel_client.models.beta_user_service_remove_totp_response import BetaUserServiceRemoveTOTPResponse
-from zitadel_client.models.beta_user_service_resend_email_code_request import BetaUserServiceResendEmailCodeRequest
-from zitadel_client.models.beta_user_service_resend_email_code_response import BetaUserServiceResendEmailCodeResponse
-from zitadel_client.models.beta_user_service_resend_phone_code_request import BetaUserServiceResendPhoneCodeRequest
-from zitadel_client.models.beta_user_service_resend_phone_code_response import BetaUserServiceResendPhoneCodeResponse
-from zitadel_client.models.beta_user_service_retrieve_identity_provider_intent_request import BetaUserServiceRetrieveIdentityProviderIntentRequest
-from zitadel_client.models.beta_user_service_retrieve_identity_provider_intent_response import BetaUserServiceRetrieveIdentityProviderIntentResponse
-from zitadel_client.models.beta_user_service_search_query import BetaUserServiceSearchQuery
-from zitadel_client.models.beta_user_service_send_email_verification_code import BetaUserServiceSendEmailVerificationCode
-from zitadel_client.models.beta_user_service_send_passkey_registration_link import BetaUserServiceSendPasskeyRegistrationLink
-from zitadel_client.models.beta_user_service_send_password_reset_link import BetaUserServiceSendPasswordResetLink
-from zitadel_client.models.beta_user_service_set_email_request import BetaUserServiceSetEmailRequest
-from zitadel_client.models.beta_user_service_set_email_response import BetaUserServiceSetEmailResponse
-from zitadel_client.models.beta_user_service_set_human_email import BetaUserServiceSetHumanEmail
-from zitadel_client.models.beta_user_service_set_human_phone import BetaUserServiceSetHumanPhone
-from zitadel_client.models.beta_user_service_set_human_profile import BetaUserServiceSetHumanProfile
-from zitadel_client.models.beta_user_service_set_metadata_entry import BetaUserServiceSetMetadataEntry
-from zitadel_client.models.beta_user_service_set_password import BetaUserServiceSetPassword
-from zitadel_client.models.beta_user_service_set_password_request import BetaUserServiceSetPasswordRequest
-from zitadel_client.models.beta_user_service_set_password_response import BetaUserServiceSetPasswordResponse
-from zitadel_client.models.beta_user_service_set_phone_request import BetaUserServiceSetPhoneRequest
-from zitadel_client.models.beta_user_service_set_phone_response import BetaUserServiceSetPhoneResponse
-from zitadel_client.models.beta_user_service_start_identity_provider_intent_request import BetaUserServiceStartIdentityProviderIntentRequest
-from zitadel_client.models.beta_user_service_start_identity_provider_intent_response import BetaUserServiceStartIdentityProviderIntentResponse
-from zitadel_client.models.beta_user_service_state_query import BetaUserServiceStateQuery
-from zitadel_client.models.beta_user_service_text_query_method import BetaUserServiceTextQueryMethod
-from zitadel_client.models.beta_user_service_type import BetaUserServiceType
-from zitadel_client.models.beta_user_service_type_query import BetaUserServiceTypeQuery
-from zitadel_client.models.beta_user_service_unlock_user_request import BetaUserServiceUnlockUserRequest
-from zitadel_client.models.beta_user_service_unlock_user_response import BetaUserServiceUnlockUserResponse
-from zitadel_client.models.beta_user_service_update_human_user_request import BetaUserServiceUpdateHumanUserRequest
-from zitadel_client.models.beta_user_service_update_human_user_response import BetaUserServiceUpdateHumanUserResponse
-from zitadel_client.models.beta_user_service_user import BetaUserServiceUser
-from zitadel_client.models.beta_user_service_user_field_name import BetaUserServiceUserFieldName
-from zitadel_client.models.beta_user_service_user_name_query import BetaUserServiceUserNameQuery
-from zitadel_client.models.beta_user_service_user_state import BetaUserServiceUserState
-from zitadel_client.models.beta_user_service_verify_email_request import BetaUserServiceVerifyEmailRequest
-from zitadel_client.models.beta_user_service_verify_email_response import BetaUserServiceVerifyEmailResponse
-from zitadel_client.models.beta_user_service_verify_passkey_registration_request import BetaUserServiceVerifyPasskeyRegistrationRequest
-from zitadel_client.models.beta_user_service_verify_passkey_registration_response import BetaUserServiceVerifyPasskeyRegistrationResponse
-from zitadel_client.models.beta_user_service_verify_phone_request import BetaUserServiceVerifyPhoneRequest
-from zitadel_client.models.beta_user_service_verify_phone_response import BetaUserServiceVerifyPhoneResponse
-from zitadel_client.models.beta_user_service_verify_totp_registration_request import BetaUserServiceVerifyTOTPRegistrationRequest
-from zitadel_client.models.beta_user_service_verify_totp_registration_response import BetaUserServiceVerifyTOTPRegistrationResponse
-from zitadel_client.models.beta_user_service_verify_u2_f_registration_request import BetaUserServiceVerifyU2FRegistrationRequest
-from zitadel_client.models.beta_user_service_verify_u2_f_registration_response import BetaUserServiceVerifyU2FRegistrationResponse
-from zitadel_client.models.beta_web_key_service_activate_web_key_request import BetaWebKeyServiceActivateWebKeyRequest
-from zitadel_client.models.beta_web_key_service_activate_web_key_response import BetaWebKeyServiceActivateWebKeyResponse
-from zitadel_client.models.beta_web_key_service_any import BetaWebKeyServiceAny
-from zitadel_client.models.beta_web_key_service_connect_error import BetaWebKeyServiceConnectError
-from zitadel_client.models.beta_web_key_service_create_web_key_request import BetaWebKeyServiceCreateWebKeyRequest
-from zitadel_client.models.beta_web_key_service_create_web_key_response import BetaWebKeyServiceCreateWebKeyResponse
-from zitadel_client.models.beta_web_key_service_delete_web_key_request import BetaWebKeyServiceDeleteWebKeyRequest
-from zitadel_client.models.beta_web_key_service_delete_web_key_response import BetaWebKeyServiceDeleteWebKeyResponse
-from zitadel_client.models.beta_web_key_service_ecdsa import BetaWebKeyServiceECDSA
-from zitadel_client.models.beta_web_key_service_ecdsa_curve import BetaWebKeyServiceECDSACurve
-from zitadel_client.models.beta_web_key_service_list_web_keys_response import BetaWebKeyServiceListWebKeysResponse
-from zitadel_client.models.beta_web_key_service_rsa import BetaWebKeyServiceRSA
-from zitadel_client.models.beta_web_key_service_rsa_bits import BetaWebKeyServiceRSABits
-from zitadel_client.models.beta_web_key_service_rsa_hasher import BetaWebKeyServiceRSAHasher
-from zitadel_client.models.beta_web_key_service_state import BetaWebKeyServiceState
-from zitadel_client.models.beta_web_key_service_web_key import BetaWebKeyServiceWebKey
-from zitadel_client.models.feature_service_any import FeatureServiceAny
-from zitadel_client.models.feature_service_connect_error import FeatureServiceConnectError
-from zitadel_client.models.feature_service_details import FeatureServiceDetails
-from zitadel_client.models.feature_service_feature_flag import FeatureServiceFeatureFlag
-from zitadel_client.models.feature_service_get_instance_features_request import FeatureServiceGetInstanceFeaturesRequest
-from zitadel_client.models.feature_service_get_instance_features_response import FeatureServiceGetInstanceFeaturesResponse
-from zitadel_client.models.feature_service_get_organization_features_request import FeatureServiceGetOrganizationFeaturesRequest
-from zitadel_client.models.feature_service_get_organization_features_response import FeatureServiceGetOrganizationFeaturesResponse
-from zitadel_client.models.feature_service_get_system_features_response import FeatureServiceGetSystemFeaturesResponse
-from zitadel_client.models.feature_service_get_user_features_request import FeatureServiceGetUserFeaturesRequest
-from zitadel_client.models.feature_service_get_user_features_response import FeatureServiceGetUserFeaturesResponse
-from zitadel_client.models.feature_service_improved_performance import FeatureServiceImprovedPerformance
-from zitadel_client.models.feature_service_improved_performance_feature_flag import FeatureServiceImprovedPerformanceFeatureFlag
-from zitadel_client.models.feature_service_login_v2 import FeatureServiceLoginV2
-from zitadel_client.models.feature_service_login_v2_feature_flag import FeatureServiceLoginV2FeatureFlag
-from zitadel_client.models.feature_service_reset_instance_features_response import FeatureServiceResetInstanceFeaturesResponse
-from zitadel_client.models.feature_service_reset_organization_features_request import FeatureServiceResetOrganizationFeaturesRequest
-from zitadel_client.models.feature_service_reset_organization_features_response import FeatureServiceResetOrganizationFeaturesResponse
-from zitadel_client.models.feature_service_reset_system_features_response import FeatureServiceResetSystemFeaturesResponse
-from zitadel_client.models.feature_service_reset_user_features_request import FeatureServiceResetUserFeaturesRequest
-from zitadel_client.models.feature_service_reset_user_features_response import FeatureServiceResetUserFeaturesResponse
-from zitadel_client.models.feature_service_set_instance_features_request import FeatureServiceSetInstanceFeaturesRequest
-from zitadel_client.models.feature_service_set_instance_features_response import FeatureServiceSetInstanceFeaturesResponse
-from zitadel_client.models.feature_service_set_organization_features_request import FeatureServiceSetOrganizationFeaturesRequest
-from zitadel_client.models.feature_service_set_organization_features_response import FeatureServiceSetOrganizationFeaturesResponse
-from zitadel_client.models.feature_service_set_system_features_request import FeatureServiceSetSystemFeaturesRequest
-from zitadel_client.models.feature_service_set_system_features_response import FeatureServiceSetSystemFeaturesResponse
-from zitadel_client.models.feature_service_set_user_feature_request import FeatureServiceSetUserFeatureRequest
-from zitadel_client.models.feature_service_set_user_features_response import FeatureServiceSetUserFeaturesResponse
-from zitadel_client.models.feature_service_source import FeatureServiceSource
-from zitadel_client.models.identity_provider_service_any import IdentityProviderServiceAny
-from zitadel_client.models.identity_provider_service_apple_config import IdentityProviderServiceAppleConfig
-from zitadel_client.models.identity_provider_service_auto_linking_option import IdentityProviderServiceAutoLinkingOption
-from zitadel_client.models.identity_provider_service_azure_ad_config import IdentityProviderServiceAzureADConfig
-from zitadel_client.models.identity_provider_service_azure_ad_tenant import IdentityProviderServiceAzureADTenant
-from zitadel_client.models.identity_provider_service_azure_ad_tenant_type import IdentityProviderServiceAzureADTenantType
-from zitadel_client.models.identity_provider_service_connect_error import IdentityProviderServiceConnectError
-from zitadel_client.models.identity_provider_service_details import IdentityProviderServiceDetails
-from zitadel_client.models.identity_provider_service_generic_oidc_config import IdentityProviderServiceGenericOIDCConfig
-from zitadel_client.models.identity_provider_service_get_idpby_id_request import IdentityProviderServiceGetIDPByIDRequest
-from zitadel_client.models.identity_provider_service_get_idpby_id_response import IdentityProviderServiceGetIDPByIDResponse
-from zitadel_client.models.identity_provider_service_git_hub_config import IdentityProviderServiceGitHubConfig
-from zitadel_client.models.identity_provider_service_git_hub_enterprise_server_config import IdentityProviderServiceGitHubEnterpriseServerConfig
-from zitadel_client.models.identity_provider_service_git_lab_config import IdentityProviderServiceGitLabConfig
-from zitadel_client.models.identity_provider_service_git_lab_self_hosted_config import IdentityProviderServiceGitLabSelfHostedConfig
-from zitadel_client.models.identity_provider_service_google_config import IdentityProviderServiceGoogleConfig
-from zitadel_client.models.identity_provider_service_idp import IdentityProviderServiceIDP
-from zitadel_client.models.identity_provider_service_idp_config import IdentityProviderServiceIDPConfig
-from zitadel_client.models.identity_provider_service_idp_state import IdentityProviderServiceIDPState
-from zitadel_client.models.identity_provider_service_idp_type import IdentityProviderServiceIDPType
-from zitadel_client.models.identity_provider_service_jwt_config import IdentityProviderServiceJWTConfig
-from zitadel_client.models.identity_provider_service_ldap_attributes import IdentityProviderServiceLDAPAttributes
-from zitadel_client.models.identity_provider_service_ldap_config import IdentityProviderServiceLDAPConfig
-from zitadel_client.models.identity_provider_service_o_auth_config import IdentityProviderServiceOAuthConfig
-from zitadel_client.models.identity_provider_service_options import IdentityProviderServiceOptions
-from zitadel_client.models.identity_provider_service_saml_binding import IdentityProviderServiceSAMLBinding
-from zitadel_client.models.identity_provider_service_saml_config import IdentityProviderServiceSAMLConfig
-from zitadel_client.models.identity_provider_service_saml_name_id_format import IdentityProviderServiceSAMLNameIDFormat
-from zitadel_client.models.identity_provider_service_saml_signature_algorithm import IdentityProviderServiceSAMLSignatureAlgorithm
-from zitadel_client.models.instance_service_add_custom_domain_request import InstanceServiceAddCustomDomainRequest
-from zitadel_client.models.instance_service_add_custom_domain_response import InstanceServiceAddCustomDomainResponse
-from zitadel_client.models.instance_service_add_trusted_domain_request import InstanceServiceAddTrustedDomainRequest
-from zitadel_client.models.instance_service_add_trusted_domain_response import InstanceServiceAddTrustedDomainResponse
-from zitadel_client.models.instance_service_any import InstanceServiceAny
-from zitadel_client.models.instance_service_connect_error import InstanceServiceConnectError
-from zitadel_client.models.instance_service_custom_domain import InstanceServiceCustomDomain
-from zitadel_client.models.instance_service_custom_domain_filter import InstanceServiceCustomDomainFilter
-from zitadel_client.models.instance_service_custom_domains_filter import InstanceServiceCustomDomainsFilter
-from zitadel_client.models.instance_service_delete_instance_request import InstanceServiceDeleteInstanceRequest
-from zitadel_client.models.instance_service_delete_instance_response import InstanceServiceDeleteInstanceResponse
-from zitadel_client.models.instance_service_domain_field_name import InstanceServiceDomainFieldName
-from zitadel_client.models.instance_service_domain_filter import InstanceServiceDomainFilter
-from zitadel_client.models.instance_service_field_name import InstanceServiceFieldName
-from zitadel_client.models.instance_service_filter import InstanceServiceFilter
-from zitadel_client.models.instance_service_get_instance_request import InstanceServiceGetInstanceRequest
-from zitadel_client.models.instance_service_get_instance_response import InstanceServiceGetInstanceResponse
-from zitadel_client.models.instance_service_in_ids_filter import InstanceServiceInIDsFilter
-from zitadel_client.models.instance_service_instance import InstanceServiceInstance
-from zitadel_client.models.instance_service_list_custom_domains_request import InstanceServiceListCustomDomainsRequest
-from zitadel_client.models.instance_service_list_custom_domains_response import InstanceServiceListCustomDomainsResponse
-from zitadel_client.models.instance_service_list_instances_request import InstanceServiceListInstancesRequest
-from zitadel_client.models.instance_service_list_instances_response import InstanceServiceListInstancesResponse
-from zitadel_client.models.instance_service_list_trusted_domains_request import InstanceServiceListTrustedDomainsRequest
-from zitadel_client.models.instance_service_list_trusted_domains_response import InstanceServiceListTrustedDomainsResponse
-from zitadel_client.models.instance_service_pagination_request import InstanceServicePaginationRequest
-from zitadel_client.models.instance_service_pagination_response import InstanceServicePaginationResponse
-from zitadel_client.models.instance_service_remove_custom_domain_request import InstanceServiceRemoveCustomDomainRequest
-from zitadel_client.models.instance_service_remove_custom_domain_response import InstanceServiceRemoveCustomDomainResponse
-from zitadel_client.models.instance_service_remove_trusted_domain_request import InstanceServiceRemoveTrustedDomainRequest
-from zitadel_client.models.instance_service_remove_trusted_domain_response import InstanceServiceRemoveTrustedDomainResponse
-from zitadel_client.models.instance_service_state import InstanceServiceState
-from zitadel_client.models.instance_service_text_query_method import InstanceServiceTextQueryMethod
-from zitadel_client.models.instance_service_trusted_domain import InstanceServiceTrustedDomain
-from zitadel_client.models.instance_service_trusted_domain_field_name import InstanceServiceTrustedDomainFieldName
-from zitadel_client.models.instance_service_trusted_domain_filter import InstanceServiceTrustedDomainFilter
-from zitadel_client.models.instance_service_update_instance_request import InstanceServiceUpdateInstanceRequest
-from zitadel_client.models.instance_service_update_instance_response import InstanceServiceUpdateInstanceResponse
-from zitadel_client.models.internal_permission_service_administrator import InternalPermissionServiceAdministrator
-from zitadel_client.models.internal_permission_service_administrator_field_name import InternalPermissionServiceAdministratorFieldName
-from zitadel_client.models.internal_permission_service_administrator_search_filter import InternalPermissionServiceAdministratorSearchFilter
-from zitadel_client.models.internal_permission_service_and_filter import InternalPermissionServiceAndFilter
-from zitadel_client.models.internal_permission_service_any import InternalPermissionServiceAny
-from zitadel_client.models.internal_permission_service_connect_error import InternalPermissionServiceConnectError
-from zitadel_client.models.internal_permission_service_create_administrator_request import InternalPermissionServiceCreateAdministratorRequest
-from zitadel_client.models.internal_permission_service_create_administrator_response import InternalPermissionServiceCreateAdministratorResponse
-from zitadel_client.models.internal_permission_service_delete_administrator_request import InternalPermissionServiceDeleteAdministratorRequest
-from zitadel_client.models.internal_permission_service_delete_administrator_response import InternalPermissionServiceDeleteAdministratorResponse
-from zitadel_client.models.internal_permission_service_id_filter import InternalPermissionServiceIDFilter
-from zitadel_client.models.internal_permission_service_in_ids_filter import InternalPermissionServiceInIDsFilter
-from zitadel_client.models.internal_permission_service_list_administrators_request import InternalPermissionServiceListAdministratorsRequest
-from zitadel_client.models.internal_permission_service_list_administrators_response import InternalPermissionServiceListAdministratorsResponse
-from zitadel_client.models.internal_permission_service_not_filter import InternalPermissionServiceNotFilter
-from zitadel_client.models.internal_permission_service_or_filter import InternalPermissionServiceOrFilter
-from zitadel_client.models.internal_permission_service_organization import InternalPermissionServiceOrganization
-from zitadel_client.models.internal_permission_service_pagination_request import InternalPermissionServicePaginationRequest
-from zitadel_client.models.internal_permission_service_pagination_response import InternalPermissionServicePaginationResponse
-from zitadel_client.models.internal_permission_service_project import InternalPermissionServiceProject
-from zitadel_client.models.internal_permission_service_project_grant import InternalPermissionServiceProjectGrant
-from zitadel_client.models.internal_permission_service_resource_filter import InternalPermissionServiceResourceFilter
-from zitadel_client.models.internal_permission_service_resource_type import InternalPermissionServiceResourceType
-from zitadel_client.models.internal_permission_service_role_filter import InternalPermissionServiceRoleFilter
-from zitadel_client.models.internal_permission_service_text_filter_method import InternalPermissionServiceTextFilterMethod
-from zitadel_client.models.internal_permission_service_timestamp_filter import InternalPermissionServiceTimestampFilter
-from zitadel_client.models.internal_permission_service_timestamp_filter_method import InternalPermissionServiceTimestampFilterMethod
-from zitadel_client.models.internal_permission_service_update_administrator_request import InternalPermissionServiceUpdateAdministratorRequest
-from zitadel_client.models.internal_permission_service_update_administrator_response import InternalPermissionServiceUpdateAdministratorResponse
-from zitadel_client.models.internal_permission_service_user import InternalPermissionServiceUser
-from zitadel_client.models.internal_permission_service_user_display_name_filter import InternalPermissionServiceUserDisplayNameFilter
-from zitadel_client.models.internal_permission_service_user_preferred_login_name_filter import InternalPermissionServiceUserPreferredLoginNameFilter
-from zitadel_client.models.oidc_service_any import OIDCServiceAny
-from zitadel_client.models.oidc_service_auth_request import OIDCServiceAuthRequest
-from zitadel_client.models.oidc_service_authorization_error import OIDCServiceAuthorizationError
-from zitadel_client.models.oidc_service_authorize_or_deny_device_authorization_request import OIDCServiceAuthorizeOrDenyDeviceAuthorizationRequest
-from zitadel_client.models.oidc_service_connect_error import OIDCServiceConnectError
-from zitadel_client.models.oidc_service_create_callback_request import OIDCServiceCreateCallbackRequest
-from zitadel_client.models.oidc_service_create_callback_response import OIDCServiceCreateCallbackResponse
-from zitadel_client.models.oidc_service_details import OIDCServiceDetails
-from zitadel_client.models.oidc_service_device_authorization_request import OIDCServiceDeviceAuthorizationRequest
-from zitadel_client.models.oidc_service_error_reason import OIDCServiceErrorReason
-from zitadel_client.models.oidc_service_get_auth_request_request import OIDCServiceGetAuthRequestRequest
-from zitadel_client.models.oidc_service_get_auth_request_response import OIDCServiceGetAuthRequestResponse
-from zitadel_client.models.oidc_service_get_device_authorization_request_request import OIDCServiceGetDeviceAuthorizationRequestRequest
-from zitadel_client.models.oidc_service_get_device_authorization_request_response import OIDCServiceGetDeviceAuthorizationRequestResponse
-from zitadel_client.models.oidc_service_prompt import OIDCServicePrompt
-from zitadel_client.models.oidc_service_session import OIDCServiceSession
-from zitadel_client.models.organization_service_activate_organization_request import OrganizationServiceActivateOrganizationRequest
-from zitadel_client.models.organization_service_activate_organization_response import OrganizationServiceActivateOrganizationResponse
-from zitadel_client.models.organization_service_add_human_user_request import OrganizationServiceAddHumanUserRequest
-from zitadel_client.models.organization_service_add_organization_domain_request import OrganizationServiceAddOrganizationDomainRequest
-from zitadel_client.models.organization_service_add_organization_domain_response import OrganizationServiceAddOrganizationDomainResponse
-from zitadel_client.models.organization_service_add_organization_request import OrganizationServiceAddOrganizationRequest
-from zitadel_client.models.organization_service_add_organization_response import OrganizationServiceAddOrganizationResponse
-from zitadel_client.models.organization_service_admin import OrganizationServiceAdmin
-from zitadel_client.models.organization_service_any import OrganizationServiceAny
-from zitadel_client.models.organization_service_connect_error import OrganizationServiceConnectError
-from zitadel_client.models.organization_service_created_admin import OrganizationServiceCreatedAdmin
-from zitadel_client.models.organization_service_deactivate_organization_request import OrganizationServiceDeactivateOrganizationRequest
-from zitadel_client.models.organization_service_deactivate_organization_response import OrganizationServiceDeactivateOrganizationResponse
-from zitadel_client.models.organization_service_delete_organization_domain_request import OrganizationServiceDeleteOrganizationDomainRequest
-from zitadel_client.models.organization_service_delete_organization_domain_response import OrganizationServiceDeleteOrganizationDomainResponse
-from zitadel_client.models.organization_service_delete_organization_metadata_request import OrganizationServiceDeleteOrganizationMetadataRequest
-from zitadel_client.models.organization_service_delete_organization_metadata_response import OrganizationServiceDeleteOrganizationMetadataResponse
-from zitadel_client.models.organization_service_delete_organization_request import OrganizationServiceDeleteOrganizationRequest
-from zitadel_client.models.organization_service_delete_organization_response import OrganizationServiceDeleteOrganizationResponse
-from zitadel_client.models.organization_service_details import OrganizationServiceDetails
-from zitadel_client.models.organization_service_domain import OrganizationServiceDomain
-from zitadel_client.models.organization_service_domain_field_name import OrganizationServiceDomainFieldName
-from zitadel_client.models.organization_service_domain_search_filter import OrganizationServiceDomainSearchFilter
-from zitadel_client.models.organization_service_domain_validation_type import OrganizationServiceDomainValidationType
-from zitadel_client.models.organization_service_gender import OrganizationServiceGender
-from zitadel_client.models.organization_service_generate_organization_domain_validation_request import OrganizationServiceGenerateOrganizationDomainValidationRequest
-from zitadel_client.models.organization_service_generate_organization_domain_validation_response import OrganizationServiceGenerateOrganizationDomainValidationResponse
-from zitadel_client.models.organization_service_hashed_password import OrganizationServiceHashedPassword
-from zitadel_client.models.organization_service_idp_link import OrganizationServiceIDPLink
-from zitadel_client.models.organization_service_list_details import OrganizationServiceListDetails
-from zitadel_client.models.organization_service_list_organization_domains_request import OrganizationServiceListOrganizationDomainsRequest
-from zitadel_client.models.organization_service_list_organization_domains_response import OrganizationServiceListOrganizationDomainsResponse
-from zitadel_client.models.organization_service_list_organization_metadata_request import OrganizationServiceListOrganizationMetadataRequest
-from zitadel_client.models.organization_service_list_organization_metadata_response import OrganizationServiceListOrganizationMetadataResponse
-from zitadel_client.models.organization_service_list_organizations_request import OrganizationServiceListOrganizationsRequest
-from zitadel_client.models.organization_service_list_organizations_response import OrganizationServiceListOrganizationsResponse
-from zitadel_client.models.organization_service_list_query import OrganizationServiceListQuery
-from zitadel_client.models.organization_service_metadata import OrganizationServiceMetadata
-from zitadel_client.models.organization_service_metadata_key_filter import OrganizationServiceMetadataKeyFilter
-from zitadel_client.models.organization_service_metadata_search_filter import OrganizationServiceMetadataSearchFilter
-from zitadel_client.models.organization_service_organization import OrganizationServiceOrganization
-from zitadel_client.models.organization_service_organization_domain_query import OrganizationServiceOrganizationDomainQuery
-from zitadel_client.models.organization_service_organization_field_name import OrganizationServiceOrganizationFieldName
-from zitadel_client.models.organization_service_organization_id_query import OrganizationServiceOrganizationIDQuery
-from zitadel_client.models.organization_service_organization_name_query import OrganizationServiceOrganizationNameQuery
-from zitadel_client.models.organization_service_organization_state import OrganizationServiceOrganizationState
-from zitadel_client.models.organization_service_organization_state_query import OrganizationServiceOrganizationStateQuery
-from zitadel_client.models.organization_service_pagination_request import OrganizationServicePaginationRequest
-from zitadel_client.models.organization_service_pagination_response import OrganizationServicePaginationResponse
-from zitadel_client.models.organization_service_password import OrganizationServicePassword
-from zitadel_client.models.organization_service_search_query import OrganizationServiceSearchQuery
-from zitadel_client.models.organization_service_send_email_verification_code import OrganizationServiceSendEmailVerificationCode
-from zitadel_client.models.organization_service_set_human_email import OrganizationServiceSetHumanEmail
-from zitadel_client.models.organization_service_set_human_phone import OrganizationServiceSetHumanPhone
-from zitadel_client.models.organization_service_set_human_profile import OrganizationServiceSetHumanProfile
-from zitadel_client.models.organization_service_set_metadata_entry import OrganizationServiceSetMetadataEntry
-from zitadel_client.models.organization_service_set_organization_metadata_request import OrganizationServiceSetOrganizationMetadataRequest
-from zitadel_client.models.organization_service_set_organization_metadata_response import OrganizationServiceSetOrganizationMetadataResponse
-from zitadel_client.models.organization_service_text_filter_method import OrganizationServiceTextFilterMethod
-from zitadel_client.models.organization_service_text_query_method import OrganizationServiceTextQueryMethod
-from zitadel_client.models.organization_service_update_organization_request import OrganizationServiceUpdateOrganizationRequest
-from zitadel_client.models.organization_service_update_organization_response import OrganizationServiceUpdateOrganizationResponse
-from zitadel_client.models.organization_service_verify_organization_domain_request import OrganizationServiceVerifyOrganizationDomainRequest
-from zitadel_client.models.organization_service_verify_organization_domain_response import OrganizationServiceVerifyOrganizationDomainResponse
-from zitadel_client.models.project_service_activate_project_grant_request import ProjectServiceActivateProjectGrantRequest
-from zitadel_client.models.project_service_activate_project_grant_response import ProjectServiceActivateProjectGrantResponse
-from zitadel_client.models.project_service_activate_project_request import ProjectServiceActivateProjectRequest
-from zitadel_client.models.project_service_activate_project_response import ProjectServiceActivateProjectResponse
-from zitadel_client.models.project_service_add_project_role_request import ProjectServiceAddProjectRoleRequest
-from zitadel_client.models.project_service_add_project_role_response import ProjectServiceAddProjectRoleResponse
-from zitadel_client.models.project_service_any import ProjectServiceAny
-from zitadel_client.models.project_service_connect_error import ProjectServiceConnectError
-from zitadel_client.models.project_service_create_project_grant_request import ProjectServiceCreateProjectGrantRequest
-from zitadel_client.models.project_service_create_project_grant_response import ProjectServiceCreateProjectGrantResponse
-from zitadel_client.models.project_service_create_project_request import ProjectServiceCreateProjectRequest
-from zitadel_client.models.project_service_create_project_response import ProjectServiceCreateProjectResponse
-from zitadel_client.models.project_service_deactivate_project_grant_request import ProjectServiceDeactivateProjectGrantRequest
-from zitadel_client.models.project_service_deactivate_project_grant_response import ProjectServiceDeactivateProjectGrantResponse
-from zitadel_client.models.project_service_deactivate_project_request import ProjectServiceDeactivateProjectRequest
-from zitadel_client.models.project_service_deactivate_project_response import ProjectServiceDeactivateProjectResponse
-from zitadel_client.models.project_service_delete_project_grant_request import ProjectServiceDeleteProjectGrantRequest
-from zitadel_client.models.project_service_delete_project_grant_response import ProjectServiceDeleteProjectGrantResponse
-from zitadel_client.models.project_service_delete_project_request import ProjectServiceDeleteProjectRequest
-from zitadel_client.models.project_service_delete_project_response import ProjectServiceDeleteProjectResponse
-from zitadel_client.models.project_service_get_project_request import ProjectServiceGetProjectRequest
-from zitadel_client.models.project_service_get_project_response import ProjectServiceGetProjectResponse
-from zitadel_client.models.project_service_granted_project_state import ProjectServiceGrantedProjectState
-from zitadel_client.models.project_service_id_filter import ProjectServiceIDFilter
-from zitadel_client.models.project_service_in_ids_filter import ProjectServiceInIDsFilter
-from zitadel_client.models.project_service_list_project_grants_request import ProjectServiceListProjectGrantsRequest
-from zitadel_client.models.project_service_list_project_grants_response import ProjectServiceListProjectGrantsResponse
-from zitadel_client.models.project_service_list_project_roles_request import ProjectServiceListProjectRolesRequest
-from zitadel_client.models.project_service_list_project_roles_response import ProjectServiceListProjectRolesResponse
-from zitadel_client.models.project_service_list_projects_request import ProjectServiceListProjectsRequest
-from zitadel_client.models.project_service_list_projects_response import ProjectServiceListProjectsResponse
-from zitadel_client.models.project_service_pagination_request import ProjectServicePaginationRequest
-from zitadel_client.models.project_service_pagination_response import ProjectServicePaginationResponse
-from zitadel_client.models.project_service_private_labeling_setting import ProjectServicePrivateLabelingSetting
-from zitadel_client.models.project_service_project import ProjectServiceProject
-from zitadel_client.models.project_service_project_field_name import ProjectServiceProjectFieldName
-from zitadel_client.models.project_service_project_grant import ProjectServiceProjectGrant
-from zitadel_client.models.project_service_project_grant_field_name import ProjectServiceProjectGrantFieldName
-from zitadel_client.models.project_service_project_grant_search_filter import ProjectServiceProjectGrantSearchFilter
-from zitadel_client.models.project_service_project_grant_state import ProjectServiceProjectGrantState
-from zitadel_client.models.project_service_project_name_filter import ProjectServiceProjectNameFilter
-from zitadel_client.models.project_service_project_organization_id_filter import ProjectServiceProjectOrganizationIDFilter
-from zitadel_client.models.project_service_project_role import ProjectServiceProjectRole
-from zitadel_client.models.project_service_project_role_display_name_filter import ProjectServiceProjectRoleDisplayNameFilter
-from zitadel_client.models.project_service_project_role_field_name import ProjectServiceProjectRoleFieldName
-from zitadel_client.models.project_service_project_role_key_filter import ProjectServiceProjectRoleKeyFilter
-from zitadel_client.models.project_service_project_role_search_filter import ProjectServiceProjectRoleSearchFilter
-from zitadel_client.models.project_service_project_search_filter import ProjectServiceProjectSearchFilter
-from zitadel_client.models.project_service_project_state import ProjectServiceProjectState
-from zitadel_client.models.project_service_remove_project_role_request import ProjectServiceRemoveProjectRoleRequest
-from zitadel_client.models.project_service_remove_project_role_response import ProjectServiceRemoveProjectRoleResponse
-from zitadel_client.models.project_service_text_filter_method import ProjectServiceTextFilterMethod
-from zitadel_client.models.project_service_type import ProjectServiceType
-from zitadel_client.models.project_service_update_project_grant_request import ProjectServiceUpdateProjectGrantRequest
-from zitadel_client.models.project_service_update_project_grant_response import ProjectServiceUpdateProjectGrantResponse
-from zitadel_client.models.project_service_update_project_request import ProjectServiceUpdateProjectRequest
-from zitadel_client.models.project_service_update_project_response import ProjectServiceUpdateProjectResponse
-from zitadel_client.models.project_service_update_project_role_request import ProjectServiceUpdateProjectRoleRequest
-from zitadel_client.models.project_service_update_project_role_response import ProjectServiceUpdateProjectRoleResponse
-from zitadel_client.models.saml_service_any import SAMLServiceAny
-from zitadel_client.models.saml_service_authorization_error import SAMLServiceAuthorizationError
-from zitadel_client.models.saml_service_connect_error import SAMLServiceConnectError
-from zitadel_client.models.saml_service_create_response_request import SAMLServiceCreateResponseRequest
-from zitadel_client.models.saml_service_create_response_response import SAMLServiceCreateResponseResponse
-from zitadel_client.models.saml_service_details import SAMLServiceDetails
-from zitadel_client.models.saml_service_error_reason import SAMLServiceErrorReason
-from zitadel_client.models.saml_service_get_saml_request_request import SAMLServiceGetSAMLRequestRequest
-from zitadel_client.models.saml_service_get_saml_request_response import SAMLServiceGetSAMLRequestResponse
-from zitadel_client.models.saml_service_post_response import SAMLServicePostResponse
-from zitadel_client.models.saml_service_saml_request import SAMLServiceSAMLRequest
-from zitadel_client.models.saml_service_session import SAMLServiceSession
-from zitadel_client.models.session_service_any import SessionServiceAny
-from zitadel_client.models.session_service_challenges import SessionServiceChallenges
-from zitadel_client.models.session_service_check_idp_intent import SessionServiceCheckIDPIntent
-from zitadel_client.models.session_service_check_otp import SessionServiceCheckOTP
-from zitadel_client.models.session_service_check_password import SessionServiceCheckPassword
-from zitadel_client.models.session_service_check_recovery_code import SessionServiceCheckRecoveryCode
-from zitadel_client.models.session_service_check_totp import SessionServiceCheckTOTP
-from zitadel_client.models.session_service_check_user import SessionServiceCheckUser
-from zitadel_client.models.session_service_check_web_auth_n import SessionServiceCheckWebAuthN
-from zitadel_client.models.session_service_checks import SessionServiceChecks
-from zitadel_client.models.session_service_connect_error import SessionServiceConnectError
-from zitadel_client.models.session_service_create_session_request import SessionServiceCreateSessionRequest
-from zitadel_client.models.session_service_create_session_response import SessionServiceCreateSessionResponse
-from zitadel_client.models.session_service_creation_date_query import SessionServiceCreationDateQuery
-from zitadel_client.models.session_service_creator_query import SessionServiceCreatorQuery
-from zitadel_client.models.session_service_delete_session_request import SessionServiceDeleteSessionRequest
-from zitadel_client.models.session_service_delete_session_response import SessionServiceDeleteSessionResponse
-from zitadel_client.models.session_service_details import SessionServiceDetails
-from zitadel_client.models.session_service_expiration_date_query import SessionServiceExpirationDateQuery
-from zitadel_client.models.session_service_factors import SessionServiceFactors
-from zitadel_client.models.session_service_get_session_request import SessionServiceGetSessionRequest
-from zitadel_client.models.session_service_get_session_response import SessionServiceGetSessionResponse
-from zitadel_client.models.session_service_header_values import SessionServiceHeaderValues
-from zitadel_client.models.session_service_ids_query import SessionServiceIDsQuery
-from zitadel_client.models.session_service_intent_factor import SessionServiceIntentFactor
-from zitadel_client.models.session_service_list_details import SessionServiceListDetails
-from zitadel_client.models.session_service_list_query import SessionServiceListQuery
-from zitadel_client.models.session_service_list_sessions_request import SessionServiceListSessionsRequest
-from zitadel_client.models.session_service_list_sessions_response import SessionServiceListSessionsResponse
-from zitadel_client.models.session_service_otp_email import SessionServiceOTPEmail
-from zitadel_client.models.session_service_otp_factor import SessionServiceOTPFactor
-from zitadel_client.models.session_service_otpsms import SessionServiceOTPSMS
-from zitadel_client.models.session_service_password_factor import SessionServicePasswordFactor
-from zitadel_client.models.session_service_recovery_code_factor import SessionServiceRecoveryCodeFactor
-from zitadel_client.models.session_service_request_challenges import SessionServiceRequestChallenges
-from zitadel_client.models.session_service_search_query import SessionServiceSearchQuery
-from zitadel_client.models.session_service_send_code import SessionServiceSendCode
-from zitadel_client.models.session_service_session import SessionServiceSession
-from zitadel_client.models.session_service_session_field_name import SessionServiceSessionFieldName
-from zitadel_client.models.session_service_set_session_request import SessionServiceSetSessionRequest
-from zitadel_client.models.session_service_set_session_response import SessionServiceSetSessionResponse
-from zitadel_client.models.session_service_totp_factor import SessionServiceTOTPFactor
-from zitadel_client.models.session_service_timestamp_query_method import SessionServiceTimestampQueryMethod
-from zitadel_client.models.session_service_user_agent import SessionServiceUserAgent
-from zitadel_client.models.session_service_user_agent_query import SessionServiceUserAgentQuery
-from zitadel_client.models.session_service_user_factor import SessionServiceUserFactor
-from zitadel_client.models.session_service_user_id_query import SessionServiceUserIDQuery
-from zitadel_client.models.session_service_user_verification_requirement import SessionServiceUserVerificationRequirement
-from zitadel_client.models.session_service_web_auth_n import SessionServiceWebAuthN
-from zitadel_client.models.session_service_web_auth_n_factor import SessionServiceWebAuthNFactor
-from zitadel_client.models.settings_service_any import SettingsServiceAny
-from zitadel_client.models.settings_service_auto_linking_option import SettingsServiceAutoLinkingOption
-from zitadel_client.models.settings_service_branding_settings import SettingsServiceBrandingSettings
-from zitadel_client.models.settings_service_connect_error import SettingsServiceConnectError
-from zitadel_client.models.settings_service_details import SettingsServiceDetails
-from zitadel_client.models.settings_service_domain_settings import SettingsServiceDomainSettings
-from zitadel_client.models.settings_service_embedded_iframe_settings import SettingsServiceEmbeddedIframeSettings
-from zitadel_client.models.settings_service_get_active_identity_providers_request import SettingsServiceGetActiveIdentityProvidersRequest
-from zitadel_client.models.settings_service_get_active_identity_providers_response import SettingsServiceGetActiveIdentityProvidersResponse
-from zitadel_client.models.settings_service_get_branding_settings_request import SettingsServiceGetBrandingSettingsRequest
-from zitadel_client.models.settings_service_get_branding_settings_response import SettingsServiceGetBrandingSettingsResponse
-from zitadel_client.models.settings_service_get_domain_settings_request import SettingsServiceGetDomainSettingsRequest
-from zitadel_client.models.settings_service_get_domain_settings_response import SettingsServiceGetDomainSettingsResponse
-from zitadel_client.models.settings_service_get_general_settings_response import SettingsServiceGetGeneralSettingsResponse
-from zitadel_client.models.settings_service_get_hosted_login_translation_request import SettingsServiceGetHostedLoginTranslationRequest
-from zitadel_client.models.settings_service_get_hosted_login_translation_response import SettingsServiceGetHostedLoginTranslationResponse
-from zitadel_client.models.settings_service_get_legal_and_support_settings_request import SettingsServiceGetLegalAndSupportSettingsRequest
-from zitadel_client.models.settings_service_get_legal_and_support_settings_response import SettingsServiceGetLegalAndSupportSettingsResponse
-from zitadel_client.models.settings_service_get_lockout_settings_request import SettingsServiceGetLockoutSettingsRequest
-from zitadel_client.models.settings_service_get_lockout_settings_response import SettingsServiceGetLockoutSettingsResponse
-from zitadel_client.models.settings_service_get_login_settings_request import SettingsServiceGetLoginSettingsRequest
-from zitadel_client.models.settings_service_get_login_settings_response import SettingsServiceGetLoginSettingsResponse
-from zitadel_client.models.settings_service_get_password_complexity_settings_request import SettingsServiceGetPasswordComplexitySettingsRequest
-from zitadel_client.models.settings_service_get_password_complexity_settings_response import SettingsServiceGetPasswordComplexitySettingsResponse
-from zitadel_client.models.settings_service_get_password_expiry_settings_request import SettingsServiceGetPasswordExpirySettingsRequest
-from zitadel_client.models.settings_service_get_password_expiry_settings_response import SettingsServiceGetPasswordExpirySettingsResponse
-from zitadel_client.models.settings_service_get_security_settings_response import SettingsServiceGetSecuritySettingsResponse
-from zitadel_client.models.settings_service_identity_provider import SettingsServiceIdentityProvider
-from zitadel_client.models.settings_service_identity_provider_type import SettingsServiceIdentityProviderType
-from zitadel_client.models.settings_service_legal_and_support_settings import SettingsServiceLegalAndSupportSettings
-from zitadel_client.models.settings_service_list_details import SettingsServiceListDetails
-from zitadel_client.models.settings_service_lockout_settings import SettingsServiceLockoutSettings
-from zitadel_client.models.settings_service_login_settings import SettingsServiceLoginSettings
-from zitadel_client.models.settings_service_multi_factor_type import SettingsServiceMultiFactorType
-from zitadel_client.models.settings_service_options import SettingsServiceOptions
-from zitadel_client.models.settings_service_passkeys_type import SettingsServicePasskeysType
-from zitadel_client.models.settings_service_password_complexity_settings import SettingsServicePasswordComplexitySettings
-from zitadel_client.models.settings_service_password_expiry_settings import SettingsServicePasswordExpirySettings
-from zitadel_client.models.settings_service_request_context import SettingsServiceRequestContext
-from zitadel_client.models.settings_service_resource_owner_type import SettingsServiceResourceOwnerType
-from zitadel_client.models.settings_service_second_factor_type import SettingsServiceSecondFactorType
-from zitadel_client.models.settings_service_security_settings import SettingsServiceSecuritySettings
-from zitadel_client.models.settings_service_set_hosted_login_translation_request import SettingsServiceSetHostedLoginTranslationRequest
-from zitadel_client.models.settings_service_set_hosted_login_translation_response import SettingsServiceSetHostedLoginTranslationResponse
-from zitadel_client.models.settings_service_set_security_settings_request import SettingsServiceSetSecuritySettingsRequest
-from zitadel_client.models.settings_service_set_security_settings_response import SettingsServiceSetSecuritySettingsResponse
-from zitadel_client.models.settings_service_theme import SettingsServiceTheme
-from zitadel_client.models.settings_service_theme_mode import SettingsServiceThemeMode
-from zitadel_client.models.user_service_access_token_type import UserServiceAccessTokenType
-from zitadel_client.models.user_service_add_human_user_request import UserServiceAddHumanUserRequest
-from zitadel_client.models.user_service_add_human_user_response import UserServiceAddHumanUserResponse
-from zitadel_client.models.user_service_add_idp_link_request import UserServiceAddIDPLinkRequest
-from zitadel_client.models.user_service_add_idp_link_response import UserServiceAddIDPLinkResponse
-from zitadel_client.models.user_service_add_key_request import UserServiceAddKeyRequest
-from zitadel_client.models.user_service_add_key_response import UserServiceAddKeyResponse
-from zitadel_client.models.user_service_add_otp_email_request import UserServiceAddOTPEmailRequest
-from zitadel_client.models.user_service_add_otp_email_response import UserServiceAddOTPEmailResponse
-from zitadel_client.models.user_service_add_otpsms_request import UserServiceAddOTPSMSRequest
-from zitadel_client.models.user_service_add_otpsms_response import UserServiceAddOTPSMSResponse
-from zitadel_client.models.user_service_add_personal_access_token_request import UserServiceAddPersonalAccessTokenRequest
-from zitadel_client.models.user_service_add_personal_access_token_response import UserServiceAddPersonalAccessTokenResponse
-from zitadel_client.models.user_service_add_secret_request import UserServiceAddSecretRequest
-from zitadel_client.models.user_service_add_secret_response import UserServiceAddSecretResponse
-from zitadel_client.models.user_service_and_query import UserServiceAndQuery
-from zitadel_client.models.user_service_any import UserServiceAny
-from zitadel_client.models.user_service_auth_factor import UserServiceAuthFactor
-from zitadel_client.models.user_service_auth_factor_state import UserServiceAuthFactorState
-from zitadel_client.models.user_service_auth_factor_u2_f import UserServiceAuthFactorU2F
-from zitadel_client.models.user_service_auth_factors import UserServiceAuthFactors
-from zitadel_client.models.user_service_authentication_method_type import UserServiceAuthenticationMethodType
-from zitadel_client.models.user_service_byte_filter_method import UserServiceByteFilterMethod
-from zitadel_client.models.user_service_connect_error import UserServiceConnectError
-from zitadel_client.models.user_service_create_invite_code_request import UserServiceCreateInviteCodeRequest
-from zitadel_client.models.user_service_create_invite_code_response import UserServiceCreateInviteCodeResponse
-from zitadel_client.models.user_service_create_passkey_registration_link_request import UserServiceCreatePasskeyRegistrationLinkRequest
-from zitadel_client.models.user_service_create_passkey_registration_link_response import UserServiceCreatePasskeyRegistrationLinkResponse
-from zitadel_client.models.user_service_create_user_request import UserServiceCreateUserRequest
-from zitadel_client.models.user_service_create_user_response import UserServiceCreateUserResponse
-from zitadel_client.models.user_service_deactivate_user_request import UserServiceDeactivateUserRequest
-from zitadel_client.models.user_service_deactivate_user_response import UserServiceDeactivateUserResponse
-from zitadel_client.models.user_service_delete_user_metadata_request import UserServiceDeleteUserMetadataRequest
-from zitadel_client.models.user_service_delete_user_metadata_response import UserServiceDeleteUserMetadataResponse
-from zitadel_client.models.user_service_delete_user_request import UserServiceDeleteUserRequest
-from zitadel_client.models.user_service_delete_user_response import UserServiceDeleteUserResponse
-from zitadel_client.models.user_service_details import UserServiceDetails
-from zitadel_client.models.user_service_display_name_query import UserServiceDisplayNameQuery
-from zitadel_client.models.user_service_domain_query import UserServiceDomainQuery
-from zitadel_client.models.user_service_email_query import UserServiceEmailQuery
-from zitadel_client.models.user_service_first_name_query import UserServiceFirstNameQuery
-from zitadel_client.models.user_service_form_data import UserServiceFormData
-from zitadel_client.models.user_service_gender import UserServiceGender
-from zitadel_client.models.user_service_generate_recovery_codes_request import UserServiceGenerateRecoveryCodesRequest
-from zitadel_client.models.user_service_generate_recovery_codes_response import UserServiceGenerateRecoveryCodesResponse
-from zitadel_client.models.user_service_get_user_by_id_request import UserServiceGetUserByIDRequest
-from zitadel_client.models.user_service_get_user_by_id_response import UserServiceGetUserByIDResponse
-from zitadel_client.models.user_service_hashed_password import UserServiceHashedPassword
-from zitadel_client.models.user_service_human import UserServiceHuman
-from zitadel_client.models.user_service_human_email import UserServiceHumanEmail
-from zitadel_client.models.user_service_human_mfa_init_skipped_request import UserServiceHumanMFAInitSkippedRequest
-from zitadel_client.models.user_service_human_mfa_init_skipped_response import UserServiceHumanMFAInitSkippedResponse
-from zitadel_client.models.user_service_human_phone import UserServiceHumanPhone
-from zitadel_client.models.user_service_human_profile import UserServiceHumanProfile
-from zitadel_client.models.user_service_human_user import UserServiceHumanUser
-from zitadel_client.models.user_service_id_filter import UserServiceIDFilter
-from zitadel_client.models.user_service_idp_information import UserServiceIDPInformation
-from zitadel_client.models.user_service_idp_intent import UserServiceIDPIntent
-from zitadel_client.models.user_service_idpldap_access_information import UserServiceIDPLDAPAccessInformation
-from zitadel_client.models.user_service_idp_link import UserServiceIDPLink
-from zitadel_client.models.user_service_idpo_auth_access_information import UserServiceIDPOAuthAccessInformation
-from zitadel_client.models.user_service_idpsaml_access_information import UserServiceIDPSAMLAccessInformation
-from zitadel_client.models.user_service_in_user_emails_query import UserServiceInUserEmailsQuery
-from zitadel_client.models.user_service_in_user_id_query import UserServiceInUserIDQuery
-from zitadel_client.models.user_service_key import UserServiceKey
-from zitadel_client.models.user_service_key_field_name import UserServiceKeyFieldName
-from zitadel_client.models.user_service_keys_search_filter import UserServiceKeysSearchFilter
-from zitadel_client.models.user_service_ldap_credentials import UserServiceLDAPCredentials
-from zitadel_client.models.user_service_last_name_query import UserServiceLastNameQuery
-from zitadel_client.models.user_service_list_authentication_factors_request import UserServiceListAuthenticationFactorsRequest
-from zitadel_client.models.user_service_list_authentication_factors_response import UserServiceListAuthenticationFactorsResponse
-from zitadel_client.models.user_service_list_authentication_method_types_request import UserServiceListAuthenticationMethodTypesRequest
-from zitadel_client.models.user_service_list_authentication_method_types_response import UserServiceListAuthenticationMethodTypesResponse
-from zitadel_client.models.user_service_list_details import UserServiceListDetails
-from zitadel_client.models.user_service_list_idp_links_request import UserServiceListIDPLinksRequest
-from zitadel_client.models.user_service_list_idp_links_response import UserServiceListIDPLinksResponse
-from zitadel_client.models.user_service_list_keys_request import UserServiceListKeysRequest
-from zitadel_client.models.user_service_list_keys_response import UserServiceListKeysResponse
-from zitadel_client.models.user_service_list_passkeys_request import UserServiceListPasskeysRequest
-from zitadel_client.models.user_service_list_passkeys_response import UserServiceListPasskeysResponse
-from zitadel_client.models.user_service_list_personal_access_tokens_request import UserServiceListPersonalAccessTokensRequest
-from zitadel_client.models.user_service_list_personal_access_tokens_response import UserServiceListPersonalAccessTokensResponse
-from zitadel_client.models.user_service_list_query import UserServiceListQuery
-from zitadel_client.models.user_service_list_user_metadata_request import UserServiceListUserMetadataRequest
-from zitadel_client.models.user_service_list_user_metadata_response import UserServiceListUserMetadataResponse
-from zitadel_client.models.user_service_list_users_request import UserServiceListUsersRequest
-from zitadel_client.models.user_service_list_users_response import UserServiceListUsersResponse
-from zitadel_client.models.user_service_lock_user_request import UserServiceLockUserRequest
-from zitadel_client.models.user_service_lock_user_response import UserServiceLockUserResponse
-from zitadel_client.models.user_service_login_name_query import UserServiceLoginNameQuery
-from zitadel_client.models.user_service_machine import UserServiceMachine
-from zitadel_client.models.user_service_machine_user import UserServiceMachineUser
-from zitadel_client.models.user_service_metadata import UserServiceMetadata
-from zitadel_client.models.user_service_metadata_key_filter import UserServiceMetadataKeyFilter
-from zitadel_client.models.user_service_metadata_search_filter import UserServiceMetadataSearchFilter
-from zitadel_client.models.user_service_metadata_value_filter import UserServiceMetadataValueFilter
-from zitadel_client.models.user_service_nick_name_query import UserServiceNickNameQuery
-from zitadel_client.models.user_service_not_query import UserServiceNotQuery
-from zitadel_client.models.user_service_notification_type import UserServiceNotificationType
-from zitadel_client.models.user_service_or_query import UserServiceOrQuery
-from zitadel_client.models.user_service_organization import UserServiceOrganization
-from zitadel_client.models.user_service_organization_id_query import UserServiceOrganizationIdQuery
-from zitadel_client.models.user_service_pagination_request import UserServicePaginationRequest
-from zitadel_client.models.user_service_pagination_response import UserServicePaginationResponse
-from zitadel_client.models.user_service_passkey import UserServicePasskey
-from zitadel_client.models.user_service_passkey_authenticator import UserServicePasskeyAuthenticator
-from zitadel_client.models.user_service_passkey_registration_code import UserServicePasskeyRegistrationCode
-from zitadel_client.models.user_service_password import UserServicePassword
-from zitadel_client.models.user_service_password_reset_request import UserServicePasswordResetRequest
-from zitadel_client.models.user_service_password_reset_response import UserServicePasswordResetResponse
-from zitadel_client.models.user_service_personal_access_token import UserServicePersonalAccessToken
-from zitadel_client.models.user_service_personal_access_token_field_name import UserServicePersonalAccessTokenFieldName
-from zitadel_client.models.user_service_personal_access_tokens_search_filter import UserServicePersonalAccessTokensSearchFilter
-from zitadel_client.models.user_service_phone_query import UserServicePhoneQuery
-from zitadel_client.models.user_service_profile import UserServiceProfile
-from zitadel_client.models.user_service_reactivate_user_request import UserServiceReactivateUserRequest
-from zitadel_client.models.user_service_reactivate_user_response import UserServiceReactivateUserResponse
-from zitadel_client.models.user_service_redirect_urls import UserServiceRedirectURLs
-from zitadel_client.models.user_service_register_passkey_request import UserServiceRegisterPasskeyRequest
-from zitadel_client.models.user_service_register_passkey_response import UserServiceRegisterPasskeyResponse
-from zitadel_client.models.user_service_register_totp_request import UserServiceRegisterTOTPRequest
-from zitadel_client.models.user_service_register_totp_response import UserServiceRegisterTOTPResponse
-from zitadel_client.models.user_service_register_u2_f_request import UserServiceRegisterU2FRequest
-from zitadel_client.models.user_service_register_u2_f_response import UserServiceRegisterU2FResponse
-from zitadel_client.models.user_service_remove_idp_link_request import UserServiceRemoveIDPLinkRequest
-from zitadel_client.models.user_service_remove_idp_link_response import UserServiceRemoveIDPLinkResponse
-from zitadel_client.models.user_service_remove_key_request import UserServiceRemoveKeyRequest
-from zitadel_client.models.user_service_remove_key_response import UserServiceRemoveKeyResponse
-from zitadel_client.models.user_service_remove_otp_email_request import UserServiceRemoveOTPEmailRequest
-from zitadel_client.models.user_service_remove_otp_email_response import UserServiceRemoveOTPEmailResponse
-from zitadel_client.models.user_service_remove_otpsms_request import UserServiceRemoveOTPSMSRequest
-from zitadel_client.models.user_service_remove_otpsms_response import UserServiceRemoveOTPSMSResponse
-from zitadel_client.models.user_service_remove_passkey_request import UserServiceRemovePasskeyRequest
-from zitadel_client.models.user_service_remove_passkey_response import UserServiceRemovePasskeyResponse
-from zitadel_client.models.user_service_remove_personal_access_token_request import UserServiceRemovePersonalAccessTokenRequest
-from zitadel_client.models.user_service_remove_personal_access_token_response import UserServiceRemovePersonalAccessTokenResponse
-from zitadel_client.models.user_service_remove_phone_request import UserServiceRemovePhoneRequest
-from zitadel_client.models.user_service_remove_phone_response import UserServiceRemovePhoneResponse
-from zitadel_client.models.user_service_remove_recovery_codes_request import UserServiceRemoveRecoveryCodesRequest
-from zitadel_client.models.user_service_remove_recovery_codes_response import UserServiceRemoveRecoveryCodesResponse
-from zitadel_client.models.user_service_remove_secret_request import UserServiceRemoveSecretRequest
-from zitadel_client.models.user_service_remove_secret_response import UserServiceRemoveSecretResponse
-from zitadel_client.models.user_service_remove_totp_request import UserServiceRemoveTOTPRequest
-from zitadel_client.models.user_service_remove_totp_response import UserServiceRemoveTOTPResponse
-from zitadel_client.models.user_service_remove_u2_f_request import UserServiceRemoveU2FRequest
-from zitadel_client.models.user_service_remove_u2_f_response import UserServiceRemoveU2FResponse
-from zitadel_client.models.user_service_resend_email_code_request import UserServiceResendEmailCodeRequest
-from zitadel_client.models.user_service_resend_email_code_response import UserServiceResendEmailCodeResponse
-from zitadel_client.models.user_service_resend_invite_code_request import UserServiceResendInviteCodeRequest
-from zitadel_client.models.user_service_resend_invite_code_response import UserServiceResendInviteCodeResponse
-from zitadel_client.models.user_service_resend_phone_code_request import UserServiceResendPhoneCodeRequest
-from zitadel_client.models.user_service_resend_phone_code_response import UserServiceResendPhoneCodeResponse
-from zitadel_client.models.user_service_retrieve_identity_provider_intent_request import UserServiceRetrieveIdentityProviderIntentRequest
-from zitadel_client.models.user_service_retrieve_identity_provider_intent_response import UserServiceRetrieveIdentityProviderIntentResponse
-from zitadel_client.models.user_service_search_query import UserServiceSearchQuery
-from zitadel_client.models.user_service_send_email_code_request import UserServiceSendEmailCodeRequest
-from zitadel_client.models.user_service_send_email_code_response import UserServiceSendEmailCodeResponse
-from zitadel_client.models.user_service_send_email_verification_code import UserServiceSendEmailVerificationCode
-from zitadel_client.models.user_service_send_invite_code import UserServiceSendInviteCode
-from zitadel_client.models.user_service_send_passkey_registration_link import UserServiceSendPasskeyRegistrationLink
-from zitadel_client.models.user_service_send_password_reset_link import UserServiceSendPasswordResetLink
-from zitadel_client.models.user_service_set_email_request import UserServiceSetEmailRequest
-from zitadel_client.models.user_service_set_email_response import UserServiceSetEmailResponse
-from zitadel_client.models.user_service_set_human_email import UserServiceSetHumanEmail
-from zitadel_client.models.user_service_set_human_phone import UserServiceSetHumanPhone
-from zitadel_client.models.user_service_set_human_profile import UserServiceSetHumanProfile
-from zitadel_client.models.user_service_set_metadata_entry import UserServiceSetMetadataEntry
-from zitadel_client.models.user_service_set_password import UserServiceSetPassword
-from zitadel_client.models.user_service_set_password_request import UserServiceSetPasswordRequest
-from zitadel_client.models.user_service_set_password_response import UserServiceSetPasswordResponse
-from zitadel_client.models.user_service_set_phone_request import UserServiceSetPhoneRequest
-from zitadel_client.models.user_service_set_phone_response import UserServiceSetPhoneResponse
-from zitadel_client.models.user_service_set_user_metadata_request import UserServiceSetUserMetadataRequest
-from zitadel_client.models.user_service_set_user_metadata_response import UserServiceSetUserMetadataResponse
-from zitadel_client.models.user_service_start_identity_provider_intent_request import UserServiceStartIdentityProviderIntentRequest
-from zitadel_client.models.user_service_start_identity_provider_intent_response import UserServiceStartIdentityProviderIntentResponse
-from zitadel_client.models.user_service_state_query import UserServiceStateQuery
-from zitadel_client.models.user_service_text_filter_method import UserServiceTextFilterMethod
-from zitadel_client.models.user_service_text_query_method import UserServiceTextQueryMethod
-from zitadel_client.models.user_service_timestamp_filter import UserServiceTimestampFilter
-from zitadel_client.models.user_service_timestamp_filter_method import UserServiceTimestampFilterMethod
-from zitadel_client.models.user_service_type import UserServiceType
-from zitadel_client.models.user_service_type_query import UserServiceTypeQuery
-from zitadel_client.models.user_service_unlock_user_request import UserServiceUnlockUserRequest
-from zitadel_client.models.user_service_unlock_user_response import UserServiceUnlockUserResponse
-from zitadel_client.models.user_service_update_human_user_request import UserServiceUpdateHumanUserRequest
-from zitadel_client.models.user_service_update_human_user_response import UserServiceUpdateHumanUserResponse
-from zitadel_client.models.user_service_update_user_request import UserServiceUpdateUserRequest
-from zitadel_client.models.user_service_update_user_response import UserServiceUpdateUserResponse
-from zitadel_client.models.user_service_user import UserServiceUser
-from zitadel_client.models.user_service_user_field_name import UserServiceUserFieldName
-from zitadel_client.models.user_service_user_name_query import UserServiceUserNameQuery
-from zitadel_client.models.user_service_user_state import UserServiceUserState
-from zitadel_client.models.user_service_verify_email_request import UserServiceVerifyEmailRequest
-from zitadel_client.models.user_service_verify_email_response import UserServiceVerifyEmailResponse
-from zitadel_client.models.user_service_verify_invite_code_request import UserServiceVerifyInviteCodeRequest
-from zitadel_client.models.user_service_verify_invite_code_response import UserServiceVerifyInviteCodeResponse
-from zitadel_client.models.user_service_verify_passkey_registration_request import UserServiceVerifyPasskeyRegistrationRequest
-from zitadel_client.models.user_service_verify_passkey_registration_response import UserServiceVerifyPasskeyRegistrationResponse
-from zitadel_client.models.user_service_verify_phone_request import UserServiceVerifyPhoneRequest
-from zitadel_client.models.user_service_verify_phone_response import UserServiceVerifyPhoneResponse
-from zitadel_client.models.user_service_verify_totp_registration_request import UserServiceVerifyTOTPRegistrationRequest
-from zitadel_client.models.user_service_verify_totp_registration_response import UserServiceVerifyTOTPRegistrationResponse
-from zitadel_client.models.user_service_verify_u2_f_registration_request import UserServiceVerifyU2FRegistrationRequest
-from zitadel_client.models.user_service_verify_u2_f_registration_response import UserServiceVerifyU2FRegistrationResponse
-from zitadel_client.models.web_key_service_activate_web_key_request import WebKeyServiceActivateWebKeyRequest
-from zitadel_client.models.web_key_service_activate_web_key_response import WebKeyServiceActivateWebKeyResponse
-from zitadel_client.models.web_key_service_any import WebKeyServiceAny
-from zitadel_client.models.web_key_service_connect_error import WebKeyServiceConnectError
-from zitadel_client.models.web_key_service_create_web_key_request import WebKeyServiceCreateWebKeyRequest
-from zitadel_client.models.web_key_service_create_web_key_response import WebKeyServiceCreateWebKeyResponse
-from zitadel_client.models.web_key_service_delete_web_key_request import WebKeyServiceDeleteWebKeyRequest
-from zitadel_client.models.web_key_service_delete_web_key_response import WebKeyServiceDeleteWebKeyResponse
-from zitadel_client.models.web_key_service_ecdsa import WebKeyServiceECDSA
-from zitadel_client.models.web_key_service_ecdsa_curve import WebKeyServiceECDSACurve
-from zitadel_client.models.web_key_service_list_web_keys_response import WebKeyServiceListWebKeysResponse
-from zitadel_client.models.web_key_service_rsa import WebKeyServiceRSA
-from zitadel_client.models.web_key_service_rsa_bits import WebKeyServiceRSABits
-from zitadel_client.models.web_key_service_rsa_hasher import WebKeyServiceRSAHasher
-from zitadel_client.models.web_key_service_state import WebKeyServiceState
-from zitadel_client.models.web_key_service_web_key import WebKeyServiceWebKey
+# index of model names to the modules defining them; models are imported on first access
+_MODELS: Dict[str, str] = {
+    "ActionServiceActivatePublicKeyRequest": "action_service_activate_public_key_request",
+    "ActionServiceActivatePublicKeyResponse": "action_service_activate_public_key_response",
+    "ActionServiceAddPublicKeyRequest": "action_service_add_public_key_request",
+    "ActionServiceAddPublicKeyResponse": "action_service_add_public_key_response",
+    "ActionServiceAny": "action_service_any",
+    "ActionServiceCondition": "action_service_condition",
+    "ActionServiceConnectError": "action_service_connect_error",
+    "ActionServiceCreateTargetRequest": "action_service_create_target_request",
+    "ActionServiceCreateTargetResponse": "action_service_create_target_response",
+    "ActionServiceDeactivatePublicKeyRequest": "action_service_deactivate_public_key_request",
+    "ActionServiceDeactivatePublicKeyResponse": "action_service_deactivate_public_key_response",
+    "ActionServiceDeleteTargetRequest": "action_service_delete_target_request",
+    "ActionServiceDeleteTargetResponse": "action_service_delete_target_response",
+    "ActionServiceEventExecution": "action_service_event_execution",
+    "ActionServiceExecution": "action_service_execution",
+    "ActionServiceExecutionFieldName": "action_service_execution_field_name",
+    "ActionServiceExecutionSearchFilter": "action_service_execution_search_filter",
+    "ActionServiceExecutionType": "action_service_execution_type",
+    "ActionServiceExecutionTypeFilter": "action_service_execution_type_filter",
+    "ActionServiceFunctionExecution": "action_service_function_execution",
+    "ActionServiceGetTargetRequest": "action_service_get_target_request",
+    "ActionServiceGetTargetResponse": "action_service_get_target_response",
+    "ActionServiceInConditionsFilter": "action_service_in_conditions_filter",
+    "ActionServiceInIDsFilter": "action_service_in_ids_filter",
+    "ActionServiceInTargetIDsFilter": "action_service_in_target_ids_filter",
+    "ActionServiceListExecutionFunctionsResponse": "action_service_list_execution_functions_response",
+    "ActionServiceListExecutionMethodsResponse": "action_service_list_execution_methods_response",
+    "ActionServiceListExecutionServicesResponse": "action_service_list_execution_services_response",
+    "ActionServiceListExecutionsRequest": "action_service_list_executions_request",
+    "ActionServiceListExecutionsResponse": "action_service_list_executions_response",
+    "ActionServiceListPublicKeysRequest": "action_service_list_public_keys_request",
+    "ActionServiceListPublicKeysResponse": "action_service_list_public_keys_response",
+    "ActionServiceListTargetsRequest": "action_service_list_targets_request",
+    "ActionServiceListTargetsResponse": "action_service_list_targets_response",
+    "ActionServicePaginationRequest": "action_service_pagination_request",
+    "ActionServicePaginationResponse": "action_service_pagination_response",
+    "ActionServicePayloadType": "action_service_payload_type",
+    "ActionServicePublicKey": "action_service_public_key",
+    "ActionServicePublicKeyFieldName": "action_service_public_key_field_name",
+    "ActionServicePublicKeySearchFilter": "action_service_public_key_search_filter",
+    "ActionServiceRESTCall": "action_service_rest_call",
+    "ActionServiceRESTWebhook": "action_service_rest_webhook",
+    "ActionServiceRemovePublicKeyRequest": "action_service_remove_public_key_request",
+    "ActionServiceRemovePublicKeyResponse": "action_service_remove_public_key_response",
+    "ActionServiceRequestExecution": "action_service_request_execution",
+    "ActionServiceResponseExecution": "action_service_response_execution",
+    "ActionServiceSetExecutionRequest": "action_service_set_execution_request",
+    "ActionServiceSetExecutionResponse": "action_service_set_execution_response",
+    "ActionServiceTarget": "action_service_target",
+    "ActionServiceTargetFieldName": "action_service_target_field_name",
+    "ActionServiceTargetFilter": "action_service_target_filter",
+    "ActionServiceTargetNameFilter": "action_service_target_name_filter",
+    "ActionServiceTargetSearchFilter": "action_service_target_search_filter",
+    "ActionServiceTextFilterMethod": "action_service_text_filter_method",
+    "ActionServiceTimestampFilter": "action_service_timestamp_filter",
+    "ActionServiceTimestampFilterMethod": "action_service_timestamp_filter_method",
+    "ActionServiceUpdateTargetRequest": "action_service_update_target_request",
+    "ActionServiceUpdateTargetResponse": "action_service_update_target_response",
+    "ApplicationServiceAPIAuthMethodType": "application_service_api_auth_method_type",
+    "ApplicationServiceAPIConfiguration": "application_service_api_configuration",
+    "ApplicationServiceAny": "application_service_any",
+    "ApplicationServiceApplication": "application_service_application",
+    "ApplicationServiceApplicationKey": "application_service_application_key",
+    "ApplicationServiceApplicationKeyApplicationIDFilter": "application_service_application_key_application_id_filter",
+    "ApplicationServiceApplicationKeyOrganizationIDFilter": "application_service_application_key_organization_id_filter",
+    "ApplicationServiceApplicationKeyProjectIDFilter": "application_service_application_key_project_id_filter",
+    "ApplicationServiceApplicationKeySearchFilter": "application_service_application_key_search_filter",
+    "ApplicationServiceApplicationKeysSorting": "application_service_application_keys_sorting",
+    "ApplicationServiceApplicationNameFilter": "application_service_application_name_filter",
+    "ApplicationServiceApplicationSearchFilter": "application_service_application_search_filter",
+    "ApplicationServiceApplicationSorting": "application_service_application_sorting",
+    "ApplicationServiceApplicationState": "application_service_application_state",
+    "ApplicationServiceApplicationType": "application_service_application_type",
+    "ApplicationServiceClientIDFilter": "application_service_client_id_filter",
+    "ApplicationServiceConnectError": "application_service_connect_error",
+    "ApplicationServiceCreateAPIApplicationRequest": "application_service_create_api_application_request",
+    "ApplicationServiceCreateAPIApplicationResponse": "application_service_create_api_application_response",
+    "ApplicationServiceCreateApplicationKeyRequest": "application_service_create_application_key_request",
+    "ApplicationServiceCreateApplicationKeyResponse": "application_service_create_application_key_response",
+    "ApplicationServiceCreateApplicationRequest": "application_service_create_application_request",
+    "ApplicationServiceCreateApplicationResponse": "application_service_create_application_response",
+    "ApplicationServiceCreateOIDCApplicationRequest": "application_service_create_oidc_application_request",
+    "ApplicationServiceCreateOIDCApplicationResponse": "application_service_create_oidc_application_response",
+    "ApplicationServiceCreateSAMLApplicationRequest": "application_service_create_saml_application_request",
+    "ApplicationServiceDeactivateApplicationRequest": "application_service_deactivate_application_request",
+    "ApplicationServiceDeactivateApplicationResponse": "application_service_deactivate_application_response",
+    "ApplicationServiceDeleteApplicationKeyRequest": "application_service_delete_application_key_request",
+    "ApplicationServiceDeleteApplicationKeyResponse": "application_service_delete_application_key_response",
+    "ApplicationServiceDeleteApplicationRequest": "application_service_delete_application_request",
+    "ApplicationServiceDeleteApplicationResponse": "application_service_delete_application_response",
+    "ApplicationServiceEntityIDFilter": "application_service_entity_id_filter",
+    "ApplicationServiceGenerateClientSecretRequest": "application_service_generate_client_secret_request",
+    "ApplicationServiceGenerateClientSecretResponse": "application_service_generate_client_secret_response",
+    "ApplicationServiceGetApplicationKeyRequest": "application_service_get_application_key_request",
+    "ApplicationServiceGetApplicationKeyResponse": "application_service_get_application_key_response",
+    "ApplicationServiceGetApplicationRequest": "application_service_get_application_request",
+    "ApplicationServiceGetApplicationResponse": "application_service_get_application_response",
+    "ApplicationServiceListApplicationKeysRequest": "application_service_list_application_keys_request",
+    "ApplicationServiceListApplicationKeysResponse": "application_service_list_application_keys_response",
+    "ApplicationServiceListApplicationsRequest": "application_service_list_applications_request",
+    "ApplicationServiceListApplicationsResponse": "application_service_list_applications_response",
+    "ApplicationServiceLoginV2": "application_service_login_v2",
+    "ApplicationServiceLoginVersion": "application_service_login_version",
+    "ApplicationServiceOIDCApplicationType": "application_service_oidc_application_type",
+    "ApplicationServiceOIDCAuthMethodType": "application_service_oidc_auth_method_type",
+    "ApplicationServiceOIDCConfiguration": "application_service_oidc_configuration",
+    "ApplicationServiceOIDCGrantType": "application_service_oidc_grant_type",
+    "ApplicationServiceOIDCLocalizedMessage": "application_service_oidc_localized_message",
+    "ApplicationServiceOIDCResponseType": "application_service_oidc_response_type",
+    "ApplicationServiceOIDCTokenType": "application_service_oidc_token_type",
+    "ApplicationServiceOIDCVersion": "application_service_oidc_version",
+    "ApplicationServicePaginationRequest": "application_service_pagination_request",
+    "ApplicationServicePaginationResponse": "application_service_pagination_response",
+    "ApplicationServiceProjectIDFilter": "application_service_project_id_filter",
+    "ApplicationServiceReactivateApplicationRequest": "application_service_reactivate_application_request",
+    "ApplicationServiceReactivateApplicationResponse": "application_service_reactivate_application_response",
+    "ApplicationServiceSAMLConfiguration": "application_service_saml_configuration",
+    "ApplicationServiceTextFilterMethod": "application_service_text_filter_method",
+    "ApplicationServiceUpdateAPIApplicationConfigurationRequest": "application_service_update_api_application_configuration_request",
+    "ApplicationServiceUpdateApplicationRequest": "application_service_update_application_request",
+    "ApplicationServiceUpdateApplicationResponse": "application_service_update_application_response",
+    "ApplicationServiceUpdateOIDCApplicationConfigurationRequest": "application_service_update_oidc_application_configuration_request",
+    "ApplicationServiceUpdateSAMLApplicationConfigurationRequest": "application_service_update_saml_application_configuration_request",
+    "AuthorizationServiceActivateAuthorizationRequest": "authorization_service_activate_authorization_request",
+    "AuthorizationServiceActivateAuthorizationResponse": "authorization_service_activate_authorization_response",
+    "AuthorizationServiceAny": "authorization_service_any",
+    "AuthorizationServiceAuthorization": "authorization_service_authorization",
+    "AuthorizationServiceAuthorizationFieldName": "authorization_service_authorization_field_name",
+    "AuthorizationServiceAuthorizationsSearchFilter": "authorization_service_authorizations_search_filter",
+    "AuthorizationServiceConnectError": "authorization_service_connect_error",
+    "AuthorizationServiceCreateAuthorizationRequest": "authorization_service_create_authorization_request",
+    "AuthorizationServiceCreateAuthorizationResponse": "authorization_service_create_authorization_response",
+    "AuthorizationServiceDeactivateAuthorizationRequest": "authorization_service_deactivate_authorization_request",
+    "AuthorizationServiceDeactivateAuthorizationResponse": "authorization_service_deactivate_authorization_response",
+    "AuthorizationServiceDeleteAuthorizationRequest": "authorization_service_delete_authorization_request",
+    "AuthorizationServiceDeleteAuthorizationResponse": "authorization_service_delete_authorization_response",
+    "AuthorizationServiceIDFilter": "authorization_service_id_filter",
+    "AuthorizationServiceInIDsFilter": "authorization_service_in_ids_filter",
+    "AuthorizationServiceListAuthorizationsRequest": "authorization_service_list_authorizations_request",
+    "AuthorizationServiceListAuthorizationsResponse": "authorization_service_list_authorizations_response",
+    "AuthorizationServiceOrganization": "authorization_service_organization",
+    "AuthorizationServicePaginationRequest": "authorization_service_pagination_request",
+    "AuthorizationServicePaginationResponse": "authorization_service_pagination_response",
+    "AuthorizationServiceProject": "authorization_service_project",
+    "AuthorizationServiceProjectNameQuery": "authorization_service_project_name_query",
+    "AuthorizationServiceRole": "authorization_service_role",
+    "AuthorizationServiceRoleKeyQuery": "authorization_service_role_key_query",
+    "AuthorizationServiceState": "authorization_service_state",
+    "AuthorizationServiceStateQuery": "authorization_service_state_query",
+    "AuthorizationServiceTextFilterMethod": "authorization_service_text_filter_method",
+    "AuthorizationServiceUpdateAuthorizationRequest": "authorization_service_update_authorization_request",
+    "AuthorizationServiceUpdateAuthorizationResponse": "authorization_service_update_authorization_response",
+    "AuthorizationServiceUser": "authorization_service_user",
+    "AuthorizationServiceUserDisplayNameQuery": "authorization_service_user_display_name_query",
+    "AuthorizationServiceUserPreferredLoginNameQuery": "authorization_service_user_preferred_login_name_query",
+    "BetaActionServiceAny": "beta_action_service_any",
+    "BetaActionServiceCondition": "beta_action_service_condition",
+    "BetaActionServiceConnectError": "beta_action_service_connect_error",
+    "BetaActionServiceCreateTargetRequest": "beta_action_service_create_target_request",
+    "BetaActionServiceCreateTargetResponse": "beta_action_service_create_target_response",
+    "BetaActionServiceDeleteTargetRequest": "beta_action_service_delete_target_request",
+    "BetaActionServiceDeleteTargetResponse": "beta_action_service_delete_target_response",
+    "BetaActionServiceEventExecution": "beta_action_service_event_execution",
+    "BetaActionServiceExecution": "beta_action_service_execution",
+    "BetaActionServiceExecutionFieldName": "beta_action_service_execution_field_name",
+    "BetaActionServiceExecutionSearchFilter": "beta_action_service_execution_search_filter",
+    "BetaActionServiceExecutionType": "beta_action_service_execution_type",
+    "BetaActionServiceExecutionTypeFilter": "beta_action_service_execution_type_filter",
+    "BetaActionServiceFunctionExecution": "beta_action_service_function_execution",
+    "BetaActionServiceGetTargetRequest": "beta_action_service_get_target_request",
+    "BetaActionServiceGetTargetResponse": "beta_action_service_get_target_response",
+    "BetaActionServiceInConditionsFilter": "beta_action_service_in_conditions_filter",
+    "BetaActionServiceInTargetIDsFilter": "beta_action_service_in_target_ids_filter",
+    "BetaActionServiceListExecutionFunctionsResponse": "beta_action_service_list_execution_functions_response",
+    "BetaActionServiceListExecutionMethodsResponse": "beta_action_service_list_execution_methods_response",
+    "BetaActionServiceListExecutionServicesResponse": "beta_action_service_list_execution_services_response",
+    "BetaActionServiceListExecutionsRequest": "beta_action_service_list_executions_request",
+    "BetaActionServiceListExecutionsResponse": "beta_action_service_list_executions_response",
+    "BetaActionServiceListTargetsRequest": "beta_action_service_list_targets_request",
+    "BetaActionServiceListTargetsResponse": "beta_action_service_list_targets_response",
+    "BetaActionServicePaginationRequest": "beta_action_service_pagination_request",
+    "BetaActionServicePaginationResponse": "beta_action_service_pagination_response",
+    "BetaActionServiceRESTCall": "beta_action_service_rest_call",
+    "BetaActionServiceRESTWebhook": "beta_action_service_rest_webhook",
+    "BetaActionServiceRequestExecution": "beta_action_service_request_execution",
+    "BetaActionServiceResponseExecution": "beta_action_service_response_execution",
+    "BetaActionServiceSetExecutionRequest": "beta_action_service_set_execution_request",
+    "BetaActionServiceSetExecutionResponse": "beta_action_service_set_execution_response",
+    "BetaActionServiceTarget": "beta_action_service_target",
+    "BetaActionServiceTargetFieldName": "beta_action_service_target_field_name",
+    "BetaActionServiceTargetFilter": "beta_action_service_target_filter",
+    "BetaActionServiceTargetNameFilter": "beta_action_service_target_name_filter",
+    "BetaActionServiceTargetSearchFilter": "beta_action_service_target_search_filter",
+    "BetaActionServiceTextFilterMethod": "beta_action_service_text_filter_method",
+    "BetaActionServiceUpdateTargetRequest": "beta_action_service_update_target_request",
+    "BetaActionServiceUpdateTargetResponse": "beta_action_service_update_target_response",
+    "BetaAppServiceAPIAuthMethodType": "beta_app_service_api_auth_method_type",
+    "BetaAppServiceAPIConfig": "beta_app_service_api_config",
+    "BetaAppServiceAny": "beta_app_service_any",
+    "BetaAppServiceAppSorting": "beta_app_service_app_sorting",
+    "BetaAppServiceAppState": "beta_app_service_app_state",
+    "BetaAppServiceApplication": "beta_app_service_application",
+    "BetaAppServiceApplicationKey": "beta_app_service_application_key",
+    "BetaAppServiceApplicationKeysSorting": "beta_app_service_application_keys_sorting",
+    "BetaAppServiceApplicationNameQuery": "beta_app_service_application_name_query",
+    "BetaAppServiceApplicationSearchFilter": "beta_app_service_application_search_filter",
+    "BetaAppServiceConnectError": "beta_app_service_connect_error",
+    "BetaAppServiceCreateAPIApplicationRequest": "beta_app_service_create_api_application_request",
+    "BetaAppServiceCreateAPIApplicationResponse": "beta_app_service_create_api_application_response",
+    "BetaAppServiceCreateApplicationKeyRequest": "beta_app_service_create_application_key_request",
+    "BetaAppServiceCreateApplicationKeyResponse": "beta_app_service_create_application_key_response",
+    "BetaAppServiceCreateApplicationRequest": "beta_app_service_create_application_request",
+    "BetaAppServiceCreateApplicationResponse": "beta_app_service_create_application_response",
+    "BetaAppServiceCreateOIDCApplicationRequest": "beta_app_service_create_oidc_application_request",
+    "BetaAppServiceCreateOIDCApplicationResponse": "beta_app_service_create_oidc_application_response",
+    "BetaAppServiceCreateSAMLApplicationRequest": "beta_app_service_create_saml_application_request",
+    "BetaAppServiceDeactivateApplicationRequest": "beta_app_service_deactivate_application_request",
+    "BetaAppServiceDeactivateApplicationResponse": "beta_app_service_deactivate_application_response",
+    "BetaAppServiceDeleteApplicationKeyRequest": "beta_app_service_delete_application_key_request",
+    "BetaAppServiceDeleteApplicationKeyResponse": "beta_app_service_delete_application_key_response",
+    "BetaAppServiceDeleteApplicationRequest": "beta_app_service_delete_application_request",
+    "BetaAppServiceDeleteApplicationResponse": "beta_app_service_delete_application_response",
+    "BetaAppServiceGetApplicationKeyRequest": "beta_app_service_get_application_key_request",
+    "BetaAppServiceGetApplicationKeyResponse": "beta_app_service_get_application_key_response",
+    "BetaAppServiceGetApplicationRequest": "beta_app_service_get_application_request",
+    "BetaAppServiceGetApplicationResponse": "beta_app_service_get_application_response",
+    "BetaAppServiceListApplicationKeysRequest": "beta_app_service_list_application_keys_request",
+    "BetaAppServiceListApplicationKeysResponse": "beta_app_service_list_application_keys_response",
+    "BetaAppServiceListApplicationsRequest": "beta_app_service_list_applications_request",
+    "BetaAppServiceListApplicationsResponse": "beta_app_service_list_applications_response",
+    "BetaAppServiceLoginV2": "beta_app_service_login_v2",
+    "BetaAppServiceLoginVersion": "beta_app_service_login_version",
+    "BetaAppServiceOIDCAppType": "beta_app_service_oidc_app_type",
+    "BetaAppServiceOIDCAuthMethodType": "beta_app_service_oidc_auth_method_type",
+    "BetaAppServiceOIDCConfig": "beta_app_service_oidc_config",
+    "BetaAppServiceOIDCGrantType": "beta_app_service_oidc_grant_type",
+    "BetaAppServiceOIDCLocalizedMessage": "beta_app_service_oidc_localized_message",
+    "BetaAppServiceOIDCResponseType": "beta_app_service_oidc_response_type",
+    "BetaAppServiceOIDCTokenType": "beta_app_service_oidc_token_type",
+    "BetaAppServiceOIDCVersion": "beta_app_service_oidc_version",
+    "BetaAppServicePaginationRequest": "beta_app_service_pagination_request",
+    "BetaAppServicePaginationResponse": "beta_app_service_pagination_response",
+    "BetaAppServiceReactivateApplicationRequest": "beta_app_service_reactivate_application_request",
+    "BetaAppServiceReactivateApplicationResponse": "beta_app_service_reactivate_application_response",
+    "BetaAppServiceRegenerateClientSecretRequest": "beta_app_service_regenerate_client_secret_request",
+    "BetaAppServiceRegenerateClientSecretResponse": "beta_app_service_regenerate_client_secret_response",
+    "BetaAppServiceSAMLConfig": "beta_app_service_saml_config",
+    "BetaAppServiceTextFilterMethod": "beta_app_service_text_filter_method",
+    "BetaAppServiceUpdateAPIApplicationConfigurationRequest": "beta_app_service_update_api_application_configuration_request",
+    "BetaAppServiceUpdateApplicationRequest": "beta_app_service_update_application_request",
+    "BetaAppServiceUpdateApplicationResponse": "beta_app_service_update_application_response",
+    "BetaAppServiceUpdateOIDCApplicationConfigurationRequest": "beta_app_service_update_oidc_application_configuration_request",
+    "BetaAppServiceUpdateSAMLApplicationConfigurationRequest": "beta_app_service_update_saml_application_configuration_request",
+    "BetaAuthorizationServiceActivateAuthorizationRequest": "beta_authorization_service_activate_authorization_request",
+    "BetaAuthorizationServiceActivateAuthorizationResponse": "beta_authorization_service_activate_authorization_response",
+    "BetaAuthorizationServiceAny": "beta_authorization_service_any",
+    "BetaAuthorizationServiceAuthorization": "beta_authorization_service_authorization",
+    "BetaAuthorizationServiceAuthorizationFieldName": "beta_authorization_service_authorization_field_name",
+    "BetaAuthorizationServiceAuthorizationsSearchFilter": "beta_authorization_service_authorizations_search_filter",
+    "BetaAuthorizationServiceConnectError": "beta_authorization_service_connect_error",
+    "BetaAuthorizationServiceCreateAuthorizationRequest": "beta_authorization_service_create_authorization_request",
+    "BetaAuthorizationServiceCreateAuthorizationResponse": "beta_authorization_service_create_authorization_response",
+    "BetaAuthorizationServiceDeactivateAuthorizationRequest": "beta_authorization_service_deactivate_authorization_request",
+    "BetaAuthorizationServiceDeactivateAuthorizationResponse": "beta_authorization_service_deactivate_authorization_response",
+    "BetaAuthorizationServiceDeleteAuthorizationRequest": "beta_authorization_service_delete_authorization_request",
+    "BetaAuthorizationServiceDeleteAuthorizationResponse": "beta_authorization_service_delete_authorization_response",
+    "BetaAuthorizationServiceIDFilter": "beta_authorization_service_id_filter",
+    "BetaAuthorizationServiceInIDsFilter": "beta_authorization_service_in_ids_filter",
+    "BetaAuthorizationServiceListAuthorizationsRequest": "beta_authorization_service_list_authorizations_request",
+    "BetaAuthorizationServiceListAuthorizationsResponse": "beta_authorization_service_list_authorizations_response",
+    "BetaAuthorizationServicePaginationRequest": "beta_authorization_service_pagination_request",
+    "BetaAuthorizationServicePaginationResponse": "beta_authorization_service_pagination_response",
+    "BetaAuthorizationServiceProjectNameQuery": "beta_authorization_service_project_name_query",
+    "BetaAuthorizationServiceRoleKeyQuery": "beta_authorization_service_role_key_query",
+    "BetaAuthorizationServiceState": "beta_authorization_service_state",
+    "BetaAuthorizationServiceStateQuery": "beta_authorization_service_state_query",
+    "BetaAuthorizationServiceTextFilterMethod": "beta_authorization_service_text_filter_method",
+    "BetaAuthorizationServiceUpdateAuthorizationRequest": "beta_authorization_service_update_authorization_request",
+    "BetaAuthorizationServiceUpdateAuthorizationResponse": "beta_authorization_service_update_authorization_response",
+    "BetaAuthorizationServiceUser": "beta_authorization_service_user",
+    "BetaAuthorizationServiceUserDisplayNameQuery": "beta_authorization_service_user_display_name_query",
+    "BetaAuthorizationServiceUserPreferredLoginNameQuery": "beta_authorization_service_user_preferred_login_name_query",
+    "BetaFeatureServiceAny": "beta_feature_service_any",
+    "BetaFeatureServiceConnectError": "beta_feature_service_connect_error",
+    "BetaFeatureServiceDetails": "beta_feature_service_details",
+    "BetaFeatureServiceFeatureFlag": "beta_feature_service_feature_flag",
+    "BetaFeatureServiceGetInstanceFeaturesRequest": "beta_feature_service_get_instance_features_request",
+    "BetaFeatureServiceGetInstanceFeaturesResponse": "beta_feature_service_get_instance_features_response",
+    "BetaFeatureServiceGetOrganizationFeaturesRequest": "beta_feature_service_get_organization_features_request",
+    "BetaFeatureServiceGetOrganizationFeaturesResponse": "beta_feature_service_get_organization_features_response",
+    "BetaFeatureServiceGetSystemFeaturesResponse": "beta_feature_service_get_system_features_response",
+    "BetaFeatureServiceGetUserFeaturesRequest": "beta_feature_service_get_user_features_request",
+    "BetaFeatureServiceGetUserFeaturesResponse": "beta_feature_service_get_user_features_response",
+    "BetaFeatureServiceImprovedPerformance": "beta_feature_service_improved_performance",
+    "BetaFeatureServiceImprovedPerformanceFeatureFlag": "beta_feature_service_improved_performance_feature_flag",
+    "BetaFeatureServiceResetInstanceFeaturesResponse": "beta_feature_service_reset_instance_features_response",
+    "BetaFeatureServiceResetOrganizationFeaturesRequest": "beta_feature_service_reset_organization_features_request",
+    "BetaFeatureServiceResetOrganizationFeaturesResponse": "beta_feature_service_reset_organization_features_response",
+    "BetaFeatureServiceResetSystemFeaturesResponse": "beta_feature_service_reset_system_features_response",
+    "BetaFeatureServiceResetUserFeaturesRequest": "beta_feature_service_reset_user_features_request",
+    "BetaFeatureServiceResetUserFeaturesResponse": "beta_feature_service_reset_user_features_response",
+    "BetaFeatureServiceSetInstanceFeaturesRequest": "beta_feature_service_set_instance_features_request",
+    "BetaFeatureServiceSetInstanceFeaturesResponse": "beta_feature_service_set_instance_features_response",
+    "BetaFeatureServiceSetOrganizationFeaturesRequest": "beta_feature_service_set_organization_features_request",
+    "BetaFeatureServiceSetOrganizationFeaturesResponse": "beta_feature_service_set_organization_features_response",
+    "BetaFeatureServiceSetSystemFeaturesRequest": "beta_feature_service_set_system_features_request",
+    "BetaFeatureServiceSetSystemFeaturesResponse": "beta_feature_service_set_system_features_response",
+    "BetaFeatureServiceSetUserFeatureRequest": "beta_feature_service_set_user_feature_request",
+    "BetaFeatureServiceSetUserFeaturesResponse": "beta_feature_service_set_user_features_response",
+    "BetaFeatureServiceSource": "beta_feature_service_source",
+    "BetaInstanceServiceAddCustomDomainRequest": "beta_instance_service_add_custom_domain_request",
+    "BetaInstanceServiceAddCustomDomainResponse": "beta_instance_service_add_custom_domain_response",
+    "BetaInstanceServiceAddTrustedDomainRequest": "beta_instance_service_add_trusted_domain_request",
+    "BetaInstanceServiceAddTrustedDomainResponse": "beta_instance_service_add_trusted_domain_response",
+    "BetaInstanceServiceAny": "beta_instance_service_any",
+    "BetaInstanceServiceConnectError": "beta_instance_service_connect_error",
+    "BetaInstanceServiceDeleteInstanceRequest": "beta_instance_service_delete_instance_request",
+    "BetaInstanceServiceDeleteInstanceResponse": "beta_instance_service_delete_instance_response",
+    "BetaInstanceServiceDomain": "beta_instance_service_domain",
+    "BetaInstanceServiceDomainFieldName": "beta_instance_service_domain_field_name",
+    "BetaInstanceServiceDomainGeneratedQuery": "beta_instance_service_domain_generated_query",
+    "BetaInstanceServiceDomainPrimaryQuery": "beta_instance_service_domain_primary_query",
+    "BetaInstanceServiceDomainQuery": "beta_instance_service_domain_query",
+    "BetaInstanceServiceDomainSearchQuery": "beta_instance_service_domain_search_query",
+    "BetaInstanceServiceDomainsQuery": "beta_instance_service_domains_query",
+    "BetaInstanceServiceFieldName": "beta_instance_service_field_name",
+    "BetaInstanceServiceGetInstanceRequest": "beta_instance_service_get_instance_request",
+    "BetaInstanceServiceGetInstanceResponse": "beta_instance_service_get_instance_response",
+    "BetaInstanceServiceIdsQuery": "beta_instance_service_ids_query",
+    "BetaInstanceServiceInstance": "beta_instance_service_instance",
+    "BetaInstanceServiceListCustomDomainsRequest": "beta_instance_service_list_custom_domains_request",
+    "BetaInstanceServiceListCustomDomainsResponse": "beta_instance_service_list_custom_domains_response",
+    "BetaInstanceServiceListInstancesRequest": "beta_instance_service_list_instances_request",
+    "BetaInstanceServiceListInstancesResponse": "beta_instance_service_list_instances_response",
+    "BetaInstanceServiceListTrustedDomainsRequest": "beta_instance_service_list_trusted_domains_request",
+    "BetaInstanceServiceListTrustedDomainsResponse": "beta_instance_service_list_trusted_domains_response",
+    "BetaInstanceServicePaginationRequest": "beta_instance_service_pagination_request",
+    "BetaInstanceServicePaginationResponse": "beta_instance_service_pagination_response",
+    "BetaInstanceServiceQuery": "beta_instance_service_query",
+    "BetaInstanceServiceRemoveCustomDomainRequest": "beta_instance_service_remove_custom_domain_request",
+    "BetaInstanceServiceRemoveCustomDomainResponse": "beta_instance_service_remove_custom_domain_response",
+    "BetaInstanceServiceRemoveTrustedDomainRequest": "beta_instance_service_remove_trusted_domain_request",
+    "BetaInstanceServiceRemoveTrustedDomainResponse": "beta_instance_service_remove_trusted_domain_response",
+    "BetaInstanceServiceState": "beta_instance_service_state",
+    "BetaInstanceServiceTextQueryMethod": "beta_instance_service_text_query_method",
+    "BetaInstanceServiceTrustedDomain": "beta_instance_service_trusted_domain",
+    "BetaInstanceServiceTrustedDomainFieldName": "beta_instance_service_trusted_domain_field_name",
+    "BetaInstanceServiceTrustedDomainSearchQuery": "beta_instance_service_trusted_domain_search_query",
+    "BetaInstanceServiceUpdateInstanceRequest": "beta_instance_service_update_instance_request",
+    "BetaInstanceServiceUpdateInstanceResponse": "beta_instance_service_update_instance_response",
+    "BetaInternalPermissionServiceAdministrator": "beta_internal_permission_service_administrator",
+    "BetaInternalPermissionServiceAdministratorFieldName": "beta_internal_permission_service_administrator_field_name",
+    "BetaInternalPermissionServiceAdministratorSearchFilter": "beta_internal_permission_service_administrator_search_filter",
+    "BetaInternalPermissionServiceAndFilter": "beta_internal_permission_service_and_filter",
+    "BetaInternalPermissionServiceAny": "beta_internal_permission_service_any",
+    "BetaInternalPermissionServiceConnectError": "beta_internal_permission_service_connect_error",
+    "BetaInternalPermissionServiceCreateAdministratorRequest": "beta_internal_permission_service_create_administrator_request",
+    "BetaInternalPermissionServiceCreateAdministratorResponse": "beta_internal_permission_service_create_administrator_response",
+    "BetaInternalPermissionServiceDeleteAdministratorRequest": "beta_internal_permission_service_delete_administrator_request",
+    "BetaInternalPermissionServiceDeleteAdministratorResponse": "beta_internal_permission_service_delete_administrator_response",
+    "BetaInternalPermissionServiceIDFilter": "beta_internal_permission_service_id_filter",
+    "BetaInternalPermissionServiceInIDsFilter": "beta_internal_permission_service_in_ids_filter",
+    "BetaInternalPermissionServiceListAdministratorsRequest": "beta_internal_permission_service_list_administrators_request",
+    "BetaInternalPermissionServiceListAdministratorsResponse": "beta_internal_permission_service_list_administrators_response",
+    "BetaInternalPermissionServiceNotFilter": "beta_internal_permission_service_not_filter",
+    "BetaInternalPermissionServiceOrFilter": "beta_internal_permission_service_or_filter",
+    "BetaInternalPermissionServiceOrganization": "beta_internal_permission_service_organization",
+    "BetaInternalPermissionServicePaginationRequest": "beta_internal_permission_service_pagination_request",
+    "BetaInternalPermissionServicePaginationResponse": "beta_internal_permission_service_pagination_response",
+    "BetaInternalPermissionServiceProject": "beta_internal_permission_service_project",
+    "BetaInternalPermissionServiceProjectGrant": "beta_internal_permission_service_project_grant",
+    "BetaInternalPermissionServiceResourceFilter": "beta_internal_permission_service_resource_filter",
+    "BetaInternalPermissionServiceResourceType": "beta_internal_permission_service_resource_type",
+    "BetaInternalPermissionServiceRoleFilter": "beta_internal_permission_service_role_filter",
+    "BetaInternalPermissionServiceTextFilterMethod": "beta_internal_permission_service_text_filter_method",
+    "BetaInternalPermissionServiceTimestampFilter": "beta_internal_permission_service_timestamp_filter",
+    "BetaInternalPermissionServiceTimestampFilterMethod": "beta_internal_permission_service_timestamp_filter_method",
+    "BetaInternalPermissionServiceUpdateAdministratorRequest": "beta_internal_permission_service_update_administrator_request",
+    "BetaInternalPermissionServiceUpdateAdministratorResponse": "beta_internal_permission_service_update_administrator_response",
+    "BetaInternalPermissionServiceUser": "beta_internal_permission_service_user",
+    "BetaInternalPermissionServiceUserDisplayNameFilter": "beta_internal_permission_service_user_display_name_filter",
+    "BetaInternalPermissionServiceUserPreferredLoginNameFilter": "beta_internal_permission_service_user_preferred_login_name_filter",
+    "BetaOIDCServiceAny": "beta_oidc_service_any",
+    "BetaOIDCServiceAuthRequest": "beta_oidc_service_auth_request",
+    "BetaOIDCServiceAuthorizationError": "beta_oidc_service_authorization_error",
+    "BetaOIDCServiceConnectError": "beta_oidc_service_connect_error",
+    "BetaOIDCServiceCreateCallbackRequest": "beta_oidc_service_create_callback_request",
+    "BetaOIDCServiceCreateCallbackResponse": "beta_oidc_service_create_callback_response",
+    "BetaOIDCServiceDetails": "beta_oidc_service_details",
+    "BetaOIDCServiceErrorReason": "beta_oidc_service_error_reason",
+    "BetaOIDCServiceGetAuthRequestRequest": "beta_oidc_service_get_auth_request_request",
+    "BetaOIDCServiceGetAuthRequestResponse": "beta_oidc_service_get_auth_request_response",
+    "BetaOIDCServicePrompt": "beta_oidc_service_prompt",
+    "BetaOIDCServiceSession": "beta_oidc_service_session",
+    "BetaOrganizationServiceActivateOrganizationRequest": "beta_organization_service_activate_organization_request",
+    "BetaOrganizationServiceActivateOrganizationResponse": "beta_organization_service_activate_organization_response",
+    "BetaOrganizationServiceAddHumanUserRequest": "beta_organization_service_add_human_user_request",
+    "BetaOrganizationServiceAddOrganizationDomainRequest": "beta_organization_service_add_organization_domain_request",
+    "BetaOrganizationServiceAddOrganizationDomainResponse": "beta_organization_service_add_organization_domain_response",
+    "BetaOrganizationServiceAdmin": "beta_organization_service_admin",
+    "BetaOrganizationServiceAny": "beta_organization_service_any",
+    "BetaOrganizationServiceAssignedAdmin": "beta_organization_service_assigned_admin",
+    "BetaOrganizationServiceConnectError": "beta_organization_service_connect_error",
+    "BetaOrganizationServiceCreateOrganizationRequest": "beta_organization_service_create_organization_request",
+    "BetaOrganizationServiceCreateOrganizationResponse": "beta_organization_service_create_organization_response",
+    "BetaOrganizationServiceCreatedAdmin": "beta_organization_service_created_admin",
+    "BetaOrganizationServiceDeactivateOrganizationRequest": "beta_organization_service_deactivate_organization_request",
+    "BetaOrganizationServiceDeactivateOrganizationResponse": "beta_organization_service_deactivate_organization_response",
+    "BetaOrganizationServiceDeleteOrganizationDomainRequest": "beta_organization_service_delete_organization_domain_request",
+    "BetaOrganizationServiceDeleteOrganizationDomainResponse": "beta_organization_service_delete_organization_domain_response",
+    "BetaOrganizationServiceDeleteOrganizationMetadataRequest": "beta_organization_service_delete_organization_metadata_request",
+    "BetaOrganizationServiceDeleteOrganizationMetadataResponse": "beta_organization_service_delete_organization_metadata_response",
+    "BetaOrganizationServiceDeleteOrganizationRequest": "beta_organization_service_delete_organization_request",
+    "BetaOrganizationServiceDeleteOrganizationResponse": "beta_organization_service_delete_organization_response",
+    "BetaOrganizationServiceDomain": "beta_organization_service_domain",
+    "BetaOrganizationServiceDomainNameFilter": "beta_organization_service_domain_name_filter",
+    "BetaOrganizationServiceDomainSearchFilter": "beta_organization_service_domain_search_filter",
+    "BetaOrganizationServiceDomainValidationType": "beta_organization_service_domain_validation_type",
+    "BetaOrganizationServiceGender": "beta_organization_service_gender",
+    "BetaOrganizationServiceGenerateOrganizationDomainValidationRequest": "beta_organization_service_generate_organization_domain_validation_request",
+    "BetaOrganizationServiceGenerateOrganizationDomainValidationResponse": "beta_organization_service_generate_organization_domain_validation_response",
+    "BetaOrganizationServiceHashedPassword": "beta_organization_service_hashed_password",
+    "BetaOrganizationServiceIDPLink": "beta_organization_service_idp_link",
+    "BetaOrganizationServiceListOrganizationDomainsRequest": "beta_organization_service_list_organization_domains_request",
+    "BetaOrganizationServiceListOrganizationDomainsResponse": "beta_organization_service_list_organization_domains_response",
+    "BetaOrganizationServiceListOrganizationMetadataRequest": "beta_organization_service_list_organization_metadata_request",
+    "BetaOrganizationServiceListOrganizationMetadataResponse": "beta_organization_service_list_organization_metadata_response",
+    "BetaOrganizationServiceListOrganizationsRequest": "beta_organization_service_list_organizations_request",
+    "BetaOrganizationServiceListOrganizationsResponse": "beta_organization_service_list_organizations_response",
+    "BetaOrganizationServiceMetadata": "beta_organization_service_metadata",
+    "BetaOrganizationServiceMetadataKeyQuery": "beta_organization_service_metadata_key_query",
+    "BetaOrganizationServiceMetadataQuery": "beta_organization_service_metadata_query",
+    "BetaOrganizationServiceOrgDomainFilter": "beta_organization_service_org_domain_filter",
+    "BetaOrganizationServiceOrgFieldName": "beta_organization_service_org_field_name",
+    "BetaOrganizationServiceOrgIDFilter": "beta_organization_service_org_id_filter",
+    "BetaOrganizationServiceOrgNameFilter": "beta_organization_service_org_name_filter",
+    "BetaOrganizationServiceOrgState": "beta_organization_service_org_state",
+    "BetaOrganizationServiceOrgStateFilter": "beta_organization_service_org_state_filter",
+    "BetaOrganizationServiceOrganization": "beta_organization_service_organization",
+    "BetaOrganizationServiceOrganizationAdmin": "beta_organization_service_organization_admin",
+    "BetaOrganizationServiceOrganizationSearchFilter": "beta_organization_service_organization_search_filter",
+    "BetaOrganizationServicePaginationRequest": "beta_organization_service_pagination_request",
+    "BetaOrganizationServicePaginationResponse": "beta_organization_service_pagination_response",
+    "BetaOrganizationServicePassword": "beta_organization_service_password",
+    "BetaOrganizationServiceSendEmailVerificationCode": "beta_organization_service_send_email_verification_code",
+    "BetaOrganizationServiceSetHumanEmail": "beta_organization_service_set_human_email",
+    "BetaOrganizationServiceSetHumanPhone": "beta_organization_service_set_human_phone",
+    "BetaOrganizationServiceSetHumanProfile": "beta_organization_service_set_human_profile",
+    "BetaOrganizationServiceSetMetadataEntry": "beta_organization_service_set_metadata_entry",
+    "BetaOrganizationServiceSetOrganizationMetadataRequest": "beta_organization_service_set_organization_metadata_request",
+    "BetaOrganizationServiceSetOrganizationMetadataResponse": "beta_organization_service_set_organization_metadata_response",
+    "BetaOrganizationServiceTextQueryMethod": "beta_organization_service_text_query_method",
+    "BetaOrganizationServiceUpdateOrganizationRequest": "beta_organization_service_update_organization_request",
+    "BetaOrganizationServiceUpdateOrganizationResponse": "beta_organization_service_update_organization_response",
+    "BetaOrganizationServiceVerifyOrganizationDomainRequest": "beta_organization_service_verify_organization_domain_request",
+    "BetaOrganizationServiceVerifyOrganizationDomainResponse": "beta_organization_service_verify_organization_domain_response",
+    "BetaProjectServiceActivateProjectGrantRequest": "beta_project_service_activate_project_grant_request",
+    "BetaProjectServiceActivateProjectGrantResponse": "beta_project_service_activate_project_grant_response",
+    "BetaProjectServiceActivateProjectRequest": "beta_project_service_activate_project_request",
+    "BetaProjectServiceActivateProjectResponse": "beta_project_service_activate_project_response",
+    "BetaProjectServiceAddProjectRoleRequest": "beta_project_service_add_project_role_request",
+    "BetaProjectServiceAddProjectRoleResponse": "beta_project_service_add_project_role_response",
+    "BetaProjectServiceAdmin": "beta_project_service_admin",
+    "BetaProjectServiceAny": "beta_project_service_any",
+    "BetaProjectServiceConnectError": "beta_project_service_connect_error",
+    "BetaProjectServiceCreateProjectGrantRequest": "beta_project_service_create_project_grant_request",
+    "BetaProjectServiceCreateProjectGrantResponse": "beta_project_service_create_project_grant_response",
+    "BetaProjectServiceCreateProjectRequest": "beta_project_service_create_project_request",
+    "BetaProjectServiceCreateProjectResponse": "beta_project_service_create_project_response",
+    "BetaProjectServiceDeactivateProjectGrantRequest": "beta_project_service_deactivate_project_grant_request",
+    "BetaProjectServiceDeactivateProjectGrantResponse": "beta_project_service_deactivate_project_grant_response",
+    "BetaProjectServiceDeactivateProjectRequest": "beta_project_service_deactivate_project_request",
+    "BetaProjectServiceDeactivateProjectResponse": "beta_project_service_deactivate_project_response",
+    "BetaProjectServiceDeleteProjectGrantRequest": "beta_project_service_delete_project_grant_request",
+    "BetaProjectServiceDeleteProjectGrantResponse": "beta_project_service_delete_project_grant_response",
+    "BetaProjectServiceDeleteProjectRequest": "beta_project_service_delete_project_request",
+    "BetaProjectServiceDeleteProjectResponse": "beta_project_service_delete_project_response",
+    "BetaProjectServiceGetProjectRequest": "beta_project_service_get_project_request",
+    "BetaProjectServiceGetProjectResponse": "beta_project_service_get_project_response",
+    "BetaProjectServiceGrantedProjectState": "beta_project_service_granted_project_state",
+    "BetaProjectServiceIDFilter": "beta_project_service_id_filter",
+    "BetaProjectServiceInIDsFilter": "beta_project_service_in_ids_filter",
+    "BetaProjectServiceListProjectGrantsRequest": "beta_project_service_list_project_grants_request",
+    "BetaProjectServiceListProjectGrantsResponse": "beta_project_service_list_project_grants_response",
+    "BetaProjectServiceListProjectRolesRequest": "beta_project_service_list_project_roles_request",
+    "BetaProjectServiceListProjectRolesResponse": "beta_project_service_list_project_roles_response",
+    "BetaProjectServiceListProjectsRequest": "beta_project_service_list_projects_request",
+    "BetaProjectServiceListProjectsResponse": "beta_project_service_list_projects_response",
+    "BetaProjectServicePaginationRequest": "beta_project_service_pagination_request",
+    "BetaProjectServicePaginationResponse": "beta_project_service_pagination_response",
+    "BetaProjectServicePrivateLabelingSetting": "beta_project_service_private_labeling_setting",
+    "BetaProjectServiceProject": "beta_project_service_project",
+    "BetaProjectServiceProjectFieldName": "beta_project_service_project_field_name",
+    "BetaProjectServiceProjectGrant": "beta_project_service_project_grant",
+    "BetaProjectServiceProjectGrantFieldName": "beta_project_service_project_grant_field_name",
+    "BetaProjectServiceProjectGrantSearchFilter": "beta_project_service_project_grant_search_filter",
+    "BetaProjectServiceProjectGrantState": "beta_project_service_project_grant_state",
+    "BetaProjectServiceProjectNameFilter": "beta_project_service_project_name_filter",
+    "BetaProjectServiceProjectRole": "beta_project_service_project_role",
+    "BetaProjectServiceProjectRoleDisplayNameFilter": "beta_project_service_project_role_display_name_filter",
+    "BetaProjectServiceProjectRoleFieldName": "beta_project_service_project_role_field_name",
+    "BetaProjectServiceProjectRoleKeyFilter": "beta_project_service_project_role_key_filter",
+    "BetaProjectServiceProjectRoleSearchFilter": "beta_project_service_project_role_search_filter",
+    "BetaProjectServiceProjectSearchFilter": "beta_project_service_project_search_filter",
+    "BetaProjectServiceProjectState": "beta_project_service_project_state",
+    "BetaProjectServiceRemoveProjectRoleRequest": "beta_project_service_remove_project_role_request",
+    "BetaProjectServiceRemoveProjectRoleResponse": "beta_project_service_remove_project_role_response",
+    "BetaProjectServiceTextFilterMethod": "beta_project_service_text_filter_method",
+    "BetaProjectServiceUpdateProjectGrantRequest": "beta_project_service_update_project_grant_request",
+    "BetaProjectServiceUpdateProjectGrantResponse": "beta_project_service_update_project_grant_response",
+    "BetaProjectServiceUpdateProjectRequest": "beta_project_service_update_project_request",
+    "BetaProjectServiceUpdateProjectResponse": "beta_project_service_update_project_response",
+    "BetaProjectServiceUpdateProjectRoleRequest": "beta_project_service_update_project_role_request",
+    "BetaProjectServiceUpdateProjectRoleResponse": "beta_project_service_update_project_role_response",
+    "BetaSessionServiceAny": "beta_session_service_any",
+    "BetaSessionServiceChallenges": "beta_session_service_challenges",
+    "BetaSessionServiceCheckIDPIntent": "beta_session_service_check_idp_intent",
+    "BetaSessionServiceCheckOTP": "beta_session_service_check_otp",
+    "BetaSessionServiceCheckPassword": "beta_session_service_check_password",
+    "BetaSessionServiceCheckTOTP": "beta_session_service_check_totp",
+    "BetaSessionServiceCheckUser": "beta_session_service_check_user",
+    "BetaSessionServiceCheckWebAuthN": "beta_session_service_check_web_auth_n",
+    "BetaSessionServiceChecks": "beta_session_service_checks",
+    "BetaSessionServiceConnectError": "beta_session_service_connect_error",
+    "BetaSessionServiceCreateSessionRequest": "beta_session_service_create_session_request",
+    "BetaSessionServiceCreateSessionResponse": "beta_session_service_create_session_response",
+    "BetaSessionServiceCreationDateQuery": "beta_session_service_creation_date_query",
+    "BetaSessionServiceDeleteSessionRequest": "beta_session_service_delete_session_request",
+    "BetaSessionServiceDeleteSessionResponse": "beta_session_service_delete_session_response",
+    "BetaSessionServiceDetails": "beta_session_service_details",
+    "BetaSessionServiceFactors": "beta_session_service_factors",
+    "BetaSessionServiceGetSessionRequest": "beta_session_service_get_session_request",
+    "BetaSessionServiceGetSessionResponse": "beta_session_service_get_session_response",
+    "BetaSessionServiceHeaderValues": "beta_session_service_header_values",
+    "BetaSessionServiceIDsQuery": "beta_session_service_ids_query",
+    "BetaSessionServiceIntentFactor": "beta_session_service_intent_factor",
+    "BetaSessionServiceListDetails": "beta_session_service_list_details",
+    "BetaSessionServiceListQuery": "beta_session_service_list_query",
+    "BetaSessionServiceListSessionsRequest": "beta_session_service_list_sessions_request",
+    "BetaSessionServiceListSessionsResponse": "beta_session_service_list_sessions_response",
+    "BetaSessionServiceOTPEmail": "beta_session_service_otp_email",
+    "BetaSessionServiceOTPFactor": "beta_session_service_otp_factor",
+    "BetaSessionServiceOTPSMS": "beta_session_service_otpsms",
+    "BetaSessionServicePasswordFactor": "beta_session_service_password_factor",
+    "BetaSessionServiceRequestChallenges": "beta_session_service_request_challenges",
+    "BetaSessionServiceSearchQuery": "beta_session_service_search_query",
+    "BetaSessionServiceSendCode": "beta_session_service_send_code",
+    "BetaSessionServiceSession": "beta_session_service_session",
+    "BetaSessionServiceSessionFieldName": "beta_session_service_session_field_name",
+    "BetaSessionServiceSetSessionRequest": "beta_session_service_set_session_request",
+    "BetaSessionServiceSetSessionResponse": "beta_session_service_set_session_response",
+    "BetaSessionServiceTOTPFactor": "beta_session_service_totp_factor",
+    "BetaSessionServiceTimestampQueryMethod": "beta_session_service_timestamp_query_method",
+    "BetaSessionServiceUserAgent": "beta_session_service_user_agent",
+    "BetaSessionServiceUserFactor": "beta_session_service_user_factor",
+    "BetaSessionServiceUserIDQuery": "beta_session_service_user_id_query",
+    "BetaSessionServiceUserVerificationRequirement": "beta_session_service_user_verification_requirement",
+    "BetaSessionServiceWebAuthN": "beta_session_service_web_auth_n",
+    "BetaSessionServiceWebAuthNFactor": "beta_session_service_web_auth_n_factor",
+    "BetaSettingsServiceAny": "beta_settings_service_any",
+    "BetaSettingsServiceBrandingSettings": "beta_settings_service_branding_settings",
+    "BetaSettingsServiceConnectError": "beta_settings_service_connect_error",
+    "BetaSettingsServiceDetails": "beta_settings_service_details",
+    "BetaSettingsServiceDomainSettings": "beta_settings_service_domain_settings",
+    "BetaSettingsServiceEmbeddedIframeSettings": "beta_settings_service_embedded_iframe_settings",
+    "BetaSettingsServiceGetActiveIdentityProvidersRequest": "beta_settings_service_get_active_identity_providers_request",
+    "BetaSettingsServiceGetActiveIdentityProvidersResponse": "beta_settings_service_get_active_identity_providers_response",
+    "BetaSettingsServiceGetBrandingSettingsRequest": "beta_settings_service_get_branding_settings_request",
+    "BetaSettingsServiceGetBrandingSettingsResponse": "beta_settings_service_get_branding_settings_response",
+    "BetaSettingsServiceGetDomainSettingsRequest": "beta_settings_service_get_domain_settings_request",
+    "BetaSettingsServiceGetDomainSettingsResponse": "beta_settings_service_get_domain_settings_response",
+    "BetaSettingsServiceGetGeneralSettingsResponse": "beta_settings_service_get_general_settings_response",
+    "BetaSettingsServiceGetLegalAndSupportSettingsRequest": "beta_settings_service_get_legal_and_support_settings_request",
+    "BetaSettingsServiceGetLegalAndSupportSettingsResponse": "beta_settings_service_get_legal_and_support_settings_response",
+    "BetaSettingsServiceGetLockoutSettingsRequest": "beta_settings_service_get_lockout_settings_request",
+    "BetaSettingsServiceGetLockoutSettingsResponse": "beta_settings_service_get_lockout_settings_response",
+    "BetaSettingsServiceGetLoginSettingsRequest": "beta_settings_service_get_login_settings_request",
+    "BetaSettingsServiceGetLoginSettingsResponse": "beta_settings_service_get_login_settings_response",
+    "BetaSettingsServiceGetPasswordComplexitySettingsRequest": "beta_settings_service_get_password_complexity_settings_request",
+    "BetaSettingsServiceGetPasswordComplexitySettingsResponse": "beta_settings_service_get_password_complexity_settings_response",
+    "BetaSettingsServiceGetPasswordExpirySettingsRequest": "beta_settings_service_get_password_expiry_settings_request",
+    "BetaSettingsServiceGetPasswordExpirySettingsResponse": "beta_settings_service_get_password_expiry_settings_response",
+    "BetaSettingsServiceGetSecuritySettingsResponse": "beta_settings_service_get_security_settings_response",
+    "BetaSettingsServiceIdentityProvider": "beta_settings_service_identity_provider",
+    "BetaSettingsServiceIdentityProviderType": "beta_settings_service_identity_provider_type",
+    "BetaSettingsServiceLegalAndSupportSettings": "beta_settings_service_legal_and_support_settings",
+    "BetaSettingsServiceListDetails": "beta_settings_service_list_details",
+    "BetaSettingsServiceLockoutSettings": "beta_settings_service_lockout_settings",
+    "BetaSettingsServiceLoginSettings": "beta_settings_service_login_settings",
+    "BetaSettingsServiceMultiFactorType": "beta_settings_service_multi_factor_type",
+    "BetaSettingsServicePasskeysType": "beta_settings_service_passkeys_type",
+    "BetaSettingsServicePasswordComplexitySettings": "beta_settings_service_password_complexity_settings",
+    "BetaSettingsServicePasswordExpirySettings": "beta_settings_service_password_expiry_settings",
+    "BetaSettingsServiceRequestContext": "beta_settings_service_request_context",
+    "BetaSettingsServiceResourceOwnerType": "beta_settings_service_resource_owner_type",
+    "BetaSettingsServiceSecondFactorType": "beta_settings_service_second_factor_type",
+    "BetaSettingsServiceSecuritySettings": "beta_settings_service_security_settings",
+    "BetaSettingsServiceSetSecuritySettingsRequest": "beta_settings_service_set_security_settings_request",
+    "BetaSettingsServiceSetSecuritySettingsResponse": "beta_settings_service_set_security_settings_response",
+    "BetaSettingsServiceTheme": "beta_settings_service_theme",
+    "BetaSettingsServiceThemeMode": "beta_settings_service_theme_mode",
+    "BetaTelemetryServiceAny": "beta_telemetry_service_any",
+    "BetaTelemetryServiceConnectError": "beta_telemetry_service_connect_error",
+    "BetaTelemetryServiceCountParentType": "beta_telemetry_service_count_parent_type",
+    "BetaTelemetryServiceInstanceInformation": "beta_telemetry_service_instance_information",
+    "BetaTelemetryServiceReportBaseInformationRequest": "beta_telemetry_service_report_base_information_request",
+    "BetaTelemetryServiceReportBaseInformationResponse": "beta_telemetry_service_report_base_information_response",
+    "BetaTelemetryServiceReportResourceCountsRequest": "beta_telemetry_service_report_resource_counts_request",
+    "BetaTelemetryServiceReportResourceCountsResponse": "beta_telemetry_service_report_resource_counts_response",
+    "BetaTelemetryServiceResourceCount": "beta_telemetry_service_resource_count",
+    "BetaUserServiceAccessTokenType": "beta_user_service_access_token_type",
+    "BetaUserServiceAddHumanUserRequest": "beta_user_service_add_human_user_request",
+    "BetaUserServiceAddHumanUserResponse": "beta_user_service_add_human_user_response",
+    "BetaUserServiceAddIDPLinkRequest": "beta_user_service_add_idp_link_request",
+    "BetaUserServiceAddIDPLinkResponse": "beta_user_service_add_idp_link_response",
+    "BetaUserServiceAddOTPEmailRequest": "beta_user_service_add_otp_email_request",
+    "BetaUserServiceAddOTPEmailResponse": "beta_user_service_add_otp_email_response",
+    "BetaUserServiceAddOTPSMSRequest": "beta_user_service_add_otpsms_request",
+    "BetaUserServiceAddOTPSMSResponse": "beta_user_service_add_otpsms_response",
+    "BetaUserServiceAndQuery": "beta_user_service_and_query",
+    "BetaUserServiceAny": "beta_user_service_any",
+    "BetaUserServiceAuthenticationMethodType": "beta_user_service_authentication_method_type",
+    "BetaUserServiceConnectError": "beta_user_service_connect_error",
+    "BetaUserServiceCreatePasskeyRegistrationLinkRequest": "beta_user_service_create_passkey_registration_link_request",
+    "BetaUserServiceCreatePasskeyRegistrationLinkResponse": "beta_user_service_create_passkey_registration_link_response",
+    "BetaUserServiceDeactivateUserRequest": "beta_user_service_deactivate_user_request",
+    "BetaUserServiceDeactivateUserResponse": "beta_user_service_deactivate_user_response",
+    "BetaUserServiceDeleteUserRequest": "beta_user_service_delete_user_request",
+    "BetaUserServiceDeleteUserResponse": "beta_user_service_delete_user_response",
+    "BetaUserServiceDetails": "beta_user_service_details",
+    "BetaUserServiceDisplayNameQuery": "beta_user_service_display_name_query",
+    "BetaUserServiceEmailQuery": "beta_user_service_email_query",
+    "BetaUserServiceFirstNameQuery": "beta_user_service_first_name_query",
+    "BetaUserServiceFormData": "beta_user_service_form_data",
+    "BetaUserServiceGender": "beta_user_service_gender",
+    "BetaUserServiceGetUserByIDRequest": "beta_user_service_get_user_by_id_request",
+    "BetaUserServiceGetUserByIDResponse": "beta_user_service_get_user_by_id_response",
+    "BetaUserServiceHashedPassword": "beta_user_service_hashed_password",
+    "BetaUserServiceHumanEmail": "beta_user_service_human_email",
+    "BetaUserServiceHumanPhone": "beta_user_service_human_phone",
+    "BetaUserServiceHumanProfile": "beta_user_service_human_profile",
+    "BetaUserServiceHumanUser": "beta_user_service_human_user",
+    "BetaUserServiceIDPInformation": "beta_user_service_idp_information",
+    "BetaUserServiceIDPIntent": "beta_user_service_idp_intent",
+    "BetaUserServiceIDPLDAPAccessInformation": "beta_user_service_idpldap_access_information",
+    "BetaUserServiceIDPLink": "beta_user_service_idp_link",
+    "BetaUserServiceIDPOAuthAccessInformation": "beta_user_service_idpo_auth_access_information",
+    "BetaUserServiceIDPSAMLAccessInformation": "beta_user_service_idpsaml_access_information",
+    "BetaUserServiceInUserEmailsQuery": "beta_user_service_in_user_emails_query",
+    "BetaUserServiceInUserIDQuery": "beta_user_service_in_user_id_query",
+    "BetaUserServiceLDAPCredentials": "beta_user_service_ldap_credentials",
+    "BetaUserServiceLastNameQuery": "beta_user_service_last_name_query",
+    "BetaUserServiceListAuthenticationMethodTypesRequest": "beta_user_service_list_authentication_method_types_request",
+    "BetaUserServiceListAuthenticationMethodTypesResponse": "beta_user_service_list_authentication_method_types_response",
+    "BetaUserServiceListDetails": "beta_user_service_list_details",
+    "BetaUserServiceListQuery": "beta_user_service_list_query",
+    "BetaUserServiceListUsersRequest": "beta_user_service_list_users_request",
+    "BetaUserServiceListUsersResponse": "beta_user_service_list_users_response",
+    "BetaUserServiceLockUserRequest": "beta_user_service_lock_user_request",
+    "BetaUserServiceLockUserResponse": "beta_user_service_lock_user_response",
+    "BetaUserServiceLoginNameQuery": "beta_user_service_login_name_query",
+    "BetaUserServiceMachineUser": "beta_user_service_machine_user",
+    "BetaUserServiceNickNameQuery": "beta_user_service_nick_name_query",
+    "BetaUserServiceNotQuery": "beta_user_service_not_query",
+    "BetaUserServiceNotificationType": "beta_user_service_notification_type",
+    "BetaUserServiceOrQuery": "beta_user_service_or_query",
+    "BetaUserServiceOrganization": "beta_user_service_organization",
+    "BetaUserServiceOrganizationIdQuery": "beta_user_service_organization_id_query",
+    "BetaUserServicePasskeyAuthenticator": "beta_user_service_passkey_authenticator",
+    "BetaUserServicePasskeyRegistrationCode": "beta_user_service_passkey_registration_code",
+    "BetaUserServicePassword": "beta_user_service_password",
+    "BetaUserServicePasswordResetRequest": "beta_user_service_password_reset_request",
+    "BetaUserServicePasswordResetResponse": "beta_user_service_password_reset_response",
+    "BetaUserServicePhoneQuery": "beta_user_service_phone_query",
+    "BetaUserServiceReactivateUserRequest": "beta_user_service_reactivate_user_request",
+    "BetaUserServiceReactivateUserResponse": "beta_user_service_reactivate_user_response",
+    "BetaUserServiceRedirectURLs": "beta_user_service_redirect_urls",
+    "BetaUserServiceRegisterPasskeyRequest": "beta_user_service_register_passkey_request",
+    "BetaUserServiceRegisterPasskeyResponse": "beta_user_service_register_passkey_response",
+    "BetaUserServiceRegisterTOTPRequest": "beta_user_service_register_totp_request",
+    "BetaUserServiceRegisterTOTPResponse": "beta_user_service_register_totp_response",
+    "BetaUserServiceRegisterU2FRequest": "beta_user_service_register_u2_f_request",
+    "BetaUserServiceRegisterU2FResponse": "beta_user_service_register_u2_f_response",
+    "BetaUserServiceRemoveOTPEmailRequest": "beta_user_service_remove_otp_email_request",
+    "BetaUserServiceRemoveOTPEmailResponse": "beta_user_service_remove_otp_email_response",
+    "BetaUserServiceRemoveOTPSMSRequest": "beta_user_service_remove_otpsms_request",
+    "BetaUserServiceRemoveOTPSMSResponse": "beta_user_service_remove_otpsms_response",
+    "BetaUserServiceRemovePhoneRequest": "beta_user_service_remove_phone_request",
+    "BetaUserServiceRemovePhoneResponse": "beta_user_service_remove_phone_response",
+    "BetaUserServiceRemoveTOTPRequest": "beta_user_service_remove_totp_request",
+    "BetaUserServiceRemoveTOTPResponse": "beta_user_service_remove_totp_response",
+    "BetaUserServiceResendEmailCodeRequest": "beta_user_service_resend_email_code_request",
+    "BetaUserServiceResendEmailCodeResponse": "beta_user_service_resend_email_code_response",
+    "BetaUserServiceResendPhoneCodeRequest": "beta_user_service_resend_phone_code_request",
+    "BetaUserServiceResendPhoneCodeResponse": "beta_user_service_resend_phone_code_response",
+    "BetaUserServiceRetrieveIdentityProviderIntentRequest": "beta_user_service_retrieve_identity_provider_intent_request",
+    "BetaUserServiceRetrieveIdentityProviderIntentResponse": "beta_user_service_retrieve_identity_provider_intent_response",
+    "BetaUserServiceSearchQuery": "beta_user_service_search_query",
+    "BetaUserServiceSendEmailVerificationCode": "beta_user_service_send_email_verification_code",
+    "BetaUserServiceSendPasskeyRegistrationLink": "beta_user_service_send_passkey_registration_link",
+    "BetaUserServiceSendPasswordResetLink": "beta_user_service_send_password_reset_link",
+    "BetaUserServiceSetEmailRequest": "beta_user_service_set_email_request",
+    "BetaUserServiceSetEmailResponse": "beta_user_service_set_email_response",
+    "BetaUserServiceSetHumanEmail": "beta_user_service_set_human_email",
+    "BetaUserServiceSetHumanPhone": "beta_user_service_set_human_phone",
+    "BetaUserServiceSetHumanProfile": "beta_user_service_set_human_profile",
+    "BetaUserServiceSetMetadataEntry": "beta_user_service_set_metadata_entry",
+    "BetaUserServiceSetPassword": "beta_user_service_set_password",
+    "BetaUserServiceSetPasswordRequest": "beta_user_service_set_password_request",
+    "BetaUserServiceSetPasswordResponse": "beta_user_service_set_password_response",
+    "BetaUserServiceSetPhoneRequest": "beta_user_service_set_phone_request",
+    "BetaUserServiceSetPhoneResponse": "beta_user_service_set_phone_response",
+    "BetaUserServiceStartIdentityProviderIntentRequest": "beta_user_service_start_identity_provider_intent_request",
+    "BetaUserServiceStartIdentityProviderIntentResponse": "beta_user_service_start_identity_provider_intent_response",
+    "BetaUserServiceStateQuery": "beta_user_service_state_query",
+    "BetaUserServiceTextQueryMethod": "beta_user_service_text_query_method",
+    "BetaUserServiceType": "beta_user_service_type",
+    "BetaUserServiceTypeQuery": "beta_user_service_type_query",
+    "BetaUserServiceUnlockUserRequest": "beta_user_service_unlock_user_request",
+    "BetaUserServiceUnlockUserResponse": "beta_user_service_unlock_user_response",
+    "BetaUserServiceUpdateHumanUserRequest": "beta_user_service_update_human_user_request",
+    "BetaUserServiceUpdateHumanUserResponse": "beta_user_service_update_human_user_response",
+    "BetaUserServiceUser": "beta_user_service_user",
+    "BetaUserServiceUserFieldName": "beta_user_service_user_field_name",
+    "BetaUserServiceUserNameQuery": "beta_user_service_user_name_query",
+    "BetaUserServiceUserState": "beta_user_service_user_state",
+    "BetaUserServiceVerifyEmailRequest": "beta_user_service_verify_email_request",
+    "BetaUserServiceVerifyEmailResponse": "beta_user_service_verify_email_response",
+    "BetaUserServiceVerifyPasskeyRegistrationRequest": "beta_user_service_verify_passkey_registration_request",
+    "BetaUserServiceVerifyPasskeyRegistrationResponse": "beta_user_service_verify_passkey_registration_response",
+    "BetaUserServiceVerifyPhoneRequest": "beta_user_service_verify_phone_request",
+    "BetaUserServiceVerifyPhoneResponse": "beta_user_service_verify_phone_response",
+    "BetaUserServiceVerifyTOTPRegistrationRequest": "beta_user_service_verify_totp_registration_request",
+    "BetaUserServiceVerifyTOTPRegistrationResponse": "beta_user_service_verify_totp_registration_response",
+    "BetaUserServiceVerifyU2FRegistrationRequest": "beta_user_service_verify_u2_f_registration_request",
+    "BetaUserServiceVerifyU2FRegistrationResponse": "beta_user_service_verify_u2_f_registration_response",
+    "BetaWebKeyServiceActivateWebKeyRequest": "beta_web_key_service_activate_web_key_request",
+    "BetaWebKeyServiceActivateWebKeyResponse": "beta_web_key_service_activate_web_key_response",
+    "BetaWebKeyServiceAny": "beta_web_key_service_any",
+    "BetaWebKeyServiceConnectError": "beta_web_key_service_connect_error",
+    "BetaWebKeyServiceCreateWebKeyRequest": "beta_web_key_service_create_web_key_request",
+    "BetaWebKeyServiceCreateWebKeyResponse": "beta_web_key_service_create_web_key_response",
+    "BetaWebKeyServiceDeleteWebKeyRequest": "beta_web_key_service_delete_web_key_request",
+    "BetaWebKeyServiceDeleteWebKeyResponse": "beta_web_key_service_delete_web_key_response",
+    "BetaWebKeyServiceECDSA": "beta_web_key_service_ecdsa",
+    "BetaWebKeyServiceECDSACurve": "beta_web_key_service_ecdsa_curve",
+    "BetaWebKeyServiceListWebKeysResponse": "beta_web_key_service_list_web_keys_response",
+    "BetaWebKeyServiceRSA": "beta_web_key_service_rsa",
+    "BetaWebKeyServiceRSABits": "beta_web_key_service_rsa_bits",
+    "BetaWebKeyServiceRSAHasher": "beta_web_key_service_rsa_hasher",
+    "BetaWebKeyServiceState": "beta_web_key_service_state",
+    "BetaWebKeyServiceWebKey": "beta_web_key_service_web_key",
+    "FeatureServiceAny": "feature_service_any",
+    "FeatureServiceConnectError": "feature_service_connect_error",
+    "FeatureServiceDetails": "feature_service_details",
+    "FeatureServiceFeatureFlag": "feature_service_feature_flag",
+    "FeatureServiceGetInstanceFeaturesRequest": "feature_service_get_instance_features_request",
+    "FeatureServiceGetInstanceFeaturesResponse": "feature_service_get_instance_features_response",
+    "FeatureServiceGetOrganizationFeaturesRequest": "feature_service_get_organization_features_request",
+    "FeatureServiceGetOrganizationFeaturesResponse": "feature_service_get_organization_features_response",
+    "FeatureServiceGetSystemFeaturesResponse": "feature_service_get_system_features_response",
+    "FeatureServiceGetUserFeaturesRequest": "feature_service_get_user_features_request",
+    "FeatureServiceGetUserFeaturesResponse": "feature_service_get_user_features_response",
+    "FeatureServiceImprovedPerformance": "feature_service_improved_performance",
+    "FeatureServiceImprovedPerformanceFeatureFlag": "feature_service_improved_performance_feature_flag",
+    "FeatureServiceLoginV2": "feature_service_login_v2",
+    "FeatureServiceLoginV2FeatureFlag": "feature_service_login_v2_feature_flag",
+    "FeatureServiceResetInstanceFeaturesResponse": "feature_service_reset_instance_features_response",
+    "FeatureServiceResetOrganizationFeaturesRequest": "feature_service_reset_organization_features_request",
+    "FeatureServiceResetOrganizationFeaturesResponse": "feature_service_reset_organization_features_response",
+    "FeatureServiceResetSystemFeaturesResponse": "feature_service_reset_system_features_response",
+    "FeatureServiceResetUserFeaturesRequest": "feature_service_reset_user_features_request",
+    "FeatureServiceResetUserFeaturesResponse": "feature_service_reset_user_features_response",
+    "FeatureServiceSetInstanceFeaturesRequest": "feature_service_set_instance_features_request",
+    "FeatureServiceSetInstanceFeaturesResponse": "feature_service_set_instance_features_response",
+    "FeatureServiceSetOrganizationFeaturesRequest": "feature_service_set_organization_features_request",
+    "FeatureServiceSetOrganizationFeaturesResponse": "feature_service_set_organization_features_response",
+    "FeatureServiceSetSystemFeaturesRequest": "feature_service_set_system_features_request",
+    "FeatureServiceSetSystemFeaturesResponse": "feature_service_set_system_features_response",
+    "FeatureServiceSetUserFeatureRequest": "feature_service_set_user_feature_request",
+    "FeatureServiceSetUserFeaturesResponse": "feature_service_set_user_features_response",
+    "FeatureServiceSource": "feature_service_source",
+    "IdentityProviderServiceAny": "identity_provider_service_any",
+    "IdentityProviderServiceAppleConfig": "identity_provider_service_apple_config",
+    "IdentityProviderServiceAutoLinkingOption": "identity_provider_service_auto_linking_option",
+    "IdentityProviderServiceAzureADConfig": "identity_provider_service_azure_ad_config",
+    "IdentityProviderServiceAzureADTenant": "identity_provider_service_azure_ad_tenant",
+    "IdentityProviderServiceAzureADTenantType": "identity_provider_service_azure_ad_tenant_type",
+    "IdentityProviderServiceConnectError": "identity_provider_service_connect_error",
+    "IdentityProviderServiceDetails": "identity_provider_service_details",
+    "IdentityProviderServiceGenericOIDCConfig": "identity_provider_service_generic_oidc_config",
+    "IdentityProviderServiceGetIDPByIDRequest": "identity_provider_service_get_idpby_id_request",
+    "IdentityProviderServiceGetIDPByIDResponse": "identity_provider_service_get_idpby_id_response",
+    "IdentityProviderServiceGitHubConfig": "identity_provider_service_git_hub_config",
+    "IdentityProviderServiceGitHubEnterpriseServerConfig": "identity_provider_service_git_hub_enterprise_server_config",
+    "IdentityProviderServiceGitLabConfig": "identity_provider_service_git_lab_config",
+    "IdentityProviderServiceGitLabSelfHostedConfig": "identity_provider_service_git_lab_self_hosted_config",
+    "IdentityProviderServiceGoogleConfig": "identity_provider_service_google_config",
+    "IdentityProviderServiceIDP": "identity_provider_service_idp",
+    "IdentityProviderServiceIDPConfig": "identity_provider_service_idp_config",
+    "IdentityProviderServiceIDPState": "identity_provider_service_idp_state",
+    "IdentityProviderServiceIDPType": "identity_provider_service_idp_type",
+    "IdentityProviderServiceJWTConfig": "identity_provider_service_jwt_config",
+    "IdentityProviderServiceLDAPAttributes": "identity_provider_service_ldap_attributes",
+    "IdentityProviderServiceLDAPConfig": "identity_provider_service_ldap_config",
+    "IdentityProviderServiceOAuthConfig": "identity_provider_service_o_auth_config",
+    "IdentityProviderServiceOptions": "identity_provider_service_options",
+    "IdentityProviderServiceSAMLBinding": "identity_provider_service_saml_binding",
+    "IdentityProviderServiceSAMLConfig": "identity_provider_service_saml_config",
+    "IdentityProviderServiceSAMLNameIDFormat": "identity_provider_service_saml_name_id_format",
+    "IdentityProviderServiceSAMLSignatureAlgorithm": "identity_provider_service_saml_signature_algorithm",
+    "InstanceServiceAddCustomDomainRequest": "instance_service_add_custom_domain_request",
+    "InstanceServiceAddCustomDomainResponse": "instance_service_add_custom_domain_response",
+    "InstanceServiceAddTrustedDomainRequest": "instance_service_add_trusted_domain_request",
+    "InstanceServiceAddTrustedDomainResponse": "instance_service_add_trusted_domain_response",
+    "InstanceServiceAny": "instance_service_any",
+    "InstanceServiceConnectError": "instance_service_connect_error",
+    "InstanceServiceCustomDomain": "instance_service_custom_domain",
+    "InstanceServiceCustomDomainFilter": "instance_service_custom_domain_filter",
+    "InstanceServiceCustomDomainsFilter": "instance_service_custom_domains_filter",
+    "InstanceServiceDeleteInstanceRequest": "instance_service_delete_instance_request",
+    "InstanceServiceDeleteInstanceResponse": "instance_service_delete_instance_response",
+    "InstanceServiceDomainFieldName": "instance_service_domain_field_name",
+    "InstanceServiceDomainFilter": "instance_service_domain_filter",
+    "InstanceServiceFieldName": "instance_service_field_name",
+    "InstanceServiceFilter": "instance_service_filter",
+    "InstanceServiceGetInstanceRequest": "instance_service_get_instance_request",
+    "InstanceServiceGetInstanceResponse": "instance_service_get_instance_response",
+    "InstanceServiceInIDsFilter": "instance_service_in_ids_filter",
+    "InstanceServiceInstance": "instance_service_instance",
+    "InstanceServiceListCustomDomainsRequest": "instance_service_list_custom_domains_request",
+    "InstanceServiceListCustomDomainsResponse": "instance_service_list_custom_domains_response",
+    "InstanceServiceListInstancesRequest": "instance_service_list_instances_request",
+    "InstanceServiceListInstancesResponse": "instance_service_list_instances_response",
+    "InstanceServiceListTrustedDomainsRequest": "instance_service_list_trusted_domains_request",
+    "InstanceServiceListTrustedDomainsResponse": "instance_service_list_trusted_domains_response",
+    "InstanceServicePaginationRequest": "instance_service_pagination_request",
+    "InstanceServicePaginationResponse": "instance_service_pagination_response",
+    "InstanceServiceRemoveCustomDomainRequest": "instance_service_remove_custom_domain_request",
+    "InstanceServiceRemoveCustomDomainResponse": "instance_service_remove_custom_domain_response",
+    "InstanceServiceRemoveTrustedDomainRequest": "instance_service_remove_trusted_domain_request",
+    "InstanceServiceRemoveTrustedDomainResponse": "instance_service_remove_trusted_domain_response",
+    "InstanceServiceState": "instance_service_state",
+    "InstanceServiceTextQueryMethod": "instance_service_text_query_method",
+    "InstanceServiceTrustedDomain": "instance_service_trusted_domain",
+    "InstanceServiceTrustedDomainFieldName": "instance_service_trusted_domain_field_name",
+    "InstanceServiceTrustedDomainFilter": "instance_service_trusted_domain_filter",
+    "InstanceServiceUpdateInstanceRequest": "instance_service_update_instance_request",
+    "InstanceServiceUpdateInstanceResponse": "instance_service_update_instance_response",
+    "InternalPermissionServiceAdministrator": "internal_permission_service_administrator",
+    "InternalPermissionServiceAdministratorFieldName": "internal_permission_service_administrator_field_name",
+    "InternalPermissionServiceAdministratorSearchFilter": "internal_permission_service_administrator_search_filter",
+    "InternalPermissionServiceAndFilter": "internal_permission_service_and_filter",
+    "InternalPermissionServiceAny": "internal_permission_service_any",
+    "InternalPermissionServiceConnectError": "internal_permission_service_connect_error",
+    "InternalPermissionServiceCreateAdministratorRequest": "internal_permission_service_create_administrator_request",
+    "InternalPermissionServiceCreateAdministratorResponse": "internal_permission_service_create_administrator_response",
+    "InternalPermissionServiceDeleteAdministratorRequest": "internal_permission_service_delete_administrator_request",
+    "InternalPermissionServiceDeleteAdministratorResponse": "internal_permission_service_delete_administrator_response",
+    "InternalPermissionServiceIDFilter": "internal_permission_service_id_filter",
+    "InternalPermissionServiceInIDsFilter": "internal_permission_service_in_ids_filter",
+    "InternalPermissionServiceListAdministratorsRequest": "internal_permission_service_list_administrators_request",
+    "InternalPermissionServiceListAdministratorsResponse": "internal_permission_service_list_administrators_response",
+    "InternalPermissionServiceNotFilter": "internal_permission_service_not_filter",
+    "InternalPermissionServiceOrFilter": "internal_permission_service_or_filter",
+    "InternalPermissionServiceOrganization": "internal_permission_service_organization",
+    "InternalPermissionServicePaginationRequest": "internal_permission_service_pagination_request",
+    "InternalPermissionServicePaginationResponse": "internal_permission_service_pagination_response",
+    "InternalPermissionServiceProject": "internal_permission_service_project",
+    "InternalPermissionServiceProjectGrant": "internal_permission_service_project_grant",
+    "InternalPermissionServiceResourceFilter": "internal_permission_service_resource_filter",
+    "InternalPermissionServiceResourceType": "internal_permission_service_resource_type",
+    "InternalPermissionServiceRoleFilter": "internal_permission_service_role_filter",
+    "InternalPermissionServiceTextFilterMethod": "internal_permission_service_text_filter_method",
+    "InternalPermissionServiceTimestampFilter": "internal_permission_service_timestamp_filter",
+    "InternalPermissionServiceTimestampFilterMethod": "internal_permission_service_timestamp_filter_method",
+    "InternalPermissionServiceUpdateAdministratorRequest": "internal_permission_service_update_administrator_request",
+    "InternalPermissionServiceUpdateAdministratorResponse": "internal_permission_service_update_administrator_response",
+    "InternalPermissionServiceUser": "internal_permission_service_user",
+    "InternalPermissionServiceUserDisplayNameFilter": "internal_permission_service_user_display_name_filter",
+    "InternalPermissionServiceUserPreferredLoginNameFilter": "internal_permission_service_user_preferred_login_name_filter",
+    "OIDCServiceAny": "oidc_service_any",
+    "OIDCServiceAuthRequest": "oidc_service_auth_request",
+    "OIDCServiceAuthorizationError": "oidc_service_authorization_error",
+    "OIDCServiceAuthorizeOrDenyDeviceAuthorizationRequest": "oidc_service_authorize_or_deny_device_authorization_request",
+    "OIDCServiceConnectError": "oidc_service_connect_error",
+    "OIDCServiceCreateCallbackRequest": "oidc_service_create_callback_request",
+    "OIDCServiceCreateCallbackResponse": "oidc_service_create_callback_response",
+    "OIDCServiceDetails": "oidc_service_details",
+    "OIDCServiceDeviceAuthorizationRequest": "oidc_service_device_authorization_request",
+    "OIDCServiceErrorReason": "oidc_service_error_reason",
+    "OIDCServiceGetAuthRequestRequest": "oidc_service_get_auth_request_request",
+    "OIDCServiceGetAuthRequestResponse": "oidc_service_get_auth_request_response",
+    "OIDCServiceGetDeviceAuthorizationRequestRequest": "oidc_service_get_device_authorization_request_request",
+    "OIDCServiceGetDeviceAuthorizationRequestResponse": "oidc_service_get_device_authorization_request_response",
+    "OIDCServicePrompt": "oidc_service_prompt",
+    "OIDCServiceSession": "oidc_service_session",
+    "OrganizationServiceActivateOrganizationRequest": "organization_service_activate_organization_request",
+    "OrganizationServiceActivateOrganizationResponse": "organization_service_activate_organization_response",
+    "OrganizationServiceAddHumanUserRequest": "organization_service_add_human_user_request",
+    "OrganizationServiceAddOrganizationDomainRequest": "organization_service_add_organization_domain_request",
+    "OrganizationServiceAddOrganizationDomainResponse": "organization_service_add_organization_domain_response",
+    "OrganizationServiceAddOrganizationRequest": "organization_service_add_organization_request",
+    "OrganizationServiceAddOrganizationResponse": "organization_service_add_organization_response",
+    "OrganizationServiceAdmin": "organization_service_admin",
+    "OrganizationServiceAny": "organization_service_any",
+    "OrganizationServiceConnectError": "organization_service_connect_error",
+    "OrganizationServiceCreatedAdmin": "organization_service_created_admin",
+    "OrganizationServiceDeactivateOrganizationRequest": "organization_service_deactivate_organization_request",
+    "OrganizationServiceDeactivateOrganizationResponse": "organization_service_deactivate_organization_response",
+    "OrganizationServiceDeleteOrganizationDomainRequest": "organization_service_delete_organization_domain_request",
+    "OrganizationServiceDeleteOrganizationDomainResponse": "organization_service_delete_organization_domain_response",
+    "OrganizationServiceDeleteOrganizationMetadataRequest": "organization_service_delete_organization_metadata_request",
+    "OrganizationServiceDeleteOrganizationMetadataResponse": "organization_service_delete_organization_metadata_response",
+    "OrganizationServiceDeleteOrganizationRequest": "organization_service_delete_organization_request",
+    "OrganizationServiceDeleteOrganizationResponse": "organization_service_delete_organization_response",
+    "OrganizationServiceDetails": "organization_service_details",
+    "OrganizationServiceDomain": "organization_service_domain",
+    "OrganizationServiceDomainFieldName": "organization_service_domain_field_name",
+    "OrganizationServiceDomainSearchFilter": "organization_service_domain_search_filter",
+    "OrganizationServiceDomainValidationType": "organization_service_domain_validation_type",
+    "OrganizationServiceGender": "organization_service_gender",
+    "OrganizationServiceGenerateOrganizationDomainValidationRequest": "organization_service_generate_organization_domain_validation_request",
+    "OrganizationServiceGenerateOrganizationDomainValidationResponse": "organization_service_generate_organization_domain_validation_response",
+    "OrganizationServiceHashedPassword": "organization_service_hashed_password",
+    "OrganizationServiceIDPLink": "organization_service_idp_link",
+    "OrganizationServiceListDetails": "organization_service_list_details",
+    "OrganizationServiceListOrganizationDomainsRequest": "organization_service_list_organization_domains_request",
+    "OrganizationServiceListOrganizationDomainsResponse": "organization_service_list_organization_domains_response",
+    "OrganizationServiceListOrganizationMetadataRequest": "organization_service_list_organization_metadata_request",
+    "OrganizationServiceListOrganizationMetadataResponse": "organization_service_list_organization_metadata_response",
+    "OrganizationServiceListOrganizationsRequest": "organization_service_list_organizations_request",
+    "OrganizationServiceListOrganizationsResponse": "organization_service_list_organizations_response",
+    "OrganizationServiceListQuery": "organization_service_list_query",
+    "OrganizationServiceMetadata": "organization_service_metadata",
+    "OrganizationServiceMetadataKeyFilter": "organization_service_metadata_key_filter",
+    "OrganizationServiceMetadataSearchFilter": "organization_service_metadata_search_filter",
+    "OrganizationServiceOrganization": "organization_service_organization",
+    "OrganizationServiceOrganizationDomainQuery": "organization_service_organization_domain_query",
+    "OrganizationServiceOrganizationFieldName": "organization_service_organization_field_name",
+    "OrganizationServiceOrganizationIDQuery": "organization_service_organization_id_query",
+    "OrganizationServiceOrganizationNameQuery": "organization_service_organization_name_query",
+    "OrganizationServiceOrganizationState": "organization_service_organization_state",
+    "OrganizationServiceOrganizationStateQuery": "organization_service_organization_state_query",
+    "OrganizationServicePaginationRequest": "organization_service_pagination_request",
+    "OrganizationServicePaginationResponse": "organization_service_pagination_response",
+    "OrganizationServicePassword": "organization_service_password",
+    "OrganizationServiceSearchQuery": "organization_service_search_query",
+    "OrganizationServiceSendEmailVerificationCode": "organization_service_send_email_verification_code",
+    "OrganizationServiceSetHumanEmail": "organization_service_set_human_email",
+    "OrganizationServiceSetHumanPhone": "organization_service_set_human_phone",
+    "OrganizationServiceSetHumanProfile": "organization_service_set_human_profile",
+    "OrganizationServiceSetMetadataEntry": "organization_service_set_metadata_entry",
+    "OrganizationServiceSetOrganizationMetadataRequest": "organization_service_set_organization_metadata_request",
+    "OrganizationServiceSetOrganizationMetadataResponse": "organization_service_set_organization_metadata_response",
+    "OrganizationServiceTextFilterMethod": "organization_service_text_filter_method",
+    "OrganizationServiceTextQueryMethod": "organization_service_text_query_method",
+    "OrganizationServiceUpdateOrganizationRequest": "organization_service_update_organization_request",
+    "OrganizationServiceUpdateOrganizationResponse": "organization_service_update_organization_response",
+    "OrganizationServiceVerifyOrganizationDomainRequest": "organization_service_verify_organization_domain_request",
+    "OrganizationServiceVerifyOrganizationDomainResponse": "organization_service_verify_organization_domain_response",
+    "ProjectServiceActivateProjectGrantRequest": "project_service_activate_project_grant_request",
+    "ProjectServiceActivateProjectGrantResponse": "project_service_activate_project_grant_response",
+    "ProjectServiceActivateProjectRequest": "project_service_activate_project_request",
+    "ProjectServiceActivateProjectResponse": "project_service_activate_project_response",
+    "ProjectServiceAddProjectRoleRequest": "project_service_add_project_role_request",
+    "ProjectServiceAddProjectRoleResponse": "project_service_add_project_role_response",
+    "ProjectServiceAny": "project_service_any",
+    "ProjectServiceConnectError": "project_service_connect_error",
+    "ProjectServiceCreateProjectGrantRequest": "project_service_create_project_grant_request",
+    "ProjectServiceCreateProjectGrantResponse": "project_service_create_project_grant_response",
+    "ProjectServiceCreateProjectRequest": "project_service_create_project_request",
+    "ProjectServiceCreateProjectResponse": "project_service_create_project_response",
+    "ProjectServiceDeactivateProjectGrantRequest": "project_service_deactivate_project_grant_request",
+    "ProjectServiceDeactivateProjectGrantResponse": "project_service_deactivate_project_grant_response",
+    "ProjectServiceDeactivateProjectRequest": "project_service_deactivate_project_request",
+    "ProjectServiceDeactivateProjectResponse": "project_service_deactivate_project_response",
+    "ProjectServiceDeleteProjectGrantRequest": "project_service_delete_project_grant_request",
+    "ProjectServiceDeleteProjectGrantResponse": "project_service_delete_project_grant_response",
+    "ProjectServiceDeleteProjectRequest": "project_service_delete_project_request",
+    "ProjectServiceDeleteProjectResponse": "project_service_delete_project_response",
+    "ProjectServiceGetProjectRequest": "project_service_get_project_request",
+    "ProjectServiceGetProjectResponse": "project_service_get_project_response",
+    "ProjectServiceGrantedProjectState": "project_service_granted_project_state",
+    "ProjectServiceIDFilter": "project_service_id_filter",
+    "ProjectServiceInIDsFilter": "project_service_in_ids_filter",
+    "ProjectServiceListProjectGrantsRequest": "project_service_list_project_grants_request",
+    "ProjectServiceListProjectGrantsResponse": "project_service_list_project_grants_response",
+    "ProjectServiceListProjectRolesRequest": "project_service_list_project_roles_request",
+    "ProjectServiceListProjectRolesResponse": "project_service_list_project_roles_response",
+    "ProjectServiceListProjectsRequest": "project_service_list_projects_request",
+    "ProjectServiceListProjectsResponse": "project_service_list_projects_response",
+    "ProjectServicePaginationRequest": "project_service_pagination_request",
+    "ProjectServicePaginationResponse": "project_service_pagination_response",
+    "ProjectServicePrivateLabelingSetting": "project_service_private_labeling_setting",
+    "ProjectServiceProject": "project_service_project",
+    "ProjectServiceProjectFieldName": "project_service_project_field_name",
+    "ProjectServiceProjectGrant": "project_service_project_grant",
+    "ProjectServiceProjectGrantFieldName": "project_service_project_grant_field_name",
+    "ProjectServiceProjectGrantSearchFilter": "project_service_project_grant_search_filter",
+    "ProjectServiceProjectGrantState": "project_service_project_grant_state",
+    "ProjectServiceProjectNameFilter": "project_service_project_name_filter",
+    "ProjectServiceProjectOrganizationIDFilter": "project_service_project_organization_id_filter",
+    "ProjectServiceProjectRole": "project_service_project_role",
+    "ProjectServiceProjectRoleDisplayNameFilter": "project_service_project_role_display_name_filter",
+    "ProjectServiceProjectRoleFieldName": "project_service_project_role_field_name",
+    "ProjectServiceProjectRoleKeyFilter": "project_service_project_role_key_filter",
+    "ProjectServiceProjectRoleSearchFilter": "project_service_project_role_search_filter",
+    "ProjectServiceProjectSearchFilter": "project_service_project_search_filter",
+    "ProjectServiceProjectState": "project_service_project_state",
+    "ProjectServiceRemoveProjectRoleRequest": "project_service_remove_project_role_request",
+    "ProjectServiceRemoveProjectRoleResponse": "project_service_remove_project_role_response",
+    "ProjectServiceTextFilterMethod": "project_service_text_filter_method",
+    "ProjectServiceType": "project_service_type",
+    "ProjectServiceUpdateProjectGrantRequest": "project_service_update_project_grant_request",
+    "ProjectServiceUpdateProjectGrantResponse": "project_service_update_project_grant_response",
+    "ProjectServiceUpdateProjectRequest": "project_service_update_project_request",
+    "ProjectServiceUpdateProjectResponse": "project_service_update_project_response",
+    "ProjectServiceUpdateProjectRoleRequest": "project_service_update_project_role_request",
+    "ProjectServiceUpdateProjectRoleResponse": "project_service_update_project_role_response",
+    "SAMLServiceAny": "saml_service_any",
+    "SAMLServiceAuthorizationError": "saml_service_authorization_error",
+    "SAMLServiceConnectError": "saml_service_connect_error",
+    "SAMLServiceCreateResponseRequest": "saml_service_create_response_request",
+    "SAMLServiceCreateResponseResponse": "saml_service_create_response_response",
+    "SAMLServiceDetails": "saml_service_details",
+    "SAMLServiceErrorReason": "saml_service_error_reason",
+    "SAMLServiceGetSAMLRequestRequest": "saml_service_get_saml_request_request",
+    "SAMLServiceGetSAMLRequestResponse": "saml_service_get_saml_request_response",
+    "SAMLServicePostResponse": "saml_service_post_response",
+    "SAMLServiceSAMLRequest": "saml_service_saml_request",
+    "SAMLServiceSession": "saml_service_session",
+    "SessionServiceAny": "session_service_any",
+    "SessionServiceChallenges": "session_service_challenges",
+    "SessionServiceCheckIDPIntent": "session_service_check_idp_intent",
+    "SessionServiceCheckOTP": "session_service_check_otp",
+    "SessionServiceCheckPassword": "session_service_check_password",
+    "SessionServiceCheckRecoveryCode": "session_service_check_recovery_code",
+    "SessionServiceCheckTOTP": "session_service_check_totp",
+    "SessionServiceCheckUser": "session_service_check_user",
+    "SessionServiceCheckWebAuthN": "session_service_check_web_auth_n",
+    "SessionServiceChecks": "session_service_checks",
+    "SessionServiceConnectError": "session_service_connect_error",
+    "SessionServiceCreateSessionRequest": "session_service_create_session_request",
+    "SessionServiceCreateSessionResponse": "session_service_create_session_response",
+    "SessionServiceCreationDateQuery": "session_service_creation_date_query",
+    "SessionServiceCreatorQuery": "session_service_creator_query",
+    "SessionServiceDeleteSessionRequest": "session_service_delete_session_request",
+    "SessionServiceDeleteSessionResponse": "session_service_delete_session_response",
+    "SessionServiceDetails": "session_service_details",
+    "SessionServiceExpirationDateQuery": "session_service_expiration_date_query",
+    "SessionServiceFactors": "session_service_factors",
+    "SessionServiceGetSessionRequest": "session_service_get_session_request",
+    "SessionServiceGetSessionResponse": "session_service_get_session_response",
+    "SessionServiceHeaderValues": "session_service_header_values",
+    "SessionServiceIDsQuery": "session_service_ids_query",
+    "SessionServiceIntentFactor": "session_service_intent_factor",
+    "SessionServiceListDetails": "session_service_list_details",
+    "SessionServiceListQuery": "session_service_list_query",
+    "SessionServiceListSessionsRequest": "session_service_list_sessions_request",
+    "SessionServiceListSessionsResponse": "session_service_list_sessions_response",
+    "SessionServiceOTPEmail": "session_service_otp_email",
+    "SessionServiceOTPFactor": "session_service_otp_factor",
+    "SessionServiceOTPSMS": "session_service_otpsms",
+    "SessionServicePasswordFactor": "session_service_password_factor",
+    "SessionServiceRecoveryCodeFactor": "session_service_recovery_code_factor",
+    "SessionServiceRequestChallenges": "session_service_request_challenges",
+    "SessionServiceSearchQuery": "session_service_search_query",
+    "SessionServiceSendCode": "session_service_send_code",
+    "SessionServiceSession": "session_service_session",
+    "SessionServiceSessionFieldName": "session_service_session_field_name",
+    "SessionServiceSetSessionRequest": "session_service_set_session_request",
+    "SessionServiceSetSessionResponse": "session_service_set_session_response",
+    "SessionServiceTOTPFactor": "session_service_totp_factor",
+    "SessionServiceTimestampQueryMethod": "session_service_timestamp_query_method",
+    "SessionServiceUserAgent": "session_service_user_agent",
+    "SessionServiceUserAgentQuery": "session_service_user_agent_query",
+    "SessionServiceUserFactor": "session_service_user_factor",
+    "SessionServiceUserIDQuery": "session_service_user_id_query",
+    "SessionServiceUserVerificationRequirement": "session_service_user_verification_requirement",
+    "SessionServiceWebAuthN": "session_service_web_auth_n",
+    "SessionServiceWebAuthNFactor": "session_service_web_auth_n_factor",
+    "SettingsServiceAny": "settings_service_any",
+    "SettingsServiceAutoLinkingOption": "settings_service_auto_linking_option",
+    "SettingsServiceBrandingSettings": "settings_service_branding_settings",
+    "SettingsServiceConnectError": "settings_service_connect_error",
+    "SettingsServiceDetails": "settings_service_details",
+    "SettingsServiceDomainSettings": "settings_service_domain_settings",
+    "SettingsServiceEmbeddedIframeSettings": "settings_service_embedded_iframe_settings",
+    "SettingsServiceGetActiveIdentityProvidersRequest": "settings_service_get_active_identity_providers_request",
+    "SettingsServiceGetActiveIdentityProvidersResponse": "settings_service_get_active_identity_providers_response",
+    "SettingsServiceGetBrandingSettingsRequest": "settings_service_get_branding_settings_request",
+    "SettingsServiceGetBrandingSettingsResponse": "settings_service_get_branding_settings_response",
+    "SettingsServiceGetDomainSettingsRequest": "settings_service_get_domain_settings_request",
+    "SettingsServiceGetDomainSettingsResponse": "settings_service_get_domain_settings_response",
+    "SettingsServiceGetGeneralSettingsResponse": "settings_service_get_general_settings_response",
+    "SettingsServiceGetHostedLoginTranslationRequest": "settings_service_get_hosted_login_translation_request",
+    "SettingsServiceGetHostedLoginTranslationResponse": "settings_service_get_hosted_login_translation_response",
+    "SettingsServiceGetLegalAndSupportSettingsRequest": "settings_service_get_legal_and_support_settings_request",
+    "SettingsServiceGetLegalAndSupportSettingsResponse": "settings_service_get_legal_and_support_settings_response",
+    "SettingsServiceGetLockoutSettingsRequest": "settings_service_get_lockout_settings_request",
+    "SettingsServiceGetLockoutSettingsResponse": "settings_service_get_lockout_settings_response",
+    "SettingsServiceGetLoginSettingsRequest": "settings_service_get_login_settings_request",
+    "SettingsServiceGetLoginSettingsResponse": "settings_service_get_login_settings_response",
+    "SettingsServiceGetPasswordComplexitySettingsRequest": "settings_service_get_password_complexity_settings_request",
+    "SettingsServiceGetPasswordComplexitySettingsResponse": "settings_service_get_password_complexity_settings_response",
+    "SettingsServiceGetPasswordExpirySettingsRequest": "settings_service_get_password_expiry_settings_request",
+    "SettingsServiceGetPasswordExpirySettingsResponse": "settings_service_get_password_expiry_settings_response",
+    "SettingsServiceGetSecuritySettingsResponse": "settings_service_get_security_settings_response",
+    "SettingsServiceIdentityProvider": "settings_service_identity_provider",
+    "SettingsServiceIdentityProviderType": "settings_service_identity_provider_type",
+    "SettingsServiceLegalAndSupportSettings": "settings_service_legal_and_support_settings",
+    "SettingsServiceListDetails": "settings_service_list_details",
+    "SettingsServiceLockoutSettings": "settings_service_lockout_settings",
+    "SettingsServiceLoginSettings": "settings_service_login_settings",
+    "SettingsServiceMultiFactorType": "settings_service_multi_factor_type",
+    "SettingsServiceOptions": "settings_service_options",
+    "SettingsServicePasskeysType": "settings_service_passkeys_type",
+    "SettingsServicePasswordComplexitySettings": "settings_service_password_complexity_settings",
+    "SettingsServicePasswordExpirySettings": "settings_service_password_expiry_settings",
+    "SettingsServiceRequestContext": "settings_service_request_context",
+    "SettingsServiceResourceOwnerType": "settings_service_resource_owner_type",
+    "SettingsServiceSecondFactorType": "settings_service_second_factor_type",
+    "SettingsServiceSecuritySettings": "settings_service_security_settings",
+    "SettingsServiceSetHostedLoginTranslationRequest": "settings_service_set_hosted_login_translation_request",
+    "SettingsServiceSetHostedLoginTranslationResponse": "settings_service_set_hosted_login_translation_response",
+    "SettingsServiceSetSecuritySettingsRequest": "settings_service_set_security_settings_request",
+    "SettingsServiceSetSecuritySettingsResponse": "settings_service_set_security_settings_response",
+    "SettingsServiceTheme": "settings_service_theme",
+    "SettingsServiceThemeMode": "settings_service_theme_mode",
+    "UserServiceAccessTokenType": "user_service_access_token_type",
+    "UserServiceAddHumanUserRequest": "user_service_add_human_user_request",
+    "UserServiceAddHumanUserResponse": "user_service_add_human_user_response",
+    "UserServiceAddIDPLinkRequest": "user_service_add_idp_link_request",
+    "UserServiceAddIDPLinkResponse": "user_service_add_idp_link_response",
+    "UserServiceAddKeyRequest": "user_service_add_key_request",
+    "UserServiceAddKeyResponse": "user_service_add_key_response",
+    "UserServiceAddOTPEmailRequest": "user_service_add_otp_email_request",
+    "UserServiceAddOTPEmailResponse": "user_service_add_otp_email_response",
+    "UserServiceAddOTPSMSRequest": "user_service_add_otpsms_request",
+    "UserServiceAddOTPSMSResponse": "user_service_add_otpsms_response",
+    "UserServiceAddPersonalAccessTokenRequest": "user_service_add_personal_access_token_request",
+    "UserServiceAddPersonalAccessTokenResponse": "user_service_add_personal_access_token_response",
+    "UserServiceAddSecretRequest": "user_service_add_secret_request",
+    "UserServiceAddSecretResponse": "user_service_add_secret_response",
+    "UserServiceAndQuery": "user_service_and_query",
+    "UserServiceAny": "user_service_any",
+    "UserServiceAuthFactor": "user_service_auth_factor",
+    "UserServiceAuthFactorState": "user_service_auth_factor_state",
+    "UserServiceAuthFactorU2F": "user_service_auth_factor_u2_f",
+    "UserServiceAuthFactors": "user_service_auth_factors",
+    "UserServiceAuthenticationMethodType": "user_service_authentication_method_type",
+    "UserServiceByteFilterMethod": "user_service_byte_filter_method",
+    "UserServiceConnectError": "user_service_connect_error",
+    "UserServiceCreateInviteCodeRequest": "user_service_create_invite_code_request",
+    "UserServiceCreateInviteCodeResponse": "user_service_create_invite_code_response",
+    "UserServiceCreatePasskeyRegistrationLinkRequest": "user_service_create_passkey_registration_link_request",
+    "UserServiceCreatePasskeyRegistrationLinkResponse": "user_service_create_passkey_registration_link_response",
+    "UserServiceCreateUserRequest": "user_service_create_user_request",
+    "UserServiceCreateUserResponse": "user_service_create_user_response",
+    "UserServiceDeactivateUserRequest": "user_service_deactivate_user_request",
+    "UserServiceDeactivateUserResponse": "user_service_deactivate_user_response",
+    "UserServiceDeleteUserMetadataRequest": "user_service_delete_user_metadata_request",
+    "UserServiceDeleteUserMetadataResponse": "user_service_delete_user_metadata_response",
+    "UserServiceDeleteUserRequest": "user_service_delete_user_request",
+    "UserServiceDeleteUserResponse": "user_service_delete_user_response",
+    "UserServiceDetails": "user_service_details",
+    "UserServiceDisplayNameQuery": "user_service_display_name_query",
+    "UserServiceDomainQuery": "user_service_domain_query",
+    "UserServiceEmailQuery": "user_service_email_query",
+    "UserServiceFirstNameQuery": "user_service_first_name_query",
+    "UserServiceFormData": "user_service_form_data",
+    "UserServiceGender": "user_service_gender",
+    "UserServiceGenerateRecoveryCodesRequest": "user_service_generate_recovery_codes_request",
+    "UserServiceGenerateRecoveryCodesResponse": "user_service_generate_recovery_codes_response",
+    "UserServiceGetUserByIDRequest": "user_service_get_user_by_id_request",
+    "UserServiceGetUserByIDResponse": "user_service_get_user_by_id_response",
+    "UserServiceHashedPassword": "user_service_hashed_password",
+    "UserServiceHuman": "user_service_human",
+    "UserServiceHumanEmail": "user_service_human_email",
+    "UserServiceHumanMFAInitSkippedRequest": "user_service_human_mfa_init_skipped_request",
+    "UserServiceHumanMFAInitSkippedResponse": "user_service_human_mfa_init_skipped_response",
+    "UserServiceHumanPhone": "user_service_human_phone",
+    "UserServiceHumanProfile": "user_service_human_profile",
+    "UserServiceHumanUser": "user_service_human_user",
+    "UserServiceIDFilter": "user_service_id_filter",
+    "UserServiceIDPInformation": "user_service_idp_information",
+    "UserServiceIDPIntent": "user_service_idp_intent",
+    "UserServiceIDPLDAPAccessInformation": "user_service_idpldap_access_information",
+    "UserServiceIDPLink": "user_service_idp_link",
+    "UserServiceIDPOAuthAccessInformation": "user_service_idpo_auth_access_information",
+    "UserServiceIDPSAMLAccessInformation": "user_service_idpsaml_access_information",
+    "UserServiceInUserEmailsQuery": "user_service_in_user_emails_query",
+    "UserServiceInUserIDQuery": "user_service_in_user_id_query",
+    "UserServiceKey": "user_service_key",
+    "UserServiceKeyFieldName": "user_service_key_field_name",
+    "UserServiceKeysSearchFilter": "user_service_keys_search_filter",
+    "UserServiceLDAPCredentials": "user_service_ldap_credentials",
+    "UserServiceLastNameQuery": "user_service_last_name_query",
+    "UserServiceListAuthenticationFactorsRequest": "user_service_list_authentication_factors_request",
+    "UserServiceListAuthenticationFactorsResponse": "user_service_list_authentication_factors_response",
+    "UserServiceListAuthenticationMethodTypesRequest": "user_service_list_authentication_method_types_request",
+    "UserServiceListAuthenticationMethodTypesResponse": "user_service_list_authentication_method_types_response",
+    "UserServiceListDetails": "user_service_list_details",
+    "UserServiceListIDPLinksRequest": "user_service_list_idp_links_request",
+    "UserServiceListIDPLinksResponse": "user_service_list_idp_links_response",
+    "UserServiceListKeysRequest": "user_service_list_keys_request",
+    "UserServiceListKeysResponse": "user_service_list_keys_response",
+    "UserServiceListPasskeysRequest": "user_service_list_passkeys_request",
+    "UserServiceListPasskeysResponse": "user_service_list_passkeys_response",
+    "UserServiceListPersonalAccessTokensRequest": "user_service_list_personal_access_tokens_request",
+    "UserServiceListPersonalAccessTokensResponse": "user_service_list_personal_access_tokens_response",
+    "UserServiceListQuery": "user_service_list_query",
+    "UserServiceListUserMetadataRequest": "user_service_list_user_metadata_request",
+    "UserServiceListUserMetadataResponse": "user_service_list_user_metadata_response",
+    "UserServiceListUsersRequest": "user_service_list_users_request",
+    "UserServiceListUsersResponse": "user_service_list_users_response",
+    "UserServiceLockUserRequest": "user_service_lock_user_request",
+    "UserServiceLockUserResponse": "user_service_lock_user_response",
+    "UserServiceLoginNameQuery": "user_service_login_name_query",
+    "UserServiceMachine": "user_service_machine",
+    "UserServiceMachineUser": "user_service_machine_user",
+    "UserServiceMetadata": "user_service_metadata",
+    "UserServiceMetadataKeyFilter": "user_service_metadata_key_filter",
+    "UserServiceMetadataSearchFilter": "user_service_metadata_search_filter",
+    "UserServiceMetadataValueFilter": "user_service_metadata_value_filter",
+    "UserServiceNickNameQuery": "user_service_nick_name_query",
+    "UserServiceNotQuery": "user_service_not_query",
+    "UserServiceNotificationType": "user_service_notification_type",
+    "UserServiceOrQuery": "user_service_or_query",
+    "UserServiceOrganization": "user_service_organization",
+    "UserServiceOrganizationIdQuery": "user_service_organization_id_query",
+    "UserServicePaginationRequest": "user_service_pagination_request",
+    "UserServicePaginationResponse": "user_service_pagination_response",
+    "UserServicePasskey": "user_service_passkey",
+    "UserServicePasskeyAuthenticator": "user_service_passkey_authenticator",
+    "UserServicePasskeyRegistrationCode": "user_service_passkey_registration_code",
+    "UserServicePassword": "user_service_password",
+    "UserServicePasswordResetRequest": "user_service_password_reset_request",
+    "UserServicePasswordResetResponse": "user_service_password_reset_response",
+    "UserServicePersonalAccessToken": "user_service_personal_access_token",
+    "UserServicePersonalAccessTokenFieldName": "user_service_personal_access_token_field_name",
+    "UserServicePersonalAccessTokensSearchFilter": "user_service_personal_access_tokens_search_filter",
+    "UserServicePhoneQuery": "user_service_phone_query",
+    "UserServiceProfile": "user_service_profile",
+    "UserServiceReactivateUserRequest": "user_service_reactivate_user_request",
+    "UserServiceReactivateUserResponse": "user_service_reactivate_user_response",
+    "UserServiceRedirectURLs": "user_service_redirect_urls",
+    "UserServiceRegisterPasskeyRequest": "user_service_register_passkey_request",
+    "UserServiceRegisterPasskeyResponse": "user_service_register_passkey_response",
+    "UserServiceRegisterTOTPRequest": "user_service_register_totp_request",
+    "UserServiceRegisterTOTPResponse": "user_service_register_totp_response",
+    "UserServiceRegisterU2FRequest": "user_service_register_u2_f_request",
+    "UserServiceRegisterU2FResponse": "user_service_register_u2_f_response",
+    "UserServiceRemoveIDPLinkRequest": "user_service_remove_idp_link_request",
+    "UserServiceRemoveIDPLinkResponse": "user_service_remove_idp_link_response",
+    "UserServiceRemoveKeyRequest": "user_service_remove_key_request",
+    "UserServiceRemoveKeyResponse": "user_service_remove_key_response",
+    "UserServiceRemoveOTPEmailRequest": "user_service_remove_otp_email_request",
+    "UserServiceRemoveOTPEmailResponse": "user_service_remove_otp_email_response",
+    "UserServiceRemoveOTPSMSRequest": "user_service_remove_otpsms_request",
+    "UserServiceRemoveOTPSMSResponse": "user_service_remove_otpsms_response",
+    "UserServiceRemovePasskeyRequest": "user_service_remove_passkey_request",
+    "UserServiceRemovePasskeyResponse": "user_service_remove_passkey_response",
+    "UserServiceRemovePersonalAccessTokenRequest": "user_service_remove_personal_access_token_request",
+    "UserServiceRemovePersonalAccessTokenResponse": "user_service_remove_personal_access_token_response",
+    "UserServiceRemovePhoneRequest": "user_service_remove_phone_request",
+    "UserServiceRemovePhoneResponse": "user_service_remove_phone_response",
+    "UserServiceRemoveRecoveryCodesRequest": "user_service_remove_recovery_codes_request",
+    "UserServiceRemoveRecoveryCodesResponse": "user_service_remove_recovery_codes_response",
+    "UserServiceRemoveSecretRequest": "user_service_remove_secret_request",
+    "UserServiceRemoveSecretResponse": "user_service_remove_secret_response",
+    "UserServiceRemoveTOTPRequest": "user_service_remove_totp_request",
+    "UserServiceRemoveTOTPResponse": "user_service_remove_totp_response",
+    "UserServiceRemoveU2FRequest": "user_service_remove_u2_f_request",
+    "UserServiceRemoveU2FResponse": "user_service_remove_u2_f_response",
+    "UserServiceResendEmailCodeRequest": "user_service_resend_email_code_request",
+    "UserServiceResendEmailCodeResponse": "user_service_resend_email_code_response",
+    "UserServiceResendInviteCodeRequest": "user_service_resend_invite_code_request",
+    "UserServiceResendInviteCodeResponse": "user_service_resend_invite_code_response",
+    "UserServiceResendPhoneCodeRequest": "user_service_resend_phone_code_request",
+    "UserServiceResendPhoneCodeResponse": "user_service_resend_phone_code_response",
+    "UserServiceRetrieveIdentityProviderIntentRequest": "user_service_retrieve_identity_provider_intent_request",
+    "UserServiceRetrieveIdentityProviderIntentResponse": "user_service_retrieve_identity_provider_intent_response",
+    "UserServiceSearchQuery": "user_service_search_query",
+    "UserServiceSendEmailCodeRequest": "user_service_send_email_code_request",
+    "UserServiceSendEmailCodeResponse": "user_service_send_email_code_response",
+    "UserServiceSendEmailVerificationCode": "user_service_send_email_verification_code",
+    "UserServiceSendInviteCode": "user_service_send_invite_code",
+    "UserServiceSendPasskeyRegistrationLink": "user_service_send_passkey_registration_link",
+    "UserServiceSendPasswordResetLink": "user_service_send_password_reset_link",
+    "UserServiceSetEmailRequest": "user_service_set_email_request",
+    "UserServiceSetEmailResponse": "user_service_set_email_response",
+    "UserServiceSetHumanEmail": "user_service_set_human_email",
+    "UserServiceSetHumanPhone": "user_service_set_human_phone",
+    "UserServiceSetHumanProfile": "user_service_set_human_profile",
+    "UserServiceSetMetadataEntry": "user_service_set_metadata_entry",
+    "UserServiceSetPassword": "user_service_set_password",
+    "UserServiceSetPasswordRequest": "user_service_set_password_request",
+    "UserServiceSetPasswordResponse": "user_service_set_password_response",
+    "UserServiceSetPhoneRequest": "user_service_set_phone_request",
+    "UserServiceSetPhoneResponse": "user_service_set_phone_response",
+    "UserServiceSetUserMetadataRequest": "user_service_set_user_metadata_request",
+    "UserServiceSetUserMetadataResponse": "user_service_set_user_metadata_response",
+    "UserServiceStartIdentityProviderIntentRequest": "user_service_start_identity_provider_intent_request",
+    "UserServiceStartIdentityProviderIntentResponse": "user_service_start_identity_provider_intent_response",
+    "UserServiceStateQuery": "user_service_state_query",
+    "UserServiceTextFilterMethod": "user_service_text_filter_method",
+    "UserServiceTextQueryMethod": "user_service_text_query_method",
+    "UserServiceTimestampFilter": "user_service_timestamp_filter",
+    "UserServiceTimestampFilterMethod": "user_service_timestamp_filter_method",
+    "UserServiceType": "user_service_type",
+    "UserServiceTypeQuery": "user_service_type_query",
+    "UserServiceUnlockUserRequest": "user_service_unlock_user_request",
+    "UserServiceUnlockUserResponse": "user_service_unlock_user_response",
+    "UserServiceUpdateHumanUserRequest": "user_service_update_human_user_request",
+    "UserServiceUpdateHumanUserResponse": "user_service_update_human_user_response",
+    "UserServiceUpdateUserRequest": "user_service_update_user_request",
+    "UserServiceUpdateUserResponse": "user_service_update_user_response",
+    "UserServiceUser": "user_service_user",
+    "UserServiceUserFieldName": "user_service_user_field_name",
+    "UserServiceUserNameQuery": "user_service_user_name_query",
+    "UserServiceUserState": "user_service_user_state",
+    "UserServiceVerifyEmailRequest": "user_service_verify_email_request",
+    "UserServiceVerifyEmailResponse": "user_service_verify_email_response",
+    "UserServiceVerifyInviteCodeRequest": "user_service_verify_invite_code_request",
+    "UserServiceVerifyInviteCodeResponse": "user_service_verify_invite_code_response",
+    "UserServiceVerifyPasskeyRegistrationRequest": "user_service_verify_passkey_registration_request",
+    "UserServiceVerifyPasskeyRegistrationResponse": "user_service_verify_passkey_registration_response",
+    "UserServiceVerifyPhoneRequest": "user_service_verify_phone_request",
+    "UserServiceVerifyPhoneResponse": "user_service_verify_phone_response",
+    "UserServiceVerifyTOTPRegistrationRequest": "user_service_verify_totp_registration_request",
+    "UserServiceVerifyTOTPRegistrationResponse": "user_service_verify_totp_registration_response",
+    "UserServiceVerifyU2FRegistrationRequest": "user_service_verify_u2_f_registration_request",
+    "UserServiceVerifyU2FRegistrationResponse": "user_service_verify_u2_f_registration_response",
+    "WebKeyServiceActivateWebKeyRequest": "web_key_service_activate_web_key_request",
+    "WebKeyServiceActivateWebKeyResponse": "web_key_service_activate_web_key_response",
+    "WebKeyServiceAny": "web_key_service_any",
+    "WebKeyServiceConnectError": "web_key_service_connect_error",
+    "WebKeyServiceCreateWebKeyRequest": "web_key_service_create_web_key_request",
+    "WebKeyServiceCreateWebKeyResponse": "web_key_service_create_web_key_response",
+    "WebKeyServiceDeleteWebKeyRequest": "web_key_service_delete_web_key_request",
+    "WebKeyServiceDeleteWebKeyResponse": "web_key_service_delete_web_key_response",
+    "WebKeyServiceECDSA": "web_key_service_ecdsa",
+    "WebKeyServiceECDSACurve": "web_key_service_ecdsa_curve",
+    "WebKeyServiceListWebKeysResponse": "web_key_service_list_web_keys_response",
+    "WebKeyServiceRSA": "web_key_service_rsa",
+    "WebKeyServiceRSABits": "web_key_service_rsa_bits",
+    "WebKeyServiceRSAHasher": "web_key_service_rsa_hasher",
+    "WebKeyServiceState": "web_key_service_state",
+    "WebKeyServiceWebKey": "web_key_service_web_key",
+}
+
+__all__: List[str] = list(_MODELS)
+
+if TYPE_CHECKING:
+    from zitadel_client.models.action_service_activate_public_key_request import ActionServiceActivatePublicKeyRequest
+    from zitadel_client.models.action_service_activate_public_key_response import ActionServiceActivatePublicKeyResponse
+    from zitadel_client.models.action_service_add_public_key_request import ActionServiceAddPublicKeyRequest
+    from zitadel_client.models.action_service_add_public_key_response import ActionServiceAddPublicKeyResponse
+    from zitadel_client.models.action_service_any import ActionServiceAny
+    from zitadel_client.models.action_service_condition import ActionServiceCondition
+    from zitadel_client.models.action_service_connect_error import ActionServiceConnectError
+    from zitadel_client.models.action_service_create_target_request import ActionServiceCreateTargetRequest
+    from zitadel_client.models.action_service_create_target_response import ActionServiceCreateTargetResponse
+    from zitadel_client.models.action_service_deactivate_public_key_request import ActionServiceDeactivatePublicKeyRequest
+    from zitadel_client.models.action_service_deactivate_public_key_response import ActionServiceDeactivatePublicKeyResponse
+    from zitadel_client.models.action_service_delete_target_request import ActionServiceDeleteTargetRequest
+    from zitadel_client.models.action_service_delete_target_response import ActionServiceDeleteTargetResponse
+    from zitadel_client.models.action_service_event_execution import ActionServiceEventExecution
+    from zitadel_client.models.action_service_execution import ActionServiceExecution
+    from zitadel_client.models.action_service_execution_field_name import ActionServiceExecutionFieldName
+    from zitadel_client.models.action_service_execution_search_filter import ActionServiceExecutionSearchFilter
+    from zitadel_client.models.action_service_execution_type import ActionServiceExecutionType
+    from zitadel_client.models.action_service_execution_type_filter import ActionServiceExecutionTypeFilter
+    from zitadel_client.models.action_service_function_execution import ActionServiceFunctionExecution
+    from zitadel_client.models.action_service_get_target_request import ActionServiceGetTargetRequest
+    from zitadel_client.models.action_service_get_target_response import ActionServiceGetTargetResponse
+    from zitadel_client.models.action_service_in_conditions_filter import ActionServiceInConditionsFilter
+    from zitadel_client.models.action_service_in_ids_filter import ActionServiceInIDsFilter
+    from zitadel_client.models.action_service_in_target_ids_filter import ActionServiceInTargetIDsFilter
+    from zitadel_client.models.action_service_list_execution_functions_response import ActionServiceListExecutionFunctionsResponse
+    from zitadel_client.models.action_service_list_execution_methods_response import ActionServiceListExecutionMethodsResponse
+    from zitadel_client.models.action_service_list_execution_services_response import ActionServiceListExecutionServicesResponse
+    from zitadel_client.models.action_service_list_executions_request import ActionServiceListExecutionsRequest
+    from zitadel_client.models.action_service_list_executions_response import ActionServiceListExecutionsResponse
+    from zitadel_client.models.action_service_list_public_keys_request import ActionServiceListPublicKeysRequest
+    from zitadel_client.models.action_service_list_public_keys_response import ActionServiceListPublicKeysResponse
+    from zitadel_client.models.action_service_list_targets_request import ActionServiceListTargetsRequest
+    from zitadel_client.models.action_service_list_targets_response import ActionServiceListTargetsResponse
+    from zitadel_client.models.action_service_pagination_request import ActionServicePaginationRequest
+    from zitadel_client.models.action_service_pagination_response import ActionServicePaginationResponse
+    from zitadel_client.models.action_service_payload_type import ActionServicePayloadType
+    from zitadel_client.models.action_service_public_key import ActionServicePublicKey
+    from zitadel_client.models.action_service_public_key_field_name import ActionServicePublicKeyFieldName
+    from zitadel_client.models.action_service_public_key_search_filter import ActionServicePublicKeySearchFilter
+    from zitadel_client.models.action_service_rest_call import ActionServiceRESTCall
+    from zitadel_client.models.action_service_rest_webhook import ActionServiceRESTWebhook
+    from zitadel_client.models.action_service_remove_public_key_request import ActionServiceRemovePublicKeyRequest
+    from zitadel_client.models.action_service_remove_public_key_response import ActionServiceRemovePublicKeyResponse
+    from zitadel_client.models.action_service_request_execution import ActionServiceRequestExecution
+    from zitadel_client.models.action_service_response_execution import ActionServiceResponseExecution
+    from zitadel_client.models.action_service_set_execution_request import ActionServiceSetExecutionRequest
+    from zitadel_client.models.action_service_set_execution_response import ActionServiceSetExecutionResponse
+    from zitadel_client.models.action_service_target import ActionServiceTarget
+    from zitadel_client.models.action_service_target_field_name import ActionServiceTargetFieldName
+    from zitadel_client.models.action_service_target_filter import ActionServiceTargetFilter
+    from zitadel_client.models.action_service_target_name_filter import ActionServiceTargetNameFilter
+    from zitadel_client.models.action_service_target_search_filter import ActionServiceTargetSearchFilter
+    from zitadel_client.models.action_service_text_filter_method import ActionServiceTextFilterMethod
+    from zitadel_client.models.action_service_timestamp_filter import ActionServiceTimestampFilter
+    from zitadel_client.models.action_service_timestamp_filter_method import ActionServiceTimestampFilterMethod
+    from zitadel_client.models.action_service_update_target_request import ActionServiceUpdateTargetRequest
+    from zitadel_client.models.action_service_update_target_response import ActionServiceUpdateTargetResponse
+    from zitadel_client.models.application_service_api_auth_method_type import ApplicationServiceAPIAuthMethodType
+    from zitadel_client.models.application_service_api_configuration import ApplicationServiceAPIConfiguration
+    from zitadel_client.models.application_service_any import ApplicationServiceAny
+    from zitadel_client.models.application_service_application import ApplicationServiceApplication
+    from zitadel_client.models.application_service_application_key import ApplicationServiceApplicationKey
+    from zitadel_client.models.application_service_application_key_application_id_filter import ApplicationServiceApplicationKeyApplicationIDFilter
+    from zitadel_client.models.application_service_application_key_organization_id_filter import ApplicationServiceApplicationKeyOrganizationIDFilter
+    from zitadel_client.models.application_service_application_key_project_id_filter import ApplicationServiceApplicationKeyProjectIDFilter
+    from zitadel_client.models.application_service_application_key_search_filter import ApplicationServiceApplicationKeySearchFilter
+    from zitadel_client.models.application_service_application_keys_sorting import ApplicationServiceApplicationKeysSorting
+    from zitadel_client.models.application_service_application_name_filter import ApplicationServiceApplicationNameFilter
+    from zitadel_client.models.application_service_application_search_filter import ApplicationServiceApplicationSearchFilter
+    from zitadel_client.models.application_service_application_sorting import ApplicationServiceApplicationSorting
+    from zitadel_client.models.application_service_application_state import ApplicationServiceApplicationState
+    from zitadel_client.models.application_service_application_type import ApplicationServiceApplicationType
+    from zitadel_client.models.application_service_client_id_filter import ApplicationServiceClientIDFilter
+    from zitadel_client.models.application_service_connect_error import ApplicationServiceConnectError
+    from zitadel_client.models.application_service_create_api_application_request import ApplicationServiceCreateAPIApplicationRequest
+    from zitadel_client.models.application_service_create_api_application_response import ApplicationServiceCreateAPIApplicationResponse
+    from zitadel_client.models.application_service_create_application_key_request import ApplicationServiceCreateApplicationKeyRequest
+    from zitadel_client.models.application_service_create_application_key_response import ApplicationServiceCreateApplicationKeyResponse
+    from zitadel_client.models.application_service_create_application_request import ApplicationServiceCreateApplicationRequest
+    from zitadel_client.models.application_service_create_application_response import ApplicationServiceCreateApplicationResponse
+    from zitadel_client.models.application_service_create_oidc_application_request import ApplicationServiceCreateOIDCApplicationRequest
+    from zitadel_client.models.application_service_create_oidc_application_response import ApplicationServiceCreateOIDCApplicationResponse
+    from zitadel_client.models.application_service_create_saml_application_request import ApplicationServiceCreateSAMLApplicationRequest
+    from zitadel_client.models.application_service_deactivate_application_request import ApplicationServiceDeactivateApplicationRequest
+    from zitadel_client.models.application_service_deactivate_application_response import ApplicationServiceDeactivateApplicationResponse
+    from zitadel_client.models.application_service_delete_application_key_request import ApplicationServiceDeleteApplicationKeyRequest
+    from zitadel_client.models.application_service_delete_application_key_response import ApplicationServiceDeleteApplicationKeyResponse
+    from zitadel_client.models.application_service_delete_application_request import ApplicationServiceDeleteApplicationRequest
+    from zitadel_client.models.application_service_delete_application_response import ApplicationServiceDeleteApplicationResponse
+    from zitadel_client.models.application_service_entity_id_filter import ApplicationServiceEntityIDFilter
+    from zitadel_client.models.application_service_generate_client_secret_request import ApplicationServiceGenerateClientSecretRequest
+    from zitadel_client.models.application_service_generate_client_secret_response import ApplicationServiceGenerateClientSecretResponse
+    from zitadel_client.models.application_service_get_application_key_request import ApplicationServiceGetApplicationKeyRequest
+    from zitadel_client.models.application_service_get_application_key_response import ApplicationServiceGetApplicationKeyResponse
+    from zitadel_client.models.application_service_get_application_request import ApplicationServiceGetApplicationRequest
+    from zitadel_client.models.application_service_get_application_response import ApplicationServiceGetApplicationResponse
+    from zitadel_client.models.application_service_list_application_keys_request import ApplicationServiceListApplicationKeysRequest
+    from zitadel_client.models.application_service_list_application_keys_response import ApplicationServiceListApplicationKeysResponse
+    from zitadel_client.models.application_service_list_applications_request import ApplicationServiceListApplicationsRequest
+    from zitadel_client.models.application_service_list_applications_response import ApplicationServiceListApplicationsResponse
+    from zitadel_client.models.application_service_login_v2 import ApplicationServiceLoginV2
+    from zitadel_client.models.application_service_login_version import ApplicationServiceLoginVersion
+    from zitadel_client.models.application_service_oidc_application_type import ApplicationServiceOIDCApplicationType
+    from zitadel_client.models.application_service_oidc_auth_method_type import ApplicationServiceOIDCAuthMethodType
+    from zitadel_client.models.application_service_oidc_configuration import ApplicationServiceOIDCConfiguration
+    from zitadel_client.models.application_service_oidc_grant_type import ApplicationServiceOIDCGrantType
+    from zitadel_client.models.application_service_oidc_localized_message import ApplicationServiceOIDCLocalizedMessage
+    from zitadel_client.models.application_service_oidc_response_type import ApplicationServiceOIDCResponseType
+    from zitadel_client.models.application_service_oidc_token_type import ApplicationServiceOIDCTokenType
+    from zitadel_client.models.application_service_oidc_version import ApplicationServiceOIDCVersion
+    from zitadel_client.models.application_service_pagination_request import ApplicationServicePaginationRequest
+    from zitadel_client.models.application_service_pagination_response import ApplicationServicePaginationResponse
+    from zitadel_client.models.application_service_project_id_filter import ApplicationServiceProjectIDFilter
+    from zitadel_client.models.application_service_reactivate_application_request import ApplicationServiceReactivateApplicationRequest
+    from zitadel_client.models.application_service_reactivate_application_response import ApplicationServiceReactivateApplicationResponse
+    from zitadel_client.models.application_service_saml_configuration import ApplicationServiceSAMLConfiguration
+    from zitadel_client.models.application_service_text_filter_method import ApplicationServiceTextFilterMethod
+    from zitadel_client.models.application_service_update_api_application_configuration_request import ApplicationServiceUpdateAPIApplicationConfigurationRequest
+    from zitadel_client.models.application_service_update_application_request import ApplicationServiceUpdateApplicationRequest
+    from zitadel_client.models.application_service_update_application_response import ApplicationServiceUpdateApplicationResponse
+    from zitadel_client.models.application_service_update_oidc_application_configuration_request import ApplicationServiceUpdateOIDCApplicationConfigurationRequest
+    from zitadel_client.models.application_service_update_saml_application_configuration_request import ApplicationServiceUpdateSAMLApplicationConfigurationRequest
+    from zitadel_client.models.authorization_service_activate_authorization_request import AuthorizationServiceActivateAuthorizationRequest
+    from zitadel_client.models.authorization_service_activate_authorization_response import AuthorizationServiceActivateAuthorizationResponse
+    from zitadel_client.models.authorization_service_any import AuthorizationServiceAny
+    from zitadel_client.models.authorization_service_authorization import AuthorizationServiceAuthorization
+    from zitadel_client.models.authorization_service_authorization_field_name import AuthorizationServiceAuthorizationFieldName
+    from zitadel_client.models.authorization_service_authorizations_search_filter import AuthorizationServiceAuthorizationsSearchFilter
+    from zitadel_client.models.authorization_service_connect_error import AuthorizationServiceConnectError
+    from zitadel_client.models.authorization_service_create_authorization_request import AuthorizationServiceCreateAuthorizationRequest
+    from zitadel_client.models.authorization_service_create_authorization_response import AuthorizationServiceCreateAuthorizationResponse
+    from zitadel_client.models.authorization_service_deactivate_authorization_request import AuthorizationServiceDeactivateAuthorizationRequest
+    from zitadel_client.models.authorization_service_deactivate_authorization_response import AuthorizationServiceDeactivateAuthorizationResponse
+    from zitadel_client.models.authorization_service_delete_authorization_request import AuthorizationServiceDeleteAuthorizationRequest
+    from zitadel_client.models.authorization_service_delete_authorization_response import AuthorizationServiceDeleteAuthorizationResponse
+    from zitadel_client.models.authorization_service_id_filter import AuthorizationServiceIDFilter
+    from zitadel_client.models.authorization_service_in_ids_filter import AuthorizationServiceInIDsFilter
+    from zitadel_client.models.authorization_service_list_authorizations_request import AuthorizationServiceListAuthorizationsRequest
+    from zitadel_client.models.authorization_service_list_authorizations_response import AuthorizationServiceListAuthorizationsResponse
+    from zitadel_client.models.authorization_service_organization import AuthorizationServiceOrganization
+    from zitadel_client.models.authorization_service_pagination_request import AuthorizationServicePaginationRequest
+    from zitadel_client.models.authorization_service_pagination_response import AuthorizationServicePaginationResponse
+    from zitadel_client.models.authorization_service_project import AuthorizationServiceProject
+    from zitadel_client.models.authorization_service_project_name_query import AuthorizationServiceProjectNameQuery
+    from zitadel_client.models.authorization_service_role import AuthorizationServiceRole
+    from zitadel_client.models.authorization_service_role_key_query import AuthorizationServiceRoleKeyQuery
+    from zitadel_client.models.authorization_service_state import AuthorizationServiceState
+    from zitadel_client.models.authorization_service_state_query import AuthorizationServiceStateQuery
+    from zitadel_client.models.authorization_service_text_filter_method import AuthorizationServiceTextFilterMethod
+    from zitadel_client.models.authorization_service_update_authorization_request import AuthorizationServiceUpdateAuthorizationRequest
+    from zitadel_client.models.authorization_service_update_authorization_response import AuthorizationServiceUpdateAuthorizationResponse
+    from zitadel_client.models.authorization_service_user import AuthorizationServiceUser
+    from zitadel_client.models.authorization_service_user_display_name_query import AuthorizationServiceUserDisplayNameQuery
+    from zitadel_client.models.authorization_service_user_preferred_login_name_query import AuthorizationServiceUserPreferredLoginNameQuery
+    from zitadel_client.models.beta_action_service_any import BetaActionServiceAny
+    from zitadel_client.models.beta_action_service_condition import BetaActionServiceCondition
+    from zitadel_client.models.beta_action_service_connect_error import BetaActionServiceConnectError
+    from zitadel_client.models.beta_action_service_create_target_request import BetaActionServiceCreateTargetRequest
+    from zitadel_client.models.beta_action_service_create_target_response import BetaActionServiceCreateTargetResponse
+    from zitadel_client.models.beta_action_service_delete_target_request import BetaActionServiceDeleteTargetRequest
+    from zitadel_client.models.beta_action_service_delete_target_response import BetaActionServiceDeleteTargetResponse
+    from zitadel_client.models.beta_action_service_event_execution import BetaActionServiceEventExecution
+    from zitadel_client.models.beta_action_service_execution import BetaActionServiceExecution
+    from zitadel_client.models.beta_action_service_execution_field_name import BetaActionServiceExecutionFieldName
+    from zitadel_client.models.beta_action_service_execution_search_filter import BetaActionServiceExecutionSearchFilter
+    from zitadel_client.models.beta_action_service_execution_type import BetaActionServiceExecutionType
+    from zitadel_client.models.beta_action_service_execution_type_filter import BetaActionServiceExecutionTypeFilter
+    from zitadel_client.models.beta_action_service_function_execution import BetaActionServiceFunctionExecution
+    from zitadel_client.models.beta_action_service_get_target_request import BetaActionServiceGetTargetRequest
+    from zitadel_client.models.beta_action_service_get_target_response import BetaActionServiceGetTargetResponse
+    from zitadel_client.models.beta_action_service_in_conditions_filter import BetaActionServiceInConditionsFilter
+    from zitadel_client.models.beta_action_service_in_target_ids_filter import BetaActionServiceInTargetIDsFilter
+    from zitadel_client.models.beta_action_service_list_execution_functions_response import BetaActionServiceListExecutionFunctionsResponse
+    from zitadel_client.models.beta_action_service_list_execution_methods_response import BetaActionServiceListExecutionMethodsResponse
+    from zitadel_client.models.beta_action_service_list_execution_services_response import BetaActionServiceListExecutionServicesResponse
+    from zitadel_client.models.beta_action_service_list_executions_request import BetaActionServiceListExecutionsRequest
+    from zitadel_client.models.beta_action_service_list_executions_response import BetaActionServiceListExecutionsResponse
+    from zitadel_client.models.beta_action_service_list_targets_request import BetaActionServiceListTargetsRequest
+    from zitadel_client.models.beta_action_service_list_targets_response import BetaActionServiceListTargetsResponse
+    from zitadel_client.models.beta_action_service_pagination_request import BetaActionServicePaginationRequest
+    from zitadel_client.models.beta_action_service_pagination_response import BetaActionServicePaginationResponse
+    from zitadel_client.models.beta_action_service_rest_call import BetaActionServiceRESTCall
+    from zitadel_client.models.beta_action_service_rest_webhook import BetaActionServiceRESTWebhook
+    from zitadel_client.models.beta_action_service_request_execution import BetaActionServiceRequestExecution
+    from zitadel_client.models.beta_action_service_response_execution import BetaActionServiceResponseExecution
+    from zitadel_client.models.beta_action_service_set_execution_request import BetaActionServiceSetExecutionRequest
+    from zitadel_client.models.beta_action_service_set_execution_response import BetaActionServiceSetExecutionResponse
+    from zitadel_client.models.beta_action_service_target import BetaActionServiceTarget
+    from zitadel_client.models.beta_action_service_target_field_name import BetaActionServiceTargetFieldName
+    from zitadel_client.models.beta_action_service_target_filter import BetaActionServiceTargetFilter
+    from zitadel_client.models.beta_action_service_target_name_filter import BetaActionServiceTargetNameFilter
+    from zitadel_client.models.beta_action_service_target_search_filter import BetaActionServiceTargetSearchFilter
+    from zitadel_client.models.beta_action_service_text_filter_method import BetaActionServiceTextFilterMethod
+    from zitadel_client.models.beta_action_service_update_target_request import BetaActionServiceUpdateTargetRequest
+    from zitadel_client.models.beta_action_service_update_target_response import BetaActionServiceUpdateTargetResponse
+    from zitadel_client.models.beta_app_service_api_auth_method_type import BetaAppServiceAPIAuthMethodType
+    from zitadel_client.models.beta_app_service_api_config import BetaAppServiceAPIConfig
+    from zitadel_client.models.beta_app_service_any import BetaAppServiceAny
+    from zitadel_client.models.beta_app_service_app_sorting import BetaAppServiceAppSorting
+    from zitadel_client.models.beta_app_service_app_state import BetaAppServiceAppState
+    from zitadel_client.models.beta_app_service_application import BetaAppServiceApplication
+    from zitadel_client.models.beta_app_service_application_key import BetaAppServiceApplicationKey
+    from zitadel_client.models.beta_app_service_application_keys_sorting import BetaAppServiceApplicationKeysSorting
+    from zitadel_client.models.beta_app_service_application_name_query import BetaAppServiceApplicationNameQuery
+    from zitadel_client.models.beta_app_service_application_search_filter import BetaAppServiceApplicationSearchFilter
+    from zitadel_client.models.beta_app_service_connect_error import BetaAppServiceConnectError
+    from zitadel_client.models.beta_app_service_create_api_application_request import BetaAppServiceCreateAPIApplicationRequest
+    from zitadel_client.models.beta_app_service_create_api_application_response import BetaAppServiceCreateAPIApplicationResponse
+    from zitadel_client.models.beta_app_service_create_application_key_request import BetaAppServiceCreateApplicationKeyRequest
+    from zitadel_client.models.beta_app_service_create_application_key_response import BetaAppServiceCreateApplicationKeyResponse
+    from zitadel_client.models.beta_app_service_create_application_request import BetaAppServiceCreateApplicationRequest
+    from zitadel_client.models.beta_app_service_create_application_response import BetaAppServiceCreateApplicationResponse
+    from zitadel_client.models.beta_app_service_create_oidc_application_request import BetaAppServiceCreateOIDCApplicationRequest
+    from zitadel_client.models.beta_app_service_create_oidc_application_response import BetaAppServiceCreateOIDCApplicationResponse
+    from zitadel_client.models.beta_app_service_create_saml_application_request import BetaAppServiceCreateSAMLApplicationRequest
+    from zitadel_client.models.beta_app_service_deactivate_application_request import BetaAppServiceDeactivateApplicationRequest
+    from zitadel_client.models.beta_app_service_deactivate_application_response import BetaAppServiceDeactivateApplicationResponse
+    from zitadel_client.models.beta_app_service_delete_application_key_request import BetaAppServiceDeleteApplicationKeyRequest
+    from zitadel_client.models.beta_app_service_delete_application_key_response import BetaAppServiceDeleteApplicationKeyResponse
+    from zitadel_client.models.beta_app_service_delete_application_request import BetaAppServiceDeleteApplicationRequest
+    from zitadel_client.models.beta_app_service_delete_application_response import BetaAppServiceDeleteApplicationResponse
+    from zitadel_client.models.beta_app_service_get_application_key_request import BetaAppServiceGetApplicationKeyRequest
+    from zitadel_client.models.beta_app_service_get_application_key_response import BetaAppServiceGetApplicationKeyResponse
+    from zitadel_client.models.beta_app_service_get_application_request import BetaAppServiceGetApplicationRequest
+    from zitadel_client.models.beta_app_service_get_application_response import BetaAppServiceGetApplicationResponse
+    from zitadel_client.models.beta_app_service_list_application_keys_request import BetaAppServiceListApplicationKeysRequest
+    from zitadel_client.models.beta_app_service_list_application_keys_response import BetaAppServiceListApplicationKeysResponse
+    from zitadel_client.models.beta_app_service_list_applications_request import BetaAppServiceListApplicationsRequest
+    from zitadel_client.models.beta_app_service_list_applications_response import BetaAppServiceListApplicationsResponse
+    from zitadel_client.models.beta_app_service_login_v2 import BetaAppServiceLoginV2
+    from zitadel_client.models.beta_app_service_login_version import BetaAppServiceLoginVersion
+    from zitadel_client.models.beta_app_service_oidc_app_type import BetaAppServiceOIDCAppType
+    from zitadel_client.models.beta_app_service_oidc_auth_method_type import BetaAppServiceOIDCAuthMethodType
+    from zitadel_client.models.beta_app_service_oidc_config import BetaAppServiceOIDCConfig
+    from zitadel_client.models.beta_app_service_oidc_grant_type import BetaAppServiceOIDCGrantType
+    from zitadel_client.models.beta_app_service_oidc_localized_message import BetaAppServiceOIDCLocalizedMessage
+    from zitadel_client.models.beta_app_service_oidc_response_type import BetaAppServiceOIDCResponseType
+    from zitadel_client.models.beta_app_service_oidc_token_type import BetaAppServiceOIDCTokenType
+    from zitadel_client.models.beta_app_service_oidc_version import BetaAppServiceOIDCVersion
+    from zitadel_client.models.beta_app_service_pagination_request import BetaAppServicePaginationRequest
+    from zitadel_client.models.beta_app_service_pagination_response import BetaAppServicePaginationResponse
+    from zitadel_client.models.beta_app_service_reactivate_application_request import BetaAppServiceReactivateApplicationRequest
+    from zitadel_client.models.beta_app_service_reactivate_application_response import BetaAppServiceReactivateApplicationResponse
+    from zitadel_client.models.beta_app_service_regenerate_client_secret_request import BetaAppServiceRegenerateClientSecretRequest
+    from zitadel_client.models.beta_app_service_regenerate_client_secret_response import BetaAppServiceRegenerateClientSecretResponse
+    from zitadel_client.models.beta_app_service_saml_config import BetaAppServiceSAMLConfig
+    from zitadel_client.models.beta_app_service_text_filter_method import BetaAppServiceTextFilterMethod
+    from zitadel_client.models.beta_app_service_update_api_application_configuration_request import BetaAppServiceUpdateAPIApplicationConfigurationRequest
+    from zitadel_client.models.beta_app_service_update_application_request import BetaAppServiceUpdateApplicationRequest
+    from zitadel_client.models.beta_app_service_update_application_response import BetaAppServiceUpdateApplicationResponse
+    from zitadel_client.models.beta_app_service_update_oidc_application_configuration_request import BetaAppServiceUpdateOIDCApplicationConfigurationRequest
+    from zitadel_client.models.beta_app_service_update_saml_application_configuration_request import BetaAppServiceUpdateSAMLApplicationConfigurationRequest
+    from zitadel_client.models.beta_authorization_service_activate_authorization_request import BetaAuthorizationServiceActivateAuthorizationRequest
+    from zitadel_client.models.beta_authorization_service_activate_authorization_response import BetaAuthorizationServiceActivateAuthorizationResponse
+    from zitadel_client.models.beta_authorization_service_any import BetaAuthorizationServiceAny
+    from zitadel_client.models.beta_authorization_service_authorization import BetaAuthorizationServiceAuthorization
+    from zitadel_client.models.beta_authorization_service_authorization_field_name import BetaAuthorizationServiceAuthorizationFieldName
+    from zitadel_client.models.beta_authorization_service_authorizations_search_filter import BetaAuthorizationServiceAuthorizationsSearchFilter
+    from zitadel_client.models.beta_authorization_service_connect_error import BetaAuthorizationServiceConnectError
+    from zitadel_client.models.beta_authorization_service_create_authorization_request import BetaAuthorizationServiceCreateAuthorizationRequest
+    from zitadel_client.models.beta_authorization_service_create_authorization_response import BetaAuthorizationServiceCreateAuthorizationResponse
+    from zitadel_client.models.beta_authorization_service_deactivate_authorization_request import BetaAuthorizationServiceDeactivateAuthorizationRequest
+    from zitadel_client.models.beta_authorization_service_deactivate_authorization_response import BetaAuthorizationServiceDeactivateAuthorizationResponse
+    from zitadel_client.models.beta_authorization_service_delete_authorization_request import BetaAuthorizationServiceDeleteAuthorizationRequest
+    from zitadel_client.models.beta_authorization_service_delete_authorization_response import BetaAuthorizationServiceDeleteAuthorizationResponse
+    from zitadel_client.models.beta_authorization_service_id_filter import BetaAuthorizationServiceIDFilter
+    from zitadel_client.models.beta_authorization_service_in_ids_filter import BetaAuthorizationServiceInIDsFilter
+    from zitadel_client.models.beta_authorization_service_list_authorizations_request import BetaAuthorizationServiceListAuthorizationsRequest
+    from zitadel_client.models.beta_authorization_service_list_authorizations_response import BetaAuthorizationServiceListAuthorizationsResponse
+    from zitadel_client.models.beta_authorization_service_pagination_request import BetaAuthorizationServicePaginationRequest
+    from zitadel_client.models.beta_authorization_service_pagination_response import BetaAuthorizationServicePaginationResponse
+    from zitadel_client.models.beta_authorization_service_project_name_query import BetaAuthorizationServiceProjectNameQuery
+    from zitadel_client.models.beta_authorization_service_role_key_query import BetaAuthorizationServiceRoleKeyQuery
+    from zitadel_client.models.beta_authorization_service_state import BetaAuthorizationServiceState
+    from zitadel_client.models.beta_authorization_service_state_query import BetaAuthorizationServiceStateQuery
+    from zitadel_client.models.beta_authorization_service_text_filter_method import BetaAuthorizationServiceTextFilterMethod
+    from zitadel_client.models.beta_authorization_service_update_authorization_request import BetaAuthorizationServiceUpdateAuthorizationRequest
+    from zitadel_client.models.beta_authorization_service_update_authorization_response import BetaAuthorizationServiceUpdateAuthorizationResponse
+    from zitadel_client.models.beta_authorization_service_user import BetaAuthorizationServiceUser
+    from zitadel_client.models.beta_authorization_service_user_display_name_query import BetaAuthorizationServiceUserDisplayNameQuery
+    from zitadel_client.models.beta_authorization_service_user_preferred_login_name_query import BetaAuthorizationServiceUserPreferredLoginNameQuery
+    from zitadel_client.models.beta_feature_service_any import BetaFeatureServiceAny
+    from zitadel_client.models.beta_feature_service_connect_error import BetaFeatureServiceConnectError
+    from zitadel_client.models.beta_feature_service_details import BetaFeatureServiceDetails
+    from zitadel_client.models.beta_feature_service_feature_flag import BetaFeatureServiceFeatureFlag
+    from zitadel_client.models.beta_feature_service_get_instance_features_request import BetaFeatureServiceGetInstanceFeaturesRequest
+    from zitadel_client.models.beta_feature_service_get_instance_features_response import BetaFeatureServiceGetInstanceFeaturesResponse
+    from zitadel_client.models.beta_feature_service_get_organization_features_request import BetaFeatureServiceGetOrganizationFeaturesRequest
+    from zitadel_client.models.beta_feature_service_get_organization_features_response import BetaFeatureServiceGetOrganizationFeaturesResponse
+    from zitadel_client.models.beta_feature_service_get_system_features_response import BetaFeatureServiceGetSystemFeaturesResponse
+    from zitadel_client.models.beta_feature_service_get_user_features_request import BetaFeatureServiceGetUserFeaturesRequest
+    from zitadel_client.models.beta_feature_service_get_user_features_response import BetaFeatureServiceGetUserFeaturesResponse
+    from zitadel_client.models.beta_feature_service_improved_performance import BetaFeatureServiceImprovedPerformance
+    from zitadel_client.models.beta_feature_service_improved_performance_feature_flag import BetaFeatureServiceImprovedPerformanceFeatureFlag
+    from zitadel_client.models.beta_feature_service_reset_instance_features_response import BetaFeatureServiceResetInstanceFeaturesResponse
+    from zitadel_client.models.beta_feature_service_reset_organization_features_request import BetaFeatureServiceResetOrganizationFeaturesRequest
+    from zitadel_client.models.beta_feature_service_reset_organization_features_response import BetaFeatureServiceResetOrganizationFeaturesResponse
+    from zitadel_client.models.beta_feature_service_reset_system_features_response import BetaFeatureServiceResetSystemFeaturesResponse
+    from zitadel_client.models.beta_feature_service_reset_user_features_request import BetaFeatureServiceResetUserFeaturesRequest
+    from zitadel_client.models.beta_feature_service_reset_user_features_response import BetaFeatureServiceResetUserFeaturesResponse
+    from zitadel_client.models.beta_feature_service_set_instance_features_request import BetaFeatureServiceSetInstanceFeaturesRequest
+    from zitadel_client.models.beta_feature_service_set_instance_features_response import BetaFeatureServiceSetInstanceFeaturesResponse
+    from zitadel_client.models.beta_feature_service_set_organization_features_request import BetaFeatureServiceSetOrganizationFeaturesRequest
+    from zitadel_client.models.beta_feature_service_set_organization_features_response import BetaFeatureServiceSetOrganizationFeaturesResponse
+    from zitadel_client.models.beta_feature_service_set_system_features_request import BetaFeatureServiceSetSystemFeaturesRequest
+    from zitadel_client.models.beta_feature_service_set_system_features_response import BetaFeatureServiceSetSystemFeaturesResponse
+    from zitadel_client.models.beta_feature_service_set_user_feature_request import BetaFeatureServiceSetUserFeatureRequest
+    from zitadel_client.models.beta_feature_service_set_user_features_response import BetaFeatureServiceSetUserFeaturesResponse
+    from zitadel_client.models.beta_feature_service_source import BetaFeatureServiceSource
+    from zitadel_client.models.beta_instance_service_add_custom_domain_request import BetaInstanceServiceAddCustomDomainRequest
+    from zitadel_client.models.beta_instance_service_add_custom_domain_response import BetaInstanceServiceAddCustomDomainResponse
+    from zitadel_client.models.beta_instance_service_add_trusted_domain_request import BetaInstanceServiceAddTrustedDomainRequest
+    from zitadel_client.models.beta_instance_service_add_trusted_domain_response import BetaInstanceServiceAddTrustedDomainResponse
+    from zitadel_client.models.beta_instance_service_any import BetaInstanceServiceAny
+    from zitadel_client.models.beta_instance_service_connect_error import BetaInstanceServiceConnectError
+    from zitadel_client.models.beta_instance_service_delete_instance_request import BetaInstanceServiceDeleteInstanceRequest
+    from zitadel_client.models.beta_instance_service_delete_instance_response import BetaInstanceServiceDeleteInstanceResponse
+    from zitadel_client.models.beta_instance_service_domain import BetaInstanceServiceDomain
+    from zitadel_client.models.beta_instance_service_domain_field_name import BetaInstanceServiceDomainFieldName
+    from zitadel_client.models.beta_instance_service_domain_generated_query import BetaInstanceServiceDomainGeneratedQuery
+    from zitadel_client.models.beta_instance_service_domain_primary_query import BetaInstanceServiceDomainPrimaryQuery
+    from zitadel_client.models.beta_instance_service_domain_query import BetaInstanceServiceDomainQuery
+    from zitadel_client.models.beta_instance_service_domain_search_query import BetaInstanceServiceDomainSearchQuery
+    from zitadel_client.models.beta_instance_service_domains_query import BetaInstanceServiceDomainsQuery
+    from zitadel_client.models.beta_instance_service_field_name import BetaInstanceServiceFieldName
+    from zitadel_client.models.beta_instance_service_get_instance_request import BetaInstanceServiceGetInstanceRequest
+    from zitadel_client.models.beta_instance_service_get_instance_response import BetaInstanceServiceGetInstanceResponse
+    from zitadel_client.models.beta_instance_service_ids_query import BetaInstanceServiceIdsQuery
+    from zitadel_client.models.beta_instance_service_instance import BetaInstanceServiceInstance
+    from zitadel_client.models.beta_instance_service_list_custom_domains_request import BetaInstanceServiceListCustomDomainsRequest
+    from zitadel_client.models.beta_instance_service_list_custom_domains_response import BetaInstanceServiceListCustomDomainsResponse
+    from zitadel_client.models.beta_instance_service_list_instances_request import BetaInstanceServiceListInstancesRequest
+    from zitadel_client.models.beta_instance_service_list_instances_response import BetaInstanceServiceListInstancesResponse
+    from zitadel_client.models.beta_instance_service_list_trusted_domains_request import BetaInstanceServiceListTrustedDomainsRequest
+    from zitadel_client.models.beta_instance_service_list_trusted_domains_response import BetaInstanceServiceListTrustedDomainsResponse
+    from zitadel_client.models.beta_instance_service_pagination_request import BetaInstanceServicePaginationRequest
+    from zitadel_client.models.beta_instance_service_pagination_response import BetaInstanceServicePaginationResponse
+    from zitadel_client.models.beta_instance_service_query import BetaInstanceServiceQuery
+    from zitadel_client.models.beta_instance_service_remove_custom_domain_request import BetaInstanceServiceRemoveCustomDomainRequest
+    from zitadel_client.models.beta_instance_service_remove_custom_domain_response import BetaInstanceServiceRemoveCustomDomainResponse
+    from zitadel_client.models.beta_instance_service_remove_trusted_domain_request import BetaInstanceServiceRemoveTrustedDomainRequest
+    from zitadel_client.models.beta_instance_service_remove_trusted_domain_response import BetaInstanceServiceRemoveTrustedDomainResponse
+    from zitadel_client.models.beta_instance_service_state import BetaInstanceServiceState
+    from zitadel_client.models.beta_instance_service_text_query_method import BetaInstanceServiceTextQueryMethod
+    from zitadel_client.models.beta_instance_service_trusted_domain import BetaInstanceServiceTrustedDomain
+    from zitadel_client.models.beta_instance_service_trusted_domain_field_name import BetaInstanceServiceTrustedDomainFieldName
+    from zitadel_client.models.beta_instance_service_trusted_domain_search_query import BetaInstanceServiceTrustedDomainSearchQuery
+    from zitadel_client.models.beta_instance_service_update_instance_request import BetaInstanceServiceUpdateInstanceRequest
+    from zitadel_client.models.beta_instance_service_update_instance_response import BetaInstanceServiceUpdateInstanceResponse
+    from zitadel_client.models.beta_internal_permission_service_administrator import BetaInternalPermissionServiceAdministrator
+    from zitadel_client.models.beta_internal_permission_service_administrator_field_name import BetaInternalPermissionServiceAdministratorFieldName
+    from zitadel_client.models.beta_internal_permission_service_administrator_search_filter import BetaInternalPermissionServiceAdministratorSearchFilter
+    from zitadel_client.models.beta_internal_permission_service_and_filter import BetaInternalPermissionServiceAndFilter
+    from zitadel_client.models.beta_internal_permission_service_any import BetaInternalPermissionServiceAny
+    from zitadel_client.models.beta_internal_permission_service_connect_error import BetaInternalPermissionServiceConnectError
+    from zitadel_client.models.beta_internal_permission_service_create_administrator_request import BetaInternalPermissionServiceCreateAdministratorRequest
+    from zitadel_client.models.beta_internal_permission_service_create_administrator_response import BetaInternalPermissionServiceCreateAdministratorResponse
+    from zitadel_client.models.beta_internal_permission_service_delete_administrator_request import BetaInternalPermissionServiceDeleteAdministratorRequest
+    from zitadel_client.models.beta_internal_permission_service_delete_administrator_response import BetaInternalPermissionServiceDeleteAdministratorResponse
+    from zitadel_client.models.beta_internal_permission_service_id_filter import BetaInternalPermissionServiceIDFilter
+    from zitadel_client.models.beta_internal_permission_service_in_ids_filter import BetaInternalPermissionServiceInIDsFilter
+    from zitadel_client.models.beta_internal_permission_service_list_administrators_request import BetaInternalPermissionServiceListAdministratorsRequest
+    from zitadel_client.models.beta_internal_permission_service_list_administrators_response import BetaInternalPermissionServiceListAdministratorsResponse
+    from zitadel_client.models.beta_internal_permission_service_not_filter import BetaInternalPermissionServiceNotFilter
+    from zitadel_client.models.beta_internal_permission_service_or_filter import BetaInternalPermissionServiceOrFilter
+    from zitadel_client.models.beta_internal_permission_service_organization import BetaInternalPermissionServiceOrganization
+    from zitadel_client.models.beta_internal_permission_service_pagination_request import BetaInternalPermissionServicePaginationRequest
+    from zitadel_client.models.beta_internal_permission_service_pagination_response import BetaInternalPermissionServicePaginationResponse
+    from zitadel_client.models.beta_internal_permission_service_project import BetaInternalPermissionServiceProject
+    from zitadel_client.models.beta_internal_permission_service_project_grant import BetaInternalPermissionServiceProjectGrant
+    from zitadel_client.models.beta_internal_permission_service_resource_filter import BetaInternalPermissionServiceResourceFilter
+    from zitadel_client.models.beta_internal_permission_service_resource_type import BetaInternalPermissionServiceResourceType
+    from zitadel_client.models.beta_internal_permission_service_role_filter import BetaInternalPermissionServiceRoleFilter
+    from zitadel_client.models.beta_internal_permission_service_text_filter_method import BetaInternalPermissionServiceTextFilterMethod
+    from zitadel_client.models.beta_internal_permission_service_timestamp_filter import BetaInternalPermissionServiceTimestampFilter
+    from zitadel_client.models.beta_internal_permission_service_timestamp_filter_method import BetaInternalPermissionServiceTimestampFilterMethod
+    from zitadel_client.models.beta_internal_permission_service_update_administrator_request import BetaInternalPermissionServiceUpdateAdministratorRequest
+    from zitadel_client.models.beta_internal_permission_service_update_administrator_response import BetaInternalPermissionServiceUpdateAdministratorResponse
+    from zitadel_client.models.beta_internal_permission_service_user import BetaInternalPermissionServiceUser
+    from zitadel_client.models.beta_internal_permission_service_user_display_name_filter import BetaInternalPermissionServiceUserDisplayNameFilter
+    from zitadel_client.models.beta_internal_permission_service_user_preferred_login_name_filter import BetaInternalPermissionServiceUserPreferredLoginNameFilter
+    from zitadel_client.models.beta_oidc_service_any import BetaOIDCServiceAny
+    from zitadel_client.models.beta_oidc_service_auth_request import BetaOIDCServiceAuthRequest
+    from zitadel_client.models.beta_oidc_service_authorization_error import BetaOIDCServiceAuthorizationError
+    from zitadel_client.models.beta_oidc_service_connect_error import BetaOIDCServiceConnectError
+    from zitadel_client.models.beta_oidc_service_create_callback_request import BetaOIDCServiceCreateCallbackRequest
+    from zitadel_client.models.beta_oidc_service_create_callback_response import BetaOIDCServiceCreateCallbackResponse
+    from zitadel_client.models.beta_oidc_service_details import BetaOIDCServiceDetails
+    from zitadel_client.models.beta_oidc_service_error_reason import BetaOIDCServiceErrorReason
+    from zitadel_client.models.beta_oidc_service_get_auth_request_request import BetaOIDCServiceGetAuthRequestRequest
+    from zitadel_client.models.beta_oidc_service_get_auth_request_response import BetaOIDCServiceGetAuthRequestResponse
+    from zitadel_client.models.beta_oidc_service_prompt import BetaOIDCServicePrompt
+    from zitadel_client.models.beta_oidc_service_session import BetaOIDCServiceSession
+    from zitadel_client.models.beta_organization_service_activate_organization_request import BetaOrganizationServiceActivateOrganizationRequest
+    from zitadel_client.models.beta_organization_service_activate_organization_response import BetaOrganizationServiceActivateOrganizationResponse
+    from zitadel_client.models.beta_organization_service_add_human_user_request import BetaOrganizationServiceAddHumanUserRequest
+    from zitadel_client.models.beta_organization_service_add_organization_domain_request import BetaOrganizationServiceAddOrganizationDomainRequest
+    from zitadel_client.models.beta_organization_service_add_organization_domain_response import BetaOrganizationServiceAddOrganizationDomainResponse
+    from zitadel_client.models.beta_organization_service_admin import BetaOrganizationServiceAdmin
+    from zitadel_client.models.beta_organization_service_any import BetaOrganizationServiceAny
+    from zitadel_client.models.beta_organization_service_assigned_admin import BetaOrganizationServiceAssignedAdmin
+    from zitadel_client.models.beta_organization_service_connect_error import BetaOrganizationServiceConnectError
+    from zitadel_client.models.beta_organization_service_create_organization_request import BetaOrganizationServiceCreateOrganizationRequest
+    from zitadel_client.models.beta_organization_service_create_organization_response import BetaOrganizationServiceCreateOrganizationResponse
+    from zitadel_client.models.beta_organization_service_created_admin import BetaOrganizationServiceCreatedAdmin
+    from zitadel_client.models.beta_organization_service_deactivate_organization_request import BetaOrganizationServiceDeactivateOrganizationRequest
+    from zitadel_client.models.beta_organization_service_deactivate_organization_response import BetaOrganizationServiceDeactivateOrganizationResponse
+    from zitadel_client.models.beta_organization_service_delete_organization_domain_request import BetaOrganizationServiceDeleteOrganizationDomainRequest
+    from zitadel_client.models.beta_organization_service_delete_organization_domain_response import BetaOrganizationServiceDeleteOrganizationDomainResponse
+    from zitadel_client.models.beta_organization_service_delete_organization_metadata_request import BetaOrganizationServiceDeleteOrganizationMetadataRequest
+    from zitadel_client.models.beta_organization_service_delete_organization_metadata_response import BetaOrganizationServiceDeleteOrganizationMetadataResponse
+    from zitadel_client.models.beta_organization_service_delete_organization_request import BetaOrganizationServiceDeleteOrganizationRequest
+    from zitadel_client.models.beta_organization_service_delete_organization_response import BetaOrganizationServiceDeleteOrganizationResponse
+    from zitadel_client.models.beta_organization_service_domain import BetaOrganizationServiceDomain
+    from zitadel_client.models.beta_organization_service_domain_name_filter import BetaOrganizationServiceDomainNameFilter
+    from zitadel_client.models.beta_organization_service_domain_search_filter import BetaOrganizationServiceDomainSearchFilter
+    from zitadel_client.models.beta_organization_service_domain_validation_type import BetaOrganizationServiceDomainValidationType
+    from zitadel_client.models.beta_organization_service_gender import BetaOrganizationServiceGender
+    from zitadel_client.models.beta_organization_service_generate_organization_domain_validation_request import BetaOrganizationServiceGenerateOrganizationDomainValidationRequest
+    from zitadel_client.models.beta_organization_service_generate_organization_domain_validation_response import BetaOrganizationServiceGenerateOrganizationDomainValidationResponse
+    from zitadel_client.models.beta_organization_service_hashed_password import BetaOrganizationServiceHashedPassword
+    from zitadel_client.models.beta_organization_service_idp_link import BetaOrganizationServiceIDPLink
+    from zitadel_client.models.beta_organization_service_list_organization_domains_request import BetaOrganizationServiceListOrganizationDomainsRequest
+    from zitadel_client.models.beta_organization_service_list_organization_domains_response import BetaOrganizationServiceListOrganizationDomainsResponse
+    from zitadel_client.models.beta_organization_service_list_organization_metadata_request import BetaOrganizationServiceListOrganizationMetadataRequest
+    from zitadel_client.models.beta_organization_service_list_organization_metadata_response import BetaOrganizationServiceListOrganizationMetadataResponse
+    from zitadel_client.models.beta_organization_service_list_organizations_request import BetaOrganizationServiceListOrganizationsRequest
+    from zitadel_client.models.beta_organization_service_list_organizations_response import BetaOrganizationServiceListOrganizationsResponse
+    from zitadel_client.models.beta_organization_service_metadata import BetaOrganizationServiceMetadata
+    from zitadel_client.models.beta_organization_service_metadata_key_query import BetaOrganizationServiceMetadataKeyQuery
+    from zitadel_client.models.beta_organization_service_metadata_query import BetaOrganizationServiceMetadataQuery
+    from zitadel_client.models.beta_organization_service_org_domain_filter import BetaOrganizationServiceOrgDomainFilter
+    from zitadel_client.models.beta_organization_service_org_field_name import BetaOrganizationServiceOrgFieldName
+    from zitadel_client.models.beta_organization_service_org_id_filter import BetaOrganizationServiceOrgIDFilter
+    from zitadel_client.models.beta_organization_service_org_name_filter import BetaOrganizationServiceOrgNameFilter
+    from zitadel_client.models.beta_organization_service_org_state import BetaOrganizationServiceOrgState
+    from zitadel_client.models.beta_organization_service_org_state_filter import BetaOrganizationServiceOrgStateFilter
+    from zitadel_client.models.beta_organization_service_organization import BetaOrganizationServiceOrganization
+    from zitadel_client.models.beta_organization_service_organization_admin import BetaOrganizationServiceOrganizationAdmin
+    from zitadel_client.models.beta_organization_service_organization_search_filter import BetaOrganizationServiceOrganizationSearchFilter
+    from zitadel_client.models.beta_organization_service_pagination_request import BetaOrganizationServicePaginationRequest
+    from zitadel_client.models.beta_organization_service_pagination_response import BetaOrganizationServicePaginationResponse
+    from zitadel_client.models.beta_organization_service_password import BetaOrganizationServicePassword
+    from zitadel_client.models.beta_organization_service_send_email_verification_code import BetaOrganizationServiceSendEmailVerificationCode
+    from zitadel_client.models.beta_organization_service_set_human_email import BetaOrganizationServiceSetHumanEmail
+    from zitadel_client.models.beta_organization_service_set_human_phone import BetaOrganizationServiceSetHumanPhone
+    from zitadel_client.models.beta_organization_service_set_human_profile import BetaOrganizationServiceSetHumanProfile
+    from zitadel_client.models.beta_organization_service_set_metadata_entry import BetaOrganizationServiceSetMetadataEntry
+    from zitadel_client.models.beta_organization_service_set_organization_metadata_request import BetaOrganizationServiceSetOrganizationMetadataRequest
+    from zitadel_client.models.beta_organization_service_set_organization_metadata_response import BetaOrganizationServiceSetOrganizationMetadataResponse
+    from zitadel_client.models.beta_organization_service_text_query_method import BetaOrganizationServiceTextQueryMethod
+    from zitadel_client.models.beta_organization_service_update_organization_request import BetaOrganizationServiceUpdateOrganizationRequest
+    from zitadel_client.models.beta_organization_service_update_organization_response import BetaOrganizationServiceUpdateOrganizationResponse
+    from zitadel_client.models.beta_organization_service_verify_organization_domain_request import BetaOrganizationServiceVerifyOrganizationDomainRequest
+    from zitadel_client.models.beta_organization_service_verify_organization_domain_response import BetaOrganizationServiceVerifyOrganizationDomainResponse
+    from zitadel_client.models.beta_project_service_activate_project_grant_request import BetaProjectServiceActivateProjectGrantRequest
+    from zitadel_client.models.beta_project_service_activate_project_grant_response import BetaProjectServiceActivateProjectGrantResponse
+    from zitadel_client.models.beta_project_service_activate_project_request import BetaProjectServiceActivateProjectRequest
+    from zitadel_client.models.beta_project_service_activate_project_response import BetaProjectServiceActivateProjectResponse
+    from zitadel_client.models.beta_project_service_add_project_role_request import BetaProjectServiceAddProjectRoleRequest
+    from zitadel_client.models.beta_project_service_add_project_role_response import BetaProjectServiceAddProjectRoleResponse
+    from zitadel_client.models.beta_project_service_admin import BetaProjectServiceAdmin
+    from zitadel_client.models.beta_project_service_any import BetaProjectServiceAny
+    from zitadel_client.models.beta_project_service_connect_error import BetaProjectServiceConnectError
+    from zitadel_client.models.beta_project_service_create_project_grant_request import BetaProjectServiceCreateProjectGrantRequest
+    from zitadel_client.models.beta_project_service_create_project_grant_response import BetaProjectServiceCreateProjectGrantResponse
+    from zitadel_client.models.beta_project_service_create_project_request import BetaProjectServiceCreateProjectRequest
+    from zitadel_client.models.beta_project_service_create_project_response import BetaProjectServiceCreateProjectResponse
+    from zitadel_client.models.beta_project_service_deactivate_project_grant_request import BetaProjectServiceDeactivateProjectGrantRequest
+    from zitadel_client.models.beta_project_service_deactivate_project_grant_response import BetaProjectServiceDeactivateProjectGrantResponse
+    from zitadel_client.models.beta_project_service_deactivate_project_request import BetaProjectServiceDeactivateProjectRequest
+    from zitadel_client.models.beta_project_service_deactivate_project_response import BetaProjectServiceDeactivateProjectResponse
+    from zitadel_client.models.beta_project_service_delete_project_grant_request import BetaProjectServiceDeleteProjectGrantRequest
+    from zitadel_client.models.beta_project_service_delete_project_grant_response import BetaProjectServiceDeleteProjectGrantResponse
+    from zitadel_client.models.beta_project_service_delete_project_request import BetaProjectServiceDeleteProjectRequest
+    from zitadel_client.models.beta_project_service_delete_project_response import BetaProjectServiceDeleteProjectResponse
+    from zitadel_client.models.beta_project_service_get_project_request import BetaProjectServiceGetProjectRequest
+    from zitadel_client.models.beta_project_service_get_project_response import BetaProjectServiceGetProjectResponse
+    from zitadel_client.models.beta_project_service_granted_project_state import BetaProjectServiceGrantedProjectState
+    from zitadel_client.models.beta_project_service_id_filter import BetaProjectServiceIDFilter
+    from zitadel_client.models.beta_project_service_in_ids_filter import BetaProjectServiceInIDsFilter
+    from zitadel_client.models.beta_project_service_list_project_grants_request import BetaProjectServiceListProjectGrantsRequest
+    from zitadel_client.models.beta_project_service_list_project_grants_response import BetaProjectServiceListProjectGrantsResponse
+    from zitadel_client.models.beta_project_service_list_project_roles_request import BetaProjectServiceListProjectRolesRequest
+    from zitadel_client.models.beta_project_service_list_project_roles_response import BetaProjectServiceListProjectRolesResponse
+    from zitadel_client.models.beta_project_service_list_projects_request import BetaProjectServiceListProjectsRequest
+    from zitadel_client.models.beta_project_service_list_projects_response import BetaProjectServiceListProjectsResponse
+    from zitadel_client.models.beta_project_service_pagination_request import BetaProjectServicePaginationRequest
+    from zitadel_client.models.beta_project_service_pagination_response import BetaProjectServicePaginationResponse
+    from zitadel_client.models.beta_project_service_private_labeling_setting import BetaProjectServicePrivateLabelingSetting
+    from zitadel_client.models.beta_project_service_project import BetaProjectServiceProject
+    from zitadel_client.models.beta_project_service_project_field_name import BetaProjectServiceProjectFieldName
+    from zitadel_client.models.beta_project_service_project_grant import BetaProjectServiceProjectGrant
+    from zitadel_client.models.beta_project_service_project_grant_field_name import BetaProjectServiceProjectGrantFieldName
+    from zitadel_client.models.beta_project_service_project_grant_search_filter import BetaProjectServiceProjectGrantSearchFilter
+    from zitadel_client.models.beta_project_service_project_grant_state import BetaProjectServiceProjectGrantState
+    from zitadel_client.models.beta_project_service_project_name_filter import BetaProjectServiceProjectNameFilter
+    from zitadel_client.models.beta_project_service_project_role import BetaProjectServiceProjectRole
+    from zitadel_client.models.beta_project_service_project_role_display_name_filter import BetaProjectServiceProjectRoleDisplayNameFilter
+    from zitadel_client.models.beta_project_service_project_role_field_name import BetaProjectServiceProjectRoleFieldName
+    from zitadel_client.models.beta_project_service_project_role_key_filter import BetaProjectServiceProjectRoleKeyFilter
+    from zitadel_client.models.beta_project_service_project_role_search_filter import BetaProjectServiceProjectRoleSearchFilter
+    from zitadel_client.models.beta_project_service_project_search_filter import BetaProjectServiceProjectSearchFilter
+    from zitadel_client.models.beta_project_service_project_state import BetaProjectServiceProjectState
+    from zitadel_client.models.beta_project_service_remove_project_role_request import BetaProjectServiceRemoveProjectRoleRequest
+    from zitadel_client.models.beta_project_service_remove_project_role_response import BetaProjectServiceRemoveProjectRoleResponse
+    from zitadel_client.models.beta_project_service_text_filter_method import BetaProjectServiceTextFilterMethod
+    from zitadel_client.models.beta_project_service_update_project_grant_request import BetaProjectServiceUpdateProjectGrantRequest
+    from zitadel_client.models.beta_project_service_update_project_grant_response import BetaProjectServiceUpdateProjectGrantResponse
+    from zitadel_client.models.beta_project_service_update_project_request import BetaProjectServiceUpdateProjectRequest
+    from zitadel_client.models.beta_project_service_update_project_response import BetaProjectServiceUpdateProjectResponse
+    from zitadel_client.models.beta_project_service_update_project_role_request import BetaProjectServiceUpdateProjectRoleRequest
+    from zitadel_client.models.beta_project_service_update_project_role_response import BetaProjectServiceUpdateProjectRoleResponse
+    from zitadel_client.models.beta_session_service_any import BetaSessionServiceAny
+    from zitadel_client.models.beta_session_service_challenges import BetaSessionServiceChallenges
+    from zitadel_client.models.beta_session_service_check_idp_intent import BetaSessionServiceCheckIDPIntent
+    from zitadel_client.models.beta_session_service_check_otp import BetaSessionServiceCheckOTP
+    from zitadel_client.models.beta_session_service_check_password import BetaSessionServiceCheckPassword
+    from zitadel_client.models.beta_session_service_check_totp import BetaSessionServiceCheckTOTP
+    from zitadel_client.models.beta_session_service_check_user import BetaSessionServiceCheckUser
+    from zitadel_client.models.beta_session_service_check_web_auth_n import BetaSessionServiceCheckWebAuthN
+    from zitadel_client.models.beta_session_service_checks import BetaSessionServiceChecks
+    from zitadel_client.models.beta_session_service_connect_error import BetaSessionServiceConnectError
+    from zitadel_client.models.beta_session_service_create_session_request import BetaSessionServiceCreateSessionRequest
+    from zitadel_client.models.beta_session_service_create_session_response import BetaSessionServiceCreateSessionResponse
+    from zitadel_client.models.beta_session_service_creation_date_query import BetaSessionServiceCreationDateQuery
+    from zitadel_client.models.beta_session_service_delete_session_request import BetaSessionServiceDeleteSessionRequest
+    from zitadel_client.models.beta_session_service_delete_session_response import BetaSessionServiceDeleteSessionResponse
+    from zitadel_client.models.beta_session_service_details import BetaSessionServiceDetails
+    from zitadel_client.models.beta_session_service_factors import BetaSessionServiceFactors
+    from zitadel_client.models.beta_session_service_get_session_request import BetaSessionServiceGetSessionRequest
+    from zitadel_client.models.beta_session_service_get_session_response import BetaSessionServiceGetSessionResponse
+    from zitadel_client.models.beta_session_service_header_values import BetaSessionServiceHeaderValues
+    from zitadel_client.models.beta_session_service_ids_query import BetaSessionServiceIDsQuery
+    from zitadel_client.models.beta_session_service_intent_factor import BetaSessionServiceIntentFactor
+    from zitadel_client.models.beta_session_service_list_details import BetaSessionServiceListDetails
+    from zitadel_client.models.beta_session_service_list_query import BetaSessionServiceListQuery
+    from zitadel_client.models.beta_session_service_list_sessions_request import BetaSessionServiceListSessionsRequest
+    from zitadel_client.models.beta_session_service_list_sessions_response import BetaSessionServiceListSessionsResponse
+    from zitadel_client.models.beta_session_service_otp_email import BetaSessionServiceOTPEmail
+    from zitadel_client.models.beta_session_service_otp_factor import BetaSessionServiceOTPFactor
+    from zitadel_client.models.beta_session_service_otpsms import BetaSessionServiceOTPSMS
+    from zitadel_client.models.beta_session_service_password_factor import BetaSessionServicePasswordFactor
+    from zitadel_client.models.beta_session_service_request_challenges import BetaSessionServiceRequestChallenges
+    from zitadel_client.models.beta_session_service_search_query import BetaSessionServiceSearchQuery
+    from zitadel_client.models.beta_session_service_send_code import BetaSessionServiceSendCode
+    from zitadel_client.models.beta_session_service_session import BetaSessionServiceSession
+    from zitadel_client.models.beta_session_service_session_field_name import BetaSessionServiceSessionFieldName
+    from zitadel_client.models.beta_session_service_set_session_request import BetaSessionServiceSetSessionRequest
+    from zitadel_client.models.beta_session_service_set_session_response import BetaSessionServiceSetSessionResponse
+    from zitadel_client.models.beta_session_service_totp_factor import BetaSessionServiceTOTPFactor
+    from zitadel_client.models.beta_session_service_timestamp_query_method import BetaSessionServiceTimestampQueryMethod
+    from zitadel_client.models.beta_session_service_user_agent import BetaSessionServiceUserAgent
+    from zitadel_client.models.beta_session_service_user_factor import BetaSessionServiceUserFactor
+    from zitadel_client.models.beta_session_service_user_id_query import BetaSessionServiceUserIDQuery
+    from zitadel_client.models.beta_session_service_user_verification_requirement import BetaSessionServiceUserVerificationRequirement
+    from zitadel_client.models.beta_session_service_web_auth_n import BetaSessionServiceWebAuthN
+    from zitadel_client.models.beta_session_service_web_auth_n_factor import BetaSessionServiceWebAuthNFactor
+    from zitadel_client.models.beta_settings_service_any import BetaSettingsServiceAny
+    from zitadel_client.models.beta_settings_service_branding_settings import BetaSettingsServiceBrandingSettings
+    from zitadel_client.models.beta_settings_service_connect_error import BetaSettingsServiceConnectError
+    from zitadel_client.models.beta_settings_service_details import BetaSettingsServiceDetails
+    from zitadel_client.models.beta_settings_service_domain_settings import BetaSettingsServiceDomainSettings
+    from zitadel_client.models.beta_settings_service_embedded_iframe_settings import BetaSettingsServiceEmbeddedIframeSettings
+    from zitadel_client.models.beta_settings_service_get_active_identity_providers_request import BetaSettingsServiceGetActiveIdentityProvidersRequest
+    from zitadel_client.models.beta_settings_service_get_active_identity_providers_response import BetaSettingsServiceGetActiveIdentityProvidersResponse
+    from zitadel_client.models.beta_settings_service_get_branding_settings_request import BetaSettingsServiceGetBrandingSettingsRequest
+    from zitadel_client.models.beta_settings_service_get_branding_settings_response import BetaSettingsServiceGetBrandingSettingsResponse
+    from zitadel_client.models.beta_settings_service_get_domain_settings_request import BetaSettingsServiceGetDomainSettingsRequest
+    from zitadel_client.models.beta_settings_service_get_domain_settings_response import BetaSettingsServiceGetDomainSettingsResponse
+    from zitadel_client.models.beta_settings_service_get_general_settings_response import BetaSettingsServiceGetGeneralSettingsResponse
+    from zitadel_client.models.beta_settings_service_get_legal_and_support_settings_request import BetaSettingsServiceGetLegalAndSupportSettingsRequest
+    from zitadel_client.models.beta_settings_service_get_legal_and_support_settings_response import BetaSettingsServiceGetLegalAndSupportSettingsResponse
+    from zitadel_client.models.beta_settings_service_get_lockout_settings_request import BetaSettingsServiceGetLockoutSettingsRequest
+    from zitadel_client.models.beta_settings_service_get_lockout_settings_response import BetaSettingsServiceGetLockoutSettingsResponse
+    from zitadel_client.models.beta_settings_service_get_login_settings_request import BetaSettingsServiceGetLoginSettingsRequest
+    from zitadel_client.models.beta_settings_service_get_login_settings_response import BetaSettingsServiceGetLoginSettingsResponse
+    from zitadel_client.models.beta_settings_service_get_password_complexity_settings_request import BetaSettingsServiceGetPasswordComplexitySettingsRequest
+    from zitadel_client.models.beta_settings_service_get_password_complexity_settings_response import BetaSettingsServiceGetPasswordComplexitySettingsResponse
+    from zitadel_client.models.beta_settings_service_get_password_expiry_settings_request import BetaSettingsServiceGetPasswordExpirySettingsRequest
+    from zitadel_client.models.beta_settings_service_get_password_expiry_settings_response import BetaSettingsServiceGetPasswordExpirySettingsResponse
+    from zitadel_client.models.beta_settings_service_get_security_settings_response import BetaSettingsServiceGetSecuritySettingsResponse
+    from zitadel_client.models.beta_settings_service_identity_provider import BetaSettingsServiceIdentityProvider
+    from zitadel_client.models.beta_settings_service_identity_provider_type import BetaSettingsServiceIdentityProviderType
+    from zitadel_client.models.beta_settings_service_legal_and_support_settings import BetaSettingsServiceLegalAndSupportSettings
+    from zitadel_client.models.beta_settings_service_list_details import BetaSettingsServiceListDetails
+    from zitadel_client.models.beta_settings_service_lockout_settings import BetaSettingsServiceLockoutSettings
+    from zitadel_client.models.beta_settings_service_login_settings import BetaSettingsServiceLoginSettings
+    from zitadel_client.models.beta_settings_service_multi_factor_type import BetaSettingsServiceMultiFactorType
+    from zitadel_client.models.beta_settings_service_passkeys_type import BetaSettingsServicePasskeysType
+    from zitadel_client.models.beta_settings_service_password_complexity_settings import BetaSettingsServicePasswordComplexitySettings
+    from zitadel_client.models.beta_settings_service_password_expiry_settings import BetaSettingsServicePasswordExpirySettings
+    from zitadel_client.models.beta_settings_service_request_context import BetaSettingsServiceRequestContext
+    from zitadel_client.models.beta_settings_service_resource_owner_type import BetaSettingsServiceResourceOwnerType
+    from zitadel_client.models.beta_settings_service_second_factor_type import BetaSettingsServiceSecondFactorType
+    from zitadel_client.models.beta_settings_service_security_settings import BetaSettingsServiceSecuritySettings
+    from zitadel_client.models.beta_settings_service_set_security_settings_request import BetaSettingsServiceSetSecuritySettingsRequest
+    from zitadel_client.models.beta_settings_service_set_security_settings_response import BetaSettingsServiceSetSecuritySettingsResponse
+    from zitadel_client.models.beta_settings_service_theme import BetaSettingsServiceTheme
+    from zitadel_client.models.beta_settings_service_theme_mode import BetaSettingsServiceThemeMode
+    from zitadel_client.models.beta_telemetry_service_any import BetaTelemetryServiceAny
+    from zitadel_client.models.beta_telemetry_service_connect_error import BetaTelemetryServiceConnectError
+    from zitadel_client.models.beta_telemetry_service_count_parent_type import BetaTelemetryServiceCountParentType
+    from zitadel_client.models.beta_telemetry_service_instance_information import BetaTelemetryServiceInstanceInformation
+    from zitadel_client.models.beta_telemetry_service_report_base_information_request import BetaTelemetryServiceReportBaseInformationRequest
+    from zitadel_client.models.beta_telemetry_service_report_base_information_response import BetaTelemetryServiceReportBaseInformationResponse
+    from zitadel_client.models.beta_telemetry_service_report_resource_counts_request import BetaTelemetryServiceReportResourceCountsRequest
+    from zitadel_client.models.beta_telemetry_service_report_resource_counts_response import BetaTelemetryServiceReportResourceCountsResponse
+    from zitadel_client.models.beta_telemetry_service_resource_count import BetaTelemetryServiceResourceCount
+    from zitadel_client.models.beta_user_service_access_token_type import BetaUserServiceAccessTokenType
+    from zitadel_client.models.beta_user_service_add_human_user_request import BetaUserServiceAddHumanUserRequest
+    from zitadel_client.models.beta_user_service_add_human_user_response import BetaUserServiceAddHumanUserResponse
+    from zitadel_client.models.beta_user_service_add_idp_link_request import BetaUserServiceAddIDPLinkRequest
+    from zitadel_client.models.beta_user_service_add_idp_link_response import BetaUserServiceAddIDPLinkResponse
+    from zitadel_client.models.beta_user_service_add_otp_email_request import BetaUserServiceAddOTPEmailRequest
+    from zitadel_client.models.beta_user_service_add_otp_email_response import BetaUserServiceAddOTPEmailResponse
+    from zitadel_client.models.beta_user_service_add_otpsms_request import BetaUserServiceAddOTPSMSRequest
+    from zitadel_client.models.beta_user_service_add_otpsms_response import BetaUserServiceAddOTPSMSResponse
+    from zitadel_client.models.beta_user_service_and_query import BetaUserServiceAndQuery
+    from zitadel_client.models.beta_user_service_any import BetaUserServiceAny
+    from zitadel_client.models.beta_user_service_authentication_method_type import BetaUserServiceAuthenticationMethodType
+    from zitadel_client.models.beta_user_service_connect_error import BetaUserServiceConnectError
+    from zitadel_client.models.beta_user_service_create_passkey_registration_link_request import BetaUserServiceCreatePasskeyRegistrationLinkRequest
+    from zitadel_client.models.beta_user_service_create_passkey_registration_link_response import BetaUserServiceCreatePasskeyRegistrationLinkResponse
+    from zitadel_client.models.beta_user_service_deactivate_user_request import BetaUserServiceDeactivateUserRequest
+    from zitadel_client.models.beta_user_service_deactivate_user_response import BetaUserServiceDeactivateUserResponse
+    from zitadel_client.models.beta_user_service_delete_user_request import BetaUserServiceDeleteUserRequest
+    from zitadel_client.models.beta_user_service_delete_user_response import BetaUserServiceDeleteUserResponse
+    from zitadel_client.models.beta_user_service_details import BetaUserServiceDetails
+    from zitadel_client.models.beta_user_service_display_name_query import BetaUserServiceDisplayNameQuery
+    from zitadel_client.models.beta_user_service_email_query import BetaUserServiceEmailQuery
+    from zitadel_client.models.beta_user_service_first_name_query import BetaUserServiceFirstNameQuery
+    from zitadel_client.models.beta_user_service_form_data import BetaUserServiceFormData
+    from zitadel_client.models.beta_user_service_gender import BetaUserServiceGender
+    from zitadel_client.models.beta_user_service_get_user_by_id_request import BetaUserServiceGetUserByIDRequest
+    from zitadel_client.models.beta_user_service_get_user_by_id_response import BetaUserServiceGetUserByIDResponse
+    from zitadel_client.models.beta_user_service_hashed_password import BetaUserServiceHashedPassword
+    from zitadel_client.models.beta_user_service_human_email import BetaUserServiceHumanEmail
+    from zitadel_client.models.beta_user_service_human_phone import BetaUserServiceHumanPhone
+    from zitadel_client.models.beta_user_service_human_profile import BetaUserServiceHumanProfile
+    from zitadel_client.models.beta_user_service_human_user import BetaUserServiceHumanUser
+    from zitadel_client.models.beta_user_service_idp_information import BetaUserServiceIDPInformation
+    from zitadel_client.models.beta_user_service_idp_intent import BetaUserServiceIDPIntent
+    from zitadel_client.models.beta_user_service_idpldap_access_information import BetaUserServiceIDPLDAPAccessInformation
+    from zitadel_client.models.beta_user_service_idp_link import BetaUserServiceIDPLink
+    from zitadel_client.models.beta_user_service_idpo_auth_access_information import BetaUserServiceIDPOAuthAccessInformation
+    from zitadel_client.models.beta_user_service_idpsaml_access_information import BetaUserServiceIDPSAMLAccessInformation
+    from zitadel_client.models.beta_user_service_in_user_emails_query import BetaUserServiceInUserEmailsQuery
+    from zitadel_client.models.beta_user_service_in_user_id_query import BetaUserServiceInUserIDQuery
+    from zitadel_client.models.beta_user_service_ldap_credentials import BetaUserServiceLDAPCredentials
+    from zitadel_client.models.beta_user_service_last_name_query import BetaUserServiceLastNameQuery
+    from zitadel_client.models.beta_user_service_list_authentication_method_types_request import BetaUserServiceListAuthenticationMethodTypesRequest
+    from zitadel_client.models.beta_user_service_list_authentication_method_types_response import BetaUserServiceListAuthenticationMethodTypesResponse
+    from zitadel_client.models.beta_user_service_list_details import BetaUserServiceListDetails
+    from zitadel_client.models.beta_user_service_list_query import BetaUserServiceListQuery
+    from zitadel_client.models.beta_user_service_list_users_request import BetaUserServiceListUsersRequest
+    from zitadel_client.models.beta_user_service_list_users_response import BetaUserServiceListUsersResponse
+    from zitadel_client.models.beta_user_service_lock_user_request import BetaUserServiceLockUserRequest
+    from zitadel_client.models.beta_user_service_lock_user_response import BetaUserServiceLockUserResponse
+    from zitadel_client.models.beta_user_service_login_name_query import BetaUserServiceLoginNameQuery
+    from zitadel_client.models.beta_user_service_machine_user import BetaUserServiceMachineUser
+    from zitadel_client.models.beta_user_service_nick_name_query import BetaUserServiceNickNameQuery
+    from zitadel_client.models.beta_user_service_not_query import BetaUserServiceNotQuery
+    from zitadel_client.models.beta_user_service_notification_type import BetaUserServiceNotificationType
+    from zitadel_client.models.beta_user_service_or_query import BetaUserServiceOrQuery
+    from zitadel_client.models.beta_user_service_organization import BetaUserServiceOrganization
+    from zitadel_client.models.beta_user_service_organization_id_query import BetaUserServiceOrganizationIdQuery
+    from zitadel_client.models.beta_user_service_passkey_authenticator import BetaUserServicePasskeyAuthenticator
+    from zitadel_client.models.beta_user_service_passkey_registration_code import BetaUserServicePasskeyRegistrationCode
+    from zitadel_client.models.beta_user_service_password import BetaUserServicePassword
+    from zitadel_client.models.beta_user_service_password_reset_request import BetaUserServicePasswordResetRequest
+    from zitadel_client.models.beta_user_service_password_reset_response import BetaUserServicePasswordResetResponse
+    from zitadel_client.models.beta_user_service_phone_query import BetaUserServicePhoneQuery
+    from zitadel_client.models.beta_user_service_reactivate_user_request import BetaUserServiceReactivateUserRequest
+    from zitadel_client.models.beta_user_service_reactivate_user_response import BetaUserServiceReactivateUserResponse
+    from zitadel_client.models.beta_user_service_redirect_urls import BetaUserServiceRedirectURLs
+    from zitadel_client.models.beta_user_service_register_passkey_request import BetaUserServiceRegisterPasskeyRequest
+    from zitadel_client.models.beta_user_service_register_passkey_response import BetaUserServiceRegisterPasskeyResponse
+    from zitadel_client.models.beta_user_service_register_totp_request import BetaUserServiceRegisterTOTPRequest
+    from zitadel_client.models.beta_user_service_register_totp_response import BetaUserServiceRegisterTOTPResponse
+    from zitadel_client.models.beta_user_service_register_u2_f_request import BetaUserServiceRegisterU2FRequest
+    from zitadel_client.models.beta_user_service_register_u2_f_response import BetaUserServiceRegisterU2FResponse
+    from zitadel_client.models.beta_user_service_remove_otp_email_request import BetaUserServiceRemoveOTPEmailRequest
+    from zitadel_client.models.beta_user_service_remove_otp_email_response import BetaUserServiceRemoveOTPEmailResponse
+    from zitadel_client.models.beta_user_service_remove_otpsms_request import BetaUserServiceRemoveOTPSMSRequest
+    from zitadel_client.models.beta_user_service_remove_otpsms_response import BetaUserServiceRemoveOTPSMSResponse
+    from zitadel_client.models.beta_user_service_remove_phone_request import BetaUserServiceRemovePhoneRequest
+    from zitadel_client.models.beta_user_service_remove_phone_response import BetaUserServiceRemovePhoneResponse
+    from zitadel_client.models.beta_user_service_remove_totp_request import BetaUserServiceRemoveTOTPRequest
+    from zitadel_client.models.beta_user_service_remove_totp_response import BetaUserServiceRemoveTOTPResponse
+    from zitadel_client.models.beta_user_service_resend_email_code_request import BetaUserServiceResendEmailCodeRequest
+    from zitadel_client.models.beta_user_service_resend_email_code_response import BetaUserServiceResendEmailCodeResponse
+    from zitadel_client.models.beta_user_service_resend_phone_code_request import BetaUserServiceResendPhoneCodeRequest
+    from zitadel_client.models.beta_user_service_resend_phone_code_response import BetaUserServiceResendPhoneCodeResponse
+    from zitadel_client.models.beta_user_service_retrieve_identity_provider_intent_request import BetaUserServiceRetrieveIdentityProviderIntentRequest
+    from zitadel_client.models.beta_user_service_retrieve_identity_provider_intent_response import BetaUserServiceRetrieveIdentityProviderIntentResponse
+    from zitadel_client.models.beta_user_service_search_query import BetaUserServiceSearchQuery
+    from zitadel_client.models.beta_user_service_send_email_verification_code import BetaUserServiceSendEmailVerificationCode
+    from zitadel_client.models.beta_user_service_send_passkey_registration_link import BetaUserServiceSendPasskeyRegistrationLink
+    from zitadel_client.models.beta_user_service_send_password_reset_link import BetaUserServiceSendPasswordResetLink
+    from zitadel_client.models.beta_user_service_set_email_request import BetaUserServiceSetEmailRequest
+    from zitadel_client.models.beta_user_service_set_email_response import BetaUserServiceSetEmailResponse
+    from zitadel_client.models.beta_user_service_set_human_email import BetaUserServiceSetHumanEmail
+    from zitadel_client.models.beta_user_service_set_human_phone import BetaUserServiceSetHumanPhone
+    from zitadel_client.models.beta_user_service_set_human_profile import BetaUserServiceSetHumanProfile
+    from zitadel_client.models.beta_user_service_set_metadata_entry import BetaUserServiceSetMetadataEntry
+    from zitadel_client.models.beta_user_service_set_password import BetaUserServiceSetPassword
+    from zitadel_client.models.beta_user_service_set_password_request import BetaUserServiceSetPasswordRequest
+    from zitadel_client.models.beta_user_service_set_password_response import BetaUserServiceSetPasswordResponse
+    from zitadel_client.models.beta_user_service_set_phone_request import BetaUserServiceSetPhoneRequest
+    from zitadel_client.models.beta_user_service_set_phone_response import BetaUserServiceSetPhoneResponse
+    from zitadel_client.models.beta_user_service_start_identity_provider_intent_request import BetaUserServiceStartIdentityProviderIntentRequest
+    from zitadel_client.models.beta_user_service_start_identity_provider_intent_response import BetaUserServiceStartIdentityProviderIntentResponse
+    from zitadel_client.models.beta_user_service_state_query import BetaUserServiceStateQuery
+    from zitadel_client.models.beta_user_service_text_query_method import BetaUserServiceTextQueryMethod
+    from zitadel_client.models.beta_user_service_type import BetaUserServiceType
+    from zitadel_client.models.beta_user_service_type_query import BetaUserServiceTypeQuery
+    from zitadel_client.models.beta_user_service_unlock_user_request import BetaUserServiceUnlockUserRequest
+    from zitadel_client.models.beta_user_service_unlock_user_response import BetaUserServiceUnlockUserResponse
+    from zitadel_client.models.beta_user_service_update_human_user_request import BetaUserServiceUpdateHumanUserRequest
+    from zitadel_client.models.beta_user_service_update_human_user_response import BetaUserServiceUpdateHumanUserResponse
+    from zitadel_client.models.beta_user_service_user import BetaUserServiceUser
+    from zitadel_client.models.beta_user_service_user_field_name import BetaUserServiceUserFieldName
+    from zitadel_client.models.beta_user_service_user_name_query import BetaUserServiceUserNameQuery
+    from zitadel_client.models.beta_user_service_user_state import BetaUserServiceUserState
+    from zitadel_client.models.beta_user_service_verify_email_request import BetaUserServiceVerifyEmailRequest
+    from zitadel_client.models.beta_user_service_verify_email_response import BetaUserServiceVerifyEmailResponse
+    from zitadel_client.models.beta_user_service_verify_passkey_registration_request import BetaUserServiceVerifyPasskeyRegistrationRequest
+    from zitadel_client.models.beta_user_service_verify_passkey_registration_response import BetaUserServiceVerifyPasskeyRegistrationResponse
+    from zitadel_client.models.beta_user_service_verify_phone_request import BetaUserServiceVerifyPhoneRequest
+    from zitadel_client.models.beta_user_service_verify_phone_response import BetaUserServiceVerifyPhoneResponse
+    from zitadel_client.models.beta_user_service_verify_totp_registration_request import BetaUserServiceVerifyTOTPRegistrationRequest
+    from zitadel_client.models.beta_user_service_verify_totp_registration_response import BetaUserServiceVerifyTOTPRegistrationResponse
+    from zitadel_client.models.beta_user_service_verify_u2_f_registration_request import BetaUserServiceVerifyU2FRegistrationRequest
+    from zitadel_client.models.beta_user_service_verify_u2_f_registration_response import BetaUserServiceVerifyU2FRegistrationResponse
+    from zitadel_client.models.beta_web_key_service_activate_web_key_request import BetaWebKeyServiceActivateWebKeyRequest
+    from zitadel_client.models.beta_web_key_service_activate_web_key_response import BetaWebKeyServiceActivateWebKeyResponse
+    from zitadel_client.models.beta_web_key_service_any import BetaWebKeyServiceAny
+    from zitadel_client.models.beta_web_key_service_connect_error import BetaWebKeyServiceConnectError
+    from zitadel_client.models.beta_web_key_service_create_web_key_request import BetaWebKeyServiceCreateWebKeyRequest
+    from zitadel_client.models.beta_web_key_service_create_web_key_response import BetaWebKeyServiceCreateWebKeyResponse
+    from zitadel_client.models.beta_web_key_service_delete_web_key_request import BetaWebKeyServiceDeleteWebKeyRequest
+    from zitadel_client.models.beta_web_key_service_delete_web_key_response import BetaWebKeyServiceDeleteWebKeyResponse
+    from zitadel_client.models.beta_web_key_service_ecdsa import BetaWebKeyServiceECDSA
+    from zitadel_client.models.beta_web_key_service_ecdsa_curve import BetaWebKeyServiceECDSACurve
+    from zitadel_client.models.beta_web_key_service_list_web_keys_response import BetaWebKeyServiceListWebKeysResponse
+    from zitadel_client.models.beta_web_key_service_rsa import BetaWebKeyServiceRSA
+    from zitadel_client.models.beta_web_key_service_rsa_bits import BetaWebKeyServiceRSABits
+    from zitadel_client.models.beta_web_key_service_rsa_hasher import BetaWebKeyServiceRSAHasher
+    from zitadel_client.models.beta_web_key_service_state import BetaWebKeyServiceState
+    from zitadel_client.models.beta_web_key_service_web_key import BetaWebKeyServiceWebKey
+    from zitadel_client.models.feature_service_any import FeatureServiceAny
+    from zitadel_client.models.feature_service_connect_error import FeatureServiceConnectError
+    from zitadel_client.models.feature_service_details import FeatureServiceDetails
+    from zitadel_client.models.feature_service_feature_flag import FeatureServiceFeatureFlag
+    from zitadel_client.models.feature_service_get_instance_features_request import FeatureServiceGetInstanceFeaturesRequest
+    from zitadel_client.models.feature_service_get_instance_features_response import FeatureServiceGetInstanceFeaturesResponse
+    from zitadel_client.models.feature_service_get_organization_features_request import FeatureServiceGetOrganizationFeaturesRequest
+    from zitadel_client.models.feature_service_get_organization_features_response import FeatureServiceGetOrganizationFeaturesResponse
+    from zitadel_client.models.feature_service_get_system_features_response import FeatureServiceGetSystemFeaturesResponse
+    from zitadel_client.models.feature_service_get_user_features_request import FeatureServiceGetUserFeaturesRequest
+    from zitadel_client.models.feature_service_get_user_features_response import FeatureServiceGetUserFeaturesResponse
+    from zitadel_client.models.feature_service_improved_performance import FeatureServiceImprovedPerformance
+    from zitadel_client.models.feature_service_improved_performance_feature_flag import FeatureServiceImprovedPerformanceFeatureFlag
+    from zitadel_client.models.feature_service_login_v2 import FeatureServiceLoginV2
+    from zitadel_client.models.feature_service_login_v2_feature_flag import FeatureServiceLoginV2FeatureFlag
+    from zitadel_client.models.feature_service_reset_instance_features_response import FeatureServiceResetInstanceFeaturesResponse
+    from zitadel_client.models.feature_service_reset_organization_features_request import FeatureServiceResetOrganizationFeaturesRequest
+    from zitadel_client.models.feature_service_reset_organization_features_response import FeatureServiceResetOrganizationFeaturesResponse
+    from zitadel_client.models.feature_service_reset_system_features_response import FeatureServiceResetSystemFeaturesResponse
+    from zitadel_client.models.feature_service_reset_user_features_request import FeatureServiceResetUserFeaturesRequest
+    from zitadel_client.models.feature_service_reset_user_features_response import FeatureServiceResetUserFeaturesResponse
+    from zitadel_client.models.feature_service_set_instance_features_request import FeatureServiceSetInstanceFeaturesRequest
+    from zitadel_client.models.feature_service_set_instance_features_response import FeatureServiceSetInstanceFeaturesResponse
+    from zitadel_client.models.feature_service_set_organization_features_request import FeatureServiceSetOrganizationFeaturesRequest
+    from zitadel_client.models.feature_service_set_organization_features_response import FeatureServiceSetOrganizationFeaturesResponse
+    from zitadel_client.models.feature_service_set_system_features_request import FeatureServiceSetSystemFeaturesRequest
+    from zitadel_client.models.feature_service_set_system_features_response import FeatureServiceSetSystemFeaturesResponse
+    from zitadel_client.models.feature_service_set_user_feature_request import FeatureServiceSetUserFeatureRequest
+    from zitadel_client.models.feature_service_set_user_features_response import FeatureServiceSetUserFeaturesResponse
+    from zitadel_client.models.feature_service_source import FeatureServiceSource
+    from zitadel_client.models.identity_provider_service_any import IdentityProviderServiceAny
+    from zitadel_client.models.identity_provider_service_apple_config import IdentityProviderServiceAppleConfig
+    from zitadel_client.models.identity_provider_service_auto_linking_option import IdentityProviderServiceAutoLinkingOption
+    from zitadel_client.models.identity_provider_service_azure_ad_config import IdentityProviderServiceAzureADConfig
+    from zitadel_client.models.identity_provider_service_azure_ad_tenant import IdentityProviderServiceAzureADTenant
+    from zitadel_client.models.identity_provider_service_azure_ad_tenant_type import IdentityProviderServiceAzureADTenantType
+    from zitadel_client.models.identity_provider_service_connect_error import IdentityProviderServiceConnectError
+    from zitadel_client.models.identity_provider_service_details import IdentityProviderServiceDetails
+    from zitadel_client.models.identity_provider_service_generic_oidc_config import IdentityProviderServiceGenericOIDCConfig
+    from zitadel_client.models.identity_provider_service_get_idpby_id_request import IdentityProviderServiceGetIDPByIDRequest
+    from zitadel_client.models.identity_provider_service_get_idpby_id_response import IdentityProviderServiceGetIDPByIDResponse
+    from zitadel_client.models.identity_provider_service_git_hub_config import IdentityProviderServiceGitHubConfig
+    from zitadel_client.models.identity_provider_service_git_hub_enterprise_server_config import IdentityProviderServiceGitHubEnterpriseServerConfig
+    from zitadel_client.models.identity_provider_service_git_lab_config import IdentityProviderServiceGitLabConfig
+    from zitadel_client.models.identity_provider_service_git_lab_self_hosted_config import IdentityProviderServiceGitLabSelfHostedConfig
+    from zitadel_client.models.identity_provider_service_google_config import IdentityProviderServiceGoogleConfig
+    from zitadel_client.models.identity_provider_service_idp import IdentityProviderServiceIDP
+    from zitadel_client.models.identity_provider_service_idp_config import IdentityProviderServiceIDPConfig
+    from zitadel_client.models.identity_provider_service_idp_state import IdentityProviderServiceIDPState
+    from zitadel_client.models.identity_provider_service_idp_type import IdentityProviderServiceIDPType
+    from zitadel_client.models.identity_provider_service_jwt_config import IdentityProviderServiceJWTConfig
+    from zitadel_client.models.identity_provider_service_ldap_attributes import IdentityProviderServiceLDAPAttributes
+    from zitadel_client.models.identity_provider_service_ldap_config import IdentityProviderServiceLDAPConfig
+    from zitadel_client.models.identity_provider_service_o_auth_config import IdentityProviderServiceOAuthConfig
+    from zitadel_client.models.identity_provider_service_options import IdentityProviderServiceOptions
+    from zitadel_client.models.identity_provider_service_saml_binding import IdentityProviderServiceSAMLBinding
+    from zitadel_client.models.identity_provider_service_saml_config import IdentityProviderServiceSAMLConfig
+    from zitadel_client.models.identity_provider_service_saml_name_id_format import IdentityProviderServiceSAMLNameIDFormat
+    from zitadel_client.models.identity_provider_service_saml_signature_algorithm import IdentityProviderServiceSAMLSignatureAlgorithm
+    from zitadel_client.models.instance_service_add_custom_domain_request import InstanceServiceAddCustomDomainRequest
+    from zitadel_client.models.instance_service_add_custom_domain_response import InstanceServiceAddCustomDomainResponse
+    from zitadel_client.models.instance_service_add_trusted_domain_request import InstanceServiceAddTrustedDomainRequest
+    from zitadel_client.models.instance_service_add_trusted_domain_response import InstanceServiceAddTrustedDomainResponse
+    from zitadel_client.models.instance_service_any import InstanceServiceAny
+    from zitadel_client.models.instance_service_connect_error import InstanceServiceConnectError
+    from zitadel_client.models.instance_service_custom_domain import InstanceServiceCustomDomain
+    from zitadel_client.models.instance_service_custom_domain_filter import InstanceServiceCustomDomainFilter
+    from zitadel_client.models.instance_service_custom_domains_filter import InstanceServiceCustomDomainsFilter
+    from zitadel_client.models.instance_service_delete_instance_request import InstanceServiceDeleteInstanceRequest
+    from zitadel_client.models.instance_service_delete_instance_response import InstanceServiceDeleteInstanceResponse
+    from zitadel_client.models.instance_service_domain_field_name import InstanceServiceDomainFieldName
+    from zitadel_client.models.instance_service_domain_filter import InstanceServiceDomainFilter
+    from zitadel_client.models.instance_service_field_name import InstanceServiceFieldName
+    from zitadel_client.models.instance_service_filter import InstanceServiceFilter
+    from zitadel_client.models.instance_service_get_instance_request import InstanceServiceGetInstanceRequest
+    from zitadel_client.models.instance_service_get_instance_response import InstanceServiceGetInstanceResponse
+    from zitadel_client.models.instance_service_in_ids_filter import InstanceServiceInIDsFilter
+    from zitadel_client.models.instance_service_instance import InstanceServiceInstance
+    from zitadel_client.models.instance_service_list_custom_domains_request import InstanceServiceListCustomDomainsRequest
+    from zitadel_client.models.instance_service_list_custom_domains_response import InstanceServiceListCustomDomainsResponse
+    from zitadel_client.models.instance_service_list_instances_request import InstanceServiceListInstancesRequest
+    from zitadel_client.models.instance_service_list_instances_response import InstanceServiceListInstancesResponse
+    from zitadel_client.models.instance_service_list_trusted_domains_request import InstanceServiceListTrustedDomainsRequest
+    from zitadel_client.models.instance_service_list_trusted_domains_response import InstanceServiceListTrustedDomainsResponse
+    from zitadel_client.models.instance_service_pagination_request import InstanceServicePaginationRequest
+    from zitadel_client.models.instance_service_pagination_response import InstanceServicePaginationResponse
+    from zitadel_client.models.instance_service_remove_custom_domain_request import InstanceServiceRemoveCustomDomainRequest
+    from zitadel_client.models.instance_service_remove_custom_domain_response import InstanceServiceRemoveCustomDomainResponse
+    from zitadel_client.models.instance_service_remove_trusted_domain_request import InstanceServiceRemoveTrustedDomainRequest
+    from zitadel_client.models.instance_service_remove_trusted_domain_response import InstanceServiceRemoveTrustedDomainResponse
+    from zitadel_client.models.instance_service_state import InstanceServiceState
+    from zitadel_client.models.instance_service_text_query_method import InstanceServiceTextQueryMethod
+    from zitadel_client.models.instance_service_trusted_domain import InstanceServiceTrustedDomain
+    from zitadel_client.models.instance_service_trusted_domain_field_name import InstanceServiceTrustedDomainFieldName
+    from zitadel_client.models.instance_service_trusted_domain_filter import InstanceServiceTrustedDomainFilter
+    from zitadel_client.models.instance_service_update_instance_request import InstanceServiceUpdateInstanceRequest
+    from zitadel_client.models.instance_service_update_instance_response import InstanceServiceUpdateInstanceResponse
+    from zitadel_client.models.internal_permission_service_administrator import InternalPermissionServiceAdministrator
+    from zitadel_client.models.internal_permission_service_administrator_field_name import InternalPermissionServiceAdministratorFieldName
+    from zitadel_client.models.internal_permission_service_administrator_search_filter import InternalPermissionServiceAdministratorSearchFilter
+    from zitadel_client.models.internal_permission_service_and_filter import InternalPermissionServiceAndFilter
+    from zitadel_client.models.internal_permission_service_any import InternalPermissionServiceAny
+    from zitadel_client.models.internal_permission_service_connect_error import InternalPermissionServiceConnectError
+    from zitadel_client.models.internal_permission_service_create_administrator_request import InternalPermissionServiceCreateAdministratorRequest
+    from zitadel_client.models.internal_permission_service_create_administrator_response import InternalPermissionServiceCreateAdministratorResponse
+    from zitadel_client.models.internal_permission_service_delete_administrator_request import InternalPermissionServiceDeleteAdministratorRequest
+    from zitadel_client.models.internal_permission_service_delete_administrator_response import InternalPermissionServiceDeleteAdministratorResponse
+    from zitadel_client.models.internal_permission_service_id_filter import InternalPermissionServiceIDFilter
+    from zitadel_client.models.internal_permission_service_in_ids_filter import InternalPermissionServiceInIDsFilter
+    from zitadel_client.models.internal_permission_service_list_administrators_request import InternalPermissionServiceListAdministratorsRequest
+    from zitadel_client.models.internal_permission_service_list_administrators_response import InternalPermissionServiceListAdministratorsResponse
+    from zitadel_client.models.internal_permission_service_not_filter import InternalPermissionServiceNotFilter
+    from zitadel_client.models.internal_permission_service_or_filter import InternalPermissionServiceOrFilter
+    from zitadel_client.models.internal_permission_service_organization import InternalPermissionServiceOrganization
+    from zitadel_client.models.internal_permission_service_pagination_request import InternalPermissionServicePaginationRequest
+    from zitadel_client.models.internal_permission_service_pagination_response import InternalPermissionServicePaginationResponse
+    from zitadel_client.models.internal_permission_service_project import InternalPermissionServiceProject
+    from zitadel_client.models.internal_permission_service_project_grant import InternalPermissionServiceProjectGrant
+    from zitadel_client.models.internal_permission_service_resource_filter import InternalPermissionServiceResourceFilter
+    from zitadel_client.models.internal_permission_service_resource_type import InternalPermissionServiceResourceType
+    from zitadel_client.models.internal_permission_service_role_filter import InternalPermissionServiceRoleFilter
+    from zitadel_client.models.internal_permission_service_text_filter_method import InternalPermissionServiceTextFilterMethod
+    from zitadel_client.models.internal_permission_service_timestamp_filter import InternalPermissionServiceTimestampFilter
+    from zitadel_client.models.internal_permission_service_timestamp_filter_method import InternalPermissionServiceTimestampFilterMethod
+    from zitadel_client.models.internal_permission_service_update_administrator_request import InternalPermissionServiceUpdateAdministratorRequest
+    from zitadel_client.models.internal_permission_service_update_administrator_response import InternalPermissionServiceUpdateAdministratorResponse
+    from zitadel_client.models.internal_permission_service_user import InternalPermissionServiceUser
+    from zitadel_client.models.internal_permission_service_user_display_name_filter import InternalPermissionServiceUserDisplayNameFilter
+    from zitadel_client.models.internal_permission_service_user_preferred_login_name_filter import InternalPermissionServiceUserPreferredLoginNameFilter
+    from zitadel_client.models.oidc_service_any import OIDCServiceAny
+    from zitadel_client.models.oidc_service_auth_request import OIDCServiceAuthRequest
+    from zitadel_client.models.oidc_service_authorization_error import OIDCServiceAuthorizationError
+    from zitadel_client.models.oidc_service_authorize_or_deny_device_authorization_request import OIDCServiceAuthorizeOrDenyDeviceAuthorizationRequest
+    from zitadel_client.models.oidc_service_connect_error import OIDCServiceConnectError
+    from zitadel_client.models.oidc_service_create_callback_request import OIDCServiceCreateCallbackRequest
+    from zitadel_client.models.oidc_service_create_callback_response import OIDCServiceCreateCallbackResponse
+    from zitadel_client.models.oidc_service_details import OIDCServiceDetails
+    from zitadel_client.models.oidc_service_device_authorization_request import OIDCServiceDeviceAuthorizationRequest
+    from zitadel_client.models.oidc_service_error_reason import OIDCServiceErrorReason
+    from zitadel_client.models.oidc_service_get_auth_request_request import OIDCServiceGetAuthRequestRequest
+    from zitadel_client.models.oidc_service_get_auth_request_response import OIDCServiceGetAuthRequestResponse
+    from zitadel_client.models.oidc_service_get_device_authorization_request_request import OIDCServiceGetDeviceAuthorizationRequestRequest
+    from zitadel_client.models.oidc_service_get_device_authorization_request_response import OIDCServiceGetDeviceAuthorizationRequestResponse
+    from zitadel_client.models.oidc_service_prompt import OIDCServicePrompt
+    from zitadel_client.models.oidc_service_session import OIDCServiceSession
+    from zitadel_client.models.organization_service_activate_organization_request import OrganizationServiceActivateOrganizationRequest
+    from zitadel_client.models.organization_service_activate_organization_response import OrganizationServiceActivateOrganizationResponse
+    from zitadel_client.models.organization_service_add_human_user_request import OrganizationServiceAddHumanUserRequest
+    from zitadel_client.models.organization_service_add_organization_domain_request import OrganizationServiceAddOrganizationDomainRequest
+    from zitadel_client.models.organization_service_add_organization_domain_response import OrganizationServiceAddOrganizationDomainResponse
+    from zitadel_client.models.organization_service_add_organization_request import OrganizationServiceAddOrganizationRequest
+    from zitadel_client.models.organization_service_add_organization_response import OrganizationServiceAddOrganizationResponse
+    from zitadel_client.models.organization_service_admin import OrganizationServiceAdmin
+    from zitadel_client.models.organization_service_any import OrganizationServiceAny
+    from zitadel_client.models.organization_service_connect_error import OrganizationServiceConnectError
+    from zitadel_client.models.organization_service_created_admin import OrganizationServiceCreatedAdmin
+    from zitadel_client.models.organization_service_deactivate_organization_request import OrganizationServiceDeactivateOrganizationRequest
+    from zitadel_client.models.organization_service_deactivate_organization_response import OrganizationServiceDeactivateOrganizationResponse
+    from zitadel_client.models.organization_service_delete_organization_domain_request import OrganizationServiceDeleteOrganizationDomainRequest
+    from zitadel_client.models.organization_service_delete_organization_domain_response import OrganizationServiceDeleteOrganizationDomainResponse
+    from zitadel_client.models.organization_service_delete_organization_metadata_request import OrganizationServiceDeleteOrganizationMetadataRequest
+    from zitadel_client.models.organization_service_delete_organization_metadata_response import OrganizationServiceDeleteOrganizationMetadataResponse
+    from zitadel_client.models.organization_service_delete_organization_request import OrganizationServiceDeleteOrganizationRequest
+    from zitadel_client.models.organization_service_delete_organization_response import OrganizationServiceDeleteOrganizationResponse
+    from zitadel_client.models.organization_service_details import OrganizationServiceDetails
+    from zitadel_client.models.organization_service_domain import OrganizationServiceDomain
+    from zitadel_client.models.organization_service_domain_field_name import OrganizationServiceDomainFieldName
+    from zitadel_client.models.organization_service_domain_search_filter import OrganizationServiceDomainSearchFilter
+    from zitadel_client.models.organization_service_domain_validation_type import OrganizationServiceDomainValidationType
+    from zitadel_client.models.organization_service_gender import OrganizationServiceGender
+    from zitadel_client.models.organization_service_generate_organization_domain_validation_request import OrganizationServiceGenerateOrganizationDomainValidationRequest
+    from zitadel_client.models.organization_service_generate_organization_domain_validation_response import OrganizationServiceGenerateOrganizationDomainValidationResponse
+    from zitadel_client.models.organization_service_hashed_password import OrganizationServiceHashedPassword
+    from zitadel_client.models.organization_service_idp_link import OrganizationServiceIDPLink
+    from zitadel_client.models.organization_service_list_details import OrganizationServiceListDetails
+    from zitadel_client.models.organization_service_list_organization_domains_request import OrganizationServiceListOrganizationDomainsRequest
+    from zitadel_client.models.organization_service_list_organization_domains_response import OrganizationServiceListOrganizationDomainsResponse
+    from zitadel_client.models.organization_service_list_organization_metadata_request import OrganizationServiceListOrganizationMetadataRequest
+    from zitadel_client.models.organization_service_list_organization_metadata_response import OrganizationServiceListOrganizationMetadataResponse
+    from zitadel_client.models.organization_service_list_organizations_request import OrganizationServiceListOrganizationsRequest
+    from zitadel_client.models.organization_service_list_organizations_response import OrganizationServiceListOrganizationsResponse
+    from zitadel_client.models.organization_service_list_query import OrganizationServiceListQuery
+    from zitadel_client.models.organization_service_metadata import OrganizationServiceMetadata
+    from zitadel_client.models.organization_service_metadata_key_filter import OrganizationServiceMetadataKeyFilter
+    from zitadel_client.models.organization_service_metadata_search_filter import OrganizationServiceMetadataSearchFilter
+    from zitadel_client.models.organization_service_organization import OrganizationServiceOrganization
+    from zitadel_client.models.organization_service_organization_domain_query import OrganizationServiceOrganizationDomainQuery
+    from zitadel_client.models.organization_service_organization_field_name import OrganizationServiceOrganizationFieldName
+    from zitadel_client.models.organization_service_organization_id_query import OrganizationServiceOrganizationIDQuery
+    from zitadel_client.models.organization_service_organization_name_query import OrganizationServiceOrganizationNameQuery
+    from zitadel_client.models.organization_service_organization_state import OrganizationServiceOrganizationState
+    from zitadel_client.models.organization_service_organization_state_query import OrganizationServiceOrganizationStateQuery
+    from zitadel_client.models.organization_service_pagination_request import OrganizationServicePaginationRequest
+    from zitadel_client.models.organization_service_pagination_response import OrganizationServicePaginationResponse
+    from zitadel_client.models.organization_service_password import OrganizationServicePassword
+    from zitadel_client.models.organization_service_search_query import OrganizationServiceSearchQuery
+    from zitadel_client.models.organization_service_send_email_verification_code import OrganizationServiceSendEmailVerificationCode
+    from zitadel_client.models.organization_service_set_human_email import OrganizationServiceSetHumanEmail
+    from zitadel_client.models.organization_service_set_human_phone import OrganizationServiceSetHumanPhone
+    from zitadel_client.models.organization_service_set_human_profile import OrganizationServiceSetHumanProfile
+    from zitadel_client.models.organization_service_set_metadata_entry import OrganizationServiceSetMetadataEntry
+    from zitadel_client.models.organization_service_set_organization_metadata_request import OrganizationServiceSetOrganizationMetadataRequest
+    from zitadel_client.models.organization_service_set_organization_metadata_response import OrganizationServiceSetOrganizationMetadataResponse
+    from zitadel_client.models.organization_service_text_filter_method import OrganizationServiceTextFilterMethod
+    from zitadel_client.models.organization_service_text_query_method import OrganizationServiceTextQueryMethod
+    from zitadel_client.models.organization_service_update_organization_request import OrganizationServiceUpdateOrganizationRequest
+    from zitadel_client.models.organization_service_update_organization_response import OrganizationServiceUpdateOrganizationResponse
+    from zitadel_client.models.organization_service_verify_organization_domain_request import OrganizationServiceVerifyOrganizationDomainRequest
+    from zitadel_client.models.organization_service_verify_organization_domain_response import OrganizationServiceVerifyOrganizationDomainResponse
+    from zitadel_client.models.project_service_activate_project_grant_request import ProjectServiceActivateProjectGrantRequest
+    from zitadel_client.models.project_service_activate_project_grant_response import ProjectServiceActivateProjectGrantResponse
+    from zitadel_client.models.project_service_activate_project_request import ProjectServiceActivateProjectRequest
+    from zitadel_client.models.project_service_activate_project_response import ProjectServiceActivateProjectResponse
+    from zitadel_client.models.project_service_add_project_role_request import ProjectServiceAddProjectRoleRequest
+    from zitadel_client.models.project_service_add_project_role_response import ProjectServiceAddProjectRoleResponse
+    from zitadel_client.models.project_service_any import ProjectServiceAny
+    from zitadel_client.models.project_service_connect_error import ProjectServiceConnectError
+    from zitadel_client.models.project_service_create_project_grant_request import ProjectServiceCreateProjectGrantRequest
+    from zitadel_client.models.project_service_create_project_grant_response import ProjectServiceCreateProjectGrantResponse
+    from zitadel_client.models.project_service_create_project_request import ProjectServiceCreateProjectRequest
+    from zitadel_client.models.project_service_create_project_response import ProjectServiceCreateProjectResponse
+    from zitadel_client.models.project_service_deactivate_project_grant_request import ProjectServiceDeactivateProjectGrantRequest
+    from zitadel_client.models.project_service_deactivate_project_grant_response import ProjectServiceDeactivateProjectGrantResponse
+    from zitadel_client.models.project_service_deactivate_project_request import ProjectServiceDeactivateProjectRequest
+    from zitadel_client.models.project_service_deactivate_project_response import ProjectServiceDeactivateProjectResponse
+    from zitadel_client.models.project_service_delete_project_grant_request import ProjectServiceDeleteProjectGrantRequest
+    from zitadel_client.models.project_service_delete_project_grant_response import ProjectServiceDeleteProjectGrantResponse
+    from zitadel_client.models.project_service_delete_project_request import ProjectServiceDeleteProjectRequest
+    from zitadel_client.models.project_service_delete_project_response import ProjectServiceDeleteProjectResponse
+    from zitadel_client.models.project_service_get_project_request import ProjectServiceGetProjectRequest
+    from zitadel_client.models.project_service_get_project_response import ProjectServiceGetProjectResponse
+    from zitadel_client.models.project_service_granted_project_state import ProjectServiceGrantedProjectState
+    from zitadel_client.models.project_service_id_filter import ProjectServiceIDFilter
+    from zitadel_client.models.project_service_in_ids_filter import ProjectServiceInIDsFilter
+    from zitadel_client.models.project_service_list_project_grants_request import ProjectServiceListProjectGrantsRequest
+    from zitadel_client.models.project_service_list_project_grants_response import ProjectServiceListProjectGrantsResponse
+    from zitadel_client.models.project_service_list_project_roles_request import ProjectServiceListProjectRolesRequest
+    from zitadel_client.models.project_service_list_project_roles_response import ProjectServiceListProjectRolesResponse
+    from zitadel_client.models.project_service_list_projects_request import ProjectServiceListProjectsRequest
+    from zitadel_client.models.project_service_list_projects_response import ProjectServiceListProjectsResponse
+    from zitadel_client.models.project_service_pagination_request import ProjectServicePaginationRequest
+    from zitadel_client.models.project_service_pagination_response import ProjectServicePaginationResponse
+    from zitadel_client.models.project_service_private_labeling_setting import ProjectServicePrivateLabelingSetting
+    from zitadel_client.models.project_service_project import ProjectServiceProject
+    from zitadel_client.models.project_service_project_field_name import ProjectServiceProjectFieldName
+    from zitadel_client.models.project_service_project_grant import ProjectServiceProjectGrant
+    from zitadel_client.models.project_service_project_grant_field_name import ProjectServiceProjectGrantFieldName
+    from zitadel_client.models.project_service_project_grant_search_filter import ProjectServiceProjectGrantSearchFilter
+    from zitadel_client.models.project_service_project_grant_state import ProjectServiceProjectGrantState
+    from zitadel_client.models.project_service_project_name_filter import ProjectServiceProjectNameFilter
+    from zitadel_client.models.project_service_project_organization_id_filter import ProjectServiceProjectOrganizationIDFilter
+    from zitadel_client.models.project_service_project_role import ProjectServiceProjectRole
+    from zitadel_client.models.project_service_project_role_display_name_filter import ProjectServiceProjectRoleDisplayNameFilter
+    from zitadel_client.models.project_service_project_role_field_name import ProjectServiceProjectRoleFieldName
+    from zitadel_client.models.project_service_project_role_key_filter import ProjectServiceProjectRoleKeyFilter
+    from zitadel_client.models.project_service_project_role_search_filter import ProjectServiceProjectRoleSearchFilter
+    from zitadel_client.models.project_service_project_search_filter import ProjectServiceProjectSearchFilter
+    from zitadel_client.models.project_service_project_state import ProjectServiceProjectState
+    from zitadel_client.models.project_service_remove_project_role_request import ProjectServiceRemoveProjectRoleRequest
+    from zitadel_client.models.project_service_remove_project_role_response import ProjectServiceRemoveProjectRoleResponse
+    from zitadel_client.models.project_service_text_filter_method import ProjectServiceTextFilterMethod
+    from zitadel_client.models.project_service_type import ProjectServiceType
+    from zitadel_client.models.project_service_update_project_grant_request import ProjectServiceUpdateProjectGrantRequest
+    from zitadel_client.models.project_service_update_project_grant_response import ProjectServiceUpdateProjectGrantResponse
+    from zitadel_client.models.project_service_update_project_request import ProjectServiceUpdateProjectRequest
+    from zitadel_client.models.project_service_update_project_response import ProjectServiceUpdateProjectResponse
+    from zitadel_client.models.project_service_update_project_role_request import ProjectServiceUpdateProjectRoleRequest
+    from zitadel_client.models.project_service_update_project_role_response import ProjectServiceUpdateProjectRoleResponse
+    from zitadel_client.models.saml_service_any import SAMLServiceAny
+    from zitadel_client.models.saml_service_authorization_error import SAMLServiceAuthorizationError
+    from zitadel_client.models.saml_service_connect_error import SAMLServiceConnectError
+    from zitadel_client.models.saml_service_create_response_request import SAMLServiceCreateResponseRequest
+    from zitadel_client.models.saml_service_create_response_response import SAMLServiceCreateResponseResponse
+    from zitadel_client.models.saml_service_details import SAMLServiceDetails
+    from zitadel_client.models.saml_service_error_reason import SAMLServiceErrorReason
+    from zitadel_client.models.saml_service_get_saml_request_request import SAMLServiceGetSAMLRequestRequest
+    from zitadel_client.models.saml_service_get_saml_request_response import SAMLServiceGetSAMLRequestResponse
+    from zitadel_client.models.saml_service_post_response import SAMLServicePostResponse
+    from zitadel_client.models.saml_service_saml_request import SAMLServiceSAMLRequest
+    from zitadel_client.models.saml_service_session import SAMLServiceSession
+    from zitadel_client.models.session_service_any import SessionServiceAny
+    from zitadel_client.models.session_service_challenges import SessionServiceChallenges
+    from zitadel_client.models.session_service_check_idp_intent import SessionServiceCheckIDPIntent
+    from zitadel_client.models.session_service_check_otp import SessionServiceCheckOTP
+    from zitadel_client.models.session_service_check_password import SessionServiceCheckPassword
+    from zitadel_client.models.session_service_check_recovery_code import SessionServiceCheckRecoveryCode
+    from zitadel_client.models.session_service_check_totp import SessionServiceCheckTOTP
+    from zitadel_client.models.session_service_check_user import SessionServiceCheckUser
+    from zitadel_client.models.session_service_check_web_auth_n import SessionServiceCheckWebAuthN
+    from zitadel_client.models.session_service_checks import SessionServiceChecks
+    from zitadel_client.models.session_service_connect_error import SessionServiceConnectError
+    from zitadel_client.models.session_service_create_session_request import SessionServiceCreateSessionRequest
+    from zitadel_client.models.session_service_create_session_response import SessionServiceCreateSessionResponse
+    from zitadel_client.models.session_service_creation_date_query import SessionServiceCreationDateQuery
+    from zitadel_client.models.session_service_creator_query import SessionServiceCreatorQuery
+    from zitadel_client.models.session_service_delete_session_request import SessionServiceDeleteSessionRequest
+    from zitadel_client.models.session_service_delete_session_response import SessionServiceDeleteSessionResponse
+    from zitadel_client.models.session_service_details import SessionServiceDetails
+    from zitadel_client.models.session_service_expiration_date_query import SessionServiceExpirationDateQuery
+    from zitadel_client.models.session_service_factors import SessionServiceFactors
+    from zitadel_client.models.session_service_get_session_request import SessionServiceGetSessionRequest
+    from zitadel_client.models.session_service_get_session_response import SessionServiceGetSessionResponse
+    from zitadel_client.models.session_service_header_values import SessionServiceHeaderValues
+    from zitadel_client.models.session_service_ids_query import SessionServiceIDsQuery
+    from zitadel_client.models.session_service_intent_factor import SessionServiceIntentFactor
+    from zitadel_client.models.session_service_list_details import SessionServiceListDetails
+    from zitadel_client.models.session_service_list_query import SessionServiceListQuery
+    from zitadel_client.models.session_service_list_sessions_request import SessionServiceListSessionsRequest
+    from zitadel_client.models.session_service_list_sessions_response import SessionServiceListSessionsResponse
+    from zitadel_client.models.session_service_otp_email import SessionServiceOTPEmail
+    from zitadel_client.models.session_service_otp_factor import SessionServiceOTPFactor
+    from zitadel_client.models.session_service_otpsms import SessionServiceOTPSMS
+    from zitadel_client.models.session_service_password_factor import SessionServicePasswordFactor
+    from zitadel_client.models.session_service_recovery_code_factor import SessionServiceRecoveryCodeFactor
+    from zitadel_client.models.session_service_request_challenges import SessionServiceRequestChallenges
+    from zitadel_client.models.session_service_search_query import SessionServiceSearchQuery
+    from zitadel_client.models.session_service_send_code import SessionServiceSendCode
+    from zitadel_client.models.session_service_session import SessionServiceSession
+    from zitadel_client.models.session_service_session_field_name import SessionServiceSessionFieldName
+    from zitadel_client.models.session_service_set_session_request import SessionServiceSetSessionRequest
+    from zitadel_client.models.session_service_set_session_response import SessionServiceSetSessionResponse
+    from zitadel_client.models.session_service_totp_factor import SessionServiceTOTPFactor
+    from zitadel_client.models.session_service_timestamp_query_method import SessionServiceTimestampQueryMethod
+    from zitadel_client.models.session_service_user_agent import SessionServiceUserAgent
+    from zitadel_client.models.session_service_user_agent_query import SessionServiceUserAgentQuery
+    from zitadel_client.models.session_service_user_factor import SessionServiceUserFactor
+    from zitadel_client.models.session_service_user_id_query import SessionServiceUserIDQuery
+    from zitadel_client.models.session_service_user_verification_requirement import SessionServiceUserVerificationRequirement
+    from zitadel_client.models.session_service_web_auth_n import SessionServiceWebAuthN
+    from zitadel_client.models.session_service_web_auth_n_factor import SessionServiceWebAuthNFactor
+    from zitadel_client.models.settings_service_any import SettingsServiceAny
+    from zitadel_client.models.settings_service_auto_linking_option import SettingsServiceAutoLinkingOption
+    from zitadel_client.models.settings_service_branding_settings import SettingsServiceBrandingSettings
+    from zitadel_client.models.settings_service_connect_error import SettingsServiceConnectError
+    from zitadel_client.models.settings_service_details import SettingsServiceDetails
+    from zitadel_client.models.settings_service_domain_settings import SettingsServiceDomainSettings
+    from zitadel_client.models.settings_service_embedded_iframe_settings import SettingsServiceEmbeddedIframeSettings
+    from zitadel_client.models.settings_service_get_active_identity_providers_request import SettingsServiceGetActiveIdentityProvidersRequest
+    from zitadel_client.models.settings_service_get_active_identity_providers_response import SettingsServiceGetActiveIdentityProvidersResponse
+    from zitadel_client.models.settings_service_get_branding_settings_request import SettingsServiceGetBrandingSettingsRequest
+    from zitadel_client.models.settings_service_get_branding_settings_response import SettingsServiceGetBrandingSettingsResponse
+    from zitadel_client.models.settings_service_get_domain_settings_request import SettingsServiceGetDomainSettingsRequest
+    from zitadel_client.models.settings_service_get_domain_settings_response import SettingsServiceGetDomainSettingsResponse
+    from zitadel_client.models.settings_service_get_general_settings_response import SettingsServiceGetGeneralSettingsResponse
+    from zitadel_client.models.settings_service_get_hosted_login_translation_request import SettingsServiceGetHostedLoginTranslationRequest
+    from zitadel_client.models.settings_service_get_hosted_login_translation_response import SettingsServiceGetHostedLoginTranslationResponse
+    from zitadel_client.models.settings_service_get_legal_and_support_settings_request import SettingsServiceGetLegalAndSupportSettingsRequest
+    from zitadel_client.models.settings_service_get_legal_and_support_settings_response import SettingsServiceGetLegalAndSupportSettingsResponse
+    from zitadel_client.models.settings_service_get_lockout_settings_request import SettingsServiceGetLockoutSettingsRequest
+    from zitadel_client.models.settings_service_get_lockout_settings_response import SettingsServiceGetLockoutSettingsResponse
+    from zitadel_client.models.settings_service_get_login_settings_request import SettingsServiceGetLoginSettingsRequest
+    from zitadel_client.models.settings_service_get_login_settings_response import SettingsServiceGetLoginSettingsResponse
+    from zitadel_client.models.settings_service_get_password_complexity_settings_request import SettingsServiceGetPasswordComplexitySettingsRequest
+    from zitadel_client.models.settings_service_get_password_complexity_settings_response import SettingsServiceGetPasswordComplexitySettingsResponse
+    from zitadel_client.models.settings_service_get_password_expiry_settings_request import SettingsServiceGetPasswordExpirySettingsRequest
+    from zitadel_client.models.settings_service_get_password_expiry_settings_response import SettingsServiceGetPasswordExpirySettingsResponse
+    from zitadel_client.models.settings_service_get_security_settings_response import SettingsServiceGetSecuritySettingsResponse
+    from zitadel_client.models.settings_service_identity_provider import SettingsServiceIdentityProvider
+    from zitadel_client.models.settings_service_identity_provider_type import SettingsServiceIdentityProviderType
+    from zitadel_client.models.settings_service_legal_and_support_settings import SettingsServiceLegalAndSupportSettings
+    from zitadel_client.models.settings_service_list_details import SettingsServiceListDetails
+    from zitadel_client.models.settings_service_lockout_settings import SettingsServiceLockoutSettings
+    from zitadel_client.models.settings_service_login_settings import SettingsServiceLoginSettings
+    from zitadel_client.models.settings_service_multi_factor_type import SettingsServiceMultiFactorType
+    from zitadel_client.models.settings_service_options import SettingsServiceOptions
+    from zitadel_client.models.settings_service_passkeys_type import SettingsServicePasskeysType
+    from zitadel_client.models.settings_service_password_complexity_settings import SettingsServicePasswordComplexitySettings
+    from zitadel_client.models.settings_service_password_expiry_settings import SettingsServicePasswordExpirySettings
+    from zitadel_client.models.settings_service_request_context import SettingsServiceRequestContext
+    from zitadel_client.models.settings_service_resource_owner_type import SettingsServiceResourceOwnerType
+    from zitadel_client.models.settings_service_second_factor_type import SettingsServiceSecondFactorType
+    from zitadel_client.models.settings_service_security_settings import SettingsServiceSecuritySettings
+    from zitadel_client.models.settings_service_set_hosted_login_translation_request import SettingsServiceSetHostedLoginTranslationRequest
+    from zitadel_client.models.settings_service_set_hosted_login_translation_response import SettingsServiceSetHostedLoginTranslationResponse
+    from zitadel_client.models.settings_service_set_security_settings_request import SettingsServiceSetSecuritySettingsRequest
+    from zitadel_client.models.settings_service_set_security_settings_response import SettingsServiceSetSecuritySettingsResponse
+    from zitadel_client.models.settings_service_theme import SettingsServiceTheme
+    from zitadel_client.models.settings_service_theme_mode import SettingsServiceThemeMode
+    from zitadel_client.models.user_service_access_token_type import UserServiceAccessTokenType
+    from zitadel_client.models.user_service_add_human_user_request import UserServiceAddHumanUserRequest
+    from zitadel_client.models.user_service_add_human_user_response import UserServiceAddHumanUserResponse
+    from zitadel_client.models.user_service_add_idp_link_request import UserServiceAddIDPLinkRequest
+    from zitadel_client.models.user_service_add_idp_link_response import UserServiceAddIDPLinkResponse
+    from zitadel_client.models.user_service_add_key_request import UserServiceAddKeyRequest
+    from zitadel_client.models.user_service_add_key_response import UserServiceAddKeyResponse
+    from zitadel_client.models.user_service_add_otp_email_request import UserServiceAddOTPEmailRequest
+    from zitadel_client.models.user_service_add_otp_email_response import UserServiceAddOTPEmailResponse
+    from zitadel_client.models.user_service_add_otpsms_request import UserServiceAddOTPSMSRequest
+    from zitadel_client.models.user_service_add_otpsms_response import UserServiceAddOTPSMSResponse
+    from zitadel_client.models.user_service_add_personal_access_token_request import UserServiceAddPersonalAccessTokenRequest
+    from zitadel_client.models.user_service_add_personal_access_token_response import UserServiceAddPersonalAccessTokenResponse
+    from zitadel_client.models.user_service_add_secret_request import UserServiceAddSecretRequest
+    from zitadel_client.models.user_service_add_secret_response import UserServiceAddSecretResponse
+    from zitadel_client.models.user_service_and_query import UserServiceAndQuery
+    from zitadel_client.models.user_service_any import UserServiceAny
+    from zitadel_client.models.user_service_auth_factor import UserServiceAuthFactor
+    from zitadel_client.models.user_service_auth_factor_state import UserServiceAuthFactorState
+    from zitadel_client.models.user_service_auth_factor_u2_f import UserServiceAuthFactorU2F
+    from zitadel_client.models.user_service_auth_factors import UserServiceAuthFactors
+    from zitadel_client.models.user_service_authentication_method_type import UserServiceAuthenticationMethodType
+    from zitadel_client.models.user_service_byte_filter_method import UserServiceByteFilterMethod
+    from zitadel_client.models.user_service_connect_error import UserServiceConnectError
+    from zitadel_client.models.user_service_create_invite_code_request import UserServiceCreateInviteCodeRequest
+    from zitadel_client.models.user_service_create_invite_code_response import UserServiceCreateInviteCodeResponse
+    from zitadel_client.models.user_service_create_passkey_registration_link_request import UserServiceCreatePasskeyRegistrationLinkRequest
+    from zitadel_client.models.user_service_create_passkey_registration_link_response import UserServiceCreatePasskeyRegistrationLinkResponse
+    from zitadel_client.models.user_service_create_user_request import UserServiceCreateUserRequest
+    from zitadel_client.models.user_service_create_user_response import UserServiceCreateUserResponse
+    from zitadel_client.models.user_service_deactivate_user_request import UserServiceDeactivateUserRequest
+    from zitadel_client.models.user_service_deactivate_user_response import UserServiceDeactivateUserResponse
+    from zitadel_client.models.user_service_delete_user_metadata_request import UserServiceDeleteUserMetadataRequest
+    from zitadel_client.models.user_service_delete_user_metadata_response import UserServiceDeleteUserMetadataResponse
+    from zitadel_client.models.user_service_delete_user_request import UserServiceDeleteUserRequest
+    from zitadel_client.models.user_service_delete_user_response import UserServiceDeleteUserResponse
+    from zitadel_client.models.user_service_details import UserServiceDetails
+    from zitadel_client.models.user_service_display_name_query import UserServiceDisplayNameQuery
+    from zitadel_client.models.user_service_domain_query import UserServiceDomainQuery
+    from zitadel_client.models.user_service_email_query import UserServiceEmailQuery
+    from zitadel_client.models.user_service_first_name_query import UserServiceFirstNameQuery
+    from zitadel_client.models.user_service_form_data import UserServiceFormData
+    from zitadel_client.models.user_service_gender import UserServiceGender
+    from zitadel_client.models.user_service_generate_recovery_codes_request import UserServiceGenerateRecoveryCodesRequest
+    from zitadel_client.models.user_service_generate_recovery_codes_response import UserServiceGenerateRecoveryCodesResponse
+    from zitadel_client.models.user_service_get_user_by_id_request import UserServiceGetUserByIDRequest
+    from zitadel_client.models.user_service_get_user_by_id_response import UserServiceGetUserByIDResponse
+    from zitadel_client.models.user_service_hashed_password import UserServiceHashedPassword
+    from zitadel_client.models.user_service_human import UserServiceHuman
+    from zitadel_client.models.user_service_human_email import UserServiceHumanEmail
+    from zitadel_client.models.user_service_human_mfa_init_skipped_request import UserServiceHumanMFAInitSkippedRequest
+    from zitadel_client.models.user_service_human_mfa_init_skipped_response import UserServiceHumanMFAInitSkippedResponse
+    from zitadel_client.models.user_service_human_phone import UserServiceHumanPhone
+    from zitadel_client.models.user_service_human_profile import UserServiceHumanProfile
+    from zitadel_client.models.user_service_human_user import UserServiceHumanUser
+    from zitadel_client.models.user_service_id_filter import UserServiceIDFilter
+    from zitadel_client.models.user_service_idp_information import UserServiceIDPInformation
+    from zitadel_client.models.user_service_idp_intent import UserServiceIDPIntent
+    from zitadel_client.models.user_service_idpldap_access_information import UserServiceIDPLDAPAccessInformation
+    from zitadel_client.models.user_service_idp_link import UserServiceIDPLink
+    from zitadel_client.models.user_service_idpo_auth_access_information import UserServiceIDPOAuthAccessInformation
+    from zitadel_client.models.user_service_idpsaml_access_information import UserServiceIDPSAMLAccessInformation
+    from zitadel_client.models.user_service_in_user_emails_query import UserServiceInUserEmailsQuery
+    from zitadel_client.models.user_service_in_user_id_query import UserServiceInUserIDQuery
+    from zitadel_client.models.user_service_key import UserServiceKey
+    from zitadel_client.models.user_service_key_field_name import UserServiceKeyFieldName
+    from zitadel_client.models.user_service_keys_search_filter import UserServiceKeysSearchFilter
+    from zitadel_client.models.user_service_ldap_credentials import UserServiceLDAPCredentials
+    from zitadel_client.models.user_service_last_name_query import UserServiceLastNameQuery
+    from zitadel_client.models.user_service_list_authentication_factors_request import UserServiceListAuthenticationFactorsRequest
+    from zitadel_client.models.user_service_list_authentication_factors_response import UserServiceListAuthenticationFactorsResponse
+    from zitadel_client.models.user_service_list_authentication_method_types_request import UserServiceListAuthenticationMethodTypesRequest
+    from zitadel_client.models.user_service_list_authentication_method_types_response import UserServiceListAuthenticationMethodTypesResponse
+    from zitadel_client.models.user_service_list_details import UserServiceListDetails
+    from zitadel_client.models.user_service_list_idp_links_request import UserServiceListIDPLinksRequest
+    from zitadel_client.models.user_service_list_idp_links_response import UserServiceListIDPLinksResponse
+    from zitadel_client.models.user_service_list_keys_request import UserServiceListKeysRequest
+    from zitadel_client.models.user_service_list_keys_response import UserServiceListKeysResponse
+    from zitadel_client.models.user_service_list_passkeys_request import UserServiceListPasskeysRequest
+    from zitadel_client.models.user_service_list_passkeys_response import UserServiceListPasskeysResponse
+    from zitadel_client.models.user_service_list_personal_access_tokens_request import UserServiceListPersonalAccessTokensRequest
+    from zitadel_client.models.user_service_list_personal_access_tokens_response import UserServiceListPersonalAccessTokensResponse
+    from zitadel_client.models.user_service_list_query import UserServiceListQuery
+    from zitadel_client.models.user_service_list_user_metadata_request import UserServiceListUserMetadataRequest
+    from zitadel_client.models.user_service_list_user_metadata_response import UserServiceListUserMetadataResponse
+    from zitadel_client.models.user_service_list_users_request import UserServiceListUsersRequest
+    from zitadel_client.models.user_service_list_users_response import UserServiceListUsersResponse
+    from zitadel_client.models.user_service_lock_user_request import UserServiceLockUserRequest
+    from zitadel_client.models.user_service_lock_user_response import UserServiceLockUserResponse
+    from zitadel_client.models.user_service_login_name_query import UserServiceLoginNameQuery
+    from zitadel_client.models.user_service_machine import UserServiceMachine
+    from zitadel_client.models.user_service_machine_user import UserServiceMachineUser
+    from zitadel_client.models.user_service_metadata import UserServiceMetadata
+    from zitadel_client.models.user_service_metadata_key_filter import UserServiceMetadataKeyFilter
+    from zitadel_client.models.user_service_metadata_search_filter import UserServiceMetadataSearchFilter
+    from zitadel_client.models.user_service_metadata_value_filter import UserServiceMetadataValueFilter
+    from zitadel_client.models.user_service_nick_name_query import UserServiceNickNameQuery
+    from zitadel_client.models.user_service_not_query import UserServiceNotQuery
+    from zitadel_client.models.user_service_notification_type import UserServiceNotificationType
+    from zitadel_client.models.user_service_or_query import UserServiceOrQuery
+    from zitadel_client.models.user_service_organization import UserServiceOrganization
+    from zitadel_client.models.user_service_organization_id_query import UserServiceOrganizationIdQuery
+    from zitadel_client.models.user_service_pagination_request import UserServicePaginationRequest
+    from zitadel_client.models.user_service_pagination_response import UserServicePaginationResponse
+    from zitadel_client.models.user_service_passkey import UserServicePasskey
+    from zitadel_client.models.user_service_passkey_authenticator import UserServicePasskeyAuthenticator
+    from zitadel_client.models.user_service_passkey_registration_code import UserServicePasskeyRegistrationCode
+    from zitadel_client.models.user_service_password import UserServicePassword
+    from zitadel_client.models.user_service_password_reset_request import UserServicePasswordResetRequest
+    from zitadel_client.models.user_service_password_reset_response import UserServicePasswordResetResponse
+    from zitadel_client.models.user_service_personal_access_token import UserServicePersonalAccessToken
+    from zitadel_client.models.user_service_personal_access_token_field_name import UserServicePersonalAccessTokenFieldName
+    from zitadel_client.models.user_service_personal_access_tokens_search_filter import UserServicePersonalAccessTokensSearchFilter
+    from zitadel_client.models.user_service_phone_query import UserServicePhoneQuery
+    from zitadel_client.models.user_service_profile import UserServiceProfile
+    from zitadel_client.models.user_service_reactivate_user_request import UserServiceReactivateUserRequest
+    from zitadel_client.models.user_service_reactivate_user_response import UserServiceReactivateUserResponse
+    from zitadel_client.models.user_service_redirect_urls import UserServiceRedirectURLs
+    from zitadel_client.models.user_service_register_passkey_request import UserServiceRegisterPasskeyRequest
+    from zitadel_client.models.user_service_register_passkey_response import UserServiceRegisterPasskeyResponse
+    from zitadel_client.models.user_service_register_totp_request import UserServiceRegisterTOTPRequest
+    from zitadel_client.models.user_service_register_totp_response import UserServiceRegisterTOTPResponse
+    from zitadel_client.models.user_service_register_u2_f_request import UserServiceRegisterU2FRequest
+    from zitadel_client.models.user_service_register_u2_f_response import UserServiceRegisterU2FResponse
+    from zitadel_client.models.user_service_remove_idp_link_request import UserServiceRemoveIDPLinkRequest
+    from zitadel_client.models.user_service_remove_idp_link_response import UserServiceRemoveIDPLinkResponse
+    from zitadel_client.models.user_service_remove_key_request import UserServiceRemoveKeyRequest
+    from zitadel_client.models.user_service_remove_key_response import UserServiceRemoveKeyResponse
+    from zitadel_client.models.user_service_remove_otp_email_request import UserServiceRemoveOTPEmailRequest
+    from zitadel_client.models.user_service_remove_otp_email_response import UserServiceRemoveOTPEmailResponse
+    from zitadel_client.models.user_service_remove_otpsms_request import UserServiceRemoveOTPSMSRequest
+    from zitadel_client.models.user_service_remove_otpsms_response import UserServiceRemoveOTPSMSResponse
+    from zitadel_client.models.user_service_remove_passkey_request import UserServiceRemovePasskeyRequest
+    from zitadel_client.models.user_service_remove_passkey_response import UserServiceRemovePasskeyResponse
+    from zitadel_client.models.user_service_remove_personal_access_token_request import UserServiceRemovePersonalAccessTokenRequest
+    from zitadel_client.models.user_service_remove_personal_access_token_response import UserServiceRemovePersonalAccessTokenResponse
+    from zitadel_client.models.user_service_remove_phone_request import UserServiceRemovePhoneRequest
+    from zitadel_client.models.user_service_remove_phone_response import UserServiceRemovePhoneResponse
+    from zitadel_client.models.user_service_remove_recovery_codes_request import UserServiceRemoveRecoveryCodesRequest
+    from zitadel_client.models.user_service_remove_recovery_codes_response import UserServiceRemoveRecoveryCodesResponse
+    from zitadel_client.models.user_service_remove_secret_request import UserServiceRemoveSecretRequest
+    from zitadel_client.models.user_service_remove_secret_response import UserServiceRemoveSecretResponse
+    from zitadel_client.models.user_service_remove_totp_request import UserServiceRemoveTOTPRequest
+    from zitadel_client.models.user_service_remove_totp_response import UserServiceRemoveTOTPResponse
+    from zitadel_client.models.user_service_remove_u2_f_request import UserServiceRemoveU2FRequest
+    from zitadel_client.models.user_service_remove_u2_f_response import UserServiceRemoveU2FResponse
+    from zitadel_client.models.user_service_resend_email_code_request import UserServiceResendEmailCodeRequest
+    from zitadel_client.models.user_service_resend_email_code_response import UserServiceResendEmailCodeResponse
+    from zitadel_client.models.user_service_resend_invite_code_request import UserServiceResendInviteCodeRequest
+    from zitadel_client.models.user_service_resend_invite_code_response import UserServiceResendInviteCodeResponse
+    from zitadel_client.models.user_service_resend_phone_code_request import UserServiceResendPhoneCodeRequest
+    from zitadel_client.models.user_service_resend_phone_code_response import UserServiceResendPhoneCodeResponse
+    from zitadel_client.models.user_service_retrieve_identity_provider_intent_request import UserServiceRetrieveIdentityProviderIntentRequest
+    from zitadel_client.models.user_service_retrieve_identity_provider_intent_response import UserServiceRetrieveIdentityProviderIntentResponse
+    from zitadel_client.models.user_service_search_query import UserServiceSearchQuery
+    from zitadel_client.models.user_service_send_email_code_request import UserServiceSendEmailCodeRequest
+    from zitadel_client.models.user_service_send_email_code_response import UserServiceSendEmailCodeResponse
+    from zitadel_client.models.user_service_send_email_verification_code import UserServiceSendEmailVerificationCode
+    from zitadel_client.models.user_service_send_invite_code import UserServiceSendInviteCode
+    from zitadel_client.models.user_service_send_passkey_registration_link import UserServiceSendPasskeyRegistrationLink
+    from zitadel_client.models.user_service_send_password_reset_link import UserServiceSendPasswordResetLink
+    from zitadel_client.models.user_service_set_email_request import UserServiceSetEmailRequest
+    from zitadel_client.models.user_service_set_email_response import UserServiceSetEmailResponse
+    from zitadel_client.models.user_service_set_human_email import UserServiceSetHumanEmail
+    from zitadel_client.models.user_service_set_human_phone import UserServiceSetHumanPhone
+    from zitadel_client.models.user_service_set_human_profile import UserServiceSetHumanProfile
+    from zitadel_client.models.user_service_set_metadata_entry import UserServiceSetMetadataEntry
+    from zitadel_client.models.user_service_set_password import UserServiceSetPassword
+    from zitadel_client.models.user_service_set_password_request import UserServiceSetPasswordRequest
+    from zitadel_client.models.user_service_set_password_response import UserServiceSetPasswordResponse
+    from zitadel_client.models.user_service_set_phone_request import UserServiceSetPhoneRequest
+    from zitadel_client.models.user_service_set_phone_response import UserServiceSetPhoneResponse
+    from zitadel_client.models.user_service_set_user_metadata_request import UserServiceSetUserMetadataRequest
+    from zitadel_client.models.user_service_set_user_metadata_response import UserServiceSetUserMetadataResponse
+    from zitadel_client.models.user_service_start_identity_provider_intent_request import UserServiceStartIdentityProviderIntentRequest
+    from zitadel_client.models.user_service_start_identity_provider_intent_response import UserServiceStartIdentityProviderIntentResponse
+    from zitadel_client.models.user_service_state_query import UserServiceStateQuery
+    from zitadel_client.models.user_service_text_filter_method import UserServiceTextFilterMethod
+    from zitadel_client.models.user_service_text_query_method import UserServiceTextQueryMethod
+    from zitadel_client.models.user_service_timestamp_filter import UserServiceTimestampFilter
+    from zitadel_client.models.user_service_timestamp_filter_method import UserServiceTimestampFilterMethod
+    from zitadel_client.models.user_service_type import UserServiceType
+    from zitadel_client.models.user_service_type_query import UserServiceTypeQuery
+    from zitadel_client.models.user_service_unlock_user_request import UserServiceUnlockUserRequest
+    from zitadel_client.models.user_service_unlock_user_response import UserServiceUnlockUserResponse
+    from zitadel_client.models.user_service_update_human_user_request import UserServiceUpdateHumanUserRequest
+    from zitadel_client.models.user_service_update_human_user_response import UserServiceUpdateHumanUserResponse
+    from zitadel_client.models.user_service_update_user_request import UserServiceUpdateUserRequest
+    from zitadel_client.models.user_service_update_user_response import UserServiceUpdateUserResponse
+    from zitadel_client.models.user_service_user import UserServiceUser
+    from zitadel_client.models.user_service_user_field_name import UserServiceUserFieldName
+    from zitadel_client.models.user_service_user_name_query import UserServiceUserNameQuery
+    from zitadel_client.models.user_service_user_state import UserServiceUserState
+    from zitadel_client.models.user_service_verify_email_request import UserServiceVerifyEmailRequest
+    from zitadel_client.models.user_service_verify_email_response import UserServiceVerifyEmailResponse
+    from zitadel_client.models.user_service_verify_invite_code_request import UserServiceVerifyInviteCodeRequest
+    from zitadel_client.models.user_service_verify_invite_code_response import UserServiceVerifyInviteCodeResponse
+    from zitadel_client.models.user_service_verify_passkey_registration_request import UserServiceVerifyPasskeyRegistrationRequest
+    from zitadel_client.models.user_service_verify_passkey_registration_response import UserServiceVerifyPasskeyRegistrationResponse
+    from zitadel_client.models.user_service_verify_phone_request import UserServiceVerifyPhoneRequest
+    from zitadel_client.models.user_service_verify_phone_response import UserServiceVerifyPhoneResponse
+    from zitadel_client.models.user_service_verify_totp_registration_request import UserServiceVerifyTOTPRegistrationRequest
+    from zitadel_client.models.user_service_verify_totp_registration_response import UserServiceVerifyTOTPRegistrationResponse
+    from zitadel_client.models.user_service_verify_u2_f_registration_request import UserServiceVerifyU2FRegistrationRequest
+    from zitadel_client.models.user_service_verify_u2_f_registration_response import UserServiceVerifyU2FRegistrationResponse
+    from zitadel_client.models.web_key_service_activate_web_key_request import WebKeyServiceActivateWebKeyRequest
+    from zitadel_client.models.web_key_service_activate_web_key_response import WebKeyServiceActivateWebKeyResponse
+    from zitadel_client.models.web_key_service_any import WebKeyServiceAny
+    from zitadel_client.models.web_key_service_connect_error import WebKeyServiceConnectError
+    from zitadel_client.models.web_key_service_create_web_key_request import WebKeyServiceCreateWebKeyRequest
+    from zitadel_client.models.web_key_service_create_web_key_response import WebKeyServiceCreateWebKeyResponse
+    from zitadel_client.models.web_key_service_delete_web_key_request import WebKeyServiceDeleteWebKeyRequest
+    from zitadel_client.models.web_key_service_delete_web_key_response import WebKeyServiceDeleteWebKeyResponse
+    from zitadel_client.models.web_key_service_ecdsa import WebKeyServiceECDSA
+    from zitadel_client.models.web_key_service_ecdsa_curve import WebKeyServiceECDSACurve
+    from zitadel_client.models.web_key_service_list_web_keys_response import WebKeyServiceListWebKeysResponse
+    from zitadel_client.models.web_key_service_rsa import WebKeyServiceRSA
+    from zitadel_client.models.web_key_service_rsa_bits import WebKeyServiceRSABits
+    from zitadel_client.models.web_key_service_rsa_hasher import WebKeyServiceRSAHasher
+    from zitadel_client.models.web_key_service_state import WebKeyServiceState
+    from zitadel_client.models.web_key_service_web_key import WebKeyServiceWebKey
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _MODELS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MODELS))
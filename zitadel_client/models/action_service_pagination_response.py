@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, ClassVar, Dict, Optional
+from zitadel_client.types import Int64
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -26,8 +27,8 @@ class ActionServicePaginationResponse(BaseModel):
     """
     ActionServicePaginationResponse
     """ # noqa: E501
-    total_result: Optional[Any] = Field(default=None, description="Absolute number of objects matching the query, regardless of applied limit.", alias="totalResult")
-    applied_limit: Optional[Any] = Field(default=None, description="Applied limit from query, defines maximum amount of objects per request, to compare if all objects are returned.", alias="appliedLimit")
+    total_result: Optional[Int64] = Field(default=None, description="Absolute number of objects matching the query, regardless of applied limit.", alias="totalResult")
+    applied_limit: Optional[Int64] = Field(default=None, description="Applied limit from query, defines maximum amount of objects per request, to compare if all objects are returned.", alias="appliedLimit")
     __properties: ClassVar[List[str]] = ["totalResult", "appliedLimit"]
 
     model_config = ConfigDict(
@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, Field, StrictBool, StrictInt
 from typing import Any, ClassVar, Dict, Optional
+from zitadel_client.types import Int64
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -26,7 +27,7 @@ class AuthorizationServicePaginationRequest(BaseModel):
     """
     AuthorizationServicePaginationRequest
     """ # noqa: E501
-    offset: Optional[Any] = Field(default=None, description="Starting point for retrieval, in combination of offset used to query a set list of objects.")
+    offset: Optional[Int64] = Field(default=None, description="Starting point for retrieval, in combination of offset used to query a set list of objects.")
     limit: Optional[StrictInt] = Field(default=None, description="limit is the maximum amount of objects returned. The default is set to 100  with a maximum of 1000 in the runtime configuration.  If the limit exceeds the maximum configured ZITADEL will throw an error.  If no limit is present the default is taken.")
     asc: Optional[StrictBool] = Field(default=None, description="Asc is the sorting order. If true the list is sorted ascending, if false  the list is sorted descending. The default is descending.")
     __properties: ClassVar[List[str]] = ["offset", "limit", "asc"]
@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field
 from typing import Any, ClassVar, Dict, Optional
 from zitadel_client.models.beta_settings_service_resource_owner_type import BetaSettingsServiceResourceOwnerType
+from zitadel_client.types import Int64
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -27,9 +28,9 @@ class BetaSettingsServiceLockoutSettings(BaseModel):
     """
     BetaSettingsServiceLockoutSettings
     """ # noqa: E501
-    max_password_attempts: Optional[Any] = Field(default=None, alias="maxPasswordAttempts")
+    max_password_attempts: Optional[Int64] = Field(default=None, alias="maxPasswordAttempts")
     resource_owner_type: Optional[BetaSettingsServiceResourceOwnerType] = Field(default=None, alias="resourceOwnerType")
-    max_otp_attempts: Optional[Any] = Field(default=None, alias="maxOtpAttempts")
+    max_otp_attempts: Optional[Int64] = Field(default=None, alias="maxOtpAttempts")
     __properties: ClassVar[List[str]] = ["maxPasswordAttempts", "resourceOwnerType", "maxOtpAttempts"]
 
     model_config = ConfigDict(
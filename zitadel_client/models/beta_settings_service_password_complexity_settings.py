@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
 from typing import Any, ClassVar, Dict, Optional
 from zitadel_client.models.beta_settings_service_resource_owner_type import BetaSettingsServiceResourceOwnerType
+from zitadel_client.types import Int64
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -27,7 +28,7 @@ class BetaSettingsServicePasswordComplexitySettings(BaseModel):
     """
     BetaSettingsServicePasswordComplexitySettings
     """ # noqa: E501
-    min_length: Optional[Any] = Field(default=None, alias="minLength")
+    min_length: Optional[Int64] = Field(default=None, alias="minLength")
     requires_uppercase: Optional[StrictBool] = Field(default=None, alias="requiresUppercase")
     requires_lowercase: Optional[StrictBool] = Field(default=None, alias="requiresLowercase")
     requires_number: Optional[StrictBool] = Field(default=None, alias="requiresNumber")
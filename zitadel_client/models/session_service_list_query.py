@@ -19,6 +19,7 @@ import json
 
 from pydantic import BaseModel, ConfigDict, StrictBool, StrictInt
 from typing import Any, ClassVar, Dict, Optional
+from zitadel_client.types import Int64
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -26,7 +27,7 @@ class SessionServiceListQuery(BaseModel):
     """
     SessionServiceListQuery
     """ # noqa: E501
-    offset: Optional[Any] = None
+    offset: Optional[Int64] = None
     limit: Optional[StrictInt] = None
     asc: Optional[StrictBool] = None
     __properties: ClassVar[List[str]] = ["offset", "limit", "asc"]
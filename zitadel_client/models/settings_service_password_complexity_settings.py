@@ -20,6 +20,7 @@ import json
 from pydantic import BaseModel, ConfigDict, Field, StrictBool
 from typing import Any, ClassVar, Dict, Optional
 from zitadel_client.models.settings_service_resource_owner_type import SettingsServiceResourceOwnerType
+from zitadel_client.types import Int64
 from typing import Optional, Set
 from typing_extensions import Self
 
@@ -27,7 +28,7 @@ class SettingsServicePasswordComplexitySettings(BaseModel):
     """
     SettingsServicePasswordComplexitySettings
     """ # noqa: E501
-    min_length: Optional[Any] = Field(default=None, description="The minimum length a password must have.", alias="minLength")
+    min_length: Optional[Int64] = Field(default=None, description="The minimum length a password must have.", alias="minLength")
     requires_uppercase: Optional[StrictBool] = Field(default=None, description="Defines if the password MUST contain an upper case letter.", alias="requiresUppercase")
     requires_lowercase: Optional[StrictBool] = Field(default=None, description="Defines if the password MUST contain a lowercase letter.", alias="requiresLowercase")
     requires_number: Optional[StrictBool] = Field(default=None, description="Defines if the password MUST contain a number.", alias="requiresNumber")
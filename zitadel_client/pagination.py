@@ -0,0 +1,335 @@
+import asyncio
+import typing
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, AsyncIterator, Callable, Deque, Generic, Iterator, List, Optional, Type, TypeVar
+
+from pydantic import BaseModel
+
+from zitadel_client.exceptions import InconsistentPageError
+
+T = TypeVar("T")
+
+
+class Paginator(Generic[T]):
+    """
+    Iterates over the items of a paginated list endpoint, one page at a time.
+
+    Each page is requested with the offset and limit set in the request's page field (a
+    `*ListQuery` or `*PaginationRequest`), and iteration stops once `total_result` items
+    have been returned, or at the first short page if the server does not report a total.
+    Only the current page is held in memory; with read-ahead the next page is fetched
+    while the current one is consumed.
+
+    Since every page is addressed by its offset, `fetch_all()` can request all pages after
+    the first one concurrently, once the first page has reported the total.
+
+    Paginators over a coroutine endpoint, such as those of AsyncZitadel services, are
+    consumed with `async for` and `afetch_all()` instead.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[..., Any],
+        request: BaseModel,
+        page_field: str,
+        items_field: str,
+        page_size: int = 100,
+        read_ahead: bool = False,
+        _request_timeout: Any = None,
+    ) -> None:
+        """
+        Initializes the paginator.
+
+        :param fetch: The list endpoint, called with a request for each page.
+        :param request: The request for the first page. It is copied, never modified.
+        :param page_field: The request field holding the offset and limit, e.g. "query" or "pagination".
+        :param items_field: The response field holding the items of a page, e.g. "result".
+        :param page_size: The number of items requested per page.
+        :param read_ahead: Whether to fetch the next page while the current one is consumed.
+        :param _request_timeout: The timeout setting for each request.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+
+        self.fetch = fetch
+        self.request = request
+        self.page_field = page_field
+        self.items_field = items_field
+        self.page_size = page_size
+        self.read_ahead = read_ahead
+        self._request_timeout = _request_timeout
+
+    def _first_offset(self) -> int:
+        page = getattr(self.request, self.page_field)
+        return page.offset or 0 if page is not None else 0
+
+    def _page_request(self, offset: int) -> BaseModel:
+        page = getattr(self.request, self.page_field)
+        if page is None:
+            page = self._page_class()()
+        page = page.model_copy(update={"offset": offset, "limit": self.page_size})
+        return self.request.model_copy(update={self.page_field: page})
+
+    def _page_class(self) -> Type[BaseModel]:
+        annotation = type(self.request).model_fields[self.page_field].annotation
+        for candidate in (annotation, *typing.get_args(annotation)):
+            if isinstance(candidate, type) and issubclass(candidate, BaseModel):
+                return candidate
+        raise TypeError(f"{type(self.request).__name__}.{self.page_field} is not a pagination model")
+
+    def _fetch_page(self, offset: int, response_mode: str = "model") -> Any:
+        # pages are read through their models, whatever the client's response_mode
+        return self.fetch(self._page_request(offset), _request_timeout=self._request_timeout, _response_mode=response_mode)
+
+    def _items(self, response: Any) -> List[T]:
+        return getattr(response, self.items_field) or []
+
+    @staticmethod
+    def _total(response: Any) -> Optional[int]:
+        for name in ("details", "pagination"):
+            meta = getattr(response, name, None)
+            if meta is not None and meta.total_result is not None:
+                return meta.total_result
+        return None
+
+    def _is_last(self, response: Any, count: int, offset: int) -> bool:
+        """
+        Checks whether a page with `count` items, ending before `offset`, is the last one.
+        """
+        if count == 0:
+            return True
+        total = self._total(response)
+        if total is not None:
+            return offset >= total
+        return count < self.page_size
+
+    def _remaining_offsets(self, first: Any, offset: int) -> Optional[range]:
+        """
+        Returns the offsets of all pages after the first one, or None if the total is unknown.
+        """
+        total = self._total(first)
+        if total is None:
+            return None
+        count = len(self._items(first))
+        # servers may cap the page size below the requested one
+        step = min(count, self.page_size) or 1
+        return range(offset + count, total if count else offset, step)
+
+    @staticmethod
+    def _timestamp(response: Any) -> Any:
+        details = getattr(response, "details", None)
+        if details is None or getattr(details, "timestamp", None) is None:
+            raise ValueError(f"{type(response).__name__} does not report details.timestamp")
+        return details.timestamp
+
+    def _check_consistency(self, pinned: Any, response: Any) -> None:
+        if pinned is not None:
+            timestamp = self._timestamp(response)
+            if timestamp != pinned:
+                raise InconsistentPageError(pinned, timestamp)
+
+    @staticmethod
+    def _check_concurrency(concurrency: int) -> None:
+        if concurrency <= 0:
+            raise ValueError("concurrency must be positive")
+
+    def pages(self) -> Iterator[Any]:
+        """
+        Yields the response for each page.
+        """
+        offset = self._first_offset()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zitadel-read-ahead") if self.read_ahead else None
+        try:
+            response = self._fetch_page(offset)
+            while True:
+                count = len(self._items(response))
+                offset += count
+                last = self._is_last(response, count, offset)
+                pending: Optional[Future] = None
+                if executor is not None and not last:
+                    pending = executor.submit(self._fetch_page, offset)
+                yield response
+                if last:
+                    return
+                response = pending.result() if pending is not None else self._fetch_page(offset)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def __iter__(self) -> Iterator[T]:
+        for response in self.pages():
+            yield from self._items(response)
+
+    def stream(self) -> Iterator[T]:
+        """
+        Yields the items of all pages, decoding each item as its page is received.
+
+        Iterating the paginator holds the current page in memory, whereas here only the
+        item being decoded is buffered, so memory use is bounded by one item rather than
+        one page. Pages are requested one after another, without read-ahead.
+
+        :return: An iterator over the items of all pages.
+        """
+        offset = self._first_offset()
+        while True:
+            page = self._fetch_page(offset, "stream")
+            count = 0
+            for item in page:
+                count += 1
+                yield item
+            offset += count
+            if self._is_last(page.response, count, offset):
+                return
+
+    def fetch_all(self, concurrency: int = 4, ordered: bool = True, consistent: bool = False) -> Iterator[T]:
+        """
+        Yields the items of all pages, requesting the pages after the first one concurrently.
+
+        At most `concurrency` page requests are in flight at any time, so no more than that
+        many pages are held in memory. If the server does not report a total, the remaining
+        pages are fetched one after another instead.
+
+        :param concurrency: The maximum number of concurrent page requests.
+        :param ordered: Whether to yield pages in order, or each page as soon as it arrives.
+        :param consistent: Whether to require every page to report the same `details.timestamp`
+            as the first one, raising InconsistentPageError if the data changed during the scan.
+        :return: An iterator over the items of all pages.
+        """
+        self._check_concurrency(concurrency)
+        start = self._first_offset()
+        first = self._fetch_page(start)
+        pinned = self._timestamp(first) if consistent else None
+        yield from self._items(first)
+
+        offsets = self._remaining_offsets(first, start)
+        if offsets is None:
+            pages = self._pages_after(first, start + len(self._items(first)))
+        else:
+            pages = self._concurrent_pages(offsets, concurrency, ordered)
+        for response in pages:
+            self._check_consistency(pinned, response)
+            yield from self._items(response)
+
+    def _pages_after(self, response: Any, offset: int) -> Iterator[Any]:
+        """
+        Yields the pages following a page whose items end before `offset`, one after another.
+        """
+        count = len(self._items(response))
+        while not self._is_last(response, count, offset):
+            response = self._fetch_page(offset)
+            count = len(self._items(response))
+            offset += count
+            yield response
+
+    def _concurrent_pages(self, offsets: range, concurrency: int, ordered: bool) -> Iterator[Any]:
+        """
+        Yields the pages at the given offsets, keeping up to `concurrency` requests in flight.
+        """
+        remaining = iter(offsets)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="zitadel-fetch-all") as executor:
+            in_flight: Deque[Future] = deque(
+                executor.submit(self._fetch_page, offset) for offset in islice(remaining, concurrency)
+            )
+            try:
+                while in_flight:
+                    if ordered:
+                        future = in_flight.popleft()
+                    else:
+                        future = next(iter(wait(in_flight, return_when=FIRST_COMPLETED).done))
+                        in_flight.remove(future)
+                    response = future.result()
+                    offset = next(remaining, None)
+                    if offset is not None:
+                        in_flight.append(executor.submit(self._fetch_page, offset))
+                    yield response
+            finally:
+                for future in in_flight:
+                    future.cancel()
+
+    async def afetch_all(self, concurrency: int = 4, ordered: bool = True, consistent: bool = False) -> AsyncIterator[T]:
+        """
+        Yields the items of all pages of a coroutine endpoint, requesting the pages after the
+        first one concurrently. See fetch_all().
+
+        :param concurrency: The maximum number of concurrent page requests.
+        :param ordered: Whether to yield pages in order, or each page as soon as it arrives.
+        :param consistent: Whether to require every page to report the same `details.timestamp`
+            as the first one, raising InconsistentPageError if the data changed during the scan.
+        :return: An asynchronous iterator over the items of all pages.
+        """
+        self._check_concurrency(concurrency)
+        start = self._first_offset()
+        first = await self._fetch_page(start)
+        pinned = self._timestamp(first) if consistent else None
+        for item in self._items(first):
+            yield item
+
+        offsets = self._remaining_offsets(first, start)
+        if offsets is None:
+            pages = self._apages_after(first, start + len(self._items(first)))
+        else:
+            pages = self._aconcurrent_pages(offsets, concurrency, ordered)
+        async for response in pages:
+            self._check_consistency(pinned, response)
+            for item in self._items(response):
+                yield item
+
+    async def _apages_after(self, response: Any, offset: int) -> AsyncIterator[Any]:
+        count = len(self._items(response))
+        while not self._is_last(response, count, offset):
+            response = await self._fetch_page(offset)
+            count = len(self._items(response))
+            offset += count
+            yield response
+
+    async def _aconcurrent_pages(self, offsets: range, concurrency: int, ordered: bool) -> AsyncIterator[Any]:
+        remaining = iter(offsets)
+        in_flight: Deque[asyncio.Future] = deque(
+            asyncio.ensure_future(self._fetch_page(offset)) for offset in islice(remaining, concurrency)
+        )
+        try:
+            while in_flight:
+                if ordered:
+                    task = in_flight.popleft()
+                else:
+                    done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    task = next(iter(done))
+                    in_flight.remove(task)
+                response = await task
+                offset = next(remaining, None)
+                if offset is not None:
+                    in_flight.append(asyncio.ensure_future(self._fetch_page(offset)))
+                yield response
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def apages(self) -> AsyncIterator[Any]:
+        """
+        Yields the response for each page of a coroutine endpoint.
+        """
+        offset = self._first_offset()
+        response = await self._fetch_page(offset)
+        while True:
+            count = len(self._items(response))
+            offset += count
+            last = self._is_last(response, count, offset)
+            pending: Optional[asyncio.Task] = None
+            if self.read_ahead and not last:
+                pending = asyncio.ensure_future(self._fetch_page(offset))
+            try:
+                yield response
+            except BaseException:
+                if pending is not None:
+                    pending.cancel()
+                raise
+            if last:
+                return
+            response = await (pending if pending is not None else self._fetch_page(offset))
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        async for response in self.apages():
+            for item in self._items(response):
+                yield item
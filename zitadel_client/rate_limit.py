@@ -0,0 +1,218 @@
+import threading
+import time
+from typing import Callable, Dict, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """
+    Spaces requests out to a sustained rate, allowing bursts of up to `burst` requests.
+
+    Tokens are reserved rather than waited for under the lock, so callers on many threads
+    are queued in order: each one is told how long to wait, and waits without holding up
+    the others.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None, clock: Callable[[], float] = time.monotonic) -> None:
+        """
+        Initializes the bucket, full.
+
+        :param rate: The sustained rate, in requests per second.
+        :param burst: The requests that may be sent at once after a quiet period. Defaults to
+            one second's worth of requests.
+        :param clock: The monotonic clock, in seconds.
+        """
+        self._rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        """The current sustained rate, in requests per second."""
+        return self._rate
+
+    def reserve(self) -> float:
+        """
+        Takes a token, possibly ahead of time.
+
+        :return: The seconds to wait before sending the request, 0 if it may be sent now.
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+
+    def record(self, status: int, latency: float) -> None:
+        """
+        Records the outcome of a request. A fixed rate ignores it.
+
+        :param status: The HTTP status of the response.
+        :param latency: The seconds from sending the request to receiving the response headers.
+        """
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+
+class AdaptiveTokenBucket(TokenBucket):
+    """
+    A token bucket whose rate follows the server's capacity, by additive increase and
+    multiplicative decrease (AIMD).
+
+    The rate is cut by `decrease` when the server answers 429, or when the latency, smoothed
+    over the last few responses, grows beyond `latency_factor` times the lowest smoothed
+    latency seen, which is taken as the latency of an unloaded server. Cuts are at least
+    `cooldown` seconds apart, so that one overload is not counted once per request already
+    in flight. Otherwise the rate grows by about `increase` requests per second, every second.
+    """
+
+    LATENCY_SMOOTHING = 0.2
+
+    def __init__(
+        self,
+        rate: float,
+        min_rate: float = 1.0,
+        max_rate: float = float("inf"),
+        increase: float = 1.0,
+        decrease: float = 0.5,
+        latency_factor: Optional[float] = 2.0,
+        cooldown: float = 1.0,
+        burst: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initializes the bucket, full.
+
+        :param rate: The initial rate, in requests per second.
+        :param min_rate: The lowest rate to back off to.
+        :param max_rate: The highest rate to probe up to.
+        :param increase: The growth of the rate per second of successful responses.
+        :param decrease: The factor to cut the rate by on overload.
+        :param latency_factor: The latency growth taken as overload, or None to only react to 429.
+        :param cooldown: The minimum seconds between two cuts.
+        :param burst: The requests that may be sent at once after a quiet period. Defaults to
+            one second's worth of requests at the initial rate.
+        :param clock: The monotonic clock, in seconds.
+        """
+        super().__init__(rate, burst, clock)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.cooldown = cooldown
+        self._latency: Optional[float] = None
+        self._baseline: Optional[float] = None
+        self._decreased = float("-inf")
+
+    def record(self, status: int, latency: float) -> None:
+        with self._lock:
+            if self._latency is None:
+                self._latency = latency
+            else:
+                self._latency += AdaptiveTokenBucket.LATENCY_SMOOTHING * (latency - self._latency)
+            self._baseline = self._latency if self._baseline is None else min(self._baseline, self._latency)
+
+            slow = self.latency_factor is not None and self._latency > self._baseline * self.latency_factor
+            self._refill()
+            if status == 429 or slow:
+                now = self._clock()
+                if now - self._decreased >= self.cooldown:
+                    self._rate = max(self.min_rate, self._rate * self.decrease)
+                    self._decreased = now
+            elif status < 500:
+                # one step per response, so about `increase` per second at the current rate
+                self._rate = min(self.max_rate, self._rate + self.increase / self._rate)
+
+
+Limit = Union[float, TokenBucket]
+
+
+class RateLimiter:
+    """
+    Throttles the requests of a client, per client, per service and per endpoint.
+
+    A request waits for a token of every limit that applies to it: the client-wide limit,
+    the limit of its service and the limit of its endpoint. Limits are given as a rate, in
+    requests per second, or as a TokenBucket, e.g. an AdaptiveTokenBucket. Services are
+    named like "UserService", or in full like "zitadel.user.v2.UserService"; endpoints by
+    their RPC method, like "SetUserMetadata", or by path.
+    """
+
+    def __init__(
+        self,
+        rate: Optional[Limit] = None,
+        services: Optional[Mapping[str, Limit]] = None,
+        endpoints: Optional[Mapping[str, Limit]] = None,
+    ) -> None:
+        """
+        Initializes the limiter.
+
+        :param rate: The client-wide limit, if any.
+        :param services: The limits per service.
+        :param endpoints: The limits per endpoint.
+        """
+        self.client = RateLimiter._bucket(rate) if rate is not None else None
+        self.services = {name: RateLimiter._bucket(limit) for name, limit in (services or {}).items()}
+        self.endpoints = {name: RateLimiter._bucket(limit) for name, limit in (endpoints or {}).items()}
+        self._routes: Dict[str, Tuple[TokenBucket, ...]] = {}
+
+    def buckets(self, url: str) -> Tuple[TokenBucket, ...]:
+        """
+        Returns the buckets that apply to a request, resolved once per path.
+
+        :param url: The request URL, or its path.
+        :return: The client, service and endpoint buckets that are configured.
+        """
+        path = urlsplit(url).path
+        buckets = self._routes.get(path)
+        if buckets is None:
+            service, _, method = path.strip("/").rpartition("/")
+            candidates = (
+                self.client,
+                self.services.get(service) or self.services.get(service.rsplit(".", 1)[-1]),
+                self.endpoints.get(path) or self.endpoints.get(method),
+            )
+            buckets = self._routes.setdefault(path, tuple(bucket for bucket in candidates if bucket is not None))
+        return buckets
+
+    def reserve(self, url: str) -> float:
+        """
+        Takes a token from each bucket that applies to a request.
+
+        :param url: The request URL, or its path.
+        :return: The seconds to wait before sending the request, 0 if it may be sent now.
+        """
+        return max((bucket.reserve() for bucket in self.buckets(url)), default=0.0)
+
+    def record(self, url: str, status: int, latency: float) -> None:
+        """
+        Records the outcome of a request with each bucket that applies to it.
+
+        :param url: The request URL, or its path.
+        :param status: The HTTP status of the response.
+        :param latency: The seconds from sending the request to receiving the response headers.
+        """
+        for bucket in self.buckets(url):
+            bucket.record(status, latency)
+
+    def rates(self) -> Dict[str, float]:
+        """
+        Returns the current rate of each limit, e.g. to export as a metric.
+
+        :return: The rates in requests per second, keyed by "client", or the service or
+            endpoint name as configured.
+        """
+        rates = {"client": self.client.rate} if self.client is not None else {}
+        rates.update({name: bucket.rate for name, bucket in self.services.items()})
+        rates.update({name: bucket.rate for name, bucket in self.endpoints.items()})
+        return rates
+
+    @staticmethod
+    def _bucket(limit: Limit) -> TokenBucket:
+        return limit if isinstance(limit, TokenBucket) else TokenBucket(limit)
@@ -1,16 +1,26 @@
 import json
 import re
 import ssl
-from typing import Dict, Optional
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
 import urllib3
 
+from zitadel_client.circuit_breaker import CircuitBreaker
+from zitadel_client.codec import JsonCodec
 from zitadel_client.rest_response import RESTResponse
+from zitadel_client.transport import Transport
+
+if TYPE_CHECKING:
+    from zitadel_client.http2 import Http2PoolManager
 
 RESTResponseType = urllib3.HTTPResponse
 
 
 class RESTClientObject:
+    TRANSIENT_ERRORS = (urllib3.exceptions.HTTPError,)
+    """Errors of a request that may succeed if sent again."""
+
     def __init__(self, configuration) -> None:  # type: ignore
         # urllib3.PoolManager will pass all kw parameters to connectionpool
         # https://github.com/shazow/urllib3/blob/f9409436f83aeb79fbaf090181cd81b784f1b8ce/urllib3/poolmanager.py#L75  # noqa: E501
@@ -47,16 +57,16 @@ class RESTClientObject:
         if configuration.connection_pool_maxsize is not None:
             pool_args["maxsize"] = configuration.connection_pool_maxsize
 
-        # https pool manager
-        self.pool_manager: urllib3.PoolManager
-        if configuration.proxy_url:
-            # noinspection PyArgumentList
-            self.pool_manager = urllib3.ProxyManager(configuration.proxy_url, **pool_args)  # ty: ignore[invalid-argument-type]
-        else:
-            # noinspection PyArgumentList
-            self.pool_manager = urllib3.PoolManager(**pool_args)  # ty: ignore[invalid-argument-type]
+        # reuse the connections of a shared transport, if one was configured
+        self.transport: Transport = configuration.transport or Transport(pool_args, configuration.proxy_url, configuration.http2)
+        self.codec: JsonCodec = configuration.json_codec
+        self.circuit_breaker: Optional[CircuitBreaker] = configuration.circuit_breaker
+
+    @property
+    def pool_manager(self) -> Union[urllib3.PoolManager, "Http2PoolManager"]:
+        return self.transport.api_pool_manager
 
-    def request(  # noqa C901 too complex
+    def request(
         self,
         method: str,
         url: str,
@@ -78,7 +88,36 @@ class RESTClientObject:
                                  number provided, it will be total request
                                  timeout. It can also be a pair (tuple) of
                                  (connection, read) timeouts.
+        :raises CircuitOpenError: If a circuit breaker is configured and the
+                                  circuit of the URL's host and service is open.
         """
+        if self.circuit_breaker is None:
+            return self._send(method, url, headers, body, post_params, _request_timeout)
+
+        circuit = self.circuit_breaker.circuit(url)
+        circuit.acquire()
+        start = time.monotonic()
+        try:
+            response = self._send(method, url, headers, body, post_params, _request_timeout)
+        except self.TRANSIENT_ERRORS:
+            circuit.record(None, time.monotonic() - start)
+            raise
+        except BaseException:
+            circuit.release()
+            raise
+        circuit.record(response.status, time.monotonic() - start)
+        return response
+
+    def _send(  # noqa C901 too complex
+        self,
+        method: str,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        body=None,
+        post_params=None,
+        _request_timeout=None,
+    ):
+        """Sends a request, with the parameters of request(), regardless of the circuit breaker."""
         method = method.upper()
         assert method in ["GET", "HEAD", "DELETE", "POST", "PUT", "PATCH", "OPTIONS"]
 
@@ -103,7 +142,7 @@ class RESTClientObject:
                 if not content_type or re.search("json", content_type, re.IGNORECASE):
                     request_body = None
                     if body is not None:
-                        request_body = json.dumps(body)
+                        request_body = self.codec.dumps(body)
                     r = self.pool_manager.request(
                         method,
                         url,
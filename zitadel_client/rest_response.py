@@ -1,5 +1,6 @@
 import io
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional
 
 from urllib3 import BaseHTTPResponse
 
@@ -10,20 +11,78 @@ class RESTResponse(io.IOBase):
     def __init__(self, resp: BaseHTTPResponse, *args, **kwargs) -> None:  # type: ignore
         # noinspection PyArgumentList
         super().__init__(*args, **kwargs)
-        self.response = resp
+        self.response: Optional[BaseHTTPResponse] = resp
         self.status = resp.status
         self.reason = resp.reason
+        self.headers: Mapping[str, str] = MappingProxyType(resp.headers)
+        """A read-only, case-insensitive view of the response headers."""
         self.data = None
 
     def read(self) -> Optional[bytes]:
-        if self.data is None:
+        if self.data is None and self.response is not None:
             self.data = self.response.data
+            # the body has been read in full, so the connection can be reused right away
+            self.response.release_conn()
+        return self.data
+
+    def stream(self, chunk_size: int = 65536) -> Iterator[bytes]:
+        """
+        Yields the response body in chunks as it is received, instead of reading it at once.
+
+        The connection is returned to the pool once the body has been read in full.
+        """
+        response = self.response
+        if response is None:
+            return
+        yield from response.stream(chunk_size)
+        response.release_conn()
+
+    def release(self) -> None:
+        """Drops the response body and the underlying urllib3 response, keeping the status and headers."""
+        if self.response is not None:
+            self.response.release_conn()
+            self.response = None
+        self.data = None
+
+    def getheaders(self) -> Dict[str, str]:
+        """Returns a dictionary of the response headers."""
+        return dict(self.headers)
+
+    def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
+        """Returns a given response header."""
+        return self.headers.get(name, default)
+
+
+class AsyncRESTResponse:
+    """Response of the asynchronous REST client, exposing the same surface as RESTResponse."""
+
+    data: Optional[bytes] = None
+
+    def __init__(self, resp: Any) -> None:
+        self.response = resp
+        self.status = resp.status
+        self.reason = resp.reason
+        self.headers: Mapping[str, str] = resp.headers
+        """A read-only, case-insensitive view of the response headers."""
+        self.data = None
+
+    async def read(self) -> Optional[bytes]:
+        if self.data is None and self.response is not None:
+            self.data = await self.response.read()
+            self.response.release()
         return self.data
 
+    def release(self) -> None:
+        """Drops the response body and the underlying aiohttp response, keeping the status and headers."""
+        if self.response is not None:
+            self.response.release()
+            self.response = None
+        self.data = None
+
     def getheaders(self) -> Dict[str, str]:
         """Returns a dictionary of the response headers."""
-        return dict(self.response.headers)
+        return dict(self.headers)
 
     def getheader(self, name: str, default: Optional[str] = None) -> Optional[str]:
         """Returns a given response header."""
-        return self.response.headers.get(name, default)
+        return self.headers.get(name, default)
@@ -0,0 +1,181 @@
+import random
+import re
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Collection, Mapping, Optional
+from urllib.parse import urlsplit
+
+# the RPC method of a Connect-style path, e.g. "/zitadel.user.v2.UserService/GetUserByID"
+_READ_RPC = re.compile(r"/[\w.]+/(?:Get|List)[A-Z]\w*")
+
+
+class RetryBudget:
+    """
+    Caps retries to a fraction of the requests sent, so that retries cannot multiply the load
+    on a server that is already failing.
+
+    Every request deposits `ratio` tokens, up to `reserve` tokens in total, and every retry
+    withdraws one. A budget starts full, so that isolated failures are always retried.
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: float = 10.0) -> None:
+        """
+        Initializes the budget.
+
+        :param ratio: The retries allowed per request sent, e.g. 0.2 for one retry per five requests.
+        :param reserve: The retries allowed in a burst, and the initial balance.
+        """
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+        self._lock = threading.Lock()
+
+    @property
+    def balance(self) -> float:
+        """The retries currently allowed."""
+        return self._balance
+
+    def deposit(self) -> None:
+        """Records a request sent for the first time."""
+        with self._lock:
+            self._balance = min(self.reserve, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """
+        Takes a retry from the budget.
+
+        :return: True if the retry may be sent, False if the budget is exhausted.
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Retries idempotent RPCs that failed transiently, with exponential backoff and full jitter.
+
+    Every Zitadel RPC is a POST to `/zitadel.<service>.<version>.<Service>/<Method>`, so the
+    HTTP method does not say whether a call is safe to repeat. Reads, the RPCs named `Get...`
+    or `List...` such as `GetUserByID` or `ListUsers`, are retried. Mutations such as
+    `CreateUser` are only retried if named in `idempotent`, as a retry after a lost response
+    could apply them twice.
+
+    Connection errors and the statuses in RETRYABLE_STATUSES are retried. The `Retry-After`
+    header of a 429 or 503 response is honoured instead of the backoff, unless it asks for a
+    longer wait than `max_backoff`, in which case the response is returned as is. All retries
+    are drawn from a shared RetryBudget.
+    """
+
+    RETRYABLE_STATUSES = frozenset((429, 502, 503, 504))
+    RETRY_AFTER_STATUSES = frozenset((429, 503))
+    SAFE_METHODS = frozenset(("GET", "HEAD", "OPTIONS"))
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 10.0,
+        multiplier: float = 2.0,
+        idempotent: Collection[str] = (),
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        Initializes the policy.
+
+        :param max_attempts: The attempts per call, including the first one.
+        :param initial_backoff: The upper bound, in seconds, of the wait before the first retry.
+        :param max_backoff: The upper bound, in seconds, of any wait, including `Retry-After`.
+        :param multiplier: The growth of the backoff bound from one retry to the next.
+        :param idempotent: Further RPCs that are safe to retry, by method name, e.g.
+            "SetUserMetadata", or by path.
+        :param budget: The retry budget, shared by every call made with this policy.
+        """
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+        self.idempotent = frozenset(idempotent)
+        self.budget = budget or RetryBudget()
+
+    def is_idempotent(self, method: str, url: str) -> bool:
+        """
+        Returns whether a request is safe to send more than once.
+
+        :param method: The HTTP method.
+        :param url: The request URL, or its path.
+        :return: True for reads and for the RPCs named in `idempotent`.
+        """
+        if method.upper() in RetryPolicy.SAFE_METHODS:
+            return True
+        path = urlsplit(url).path
+        return RetryPolicy.is_read(path) or path in self.idempotent or path.rsplit("/", 1)[-1] in self.idempotent
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def is_read(path: str) -> bool:
+        """
+        Returns whether an RPC path names a read, computed once per path.
+
+        :param path: The request path, e.g. "/zitadel.user.v2.UserService/ListUsers".
+        :return: True if the RPC method is named `Get...` or `List...`.
+        """
+        return _READ_RPC.fullmatch(path) is not None
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns a random wait before a retry, between zero and an exponentially growing bound.
+
+        :param attempt: The attempt that failed, starting at 1.
+        :return: The wait in seconds.
+        """
+        bound = min(self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1))
+        return random.uniform(0, bound)  # noqa: S311
+
+    def delay(self, attempt: int, status: Optional[int] = None, headers: Optional[Mapping[str, str]] = None) -> Optional[float]:
+        """
+        Decides whether to retry a failed attempt, and how long to wait first.
+
+        A retry is taken from the budget when this returns a delay.
+
+        :param attempt: The attempt that failed, starting at 1.
+        :param status: The HTTP status of the response, or None if the request raised.
+        :param headers: The response headers, if any.
+        :return: The wait in seconds, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if status is not None and status not in RetryPolicy.RETRYABLE_STATUSES:
+            return None
+        wait = self.backoff(attempt)
+        if status in RetryPolicy.RETRY_AFTER_STATUSES and headers is not None:
+            retry_after = RetryPolicy.retry_after(headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.max_backoff:
+                    return None
+                wait = retry_after
+        if not self.budget.withdraw():
+            return None
+        return wait
+
+    @staticmethod
+    def retry_after(value: Optional[str]) -> Optional[float]:
+        """
+        Parses a `Retry-After` header.
+
+        :param value: The header value, in seconds or as an HTTP date.
+        :return: The wait in seconds, or None if the value is missing or invalid.
+        """
+        if not value:
+            return None
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
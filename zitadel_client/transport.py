@@ -0,0 +1,110 @@
+import multiprocessing
+import ssl
+from typing import TYPE_CHECKING, Any, Dict, Optional, Union
+
+import urllib3
+
+from zitadel_client.transport_options import TransportOptions
+from zitadel_client.utils.fork_util import ForkUtil
+
+if TYPE_CHECKING:
+    from zitadel_client.http2 import Http2PoolManager
+
+
+class Transport:
+    """
+    A urllib3 connection pool together with its TLS and proxy settings.
+
+    The same transport serves OpenID discovery, token requests and API calls, so a client keeps
+    a single set of keep-alive connections to each host. Transports returned by `shared()` are
+    reused by every client with equal transport options. The pool is replaced in child processes
+    after os.fork(), as its sockets would otherwise be shared with the parent.
+
+    With `http2` set, API calls are instead multiplexed over HTTP/2 connections, see
+    Http2PoolManager, while discovery and token requests keep using the urllib3 pool.
+    """
+
+    _shared: Dict[TransportOptions, "Transport"] = {}
+
+    def __init__(self, pool_args: Dict[str, Any], proxy_url: Optional[str] = None, http2: bool = False) -> None:
+        """
+        Initializes the transport.
+
+        :param pool_args: Keyword arguments for the urllib3 PoolManager, e.g. TLS settings and pool size.
+        :param proxy_url: Optional URL of a proxy that all requests are sent through.
+        :param http2: Whether to send API calls over HTTP/2. Requires the `http2` extra.
+        """
+        self.pool_args = pool_args
+        self.proxy_url = proxy_url
+        self.http2 = http2
+        self.pool_manager = self._create_pool_manager()
+        self.http2_pool_manager = self._create_http2_pool_manager()
+        ForkUtil.register(self)
+
+    @staticmethod
+    def from_options(transport_options: TransportOptions) -> "Transport":
+        """
+        Builds a new transport from transport options.
+
+        :param transport_options: Transport options for TLS and proxy.
+        :return: A new Transport.
+        """
+        pool_args: Dict[str, Any] = {
+            "cert_reqs": ssl.CERT_NONE if transport_options.insecure else ssl.CERT_REQUIRED,
+            "ca_certs": None if transport_options.insecure else transport_options.ca_cert_path,
+            # noinspection PyUnresolvedReferences
+            "maxsize": multiprocessing.cpu_count() * 5,
+        }
+        return Transport(pool_args, transport_options.proxy_url, transport_options.http2)
+
+    @staticmethod
+    def shared(transport_options: Optional[TransportOptions] = None) -> "Transport":
+        """
+        Returns the process-wide transport for the given transport options, creating it on first use.
+
+        :param transport_options: Transport options for TLS and proxy.
+        :return: The shared Transport.
+        """
+        options = transport_options or TransportOptions.defaults()
+        transport = Transport._shared.get(options)
+        if transport is None:
+            transport = Transport._shared.setdefault(options, Transport.from_options(options))
+        return transport
+
+    def _create_pool_manager(self) -> urllib3.PoolManager:
+        # https pool manager
+        if self.proxy_url:
+            # noinspection PyArgumentList
+            return urllib3.ProxyManager(self.proxy_url, **self.pool_args)
+        else:
+            # noinspection PyArgumentList
+            return urllib3.PoolManager(**self.pool_args)
+
+    def _create_http2_pool_manager(self) -> Optional["Http2PoolManager"]:
+        if not self.http2:
+            return None
+        # imported here, as h2 is an optional dependency
+        from zitadel_client.http2 import Http2PoolManager
+
+        return Http2PoolManager(self.pool_args, self.proxy_url, fallback=self.pool_manager)
+
+    @property
+    def api_pool_manager(self) -> Union[urllib3.PoolManager, "Http2PoolManager"]:
+        """The pool that API calls are sent through: the HTTP/2 pool if enabled, the urllib3 pool otherwise."""
+        return self.http2_pool_manager or self.pool_manager
+
+    def request(self, method: str, url: str, **kwargs: Any) -> urllib3.BaseHTTPResponse:
+        """
+        Sends a request through the connection pool.
+
+        :param method: The HTTP method.
+        :param url: The absolute URL.
+        :param kwargs: Further arguments for urllib3's PoolManager.request(), e.g. headers or body.
+        :return: The urllib3 response.
+        """
+        return self.pool_manager.request(method, url, **kwargs)
+
+    def after_fork(self) -> None:
+        """Replaces the connection pools, whose sockets are shared with the parent process."""
+        self.pool_manager = self._create_pool_manager()
+        self.http2_pool_manager = self._create_http2_pool_manager()
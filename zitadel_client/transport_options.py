@@ -11,16 +11,21 @@ class TransportOptions:
     :param ca_cert_path: Path to a custom CA certificate file for TLS verification.
     :param insecure: Whether to disable TLS certificate verification.
     :param proxy_url: Proxy URL for HTTP connections.
+    :param http2: Whether to multiplex API calls over HTTP/2 connections. Requires the `http2` extra.
     """
 
     default_headers: Mapping[str, str] = field(default_factory=dict)
     ca_cert_path: Optional[str] = None
     insecure: bool = False
     proxy_url: Optional[str] = None
+    http2: bool = False
 
     def __post_init__(self) -> None:
         object.__setattr__(self, "default_headers", MappingProxyType(dict(self.default_headers)))
 
+    def __hash__(self) -> int:
+        return hash((frozenset(self.default_headers.items()), self.ca_cert_path, self.insecure, self.proxy_url, self.http2))
+
     @staticmethod
     def defaults() -> "TransportOptions":
         """Returns a TransportOptions instance with all default values."""
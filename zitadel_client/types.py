@@ -0,0 +1,11 @@
+from pydantic import PlainSerializer
+from typing_extensions import Annotated
+
+Int64 = Annotated[int, PlainSerializer(str, return_type=str)]
+"""
+A proto int64 or uint64 value, such as a sequence, an offset or a total count.
+
+The proto JSON mapping encodes these as strings, since they may not fit in a JSON
+number. Both strings and numbers are accepted on input, values are held as a Python
+int, and they are serialized back to the string form.
+"""
@@ -0,0 +1,61 @@
+import datetime
+import re
+from functools import lru_cache
+
+from dateutil.parser import parse
+
+# RFC 3339 timestamps as emitted by the proto JSON mapping, with up to nine fraction digits
+_RFC3339 = re.compile(r"(\d{4}-\d{2}-\d{2}[Tt ]\d{2}:\d{2}:\d{2})(?:\.(\d{1,9}))?([Zz]|[+-]\d{2}:\d{2})?")
+
+
+class DateTimeUtil:
+    """
+    Parses the ISO 8601 timestamps and dates of API responses.
+
+    RFC 3339 timestamps, which is what the API sends, are normalized for
+    `datetime.fromisoformat()`: a `Z` suffix becomes `+00:00` and the fraction is
+    truncated or padded to microseconds. Anything else falls back to dateutil. Parsed
+    values are cached, since the same timestamps tend to repeat within a response.
+    """
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_datetime(value: str) -> datetime.datetime:
+        """
+        Parses a timestamp.
+
+        :param value: The timestamp, e.g. "2025-01-02T03:04:05.123456789Z".
+        :return: The timestamp, aware if the value has a time zone.
+        :raises ValueError: If the value is not a timestamp.
+        """
+        match = _RFC3339.fullmatch(value)
+        if match is not None:
+            seconds, fraction, zone = match.groups()
+            normalized = seconds
+            if fraction:
+                normalized += "." + fraction[:6].ljust(6, "0")
+            if zone:
+                normalized += "+00:00" if zone in "Zz" else zone
+            try:
+                return datetime.datetime.fromisoformat(normalized)
+            except ValueError:
+                pass
+        return parse(value)
+
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def parse_date(value: str) -> datetime.date:
+        """
+        Parses a date.
+
+        :param value: The date, e.g. "2025-01-02".
+        :return: The date.
+        :raises ValueError: If the value is not a date.
+        """
+        try:
+            return datetime.date.fromisoformat(value)
+        except ValueError:
+            return parse(value).date()
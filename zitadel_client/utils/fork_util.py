@@ -0,0 +1,41 @@
+import os
+import weakref
+from typing import Protocol
+
+
+class ForkSafe(Protocol):
+    def after_fork(self) -> None:
+        """Re-initializes locks, threads and pooled connections in a forked child process."""
+        ...  # pragma: no cover
+
+
+class ForkUtil:
+    """
+    Keeps track of objects holding process-local state, such as locks or pooled connections,
+    and re-initializes them in the child process after os.fork().
+
+    Objects are held weakly, so registering does not extend their lifetime.
+    """
+
+    _instances: "weakref.WeakSet[ForkSafe]" = weakref.WeakSet()
+
+    def __init__(self) -> None:
+        pass
+
+    @staticmethod
+    def register(instance: ForkSafe) -> None:
+        """
+        Registers an object whose after_fork() method runs in every forked child process.
+
+        :param instance: The object to re-initialize after a fork.
+        """
+        ForkUtil._instances.add(instance)
+
+    @staticmethod
+    def _after_fork_in_child() -> None:
+        for instance in list(ForkUtil._instances):
+            instance.after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=ForkUtil._after_fork_in_child)
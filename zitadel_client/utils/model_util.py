@@ -0,0 +1,173 @@
+import typing
+from functools import lru_cache
+from typing import Any, Callable, Iterator, List, NamedTuple, Set, Tuple, Type, Union
+
+from pydantic import BaseModel
+
+from zitadel_client.types import Int64
+
+
+class _Field(NamedTuple):
+    name: str
+    key: str
+    nullable: bool
+    int64: bool
+
+
+class _Plan(NamedTuple):
+    fields: Tuple[_Field, ...]
+    additional_properties: bool
+
+
+class ModelUtil:
+    """
+    Serializes and validates generated models without their to_dict() and from_dict() helpers.
+
+    A generated model's `to_dict()` runs `model_dump()` over the whole subtree and then
+    calls `to_dict()` again on every nested model, so serializing a request walks each
+    nested model once per level above it. `fields()` instead reads a model's field
+    values directly and yields exactly the keys and values its `to_dict()` would return,
+    in the same order, leaving nested models to be walked by the caller.
+
+    Likewise, `from_dict()` rebuilds the decoded JSON dict by dict, nested model by nested
+    model, before validating it. `validate()` hands a response body to pydantic-core in a
+    single call instead.
+    """
+
+    ADDITIONAL_PROPERTIES = "additional_properties"
+
+    JSON = "json"
+    """Validate the raw JSON document with `model_validate_json()`."""
+    PYTHON = "python"
+    """Decode the document, then validate it with a single `model_validate()` call."""
+    FROM_DICT = "from_dict"
+    """Decode the document, then build the model with its generated `from_dict()`."""
+
+    @staticmethod
+    def fields(model: BaseModel) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields the JSON key and value of each field of a generated model, as its `to_dict()` would.
+
+        Fields that are None are skipped, except nullable fields explicitly set to None,
+        which come last, after any additional properties. Int64 values are converted to
+        their string form; other nested values are not converted.
+
+        :param model: A generated model.
+        :return: An iterator over (key, value) pairs. A key may repeat if an additional
+            property shadows a field, in which case the later value wins.
+        """
+        plan = ModelUtil.plan(type(model))
+        values = model.__dict__
+        nulls: List[str] = []
+        for field in plan.fields:
+            value = values[field.name]
+            if value is not None:
+                yield field.key, str(value) if field.int64 else value
+            elif field.nullable and field.name in model.model_fields_set:
+                nulls.append(field.key)
+        if plan.additional_properties and model.additional_properties is not None:  # ty: ignore[unresolved-attribute]
+            yield from model.additional_properties.items()  # ty: ignore[unresolved-attribute]
+        for key in nulls:
+            yield key, None
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def plan(cls: Type[BaseModel]) -> _Plan:
+        """
+        Returns the fields of a generated model class, computed once per class.
+
+        Nullable fields are found by probing `to_dict()` with each field explicitly set to None.
+
+        :param cls: A generated model class.
+        :return: The JSON key and nullability of each field, and whether the model has
+            additional properties.
+        """
+        fields = []
+        for name, info in cls.model_fields.items():
+            if name == ModelUtil.ADDITIONAL_PROPERTIES:
+                continue
+            key = info.serialization_alias or info.alias or name
+            probe = cls.model_construct(**{name: None}).to_dict()  # ty: ignore[unresolved-attribute]
+            int64 = info.annotation is Int64 or Int64 in typing.get_args(info.annotation)
+            fields.append(_Field(name, key, key in probe, int64))
+        return _Plan(tuple(fields), ModelUtil.ADDITIONAL_PROPERTIES in cls.model_fields)
+
+    @staticmethod
+    def validate(cls: Type[BaseModel], data: Union[bytes, str], loads: Callable[[Union[bytes, str]], Any]) -> BaseModel:
+        """
+        Validates a JSON document as a generated model, in as few passes as the model allows.
+
+        :param cls: A generated model class.
+        :param data: The JSON document, as UTF-8 encoded bytes or text.
+        :param loads: The JSON decoder to use if the document cannot be validated directly.
+        :return: The model instance.
+        :raises pydantic.ValidationError: If the document does not match the model.
+        """
+        mode = ModelUtil.validation_mode(cls)
+        if mode == ModelUtil.JSON:
+            return cls.model_validate_json(data)
+        if mode == ModelUtil.PYTHON:
+            return cls.model_validate(loads(data))
+        return cls.from_dict(loads(data))  # ty: ignore[unresolved-attribute]
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def validation_mode(cls: Type[BaseModel]) -> str:
+        """
+        Returns how documents can be validated as the model class, computed once per class.
+
+        Models holding additional properties anywhere in their tree need `from_dict()` to
+        collect unknown keys. Bytes fields, typed as a union of bytes and str, keep the
+        document's str when validated from Python objects but would become bytes when
+        validated from JSON, so models holding them are validated from decoded objects.
+
+        :param cls: A generated model class.
+        :return: One of JSON, PYTHON or FROM_DICT.
+        """
+        models: Set[Type[BaseModel]] = set()
+        has_bytes = ModelUtil._collect(cls, models)
+        if any(ModelUtil.ADDITIONAL_PROPERTIES in model.model_fields for model in models):
+            return ModelUtil.FROM_DICT
+        return ModelUtil.PYTHON if has_bytes else ModelUtil.JSON
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def list_field(cls: Type[BaseModel]) -> Tuple[str, str, Type[BaseModel]]:
+        """
+        Returns the field of a list response holding its items, computed once per class.
+
+        :param cls: A generated response model class, e.g. UserServiceListUsersResponse.
+        :return: The field name, its JSON key and the model class of its items.
+        :raises ValueError: If the model does not have exactly one field holding a list of models.
+        """
+        found = []
+        for name, info in cls.model_fields.items():
+            for annotation in (info.annotation, *typing.get_args(info.annotation)):
+                if typing.get_origin(annotation) is list:
+                    (item,) = typing.get_args(annotation)
+                    if isinstance(item, type) and issubclass(item, BaseModel):
+                        found.append((name, info.serialization_alias or info.alias or name, item))
+        if len(found) != 1:
+            raise ValueError(f"{cls.__name__} does not have exactly one field holding a list of models")
+        return found[0]
+
+    @staticmethod
+    def _collect(annotation: Any, models: Set[Type[BaseModel]]) -> bool:
+        """
+        Adds the model classes referenced by the annotation to `models`, and returns whether
+        any of the annotations walked holds bytes.
+        """
+        if annotation is bytes:
+            return True
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            if annotation in models:
+                return False
+            models.add(annotation)
+            children = [info.annotation for info in annotation.model_fields.values()]
+        else:
+            children = list(typing.get_args(annotation))
+        has_bytes = False
+        # walk every child, without stopping at the first bytes field, to collect all models
+        for child in children:
+            has_bytes = ModelUtil._collect(child, models) or has_bytes
+        return has_bytes
@@ -1,43 +1,47 @@
+from functools import cached_property
 from types import TracebackType
-from typing import Callable, Optional, Type, TypeVar
-
-from zitadel_client.api.action_service_api import ActionServiceApi
-from zitadel_client.api.application_service_api import ApplicationServiceApi
-from zitadel_client.api.authorization_service_api import AuthorizationServiceApi
-from zitadel_client.api.beta_action_service_api import BetaActionServiceApi
-from zitadel_client.api.beta_app_service_api import BetaAppServiceApi
-from zitadel_client.api.beta_authorization_service_api import BetaAuthorizationServiceApi
-from zitadel_client.api.beta_feature_service_api import BetaFeatureServiceApi
-from zitadel_client.api.beta_instance_service_api import BetaInstanceServiceApi
-from zitadel_client.api.beta_internal_permission_service_api import BetaInternalPermissionServiceApi
-from zitadel_client.api.beta_oidc_service_api import BetaOIDCServiceApi
-from zitadel_client.api.beta_organization_service_api import BetaOrganizationServiceApi
-from zitadel_client.api.beta_project_service_api import BetaProjectServiceApi
-from zitadel_client.api.beta_session_service_api import BetaSessionServiceApi
-from zitadel_client.api.beta_settings_service_api import BetaSettingsServiceApi
-from zitadel_client.api.beta_telemetry_service_api import BetaTelemetryServiceApi
-from zitadel_client.api.beta_user_service_api import BetaUserServiceApi
-from zitadel_client.api.beta_web_key_service_api import BetaWebKeyServiceApi
-from zitadel_client.api.feature_service_api import FeatureServiceApi
-from zitadel_client.api.identity_provider_service_api import IdentityProviderServiceApi
-from zitadel_client.api.instance_service_api import InstanceServiceApi
-from zitadel_client.api.internal_permission_service_api import InternalPermissionServiceApi
-from zitadel_client.api.oidc_service_api import OIDCServiceApi
-from zitadel_client.api.organization_service_api import OrganizationServiceApi
-from zitadel_client.api.project_service_api import ProjectServiceApi
-from zitadel_client.api.saml_service_api import SAMLServiceApi
-from zitadel_client.api.session_service_api import SessionServiceApi
-from zitadel_client.api.settings_service_api import SettingsServiceApi
-from zitadel_client.api.user_service_api import UserServiceApi
-from zitadel_client.api.web_key_service_api import WebKeyServiceApi
+from typing import TYPE_CHECKING, Callable, Optional, Type, TypeVar
+
 from zitadel_client.api_client import ApiClient
 from zitadel_client.auth.authenticator import Authenticator
-from zitadel_client.auth.client_credentials_authenticator import ClientCredentialsAuthenticator
 from zitadel_client.auth.personal_access_token_authenticator import PersonalAccessTokenAuthenticator
-from zitadel_client.auth.web_token_authenticator import WebTokenAuthenticator
 from zitadel_client.configuration import Configuration
+from zitadel_client.transport import Transport
 from zitadel_client.transport_options import TransportOptions
 
+if TYPE_CHECKING:
+    from zitadel_client.api.action_service_api import ActionServiceApi
+    from zitadel_client.api.application_service_api import ApplicationServiceApi
+    from zitadel_client.api.authorization_service_api import AuthorizationServiceApi
+    from zitadel_client.api.beta_action_service_api import BetaActionServiceApi
+    from zitadel_client.api.beta_app_service_api import BetaAppServiceApi
+    from zitadel_client.api.beta_authorization_service_api import BetaAuthorizationServiceApi
+    from zitadel_client.api.beta_feature_service_api import BetaFeatureServiceApi
+    from zitadel_client.api.beta_instance_service_api import BetaInstanceServiceApi
+    from zitadel_client.api.beta_internal_permission_service_api import BetaInternalPermissionServiceApi
+    from zitadel_client.api.beta_oidc_service_api import BetaOIDCServiceApi
+    from zitadel_client.api.beta_organization_service_api import BetaOrganizationServiceApi
+    from zitadel_client.api.beta_project_service_api import BetaProjectServiceApi
+    from zitadel_client.api.beta_session_service_api import BetaSessionServiceApi
+    from zitadel_client.api.beta_settings_service_api import BetaSettingsServiceApi
+    from zitadel_client.api.beta_telemetry_service_api import BetaTelemetryServiceApi
+    from zitadel_client.api.beta_user_service_api import BetaUserServiceApi
+    from zitadel_client.api.beta_web_key_service_api import BetaWebKeyServiceApi
+    from zitadel_client.api.feature_service_api import FeatureServiceApi
+    from zitadel_client.api.identity_provider_service_api import IdentityProviderServiceApi
+    from zitadel_client.api.instance_service_api import InstanceServiceApi
+    from zitadel_client.api.internal_permission_service_api import InternalPermissionServiceApi
+    from zitadel_client.api.oidc_service_api import OIDCServiceApi
+    from zitadel_client.api.organization_service_api import OrganizationServiceApi
+    from zitadel_client.api.project_service_api import ProjectServiceApi
+    from zitadel_client.api.saml_service_api import SAMLServiceApi
+    from zitadel_client.api.session_service_api import SessionServiceApi
+    from zitadel_client.api.settings_service_api import SettingsServiceApi
+    from zitadel_client.api.user_service_api import UserServiceApi
+    from zitadel_client.api.web_key_service_api import WebKeyServiceApi
+
+S = TypeVar("S")
+
 
 class Zitadel:
     """
@@ -45,7 +49,8 @@ class Zitadel:
 
     This class initializes and configures the SDK with the provided authentication strategy.
     It sets up service APIs for interacting with various Zitadel features such as identity providers,
-    organizations, sessions, settings, users, and more.
+    organizations, sessions, settings, users, and more. Each service API is imported and constructed
+    on first access and then cached, so short-lived processes only pay for the services they use.
 
     Attributes:
     features (FeatureServiceApi)
@@ -108,7 +113,7 @@ class Zitadel:
 
         This constructor creates a configuration instance using the provided authenticator.
         Optionally, the configuration can be modified via the `mutate_config` callback function.
-        It then instantiates the underlying API client and initializes various service APIs.
+        It then instantiates the underlying API client; the service APIs are created lazily on first use.
 
         Args:
             authenticator (Authenticator): The authentication strategy to be used.
@@ -121,36 +126,237 @@ class Zitadel:
         if mutate_config:
             mutate_config(self.configuration)
 
-        client = ApiClient(configuration=self.configuration)
-        self.features = FeatureServiceApi(client)
-        self.idps = IdentityProviderServiceApi(client)
-        self.oidc = OIDCServiceApi(client)
-        self.organizations = OrganizationServiceApi(client)
-        self.saml = SAMLServiceApi(client)
-        self.sessions = SessionServiceApi(client)
-        self.settings = SettingsServiceApi(client)
-        self.users = UserServiceApi(client)
-        self.webkeys = WebKeyServiceApi(client)
-        self.actions = ActionServiceApi(client)
-        self.applications = ApplicationServiceApi(client)
-        self.authorizations = AuthorizationServiceApi(client)
-        self.beta_projects = BetaProjectServiceApi(client)
-        self.beta_apps = BetaAppServiceApi(client)
-        self.beta_oidc = BetaOIDCServiceApi(client)
-        self.beta_users = BetaUserServiceApi(client)
-        self.beta_organizations = BetaOrganizationServiceApi(client)
-        self.beta_settings = BetaSettingsServiceApi(client)
-        self.beta_permissions = BetaInternalPermissionServiceApi(client)
-        self.beta_authorizations = BetaAuthorizationServiceApi(client)
-        self.beta_sessions = BetaSessionServiceApi(client)
-        self.beta_instance = BetaInstanceServiceApi(client)
-        self.beta_telemetry = BetaTelemetryServiceApi(client)
-        self.instances = InstanceServiceApi(client)
-        self.internal_permissions = InternalPermissionServiceApi(client)
-        self.beta_features = BetaFeatureServiceApi(client)
-        self.beta_webkeys = BetaWebKeyServiceApi(client)
-        self.beta_actions = BetaActionServiceApi(client)
-        self.projects = ProjectServiceApi(client)
+        self._api_client = self._create_api_client(self.configuration)
+
+    def _create_api_client(self, configuration: Configuration) -> ApiClient:
+        """
+        Creates the API client shared by all service APIs.
+
+        :param configuration: The configuration for the client.
+        :return: The API client.
+        """
+        return ApiClient(configuration=configuration)
+
+    def _create_service(self, api_class: Callable[[ApiClient], S]) -> S:
+        """
+        Creates a service API bound to the shared API client.
+
+        :param api_class: The generated service API class.
+        :return: The service API instance.
+        """
+        return api_class(self._api_client)
+
+    @cached_property
+    def features(self) -> "FeatureServiceApi":
+        """Endpoints for feature management."""
+        from zitadel_client.api.feature_service_api import FeatureServiceApi
+
+        return self._create_service(FeatureServiceApi)
+
+    @cached_property
+    def idps(self) -> "IdentityProviderServiceApi":
+        """Endpoints for identity-provider operations."""
+        from zitadel_client.api.identity_provider_service_api import IdentityProviderServiceApi
+
+        return self._create_service(IdentityProviderServiceApi)
+
+    @cached_property
+    def oidc(self) -> "OIDCServiceApi":
+        """Endpoints for OIDC-related operations."""
+        from zitadel_client.api.oidc_service_api import OIDCServiceApi
+
+        return self._create_service(OIDCServiceApi)
+
+    @cached_property
+    def organizations(self) -> "OrganizationServiceApi":
+        """Endpoints for organization management."""
+        from zitadel_client.api.organization_service_api import OrganizationServiceApi
+
+        return self._create_service(OrganizationServiceApi)
+
+    @cached_property
+    def saml(self) -> "SAMLServiceApi":
+        """Endpoints for SAML identity-provider management."""
+        from zitadel_client.api.saml_service_api import SAMLServiceApi
+
+        return self._create_service(SAMLServiceApi)
+
+    @cached_property
+    def sessions(self) -> "SessionServiceApi":
+        """Endpoints for session lifecycle management."""
+        from zitadel_client.api.session_service_api import SessionServiceApi
+
+        return self._create_service(SessionServiceApi)
+
+    @cached_property
+    def settings(self) -> "SettingsServiceApi":
+        """Endpoints for organization- and instance-level settings."""
+        from zitadel_client.api.settings_service_api import SettingsServiceApi
+
+        return self._create_service(SettingsServiceApi)
+
+    @cached_property
+    def users(self) -> "UserServiceApi":
+        """Endpoints for end-user management."""
+        from zitadel_client.api.user_service_api import UserServiceApi
+
+        return self._create_service(UserServiceApi)
+
+    @cached_property
+    def webkeys(self) -> "WebKeyServiceApi":
+        """Endpoints for WebCrypto keys (JWKS)."""
+        from zitadel_client.api.web_key_service_api import WebKeyServiceApi
+
+        return self._create_service(WebKeyServiceApi)
+
+    @cached_property
+    def actions(self) -> "ActionServiceApi":
+        """Endpoints for custom action workflows."""
+        from zitadel_client.api.action_service_api import ActionServiceApi
+
+        return self._create_service(ActionServiceApi)
+
+    @cached_property
+    def applications(self) -> "ApplicationServiceApi":
+        """Endpoints for application registration."""
+        from zitadel_client.api.application_service_api import ApplicationServiceApi
+
+        return self._create_service(ApplicationServiceApi)
+
+    @cached_property
+    def authorizations(self) -> "AuthorizationServiceApi":
+        """Endpoints for authorization workflows."""
+        from zitadel_client.api.authorization_service_api import AuthorizationServiceApi
+
+        return self._create_service(AuthorizationServiceApi)
+
+    @cached_property
+    def beta_projects(self) -> "BetaProjectServiceApi":
+        """Preview endpoints for project management."""
+        from zitadel_client.api.beta_project_service_api import BetaProjectServiceApi
+
+        return self._create_service(BetaProjectServiceApi)
+
+    @cached_property
+    def beta_apps(self) -> "BetaAppServiceApi":
+        """Preview endpoints for application registration."""
+        from zitadel_client.api.beta_app_service_api import BetaAppServiceApi
+
+        return self._create_service(BetaAppServiceApi)
+
+    @cached_property
+    def beta_oidc(self) -> "BetaOIDCServiceApi":
+        """Preview endpoints for OIDC features not yet GA."""
+        from zitadel_client.api.beta_oidc_service_api import BetaOIDCServiceApi
+
+        return self._create_service(BetaOIDCServiceApi)
+
+    @cached_property
+    def beta_users(self) -> "BetaUserServiceApi":
+        """Preview endpoints for advanced user management."""
+        from zitadel_client.api.beta_user_service_api import BetaUserServiceApi
+
+        return self._create_service(BetaUserServiceApi)
+
+    @cached_property
+    def beta_organizations(self) -> "BetaOrganizationServiceApi":
+        """Preview endpoints for organization features."""
+        from zitadel_client.api.beta_organization_service_api import BetaOrganizationServiceApi
+
+        return self._create_service(BetaOrganizationServiceApi)
+
+    @cached_property
+    def beta_settings(self) -> "BetaSettingsServiceApi":
+        """Preview endpoints for settings not yet GA."""
+        from zitadel_client.api.beta_settings_service_api import BetaSettingsServiceApi
+
+        return self._create_service(BetaSettingsServiceApi)
+
+    @cached_property
+    def beta_permissions(self) -> "BetaInternalPermissionServiceApi":
+        """Preview endpoints for fine-grained permission management."""
+        from zitadel_client.api.beta_internal_permission_service_api import BetaInternalPermissionServiceApi
+
+        return self._create_service(BetaInternalPermissionServiceApi)
+
+    @cached_property
+    def beta_authorizations(self) -> "BetaAuthorizationServiceApi":
+        """Preview endpoints for authorization workflows."""
+        from zitadel_client.api.beta_authorization_service_api import BetaAuthorizationServiceApi
+
+        return self._create_service(BetaAuthorizationServiceApi)
+
+    @cached_property
+    def beta_sessions(self) -> "BetaSessionServiceApi":
+        """Preview endpoints for session features not yet GA."""
+        from zitadel_client.api.beta_session_service_api import BetaSessionServiceApi
+
+        return self._create_service(BetaSessionServiceApi)
+
+    @cached_property
+    def beta_instance(self) -> "BetaInstanceServiceApi":
+        """Preview endpoints for instance-level operations."""
+        from zitadel_client.api.beta_instance_service_api import BetaInstanceServiceApi
+
+        return self._create_service(BetaInstanceServiceApi)
+
+    @cached_property
+    def beta_telemetry(self) -> "BetaTelemetryServiceApi":
+        """Preview endpoints for telemetry and observability."""
+        from zitadel_client.api.beta_telemetry_service_api import BetaTelemetryServiceApi
+
+        return self._create_service(BetaTelemetryServiceApi)
+
+    @cached_property
+    def instances(self) -> "InstanceServiceApi":
+        """Endpoints for instance-level operations."""
+        from zitadel_client.api.instance_service_api import InstanceServiceApi
+
+        return self._create_service(InstanceServiceApi)
+
+    @cached_property
+    def internal_permissions(self) -> "InternalPermissionServiceApi":
+        """Endpoints for fine-grained permission management."""
+        from zitadel_client.api.internal_permission_service_api import InternalPermissionServiceApi
+
+        return self._create_service(InternalPermissionServiceApi)
+
+    @cached_property
+    def beta_features(self) -> "BetaFeatureServiceApi":
+        """Preview endpoints for new feature toggles."""
+        from zitadel_client.api.beta_feature_service_api import BetaFeatureServiceApi
+
+        return self._create_service(BetaFeatureServiceApi)
+
+    @cached_property
+    def beta_webkeys(self) -> "BetaWebKeyServiceApi":
+        """Preview endpoints for WebCrypto keys in Beta."""
+        from zitadel_client.api.beta_web_key_service_api import BetaWebKeyServiceApi
+
+        return self._create_service(BetaWebKeyServiceApi)
+
+    @cached_property
+    def beta_actions(self) -> "BetaActionServiceApi":
+        """Preview endpoints for custom action workflows."""
+        from zitadel_client.api.beta_action_service_api import BetaActionServiceApi
+
+        return self._create_service(BetaActionServiceApi)
+
+    @cached_property
+    def projects(self) -> "ProjectServiceApi":
+        """Endpoints for project management."""
+        from zitadel_client.api.project_service_api import ProjectServiceApi
+
+        return self._create_service(ProjectServiceApi)
+
+    def warm_up(self, *names: str) -> None:
+        """
+        Creates service APIs and resolves their response types ahead of their first requests.
+
+        :param names: The service attribute names, e.g. "users" or "sessions".
+        """
+        for name in names:
+            self._api_client.warm_up(getattr(self, name))
 
     # noinspection PyArgumentList
     T = TypeVar("T", bound="Zitadel")
@@ -194,20 +400,23 @@ class Zitadel:
         :param transport_options: Transport options for TLS, proxy, and headers.
         """
         config.default_headers = dict(transport_options.default_headers)
+        config.transport = Transport.shared(transport_options)
         if transport_options.ca_cert_path:
             config.ssl_ca_cert = transport_options.ca_cert_path
         if transport_options.insecure:
             config.verify_ssl = False
         if transport_options.proxy_url:
             config.proxy_url = transport_options.proxy_url
+        config.http2 = transport_options.http2
 
-    @staticmethod
+    @classmethod
     def with_access_token(
+        cls: Type[T],
         host: str,
         access_token: str,
         *,
         transport_options: Optional[TransportOptions] = None,
-    ) -> "Zitadel":
+    ) -> T:
         """
         Initialize the SDK with a Personal Access Token (PAT).
 
@@ -222,16 +431,17 @@ class Zitadel:
         def mutate_config(config: Configuration) -> None:
             Zitadel._apply_transport_options(config, resolved)
 
-        return Zitadel(PersonalAccessTokenAuthenticator(host, access_token), mutate_config=mutate_config)
+        return cls(PersonalAccessTokenAuthenticator(host, access_token), mutate_config=mutate_config)
 
-    @staticmethod
+    @classmethod
     def with_client_credentials(
+        cls: Type[T],
         host: str,
         client_id: str,
         client_secret: str,
         *,
         transport_options: Optional[TransportOptions] = None,
-    ) -> "Zitadel":
+    ) -> T:
         """
         Initialize the SDK using OAuth2 Client Credentials flow.
 
@@ -242,6 +452,8 @@ class Zitadel:
         :return: Configured Zitadel client instance with token auto-refresh.
         :see: https://zitadel.com/docs/guides/integrate/service-users/client-credentials
         """
+        from zitadel_client.auth.client_credentials_authenticator import ClientCredentialsAuthenticator
+
         resolved = transport_options or TransportOptions.defaults()
 
         authenticator = ClientCredentialsAuthenticator.builder(
@@ -254,15 +466,16 @@ class Zitadel:
         def mutate_config(config: Configuration) -> None:
             Zitadel._apply_transport_options(config, resolved)
 
-        return Zitadel(authenticator, mutate_config=mutate_config)
+        return cls(authenticator, mutate_config=mutate_config)
 
-    @staticmethod
+    @classmethod
     def with_private_key(
+        cls: Type[T],
         host: str,
         key_file: str,
         *,
         transport_options: Optional[TransportOptions] = None,
-    ) -> "Zitadel":
+    ) -> T:
         """
         Initialize the SDK via Private Key JWT assertion.
 
@@ -272,6 +485,8 @@ class Zitadel:
         :return: Configured Zitadel client instance using JWT assertion.
         :see: https://zitadel.com/docs/guides/integrate/service-users/private-key-jwt
         """
+        from zitadel_client.auth.web_token_authenticator import WebTokenAuthenticator
+
         resolved = transport_options or TransportOptions.defaults()
 
         authenticator = WebTokenAuthenticator.from_json(
@@ -283,4 +498,4 @@ class Zitadel:
         def mutate_config(config: Configuration) -> None:
             Zitadel._apply_transport_options(config, resolved)
 
-        return Zitadel(authenticator, mutate_config=mutate_config)
+        return cls(authenticator, mutate_config=mutate_config)